@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""
+NAME: cc_fake_controller_9800.py
+
+CLASSIFICATION: module
+
+PURPOSE:
+Emulates the login, prompts, pager and confirmations of a cisco 9800 controller CLI on stdin/stdout
+so ControllerSession in cc_module_9800_3504.py can be exercised without a controller.
+Commands received are appended to --log, one per line.
+
+EXAMPLE:
+    ./cc_fake_controller_9800.py --prompt WLC1 --passwd Cisco123 --drop_after 5
+
+    session = ControllerSession(prompt="WLC1", passwd="Cisco123", user="admin",
+                                spawn_command="./cc_fake_controller_9800.py --prompt WLC1 --passwd Cisco123")
+    cs = create_controller_series_object(..., prompt="WLC1", series="9800", session=session)
+    cs.show_ap_summary()
+
+COPYRIGHT:
+    Copyright 2023 Candela Technologies Inc
+    License: Free to distribute and modify. LANforge systems must be licensed.
+"""
+
+import argparse
+import sys
+import termios
+import tty
+
+AP_SUMMARY_HEADER = ["Number of APs: {count}",
+                     "",
+                     "AP Name                  Slots AP Model        Ethernet MAC   Radio MAC      Location    Country IP Address   State",
+                     "-" * 116]
+CONFIRM = "Are you sure you want to continue? (y/n)[y]:"
+
+
+def read_key():
+    if not sys.stdin.isatty():
+        return sys.stdin.readline()[:1]
+    attrs = termios.tcgetattr(sys.stdin)
+    try:
+        tty.setcbreak(sys.stdin.fileno())
+        return sys.stdin.read(1)
+    finally:
+        termios.tcsetattr(sys.stdin, termios.TCSADRAIN, attrs)
+
+
+class fake_controller:
+    def __init__(self, prompt="WLC1", passwd="Cisco123", ap_count=20, page_lines=10, drop_after=0, log=None):
+        self.prompt = prompt
+        self.passwd = passwd
+        self.ap_count = ap_count
+        self.page_lines = page_lines
+        self.drop_after = drop_after
+        self.log = log
+        self.mode = ">"
+        self.paging = True
+        self.command_count = 0
+
+    def out(self, text="", end="\n"):
+        sys.stdout.write(text + end)
+        sys.stdout.flush()
+
+    def current_prompt(self):
+        if self.mode in [">", "#"]:
+            return self.prompt + self.mode
+        return "{prompt}({mode})#".format(prompt=self.prompt, mode=self.mode)
+
+    def ask_password(self):
+        self.out("Password: ", end="")
+        return sys.stdin.readline().strip() == self.passwd
+
+    def page(self, lines):
+        for index, line in enumerate(lines):
+            if self.paging and index and index % self.page_lines == 0:
+                self.out(" --More-- ", end="")
+                if read_key() in ["q", "Q"]:
+                    self.out()
+                    return
+                self.out("\b" * 10 + " " * 10 + "\b" * 10, end="")
+            self.out(line)
+
+    def show_ap_summary(self):
+        lines = [line.format(count=self.ap_count) for line in AP_SUMMARY_HEADER]
+        for index in range(self.ap_count):
+            lines.append("AP{index:04d}.0E7B.CF9C        3     C9136I-B        a453.0e7b.{index:04x} cc9c.3ef4.{index:04x} default     US      192.168.50.{ip:<3d} Registered".format(
+                index=index, ip=index + 10))
+        self.page(lines)
+
+    def handle(self, line):
+        if line in ["en", "enable"] and self.mode == ">":
+            if self.ask_password():
+                self.mode = "#"
+            else:
+                self.out("% Bad secrets")
+        elif line.startswith("terminal length "):
+            length = int(line.split()[-1])
+            self.paging = length > 0
+            if self.paging:
+                self.page_lines = length
+        elif line in ["config t", "configure terminal"] and self.mode == "#":
+            self.out("Enter configuration commands, one per line.  End with CNTL/Z.")
+            self.mode = "config"
+        elif line.startswith("wlan ") and self.mode == "config":
+            self.mode = "config-wlan"
+        elif line == "end":
+            if self.mode not in [">", "#"]:
+                self.mode = "#"
+        elif line == "exit":
+            if self.mode == "config-wlan":
+                self.mode = "config"
+            elif self.mode == "config":
+                self.mode = "#"
+            else:
+                return False
+        elif line == "logout":
+            return False
+        elif line.startswith("show ap summary"):
+            self.show_ap_summary()
+        elif line.startswith("show ") or line.startswith("dir ") or line.startswith("more "):
+            self.out("fake output: {line}".format(line=line))
+        elif line.startswith("ap ") and line.endswith("shutdown"):
+            self.out(CONFIRM, end="")
+            sys.stdin.readline()
+        elif line and self.mode == ">":
+            self.out("% Invalid input detected at '^' marker.")
+        return True
+
+    def run(self):
+        if not self.ask_password():
+            self.out("Permission denied, please try again.")
+            return 1
+        self.out()
+        while True:
+            self.out(self.current_prompt(), end="")
+            line = sys.stdin.readline()
+            if not line:
+                return 0
+            line = line.strip()
+            if self.log:
+                with open(self.log, "a") as log_file:
+                    log_file.write(line + "\n")
+            self.command_count += 1
+            if self.drop_after and self.command_count > self.drop_after:
+                self.out("Connection to controller closed by remote host.")
+                return 0
+            if not self.handle(line):
+                return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog='cc_fake_controller_9800.py',
+        formatter_class=argparse.RawTextHelpFormatter,
+        description="emulate a 9800 controller CLI on stdin/stdout")
+    parser.add_argument("--prompt", type=str, help="controller prompt", default="WLC1")
+    parser.add_argument("--passwd", type=str, help="login and enable password", default="Cisco123")
+    parser.add_argument("--ap_count", type=int, help="APs listed by show ap summary", default=20)
+    parser.add_argument("--page_lines", type=int, help="lines per --More-- page until 'terminal length 0'", default=10)
+    parser.add_argument("--drop_after", type=int, help="close the connection after this many commands, 0 never", default=0)
+    parser.add_argument("--log", type=str, help="file to append received commands to")
+    args = parser.parse_args()
+
+    controller = fake_controller(prompt=args.prompt, passwd=args.passwd, ap_count=args.ap_count,
+                                 page_lines=args.page_lines, drop_after=args.drop_after, log=args.log)
+    sys.exit(controller.run())
+
+
+if __name__ == "__main__":
+    main()
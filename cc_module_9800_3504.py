@@ -45,8 +45,13 @@ import importlib
 import os
 import re
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
 
+import pexpect
+
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../")))
 
 
@@ -54,6 +59,199 @@ logger = logging.getLogger(__name__)
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 
 
+class ControllerSession:
+    """
+    Long lived pexpect connection to a 9800 controller CLI.
+
+    The session logs in once, elevates to the enable (#) prompt and disables paging, then stays
+    connected between commands so each action costs a round trip instead of an ssh login.
+    Commands from several threads are serialized; submit() queues them on a single worker.
+    A dropped connection is re-established and the command batch retried up to max_reconnects times.
+    Any --More-- pager and (y/n) confirmation is answered while reading output.
+    """
+    MORE = "--More--"
+    CONFIRM = r"\(y/n\)(\[[yn]\])?:?"
+    USER = r"(?i)user(name)?:"
+    PASSWORD = r"(?i)password:"
+    FINGERPRINT = r"\(yes/no(/\[fingerprint\])?\)\?"
+
+    def __init__(self,
+                 scheme="ssh",
+                 dest=None,
+                 port=None,
+                 user=None,
+                 passwd=None,
+                 prompt=None,
+                 timeout=10,
+                 spawn_command=None,
+                 max_reconnects=2):
+        """
+        :param spawn_command: command to spawn instead of ssh/telnet, used with cc_fake_controller_9800.py
+        """
+        if spawn_command is None and scheme not in ["ssh", "telnet"]:
+            logger.critical("controller session supports ssh or telnet, scheme: {scheme}".format(scheme=scheme))
+            raise ValueError("controller session supports ssh or telnet, scheme: {scheme}".format(scheme=scheme))
+        if prompt is None:
+            raise ValueError('Controller prompt must be set: WLC1')
+        self.scheme = scheme
+        self.dest = dest
+        self.port = port
+        self.user = user
+        self.passwd = passwd
+        self.prompt = prompt
+        self.timeout = float(timeout)
+        self.spawn_command = spawn_command
+        self.max_reconnects = max_reconnects
+        # WLC1>  WLC1#  WLC1(config)#  WLC1(config-wlan)#
+        self.prompt_pattern = r"(^|[\r\n])" + re.escape(prompt) + r"(\([\w\-]+\))?[>#]"
+        self.egg = None
+        self.mode = None
+        self.connect_count = 0
+        self.command_count = 0
+        self.lock = threading.Lock()
+        self.executor = None
+
+    def spawn_cmd(self):
+        if self.spawn_command is not None:
+            return self.spawn_command
+        if self.scheme == "ssh":
+            port = 22 if self.port is None else int(self.port)
+            return "ssh -p%d -o PubkeyAuthentication=no %s@%s" % (port, self.user, self.dest)
+        port = 23 if self.port is None else int(self.port)
+        return "telnet %s %d" % (self.dest, port)
+
+    def is_connected(self):
+        return self.egg is not None and self.egg.isalive()
+
+    def connect(self):
+        self.disconnect()
+        cmd = self.spawn_cmd()
+        logger.info("controller session spawn: {cmd}".format(cmd=cmd))
+        self.egg = pexpect.spawn(cmd, encoding="utf-8", codec_errors="ignore", timeout=self.timeout)
+        patterns = [self.prompt_pattern, self.USER, self.PASSWORD, self.FINGERPRINT, pexpect.EOF, pexpect.TIMEOUT]
+        for _ in range(10):
+            i = self.egg.expect(patterns)
+            if i == 0:
+                self.mode = self.egg.after.strip()
+                if self.mode.endswith(">"):
+                    self.egg.sendline("en")
+                elif self.mode != self.prompt + "#":
+                    self.egg.sendline("end")
+                else:
+                    break
+            elif i == 1:
+                self.egg.sendline(self.user)
+            elif i == 2:
+                self.egg.sendline(self.passwd)
+            elif i == 3:
+                self.egg.sendline("yes")
+            else:
+                self.disconnect()
+                logger.critical("controller login failed: {cmd}".format(cmd=cmd))
+                raise ConnectionError("controller login failed: {cmd}".format(cmd=cmd))
+        else:
+            self.disconnect()
+            logger.critical("controller never reached the {prompt}# prompt".format(prompt=self.prompt))
+            raise ConnectionError("controller never reached the {prompt}# prompt".format(prompt=self.prompt))
+        self.connect_count += 1
+        self._send_line("terminal length 0")
+        logger.info("controller session logged in, connect count: {count}".format(count=self.connect_count))
+
+    def _send_line(self, line):
+        """
+        Send one CLI line and return its output once a prompt comes back.
+        """
+        self.egg.sendline(line)
+        chunks = []
+        while True:
+            i = self.egg.expect([self.prompt_pattern, self.MORE, self.CONFIRM, pexpect.EOF, pexpect.TIMEOUT])
+            chunks.append(self.egg.before)
+            if i == 0:
+                self.mode = self.egg.after.strip()
+                break
+            elif i == 1:
+                self.egg.send(" ")
+            elif i == 2:
+                chunks.append(self.egg.after)
+                self.egg.sendline("y")
+            elif i == 3:
+                raise pexpect.EOF("connection closed sending: {line}".format(line=line))
+            else:
+                raise pexpect.TIMEOUT("no prompt after: {line}".format(line=line))
+        output = "".join(chunks).replace("\r", "")
+        # drop the echoed command
+        if output.startswith(line):
+            output = output[len(line):]
+        return output.strip("\n")
+
+    def run(self, commands=None):
+        """
+        Run a list of CLI lines in order and return the combined output.  A configuration prompt
+        left over from an earlier failure is closed with 'end' first.  A dropped session is only
+        reconnected and retried while none of the lines have been sent; once one has, a rerun
+        could apply it twice, so the output so far is raised with the ConnectionError.
+        """
+        if isinstance(commands, str):
+            commands = [commands]
+        with self.lock:
+            attempt = 0
+            while True:
+                output = []
+                sent = False
+                try:
+                    if not self.is_connected():
+                        self.connect()
+                    elif self.mode != self.prompt + "#":
+                        self._send_line("end")
+                    for line in commands:
+                        logger.info("controller session send: {line}".format(line=line))
+                        sent = True
+                        output.append(self._send_line(line))
+                        self.command_count += 1
+                    return "\n".join(output)
+                except (pexpect.EOF, pexpect.TIMEOUT, OSError) as e:
+                    attempt += 1
+                    self.disconnect()
+                    if sent:
+                        logger.critical("controller session dropped after sending {count} of {total} lines: {err}\n{output}".format(
+                            count=len(output) + 1, total=len(commands), err=e, output="\n".join(output)))
+                        raise ConnectionError("controller session dropped after sending {count} of {total} lines: {err}\n{output}".format(
+                            count=len(output) + 1, total=len(commands), err=e, output="\n".join(output)))
+                    if attempt > self.max_reconnects:
+                        logger.critical("controller session failed after {count} reconnects: {err}".format(count=self.max_reconnects, err=e))
+                        raise ConnectionError("controller session failed: {err}".format(err=e))
+                    logger.warning("controller session dropped, reconnecting: {err}".format(err=e))
+                    time.sleep(min(attempt, 3))
+
+    def submit(self, commands=None):
+        """
+        Queue commands on the session worker thread, returns a concurrent.futures.Future.
+        """
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="controller_session")
+        return self.executor.submit(self.run, commands)
+
+    def disconnect(self):
+        if self.egg is None:
+            return
+        try:
+            if self.egg.isalive():
+                self.egg.sendline("end")
+                self.egg.sendline("logout")
+        except OSError:
+            pass
+        self.egg.close(force=True)
+        self.egg = None
+        self.mode = None
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        with self.lock:
+            self.disconnect()
+
+
 class create_controller_series_object:
     def __init__(self,
                  scheme=None,
@@ -71,7 +269,9 @@ class create_controller_series_object:
                  ap_dual_band_slot_6g=None,
                  port=None,
                  timeout=None,
-                 pwd=None
+                 pwd=None,
+                 use_session=False,
+                 session=None
                  ):
         if scheme is None:
             raise ValueError('Controller scheme must be set: serial, ssh or telnet')
@@ -181,6 +381,12 @@ class create_controller_series_object:
         self.testbed_location = 'NA'
         self.ap_config_radio_role = 'NA'
 
+        # persistent CLI session, 9800 only, actions without a session translation use wifi_ctl_9800_3504.py
+        self.session = session
+        self.use_session = use_session or session is not None
+        if self.use_session and self.series != "9800":
+            logger.warning("controller session only supported on 9800 series, using wifi_ctl_9800_3504.py")
+            self.use_session = False
 
     # TODO update the wifi_ctl_9800_3504 to use 24g, 5g, 6g
 
@@ -217,6 +423,110 @@ class create_controller_series_object:
             #    logger.critical("ap_band_slot_6g needs to be set to 2 or 3")
             #    raise ValueError("ap_band_slot_6g needs to be set to 2 or 3")
 #
+    def get_session(self):
+        if self.session is None:
+            self.session = ControllerSession(scheme=self.scheme, dest=self.dest, port=self.port, user=self.user,
+                                             passwd=self.passwd, prompt=self.prompt, timeout=self.timeout)
+        return self.session
+
+    def close_session(self):
+        if self.session is not None:
+            self.session.close()
+
+    def session_band(self):
+        if self.band in ['dual_band_5g', 'dual_band_6g']:
+            return 'dual-band'
+        elif self.band == '6g':
+            return '6ghz'
+        elif self.band == '5g':
+            return '5ghz'
+        return '24ghz'
+
+    # 9800 CLI lines for an action, same commands wifi_ctl_9800_3504.py sends
+    # returns None if the action needs wifi_ctl_9800_3504.py
+    def session_commands(self):
+        band = self.session_band()
+        ap_slot = "ap name {ap} dot11 {band} slot {slot}".format(ap=self.ap, band=band, slot=self.ap_band_slot)
+        if self.action == "cmd":
+            return [self.value]
+        if self.action == "summary":
+            return ["show ap summary"]
+        if self.action == "show_ap_status":
+            return ["show ap status"]
+        if self.action in ["show_ap_wlan_summary", "show_wlan_summary"]:
+            return ["show ap wlan summary" if self.action == "show_ap_wlan_summary" else "show wlan summary"]
+        if self.action == "show_ap_name_config_role":
+            return ["show ap name {ap} config slot {slot} | inc Role".format(ap=self.ap, slot=self.ap_band_slot)]
+        if self.action == "show_ap_tx_power_config":
+            return ["show ap name {ap} config dot11 {band} | sec Tx".format(ap=self.ap, band=band)]
+        if self.action == "advanced":
+            return ["show ap dot11 {band} summary".format(band=band)]
+        if self.action in ["show_ap_bssid_24g", "show_ap_bssid_5g", "show_ap_bssid_6g",
+                           "show_ap_bssid_dual_band_5g", "show_ap_bssid_dual_band_6g"]:
+            return ["show ap name {ap} wlan dot11 {band}".format(ap=self.ap, band=band)]
+        if self.action == "show_wireless_client_sumry":
+            return ["show  wireless client summary"]
+        if self.action == "show_client_macadd_detail":
+            return ["show wireless client mac-address {mac}  detail".format(mac=self.value)]
+        if self.action == "debug_wieless_mac":
+            return ["debug wireless mac {mac}".format(mac=self.value)]
+        if self.action == "no_debug_wieless_mac":
+            return ["no debug wireless mac  {mac}".format(mac=self.value)]
+        if self.action == "get_ra_trace_files":
+            return ["dir bootflash: | i ra_trace"]
+        if self.action == "get_data_ra_trace_files":
+            return ["more bootflash:{file}".format(file=self.value)]
+        if self.action == "del_ra_trace_file":
+            return ["delete /force bootflash:{file}".format(file=self.value)]
+        if self.action == "txPower":
+            return ["{ap_slot} txpower {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "channel":
+            return ["{ap_slot} channel {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "bandwidth":
+            return ["{ap_slot} channel width {value}".format(ap_slot=ap_slot, value=self.value)]
+        if self.action == "manual":
+            if band == 'dual-band':
+                return ["{ap_slot} role manual client-serving".format(ap_slot=ap_slot)]
+            return ["{ap_slot} radio role manual client-serving".format(ap_slot=ap_slot)]
+        if self.action == "auto":
+            return ["{ap_slot} radio role auto".format(ap_slot=ap_slot)]
+        if self.action == "disable_operation_status":
+            return ["{ap_slot} shutdown".format(ap_slot=ap_slot)]
+        if self.action == "enable_operation_status":
+            return ["ap name {ap} no dot11 {band} slot {slot} shutdown".format(ap=self.ap, band=band, slot=self.ap_band_slot)]
+        if self.action in ["disable_network_dual_band_5ghz", "disable_network_dual_band_6ghz"]:
+            return ["ap name {ap} dot11 dual-band slot {slot} shutdown".format(ap=self.ap, slot=self.ap_band_slot)]
+        if self.action in ["enable_network_dual_band_5ghz", "enable_network_dual_band_6ghz"]:
+            return ["ap name {ap} no dot11 dual-band slot {slot} shutdown".format(ap=self.ap, slot=self.ap_band_slot)]
+        if self.action in ["disable_network_6ghz", "disable_network_5ghz", "disable_network_24ghz"]:
+            return ["config t", "ap dot11 {band} shutdown".format(band=self.action.split("_")[-1]), "end"]
+        if self.action in ["enable_network_6ghz", "enable_network_5ghz", "enable_network_24ghz"]:
+            return ["config t", "no ap dot11 {band} shutdown".format(band=self.action.split("_")[-1]), "end"]
+        if self.action == "dual_band_mode_shutdown":
+            return ["ap name {ap} dot11 dual-band shutdown".format(ap=self.ap)]
+        if self.action == "dual_band_no_mode_shutdown":
+            return ["ap name {ap} no dot11 dual-band shutdown".format(ap=self.ap)]
+        if self.action == "config_dual_band_mode":
+            return ["ap name {ap} dot11 dual-band slot {slot} band {band}".format(
+                ap=self.ap, slot=self.ap_band_slot, band='6ghz' if self.band == 'dual_band_6g' else '5ghz')]
+        if self.action in ["ap_dot11_dot11ax_mcs_tx_index_spatial_stream", "no_ap_dot11_dot11ax_mcs_tx_index_spatial_stream"]:
+            mcs_band = '24ghz' if self.band == '24g' else ('6ghz' if self.band in ['6g', 'dual_band_6g'] else '5ghz')
+            command = "ap dot11 {band} dot11ax mcs tx index {index} spatial-stream {stream}".format(
+                band=mcs_band, index=self.mcs_tx_index, stream=self.spatial_stream)
+            if self.action.startswith("no_"):
+                command = "no " + command
+            return ["config t", command, "end"]
+        if self.action == "no_logging_console":
+            return ["config t", "no logging console", "end"]
+        if self.action == "line_console_0":
+            return ["config t", "line console 0", "end"]
+        if self.action in ["enable_wlan", "disable_wlan"]:
+            if self.wlan is None:
+                raise ValueError("9800 series wlan is required")
+            return ["config t", "wlan {wlan}".format(wlan=self.wlan),
+                    "no shutdown" if self.action == "enable_wlan" else "shutdown", "end"]
+        return None
+
     # TODO consolidate the command formats
 
     def send_command(self):
@@ -225,6 +535,14 @@ class create_controller_series_object:
 
         logger.info("action {action}".format(action=self.action))
 
+        if self.use_session:
+            session_commands = self.session_commands()
+            if session_commands is not None:
+                summary_output = self.get_session().run(session_commands)
+                logger.info(summary_output)
+                return summary_output
+            logger.info("action {action} not available on the session, using wifi_ctl_9800_3504.py".format(action=self.action))
+
         # set the ap_band_slot 24g = ap_band_slot 0 , 5g ap_band_slot = 1 / 2, 6g - ap_band_slot 2 / 3 so needs to be passed in
 
         # Command base
@@ -1378,6 +1696,7 @@ INCLUDE_IN_README
     parser.add_argument("--series", type=str, help="controller series", choices=["9800", "3504"], required=True)
     parser.add_argument("--scheme", type=str, choices=["serial", "ssh", "telnet"], help="Connect via serial, ssh or telnet")
     parser.add_argument("--timeout", type=str, help="timeout value", default=3)
+    parser.add_argument("--use_session", help="keep one controller CLI session open instead of running wifi_ctl_9800_3504.py per command", action='store_true')
     parser.add_argument("--lf_logger_config_json", help="[debug configuration] --lf_logger_config_json <json file> , json configuration of logger")
     parser.add_argument("--debug", help='--debug flag present debug on  enable debugging', action='store_true')
     parser.add_argument('--log_level', default=None, help='--log_level <level>', choices=['debug', 'info', 'warning', 'error', 'critical'])
@@ -1410,7 +1729,8 @@ INCLUDE_IN_README
         ap=args.ap,
         port=args.port,
         band=args.band,
-        timeout=args.timeout)
+        timeout=args.timeout,
+        use_session=args.use_session)
     # TODO add ability to select tests
     # cs.show_ap_summary()
     # summary = cs.show_ap_bssid_5ghz()
@@ -1419,6 +1739,7 @@ INCLUDE_IN_README
     # sample to dump status
     # sample_test_dump_status(cs=cs)
     cs.show_wireless_client_sum_cc()
+    cs.close_session()
 
 
 if __name__ == "__main__":
@@ -85,6 +85,7 @@ from enum import Enum
 from enum import IntFlag
 import http.client
 from http.client import HTTPResponse
+import io
 import json
 import logging
 from pprint import pformat
@@ -94,9 +95,11 @@ from typing import Optional
 import urllib
 from urllib import request
 import base64
+import copy
 import string
 import re
 import random
+import threading
 
 # - - - - deployed import references - - - - -
 from .strutil import nott, iss
@@ -212,6 +215,535 @@ def print_diagnostics(url_: str = None,
         exit(1)
 
 
+class PooledHTTPResponse:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Response returned by LFConnectionPool.urlopen(). The body is read off the socket
+        before the connection is returned to the pool, so this object presents the parts
+        of http.client.HTTPResponse that BaseLFJsonRequest callers use.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    def __init__(self,
+                 url: str = None,
+                 status: int = 0,
+                 reason: str = None,
+                 headers: http.client.HTTPMessage = None,
+                 body: bytes = b''):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self.msg = headers
+        self.fp = io.BytesIO(body)
+
+    def read(self, amt: int = None) -> bytes:
+        return self.fp.read(amt)
+
+    def getheaders(self) -> list:
+        if self.headers is None:
+            return []
+        return list(self.headers.items())
+
+    def getheader(self, name: str, default=None):
+        if self.headers is None:
+            return default
+        return self.headers.get(name, default)
+
+    def getcode(self) -> int:
+        return self.status
+
+    def geturl(self) -> str:
+        return self.url
+
+    def info(self) -> http.client.HTTPMessage:
+        return self.headers
+
+    def close(self):
+        self.fp.close()
+
+
+class _PipelineReader:
+    """
+    Lets several http.client.HTTPResponse objects read one after another from the
+    same buffered socket file without any of them closing it.
+    """
+    def __init__(self, fp):
+        self.fp = fp
+
+    def makefile(self, mode: str = "rb", *args, **kwargs):
+        return self
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name: str):
+        return getattr(self.fp, name)
+
+
+class LFConnectionPool:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Bounded pool of persistent HTTP/1.1 connections, kept per (scheme, host, port).
+        Idle connections older than idle_timeout_sec are evicted, and a request that
+        fails on a reused connection because the GUI closed it is retried once on a
+        new connection. The pool is safe to share between threads.
+
+        Example Usage:
+            pool = LFConnectionPool(max_connections=4)
+            response = pool.urlopen(urllib.request.Request("http://localhost:8080/port/1/1/list"))
+            pprint(pool.get_stats())
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    Default_Max_Connections: int = 8
+    Default_Idle_Timeout_Sec: float = 30.0
+    # errors that indicate the GUI dropped a kept-alive connection underneath us
+    RESET_ERRORS = (ConnectionResetError,
+                    ConnectionAbortedError,
+                    BrokenPipeError,
+                    http.client.RemoteDisconnected,
+                    http.client.BadStatusLine,
+                    http.client.CannotSendRequest,
+                    http.client.ResponseNotReady)
+
+    def __init__(self,
+                 max_connections: int = Default_Max_Connections,
+                 idle_timeout_sec: float = Default_Idle_Timeout_Sec,
+                 connection_timeout_sec: float = None):
+        """
+        :param max_connections: most connections open to a single host at one time, requests
+        beyond this wait until a connection is released
+        :param idle_timeout_sec: close idle connections that have not been used for this long
+        :param connection_timeout_sec: socket timeout used when the request does not set one
+        """
+        if not max_connections or max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.max_connections: int = max_connections
+        self.idle_timeout_sec: float = idle_timeout_sec
+        self.connection_timeout_sec: float = connection_timeout_sec
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Condition()
+        self.idle_map: dict = {}    # host key -> list of (connection, last_used_sec)
+        self.in_use_map: dict = {}  # host key -> count of checked out connections
+        self.hits: int = 0
+        self.misses: int = 0
+        self.reconnects: int = 0
+        self.evictions: int = 0
+
+    @staticmethod
+    def host_key(url: str = None) -> tuple:
+        parsed: ParseResult = urlparse(url)
+        port = parsed.port
+        if not port:
+            port = (80, 443)[parsed.scheme == "https"]
+        return parsed.scheme, parsed.hostname, port
+
+    def _evict_idle(self, key: tuple = None, now_sec: float = None):
+        # called with self.lock held
+        idle_list = self.idle_map.get(key)
+        if not idle_list:
+            return
+        keep = []
+        for (conn, last_used_sec) in idle_list:
+            if (now_sec - last_used_sec) > self.idle_timeout_sec:
+                conn.close()
+                self.evictions += 1
+            else:
+                keep.append((conn, last_used_sec))
+        self.idle_map[key] = keep
+
+    def _new_connection(self, key: tuple = None, timeout_sec: float = None) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=timeout_sec)
+        return http.client.HTTPConnection(host, port, timeout=timeout_sec)
+
+    def acquire(self, key: tuple = None, timeout_sec: float = None, fresh: bool = False) -> tuple:
+        """
+        Check out a connection for key, waiting if max_connections are busy.
+        :param fresh: do not reuse an idle connection
+        :return: tuple of (connection, True if it was reused from the idle list)
+        """
+        with self.lock:
+            while True:
+                self._evict_idle(key=key, now_sec=time.monotonic())
+                idle_list = self.idle_map.get(key)
+                if idle_list and not fresh:
+                    conn, _ = idle_list.pop()
+                    self.in_use_map[key] = self.in_use_map.get(key, 0) + 1
+                    self.hits += 1
+                    if timeout_sec:
+                        conn.timeout = timeout_sec
+                        if conn.sock:
+                            conn.sock.settimeout(timeout_sec)
+                    return conn, True
+                if self.in_use_map.get(key, 0) < self.max_connections:
+                    self.in_use_map[key] = self.in_use_map.get(key, 0) + 1
+                    self.misses += 1
+                    break
+                self.lock.wait()
+        return self._new_connection(key=key, timeout_sec=timeout_sec), False
+
+    def release(self, key: tuple = None, conn: http.client.HTTPConnection = None, reusable: bool = True):
+        with self.lock:
+            self.in_use_map[key] = max(0, self.in_use_map.get(key, 0) - 1)
+            if reusable and conn.sock:
+                self.idle_map.setdefault(key, []).append((conn, time.monotonic()))
+            else:
+                conn.close()
+            # waiters for every host share this condition, wake them all so the one waiting on key runs
+            self.lock.notify_all()
+
+    def urlopen(self, request_: urllib.request.Request = None, timeout_sec: float = None) -> PooledHTTPResponse:
+        """
+        Perform request_ over a pooled connection. Like urllib.request.urlopen(), responses
+        with a status outside of 2xx raise urllib.error.HTTPError and connection failures
+        raise urllib.error.URLError, so callers can keep their existing error handling.
+        :param request_: urllib.request.Request to submit
+        :param timeout_sec: socket timeout, defaults to connection_timeout_sec. Like urlopen(),
+        request_.timeout is not consulted.
+        :return: PooledHTTPResponse with the body already read
+        """
+        if not request_:
+            raise ValueError("urlopen requires request_")
+        if not timeout_sec:
+            timeout_sec = self.connection_timeout_sec
+        url = request_.full_url
+        key = self.host_key(url)
+        parsed: ParseResult = urlparse(url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+        headers = dict(request_.header_items())
+        headers.pop("Connection", None)
+
+        attempt = 0
+        while True:
+            attempt += 1
+            conn, reused = self.acquire(key=key, timeout_sec=timeout_sec, fresh=(attempt > 1))
+            try:
+                conn.request(request_.get_method(), path, body=request_.data, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+            except self.RESET_ERRORS as rerror:
+                self.release(key=key, conn=conn, reusable=False)
+                if reused and attempt == 1:
+                    # the GUI closed an idle keep-alive connection, try once more on a fresh one
+                    with self.lock:
+                        self.reconnects += 1
+                    self.logger.debug(f"LFConnectionPool: reconnecting to {key[1]}:{key[2]} after {rerror!r}")
+                    continue
+                raise urllib.error.URLError(rerror)
+            except OSError as oerror:
+                self.release(key=key, conn=conn, reusable=False)
+                raise urllib.error.URLError(oerror)
+            except BaseException:
+                self.release(key=key, conn=conn, reusable=False)
+                raise
+            self.release(key=key, conn=conn, reusable=not response.will_close)
+            break
+
+        pooled = PooledHTTPResponse(url=url,
+                                    status=response.status,
+                                    reason=response.reason,
+                                    headers=response.msg,
+                                    body=body)
+        if not (200 <= response.status < 300):
+            raise urllib.error.HTTPError(url, response.status, response.reason, response.msg, pooled.fp)
+        return pooled
+
+    def pipeline(self, request_list: list = None, timeout_sec: float = None) -> list:
+        """
+        Write every request in request_list onto one connection before reading any response
+        (HTTP/1.1 pipelining). The GUI answers in submission order, so commands that depend
+        on each other can share a pipeline. All requests must be for the same host.
+        :param request_list: list of urllib.request.Request
+        :param timeout_sec: socket timeout, defaults to connection_timeout_sec
+        :return: list, in request order, of PooledHTTPResponse or the exception that
+        prevented a response from being read
+        """
+        if not request_list:
+            return []
+        if not timeout_sec:
+            timeout_sec = self.connection_timeout_sec
+        key = self.host_key(request_list[0].full_url)
+        results: list = []
+        attempt = 0
+        while len(results) < len(request_list):
+            attempt += 1
+            pending = request_list[len(results):]
+            conn, reused = self.acquire(key=key, timeout_sec=timeout_sec, fresh=(attempt > 1))
+            reusable = False
+            got_response = False
+            reader: _PipelineReader = None
+            try:
+                if not conn.sock:
+                    conn.connect()
+                payload = b''.join(self._raw_request(key=key, request_=req) for req in pending)
+                conn.sock.sendall(payload)
+                reader = _PipelineReader(conn.sock.makefile("rb"))
+                for req in pending:
+                    response = http.client.HTTPResponse(reader, method=req.get_method())
+                    response.begin()
+                    body = response.read()
+                    got_response = True
+                    results.append(PooledHTTPResponse(url=req.full_url,
+                                                      status=response.status,
+                                                      reason=response.reason,
+                                                      headers=response.msg,
+                                                      body=body))
+                    if response.will_close:
+                        # the GUI stopped reading after this response, resend the remainder
+                        break
+                else:
+                    reusable = True
+            except self.RESET_ERRORS as rerror:
+                if reused and not got_response:
+                    with self.lock:
+                        self.reconnects += 1
+                    self.logger.debug(f"LFConnectionPool: reconnecting pipeline to {key[1]}:{key[2]} after {rerror!r}")
+                    continue
+                # we cannot know whether the GUI processed the unanswered requests, do not resend them
+                results.extend([urllib.error.URLError(rerror)] * (len(request_list) - len(results)))
+            except (OSError, http.client.HTTPException) as oerror:
+                results.extend([urllib.error.URLError(oerror)] * (len(request_list) - len(results)))
+            finally:
+                if reader:
+                    reader.fp.close()
+                self.release(key=key, conn=conn, reusable=reusable)
+        return results
+
+    @staticmethod
+    def _raw_request(key: tuple = None, request_: urllib.request.Request = None) -> bytes:
+        parsed: ParseResult = urlparse(request_.full_url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+        body: bytes = request_.data or b''
+        lines = ["%s %s HTTP/1.1" % (request_.get_method(), path),
+                 "Host: %s:%s" % (key[1], key[2])]
+        for (name, value) in request_.header_items():
+            if name.lower() in ("host", "connection", "content-length"):
+                continue
+            lines.append("%s: %s" % (name, value))
+        lines.append("Content-Length: %d" % len(body))
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+    def get_stats(self) -> dict:
+        """
+        :return: dict of pool hit/miss counters and connection counts
+        """
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / requests) if requests else 0.0,
+                "reconnects": self.reconnects,
+                "evictions": self.evictions,
+                "idle": sum(len(idle_list) for idle_list in self.idle_map.values()),
+                "in_use": sum(self.in_use_map.values()),
+            }
+
+    def close(self):
+        """ close all idle connections; checked out connections close when released """
+        with self.lock:
+            for idle_list in self.idle_map.values():
+                for (conn, _) in idle_list:
+                    conn.close()
+            self.idle_map.clear()
+
+
+class LFQueryCache:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        TTL cache of JSON query results, keyed by the full query URL including the
+        ?fields= column list. Commands posted through the session invalidate the entries
+        they could have changed: a command naming a port invalidates queries on that port
+        and on port lists of its resource, a command naming a cross-connect or endpoint
+        invalidates queries on matching cx and endp names, and a command the cache has no
+        table for clears every entry. The cache is safe to share between threads.
+
+        Example Usage:
+            session = LFSession(lfclient_url="http://localhost:8080", query_cache_ttl_sec=0.5)
+            query = session.get_query()
+            query.get_port(eid_list=["1.1.sta0000"], requested_col_names=["ip"])  # GUI request
+            query.get_port(eid_list=["1.1.sta0000"], requested_col_names=["ip"])  # cached
+            session.get_command().post_set_port(port="sta0000", resource=1, shelf=1, ...)
+            pprint(session.get_cache_stats())
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    Default_TTL_Sec: float = 1.0
+    Default_Max_Entries: int = 1024
+    # words in a cli command name mapped to the query tables the command changes
+    COMMAND_TABLES = (("port", ("port", "probe", "wifi-stats")),
+                      ("sta", ("port", "probe", "wifi-stats")),
+                      ("vap", ("port", "probe", "wifi-stats")),
+                      ("vlan", ("port",)),
+                      ("bond", ("port",)),
+                      ("br", ("port",)),
+                      ("radio", ("port", "radiostatus")),
+                      ("endp", ("endp", "cx", "layer4", "generic")),
+                      ("cx", ("cx", "endp", "layer4", "generic")),
+                      ("resource", ("resource", "port")),
+                      ("event", ("events", "alerts")))
+    # port queries list these in place of port names when they cover every port
+    ALL_NAMES = ("all", "list")
+
+    def __init__(self,
+                 ttl_sec: float = Default_TTL_Sec,
+                 max_entries: int = Default_Max_Entries):
+        """
+        :param ttl_sec: seconds a result is returned from the cache before it is requested again
+        :param max_entries: most results kept, the oldest is dropped when this is exceeded
+        """
+        if not ttl_sec or ttl_sec <= 0:
+            raise ValueError("ttl_sec must be greater than 0")
+        self.ttl_sec: float = ttl_sec
+        self.max_entries: int = max_entries
+        self.logger = logging.getLogger(__name__)
+        self.lock = threading.Lock()
+        self.entry_map: dict = {}  # url -> (expires_at_sec, table, eid parts, json data)
+        self.hits: int = 0
+        self.misses: int = 0
+        self.expirations: int = 0
+        self.invalidations: int = 0
+        # incremented by every command and clear(), results of queries begun under an older generation are not kept
+        self.generation: int = 0
+        self.stale_puts: int = 0
+
+    @staticmethod
+    def split_url(url: str = None) -> tuple:
+        """
+        :param url: query URL, e.g. http://localhost:8080/port/1/1/sta0000,sta0001?fields=alias
+        :return: tuple of table name and list of path segments after it, e.g. ("port", ["1", "1", "sta0000,sta0001"])
+        """
+        path = urlparse(url).path.strip("/")
+        segments = [segment for segment in path.split("/") if segment]
+        if not segments:
+            return "", []
+        return segments[0], segments[1:]
+
+    def get(self, url: str = None):
+        """
+        :param url: query URL
+        :return: copy of the cached json data, or None when absent or expired
+        """
+        with self.lock:
+            entry = self.entry_map.get(url)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self.entry_map[url]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.hits += 1
+            return copy.deepcopy(entry[3])
+
+    def put(self, url: str = None, json_data=None, generation: int = None):
+        """
+        :param generation: value of self.generation when the query was sent; the result is
+        dropped if a command was posted since, as it may predate the change
+        """
+        if json_data is None:
+            return
+        table, parts = self.split_url(url)
+        with self.lock:
+            if (generation is not None) and (generation != self.generation):
+                self.stale_puts += 1
+                return
+            self.entry_map.pop(url, None)
+            while len(self.entry_map) >= self.max_entries:
+                del self.entry_map[next(iter(self.entry_map))]
+            self.entry_map[url] = (time.monotonic() + self.ttl_sec, table, parts, copy.deepcopy(json_data))
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.invalidations += len(self.entry_map)
+            self.entry_map.clear()
+
+    @classmethod
+    def tables_for_command(cls, cli_cmd: str = None) -> set:
+        """
+        :param cli_cmd: name of the cli command, e.g. set_port
+        :return: set of query tables the command can change, empty when unknown
+        """
+        tables = set()
+        words = cli_cmd.lower().split("_")
+        for (word, word_tables) in cls.COMMAND_TABLES:
+            if (word in words) or ((word + "s") in words):
+                tables.update(word_tables)
+        return tables
+
+    @classmethod
+    def _matches(cls, table: str = None, parts: list = None, post_data: dict = None) -> bool:
+        # decide if a cached query on table/parts could show the entity named in post_data
+        if table in ("port", "probe", "wifi-stats", "radiostatus") and post_data.get("port"):
+            port = str(post_data.get("port")).split(".")[-1]
+            resource = post_data.get("resource")
+            if (len(parts) > 1) and (resource is not None) and (parts[1] not in cls.ALL_NAMES) \
+                    and (parts[1] != str(resource)):
+                return False
+            if (len(parts) > 2) and (parts[2] not in cls.ALL_NAMES) and (port not in cls.ALL_NAMES):
+                return port in parts[2].split(",")
+            return True
+        if table in ("cx", "endp", "layer4", "generic"):
+            names = [str(post_data[key]) for key in ("cx_name", "endp_name", "name", "alias")
+                     if post_data.get(key) and str(post_data[key]) != "all"]
+            if not names or not parts or (parts[0] in cls.ALL_NAMES):
+                return True
+            for requested in parts[0].split(","):
+                for name in names:
+                    if (name in requested) or (requested in name):
+                        return True
+            return False
+        if table == "resource" and (post_data.get("resource") is not None) and (len(parts) > 1):
+            return parts[1] in cls.ALL_NAMES or parts[1] == str(post_data.get("resource"))
+        return True
+
+    def invalidate_command(self, url: str = None, post_data: dict = None):
+        """
+        Drop cached queries that the command posted to url could change. Called before the
+        command is sent and again once it returns, so results fetched while it was applied are dropped too.
+        :param url: command URL, e.g. http://localhost:8080/cli-json/set_port
+        :param post_data: command parameters
+        """
+        table, parts = self.split_url(url)
+        if table != "cli-json" or not parts:
+            return
+        tables = self.tables_for_command(parts[-1])
+        if not post_data:
+            post_data = {}
+        with self.lock:
+            self.generation += 1
+            if not self.entry_map:
+                return
+            dropped = []
+            for (cached_url, entry) in self.entry_map.items():
+                if not tables:
+                    dropped.append(cached_url)
+                elif (entry[1] in tables) and self._matches(table=entry[1], parts=entry[2], post_data=post_data):
+                    dropped.append(cached_url)
+            for cached_url in dropped:
+                del self.entry_map[cached_url]
+            self.invalidations += len(dropped)
+        if dropped:
+            self.logger.debug("query cache: %s dropped %d entries" % (parts[-1], len(dropped)))
+
+    def get_stats(self) -> dict:
+        """
+        :return: dict of cache hit/miss counters and the number of cached results
+        """
+        with self.lock:
+            requests = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / requests) if requests else 0.0,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "stale_puts": self.stale_puts,
+                "entries": len(self.entry_map),
+            }
+
+
 class BaseLFJsonRequest:
     """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
         Perform HTTP get/post/put/delete with extensions specific to LANforge JSON
@@ -303,6 +835,20 @@ class BaseLFJsonRequest:
             self.logger.debug(f"{__class__!s}: url [{url}] now [{corrected_url}]")
         return corrected_url
 
+    def urlopen(self, request_: urllib.request.Request = None):
+        """
+        Submit request_ over the session connection pool when one is available,
+        otherwise through urllib.request.urlopen (e.g. when proxies are installed).
+        :param request_: urllib.request.Request to submit
+        :return: PooledHTTPResponse or http.client.HTTPResponse
+        """
+        pool: LFConnectionPool = None
+        if self.session_instance:
+            pool = self.session_instance.get_connection_pool()
+        if pool:
+            return pool.urlopen(request_)
+        return urllib.request.urlopen(request_)
+
     def add_error(self, message: str = None):
         if not message:
             return
@@ -397,7 +943,7 @@ class BaseLFJsonRequest:
         myrequest.headers['Content-type'] = 'application/x-www-form-urlencoded'
 
         try:
-            resp = urllib.request.urlopen(myrequest)
+            resp = self.urlopen(myrequest)
             responses.append(resp)
             return responses[0]
 
@@ -425,6 +971,70 @@ class BaseLFJsonRequest:
             exit(1)
         return None
 
+    def prepare_post_data(self,
+                          post_data: dict = None,
+                          debug: bool = False,
+                          suppress_related_commands=False):
+        """
+        Set the suppress_* flags and base64 encode complex values of post_data in place,
+        as expected by the GUI's /cli-json/ responders.
+        :param post_data: command parameters
+        :param debug: add the __debug flag
+        :param suppress_related_commands: see json_post()
+        """
+        if suppress_related_commands is None:
+            if 'suppress_preexec_cli' in post_data:
+                del post_data['suppress_preexec_cli']
+            if 'suppress_preexec_method' in post_data:
+                del post_data['suppress_preexec_method']
+            if 'suppress_postexec_cli' in post_data:
+                del post_data['suppress_postexec_cli']
+            if 'suppress_postexec_method' in post_data:
+                del post_data['suppress_postexec_method']
+        elif not suppress_related_commands:
+            post_data['suppress_preexec_cli'] = False
+            post_data['suppress_preexec_method'] = False
+            post_data['suppress_postexec_cli'] = False
+            post_data['suppress_postexec_method'] = False
+        elif suppress_related_commands:
+            post_data['suppress_preexec_cli'] = True
+            post_data['suppress_preexec_method'] = True
+            post_data['suppress_postexec_cli'] = True
+            post_data['suppress_postexec_method'] = True
+
+        if debug:
+            post_data['__debug'] = 1
+
+        # self.logger.warning("Post_data: "+pformat(post_data))
+        # self.logger.warning("Encoded Post_data: %s"%json.dumps(post_data).encode("utf-8"))
+        change_list = []
+        for (key, value) in post_data.items():
+            if not isinstance(value, str):
+                continue
+            if ((value.find("\\") >= 0)
+                    or (value.find("\n") >= 0)
+                    or (value.find("\r") >= 0)
+                    or (value.find("\t") >= 0)):
+                if key.endswith(BaseLFJsonRequest.BASE64_SUFFIX):
+                    self.logger.warning(f"Post_data: {pformat(post_data)}")
+                    self.logger.error(f"Misformatted post_data key: {key}")
+                    raise ValueError(
+                        f"Complex value submitted in a base64 tagged parameter [{key}]. Cannot continue")
+                change_list.append(key)
+
+        if change_list:
+            for key in change_list:
+                value = post_data[key]
+                # base64.encodebytes provides MIME encoding which appears to be sufficient for JSON
+                # if we need to move to base64 URL encoding, please test, but CliCmd.java should
+                # maintain both decodings depending on the detection of _ and - characters
+                new_value = base64.encodebytes(value.encode("utf-8")).decode("ascii")
+                new_key = key + BaseLFJsonRequest.BASE64_SUFFIX
+                del post_data[key]
+                post_data[new_key] = new_value
+                self.logger.info("replaced key[%s] with new key: %s" % (key, new_key))
+                self.logger.info("new value [%s]" % (new_value))
+
     def json_post(self,
                   url: str = "",
                   post_data: dict = None,
@@ -460,14 +1070,11 @@ class BaseLFJsonRequest:
         die_on_error |= self.die_on_error
         if not self.session_instance:
             self.logger.warning("json_post: no session_instance!")
-        if BaseSession.session_id != self.session_instance.get_session_id():
-            self.logger.error("BaseLFJsonRequest.session_id[%s] != session.get_session_id: [%s]"
-                              % (BaseSession.session_id, self.session_instance.get_session_id()))
-            if die_on_error:
-                exit(1)
         responses: list = []  # p3.9 list[HTTPResponse]
         url = self.get_corrected_url(url)
         self.logger.debug(f"url: {url}")
+        if self.session_instance.get_query_cache():
+            self.session_instance.get_query_cache().invalidate_command(url=url, post_data=post_data)
 
         if (post_data is None) or (post_data is self.No_Data):
             # this is sending a post request without data
@@ -476,58 +1083,9 @@ class BaseLFJsonRequest:
                                         method=method_,
                                         data=post_data)
         else:
-            if suppress_related_commands is None:
-                if 'suppress_preexec_cli' in post_data:
-                    del post_data['suppress_preexec_cli']
-                if 'suppress_preexec_method' in post_data:
-                    del post_data['suppress_preexec_method']
-                if 'suppress_postexec_cli' in post_data:
-                    del post_data['suppress_postexec_cli']
-                if 'suppress_postexec_method' in post_data:
-                    del post_data['suppress_postexec_method']
-            elif not suppress_related_commands:
-                post_data['suppress_preexec_cli'] = False
-                post_data['suppress_preexec_method'] = False
-                post_data['suppress_postexec_cli'] = False
-                post_data['suppress_postexec_method'] = False
-            elif suppress_related_commands:
-                post_data['suppress_preexec_cli'] = True
-                post_data['suppress_preexec_method'] = True
-                post_data['suppress_postexec_cli'] = True
-                post_data['suppress_postexec_method'] = True
-
-            if debug:
-                post_data['__debug'] = 1
-
-            # self.logger.warning("Post_data: "+pformat(post_data))
-            # self.logger.warning("Encoded Post_data: %s"%json.dumps(post_data).encode("utf-8"))
-            change_list = []
-            for (key, value) in post_data.items():
-                if not isinstance(value, str):
-                    continue
-                if ((value.find("\\") >= 0)
-                        or (value.find("\n") >= 0)
-                        or (value.find("\r") >= 0)
-                        or (value.find("\t") >= 0)):
-                    if key.endswith(BaseLFJsonRequest.BASE64_SUFFIX):
-                        self.logger.warning(f"Post_data: {pformat(post_data)}")
-                        self.logger.error(f"Misformatted post_data key: {key}")
-                        raise ValueError(
-                            f"Complex value submitted in a base64 tagged parameter [{key}]. Cannot continue")
-                    change_list.append(key)
-
-            if change_list:
-                for key in change_list:
-                    value = post_data[key]
-                    # base64.encodebytes provides MIME encoding which appears to be sufficient for JSON
-                    # if we need to move to base64 URL encoding, please test, but CliCmd.java should
-                    # maintain both decodings depending on the detection of _ and - characters
-                    new_value = base64.encodebytes(value.encode("utf-8")).decode("ascii")
-                    new_key = key + BaseLFJsonRequest.BASE64_SUFFIX
-                    del post_data[key]
-                    post_data[new_key] = new_value
-                    self.logger.info("replaced key[%s] with new key: %s" % (key, new_key))
-                    self.logger.info("new value [%s]" % (new_value))
+            self.prepare_post_data(post_data=post_data,
+                                   debug=debug,
+                                   suppress_related_commands=suppress_related_commands)
 
             myrequest = request.Request(url=url,
                                         method=method_,
@@ -573,7 +1131,11 @@ class BaseLFJsonRequest:
         attempt = 1
         while (time.time() * 1000) < finish_time_ms:
             try:
-                response = urllib.request.urlopen(myrequest)
+                try:
+                    response = self.urlopen(myrequest)
+                finally:
+                    if self.session_instance.get_query_cache():
+                        self.session_instance.get_query_cache().invalidate_command(url=url, post_data=post_data)
                 resp_data = response.read().decode('utf-8')
                 if self.receives_async_feedback and (response_json_list is None and resp_data):
                     self.logger.warning("json_post: POST to URL has data: " + url)
@@ -598,9 +1160,10 @@ class BaseLFJsonRequest:
                     self.logger.debug(pformat(header_items))
 
                 if SESSION_HEADER in header_items:
-                    if BaseSession.session_id != response.getheader(SESSION_HEADER):
+                    if self.session_instance.get_session_id() != response.getheader(SESSION_HEADER):
                         self.logger.warning("established session header [%s] different from response session header[%s]"
-                                            % (BaseSession.session_id, response.getheader(SESSION_HEADER)))
+                                            % (self.session_instance.get_session_id(),
+                                               response.getheader(SESSION_HEADER)))
                 if errors_warnings:
                     for header in header_items:
                         if header[0].startswith("X-Error") == 0:
@@ -788,8 +1351,8 @@ class BaseLFJsonRequest:
         requested_url = self.get_corrected_url(url,
                                                debug=debug | self.debug_on)
         #pprint(["get,default_headers", self.default_headers])
-        if BaseSession.session_id:
-            self.default_headers[SESSION_HEADER] = BaseSession.session_id
+        if self.session_instance.get_session_id():
+            self.default_headers[SESSION_HEADER] = self.session_instance.get_session_id()
         myrequest = request.Request(url=requested_url,
                                     headers=self.default_headers,
                                     method=method_)
@@ -798,7 +1361,7 @@ class BaseLFJsonRequest:
 
         myresponses: list = []  # list[HTTPResponse]
         try:
-            myresponses.append(request.urlopen(myrequest))
+            myresponses.append(self.urlopen(myrequest))
             return myresponses[0]
 
         except urllib.error.HTTPError as herror:
@@ -914,7 +1477,7 @@ class BaseLFJsonRequest:
             if wait_sec:
                 time.sleep(wait_sec)
             try:
-                if not BaseSession.session_id:
+                if not self.session_instance.get_session_id():
                     logging.info("json_get lacks session_id")
                 json_response = self.get_as_json(url=url,
                                                  debug=debug,
@@ -1002,6 +1565,39 @@ class JsonQuery(BaseLFJsonRequest):
                          debug=debug | session_obj.is_debug(),
                          exit_on_error=exit_on_error)
 
+    def json_get(self,
+                 url: str = None,
+                 debug: bool = False,
+                 wait_sec: float = None,
+                 request_timeout_sec: float = None,
+                 max_timeout_sec: float = None,
+                 errors_warnings: list = None):
+        """
+        Returns json record from GET request, answered from the session query cache when
+        the session has one and holds an unexpired result for this URL. See BaseLFJsonRequest.json_get
+        """
+        query_cache: LFQueryCache = self.session_instance.get_query_cache()
+        if not query_cache or nott(url):
+            return super().json_get(url=url,
+                                    debug=debug,
+                                    wait_sec=wait_sec,
+                                    request_timeout_sec=request_timeout_sec,
+                                    max_timeout_sec=max_timeout_sec,
+                                    errors_warnings=errors_warnings)
+        url = self.get_corrected_url(url=url)
+        json_response = query_cache.get(url=url)
+        if json_response is not None:
+            return json_response
+        generation = query_cache.generation
+        json_response = super().json_get(url=url,
+                                         debug=debug,
+                                         wait_sec=wait_sec,
+                                         request_timeout_sec=request_timeout_sec,
+                                         max_timeout_sec=max_timeout_sec,
+                                         errors_warnings=errors_warnings)
+        query_cache.put(url=url, json_data=json_response, generation=generation)
+        return json_response
+
 
 class JsonCommand(BaseLFJsonRequest):
     def __init__(self,
@@ -1147,11 +1743,243 @@ class JsonCommand(BaseLFJsonRequest):
                 sys.exit(1)
             return False
 
-        BaseSession.session_id = first_response.getheader(SESSION_HEADER)
-        # print(f"BASESESSION SESSION_ID: {BaseSession.session_id}")
-        self.default_headers[SESSION_HEADER] = BaseSession.session_id
+        self.session_instance.session_id = first_response.getheader(SESSION_HEADER)
+        # kept for scripts that read the class attribute, it holds the latest session established
+        BaseSession.session_id = self.session_instance.session_id
+        self.default_headers[SESSION_HEADER] = self.session_instance.session_id
         return True
 
+    def batch(self,
+              batch_size: int = None,
+              debug: bool = False) -> 'JsonCommandBatch':
+        """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Collect post_* calls and submit them in pipelined groups. See JsonCommandBatch.
+
+        Example Usage:
+            with session.batch(batch_size=64) as b:
+                for name in station_names:
+                    b.post_add_sta(radio='wiphy0', sta_name=name, ...)
+                    b.post_set_port(port=name, ...)
+            if b.result.has_errors():
+                pprint(b.result.get_errors())
+        ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+        return JsonCommandBatch(command_obj=self,
+                                batch_size=batch_size,
+                                debug=debug | self.debug_on)
+
+
+class BatchCommandResult:
+    """
+    Outcome of one command submitted through a JsonCommandBatch
+    """
+    def __init__(self,
+                 url: str = None,
+                 post_data: dict = None):
+        self.url: str = url
+        self.post_data: dict = post_data
+        self.status: int = 0
+        self.response_json = None
+        self.errors: list = []
+        self.warnings: list = []
+
+    def get_cli_cmd(self) -> str:
+        return self.url[self.url.rfind('/') + 1:]
+
+    def is_ok(self) -> bool:
+        return (self.status in BaseLFJsonRequest.OK_STATUSES) and not self.errors
+
+    def __repr__(self):
+        return "<%s %s status:%s errors:%s>" % (self.__class__.__name__, self.get_cli_cmd(), self.status, self.errors)
+
+
+class JsonCommandBatchResult:
+    """
+    Per-command results of every group flushed by a JsonCommandBatch, in submission order
+    """
+    def __init__(self):
+        self.results: list = []  # list[BatchCommandResult]
+        self.groups_sent: int = 0
+
+    def has_errors(self) -> bool:
+        return len(self.get_failed()) > 0
+
+    def get_failed(self) -> list:
+        return [result for result in self.results if not result.is_ok()]
+
+    def get_errors(self) -> list:
+        """
+        :return: list of (cli command, post_data, error message) for every failed command
+        """
+        errors = []
+        for result in self.get_failed():
+            for message in (result.errors or ["HTTP %s" % result.status]):
+                errors.append((result.get_cli_cmd(), result.post_data, message))
+        return errors
+
+    def __len__(self):
+        return len(self.results)
+
+
+class JsonCommandBatch:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Records post_* calls made against it instead of sending them, then submits the
+        recorded commands in groups of batch_size. When the session has a connection
+        pool each group is pipelined over one keep-alive connection, so a group costs a
+        single round trip and commands still reach the GUI in the order they were made.
+        Without a pool (proxied sessions) commands are posted one at a time.
+
+        Any post_* method of the command instance can be called on the batch. Those
+        calls return None; their response_json_list and errors_warnings arguments are
+        filled in when the group they belong to is flushed. The batch flushes itself
+        when batch_size commands are pending and when the with-block exits.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    Default_Batch_Size: int = 32
+
+    def __init__(self,
+                 command_obj: JsonCommand = None,
+                 batch_size: int = None,
+                 debug: bool = False):
+        if not command_obj:
+            raise ValueError("JsonCommandBatch requires command_obj")
+        if not batch_size:
+            batch_size = self.Default_Batch_Size
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.command_instance: JsonCommand = command_obj
+        self.batch_size: int = batch_size
+        self.debug_on: bool = debug
+        self.die_on_error: bool = command_obj.die_on_error
+        self.logger = logging.getLogger(__name__)
+        self.pending: list = []  # list of (BatchCommandResult, request, response_json_list, errors_warnings, die_on_error)
+        self.result: JsonCommandBatchResult = JsonCommandBatchResult()
+
+    def __getattr__(self, name: str):
+        # bind post_* methods of the command class to this batch so their json_post() lands here
+        attr = getattr(type(self.command_instance), name, None)
+        if name.startswith("post_") and callable(attr):
+            return attr.__get__(self, type(self))
+        return getattr(self.command_instance, name)
+
+    def __enter__(self) -> 'JsonCommandBatch':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
+        elif self.pending:
+            self.logger.warning("JsonCommandBatch: discarding %d unsent commands after %s"
+                                % (len(self.pending), exc_type.__name__))
+            self.pending.clear()
+        return False
+
+    def json_post(self,
+                  url: str = "",
+                  post_data: dict = None,
+                  debug: bool = False,
+                  die_on_error: bool = False,
+                  errors_warnings: list = None,
+                  response_json_list: list = None,
+                  suppress_related_commands=False,
+                  **kwargs):
+        """
+        Queue a command; called by the post_* methods.
+        :param die_on_error: exit() when this command fails, checked when its group is flushed
+        :return: None, responses are available after flush()
+        """
+        command = self.command_instance
+        url = command.get_corrected_url(url)
+        if post_data is None or post_data is BaseLFJsonRequest.No_Data:
+            post_data = {}
+        command.prepare_post_data(post_data=post_data,
+                                  debug=debug | self.debug_on,
+                                  suppress_related_commands=suppress_related_commands)
+        headers = dict(command.default_headers)
+        headers['Content-type'] = 'application/json'
+        if iss(command.session_instance.get_session_id()):
+            headers[SESSION_HEADER] = str(command.session_instance.get_session_id())
+        myrequest = request.Request(url=url,
+                                    method='POST',
+                                    data=json.dumps(post_data).encode("utf-8"),
+                                    headers=headers)
+        result = BatchCommandResult(url=url, post_data=post_data)
+        self.pending.append((result, myrequest, response_json_list, errors_warnings, die_on_error | self.die_on_error))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+        return None
+
+    def flush(self) -> JsonCommandBatchResult:
+        """
+        Submit pending commands in groups of batch_size.
+        :return: the JsonCommandBatchResult accumulated so far
+        """
+        while self.pending:
+            group = self.pending[:self.batch_size]
+            self.pending = self.pending[self.batch_size:]
+            self._send_group(group)
+            self.result.groups_sent += 1
+        return self.result
+
+    def _send_group(self, group: list = None):
+        query_cache: LFQueryCache = self.command_instance.session_instance.get_query_cache()
+        if query_cache:
+            for (result, _, _, _, _) in group:
+                query_cache.invalidate_command(url=result.url, post_data=result.post_data)
+        pool: LFConnectionPool = self.command_instance.session_instance.get_connection_pool()
+        if pool:
+            responses = pool.pipeline(request_list=[item[1] for item in group])
+        else:
+            responses = []
+            for (_, myrequest, _, _, _) in group:
+                try:
+                    responses.append(self.command_instance.urlopen(myrequest))
+                except (urllib.error.HTTPError, urllib.error.URLError) as error:
+                    responses.append(error)
+        if query_cache:
+            # again once the GUI has answered, queries made meanwhile may hold the old state
+            for (result, _, _, _, _) in group:
+                query_cache.invalidate_command(url=result.url, post_data=result.post_data)
+
+        for ((result, myrequest, response_json_list, errors_warnings, die_on_error), response) in zip(group, responses):
+            self._record(result=result, response=response)
+            if (response_json_list is not None) and (result.response_json is not None):
+                response_json_list.append(result.response_json)
+            if errors_warnings is not None:
+                errors_warnings.extend(result.errors)
+                errors_warnings.extend(result.warnings)
+            self.result.results.append(result)
+            if not result.is_ok():
+                self.command_instance.add_error("%s: %s" % (result.get_cli_cmd(), result.errors))
+                if die_on_error and (result.status != 404):
+                    sys.exit(1)
+
+    @staticmethod
+    def _record(result: BatchCommandResult = None, response=None):
+        if isinstance(response, urllib.error.HTTPError):
+            result.status = response.code
+            result.errors.append("[HTTP %s] %s" % (response.code, response.reason))
+            if response.headers:
+                for headername in sorted(response.headers.keys()):
+                    if headername.startswith("X-Error-"):
+                        result.errors.append("%s: %s" % (headername, response.headers.get(headername)))
+            return
+        if isinstance(response, Exception):
+            result.errors.append(str(response))
+            return
+        result.status = response.status
+        resp_data = response.read().decode('utf-8')
+        if not (200 <= response.status < 300):
+            result.errors.append("[HTTP %s] %s" % (response.status, response.reason))
+        if not resp_data:
+            return
+        try:
+            result.response_json = json.loads(resp_data)
+        except ValueError:
+            result.errors.append("unable to decode response: %s" % resp_data[:120])
+            return
+        if isinstance(result.response_json, dict):
+            result.errors.extend(result.response_json.get("errors") or [])
+            result.warnings.extend(result.response_json.get("warnings") or [])
+
 
 class BaseSession:
     """
@@ -1178,7 +2006,11 @@ class BaseSession:
                  retry_sec: float = Default_Retry_Sec,
                  stream_errors: bool = True,
                  stream_warnings: bool = False,
-                 exit_on_error: bool = False):
+                 exit_on_error: bool = False,
+                 keep_alive: bool = True,
+                 pool_max_connections: int = LFConnectionPool.Default_Max_Connections,
+                 pool_idle_timeout_sec: float = LFConnectionPool.Default_Idle_Timeout_Sec,
+                 query_cache_ttl_sec: float = None):
         self.debug_on = debug
         # self.logger = Logg(name='json_api_session')
         self.logger = logging.getLogger(__name__)
@@ -1210,7 +2042,15 @@ class BaseSession:
         self.stream_warnings = False
         self.session_connection_check: bool
         self.session_connection_check = False
+        # id of this session's GUI connection, BaseSession.session_id only holds the latest one established
+        self.session_id: str = None
         self.session_started_at: int = 0
+        self.connection_pool: LFConnectionPool
+        self.connection_pool = None
+        self.query_cache: LFQueryCache
+        self.query_cache = None
+        if query_cache_ttl_sec:
+            self.query_cache = LFQueryCache(ttl_sec=query_cache_ttl_sec)
 
         # please see this discussion on ProxyHandlers:
         # https://docs.python.org/3/library/urllib.request.html#urllib.request.ProxyHandler
@@ -1239,6 +2079,12 @@ class BaseSession:
         self.stream_errors = stream_errors
         self.stream_warnings = stream_warnings
 
+        # persistent connections bypass urllib openers, so proxied sessions keep using urlopen()
+        if keep_alive and not self.proxies_installed:
+            self.connection_pool = LFConnectionPool(max_connections=pool_max_connections,
+                                                    idle_timeout_sec=pool_idle_timeout_sec,
+                                                    connection_timeout_sec=self.connection_timeout_sec)
+
         # if debug:
         #     if self.proxies is None:
         #         print("BaseSession _init_: no proxies")
@@ -1301,10 +2147,12 @@ class BaseSession:
         if not self.session_connection_check:
             self.logger.warning("%s no connection established, exiting" % self.session_connection_check)
             return
-        self.logger.debug("%s: asking for session %s to end" % (__name__, BaseSession.session_id))
+        self.logger.debug("%s: asking for session %s to end" % (__name__, self.session_id))
         BaseSession.end_session(command_obj=self.command_instance,
-                                session_id_=BaseSession.session_id,
+                                session_id_=self.session_id,
                                 debug=False)
+        if self.connection_pool:
+            self.connection_pool.close()
 
     def get_command(self) -> 'JsonCommand':
         """
@@ -1351,7 +2199,7 @@ class BaseSession:
         return self.debug_on
 
     def get_session_id(self) -> str:
-        return BaseSession.session_id
+        return self.session_id
 
     def get_session_based_key(self) -> str:
         """
@@ -1359,8 +2207,8 @@ class BaseSession:
         :return: modestly random string prefixed with the alphanumeric characters of the existing session
         """
         short_session : str = None
-        if BaseSession.session_id:
-            short_session = re.sub("[^A-Za-z0-9]", "", BaseSession.session_id)
+        if self.session_id:
+            short_session = re.sub("[^A-Za-z0-9]", "", self.session_id)
         else:
             short_session = "00000"
         return short_session+"KEY"+''.join(random.choice(string.ascii_lowercase + string.digits) for _ in range(12))
@@ -1371,6 +2219,53 @@ class BaseSession:
     def get_timeout_sec(self) -> float:
         return self.connection_timeout_sec
 
+    def get_connection_pool(self) -> LFConnectionPool:
+        return self.connection_pool
+
+    def get_pool_stats(self) -> dict:
+        """
+        :return: keep-alive connection pool counters, see LFConnectionPool.get_stats()
+        """
+        if not self.connection_pool:
+            return {}
+        return self.connection_pool.get_stats()
+
+    def get_query_cache(self) -> LFQueryCache:
+        return self.query_cache
+
+    def enable_query_cache(self, ttl_sec: float = LFQueryCache.Default_TTL_Sec) -> LFQueryCache:
+        """
+        Start caching query results for ttl_sec seconds, see LFQueryCache
+        :return: the session LFQueryCache
+        """
+        if self.query_cache:
+            self.query_cache.ttl_sec = ttl_sec
+        else:
+            self.query_cache = LFQueryCache(ttl_sec=ttl_sec)
+        return self.query_cache
+
+    def disable_query_cache(self):
+        self.query_cache = None
+
+    def get_cache_stats(self) -> dict:
+        """
+        :return: query cache counters, see LFQueryCache.get_stats()
+        """
+        if not self.query_cache:
+            return {}
+        return self.query_cache.get_stats()
+
+    def batch(self,
+              batch_size: int = None,
+              debug: bool = False) -> 'JsonCommandBatch':
+        """
+        Collect post_* calls from the session command instance and submit them in pipelined groups.
+        :param batch_size: number of commands submitted per group
+        :param debug: turn on diagnostic information
+        :return: JsonCommandBatch, a context manager
+        """
+        return self.get_command().batch(batch_size=batch_size, debug=debug)
+
     @classmethod
     def end_session(cls,
                     command_obj: JsonCommand = None,
@@ -24495,7 +25390,11 @@ class LFSession(BaseSession):
                  stream_errors: bool = True,
                  stream_warnings: bool = False,
                  require_session: bool = False,
-                 exit_on_error: bool = False):
+                 exit_on_error: bool = False,
+                 keep_alive: bool = True,
+                 pool_max_connections: int = LFConnectionPool.Default_Max_Connections,
+                 pool_idle_timeout_sec: float = LFConnectionPool.Default_Idle_Timeout_Sec,
+                 query_cache_ttl_sec: float = None):
         """
         :param debug: turn on diagnostic information
         :param proxy_map: a dict with addresses of proxies to route requests through.
@@ -24508,6 +25407,12 @@ class LFSession(BaseSession):
         :param require_session: exit(1) if unable to establish a session_id
         :param exit_on_error: on requests failing HTTP requests on besides error 404,
         exit(1). This does not include failing to establish a session_id
+        :param keep_alive: reuse persistent HTTP/1.1 connections to the GUI for queries and commands.
+        This is disabled when a proxy_map is provided.
+        :param pool_max_connections: most simultaneous connections to the GUI from this session
+        :param pool_idle_timeout_sec: close pooled connections that have been idle this long
+        :param query_cache_ttl_sec: when set, LFJsonQuery results are cached this many seconds
+        and commands posted through this session invalidate the entries they change. See LFQueryCache
         """
         super().__init__(lfclient_url=lfclient_url,
                          debug=debug,
@@ -24515,17 +25420,21 @@ class LFSession(BaseSession):
                          connection_timeout_sec=connection_timeout_sec,
                          stream_errors=stream_errors,
                          stream_warnings=stream_warnings,
-                         exit_on_error=exit_on_error)
+                         exit_on_error=exit_on_error,
+                         keep_alive=keep_alive,
+                         pool_max_connections=pool_max_connections,
+                         pool_idle_timeout_sec=pool_idle_timeout_sec,
+                         query_cache_ttl_sec=query_cache_ttl_sec)
         self.command_instance = LFJsonCommand(session_obj=self, debug=debug, exit_on_error=exit_on_error)
         self.session_connection_check = \
             self.command_instance.start_session(debug=debug,
                                                 die_without_session_id_=require_session)
         if self.session_connection_check:
-            if not BaseSession.session_id:
-                self.logger.info("BaseSession.session_id absent")
+            if not self.session_id:
+                self.logger.info("LFSession.session_id absent")
         else:
             self.logger.error('LFSession failed to establish session_id') 
-        if require_session and (not BaseSession.session_id):
+        if require_session and (not self.session_id):
             self.logger.error('LFSession failed to setup session_id correctly') 
         self.query_instance = LFJsonQuery(session_obj=self, debug=debug, exit_on_error=exit_on_error)
         self.method_map : dict = {}
@@ -24545,8 +25454,8 @@ class LFSession(BaseSession):
             Remember to override this method with your session subclass, it should return LFJsonQuery
             :return: registered instance of JsonQuery
         """
-        if not BaseSession.session_id:
-            self.logger.info("get_query basesession lacks sessionid")
+        if not self.session_id:
+            self.logger.info("get_query session lacks sessionid")
         if self.query_instance:
             return self.query_instance
         self.query_instance = LFJsonQuery(session_obj=self, debug=self.debug_on, exit_on_error=self.exit_on_error)
@@ -24559,6 +25468,16 @@ class LFSession(BaseSession):
             class and method used by a python script. This provides a dyanmic approach 
             to assembling method calls at runtime.
         ---- ---- ---- ---- """
+        if cli_name not in self.get_method_map():
+            self.logger.error(f"LFSession::find_method: command '{cli_name}' not present")
+            self.print_method_map()
+            return None
+        return self.method_map[cli_name]
+
+    def get_method_map(self) -> dict:
+        """
+        :return: dict of CLI command names and query endpoints to their methods, built on first use
+        """
         if not self.method_map or len(self.method_map) < 1:
             self.method_map = {
                 "adb": self.command_instance.post_adb,
@@ -24854,11 +25773,7 @@ class LFSession(BaseSession):
                 "/wl-endp": self.query_instance.get_wl_endp,
                 "/ws-msg": self.query_instance.get_ws_msg,
             }
-        if cli_name not in self.method_map:
-            self.logger.error(f"LFSession::find_method: command '{cli_name}' not present")
-            self.print_method_map()
-            return None
-        return self.method_map[cli_name]
+        return self.method_map
 
     def print_method_map(self):
         pprint(["method_map keys:", self.method_map.keys()])
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+
+    LANforge JSON API, asyncio flavor
+
+    AsyncLFSession wraps an LFSession and exposes awaitable versions of the
+    LFJsonQuery.get_* and LFJsonCommand.post_* methods. Calls are resolved through
+    the same generated method table as LFSession.find_method() and are run on a
+    thread pool sharing the session's keep-alive connection pool, with at most
+    max_concurrency requests outstanding per session.
+
+    EXAMPLE PYTHON USAGE:
+    ----- ----- ----- 8< ----- ----- ----- 8< ----- ----- -----
+    async def main():
+        async with AsyncLFSession(lfclient_url="http://192.168.1.101:8080",
+                                  max_concurrency=16) as lab_a, \\
+                AsyncLFSession(lfclient_url="http://192.168.1.102:8080") as lab_b:
+            ports_a, ports_b = await asyncio.gather(
+                lab_a.get_port(eid_list=["1.1.list"], requested_col_names=["port", "ip"]),
+                lab_b.get_port(eid_list=["1.1.list"], requested_col_names=["port", "ip"]))
+            await asyncio.gather(*[lab_a.post_set_port(shelf=1, resource=1, port=name,
+                                                       current_flags=0, interest=0x800000)
+                                   for name in ("sta0000", "sta0001")])
+
+    asyncio.run(main())
+    ----- ----- ----- 8< ----- ----- ----- 8< ----- ----- -----
+
+    Each session presents its own session id to its GUI, so one process can drive
+    several LANforge managers at once.
+
+----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+import asyncio
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+if sys.version_info[0] != 3:
+    print("This script requires Python 3")
+    exit()
+
+# - - - - deployed import references - - - - -
+from .lanforge_api import LFSession, LFConnectionPool
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncLFSession:
+    """----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----
+        Awaitable access to one LANforge GUI. Attribute lookups of the form post_<cli_cmd>
+        and get_<endpoint> are resolved with LFSession.find_method() and return coroutine
+        functions that take the same keyword arguments as the synchronous methods.
+    ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- ----- -----"""
+    Default_Max_Concurrency: int = 8
+
+    def __init__(self, lfclient_url: str = 'http://localhost:8080',
+                 debug: bool = False,
+                 connection_timeout_sec: float = None,
+                 stream_errors: bool = True,
+                 stream_warnings: bool = False,
+                 require_session: bool = False,
+                 exit_on_error: bool = False,
+                 max_concurrency: int = Default_Max_Concurrency,
+                 session: LFSession = None):
+        """
+        :param lfclient_url: URL of the LANforge GUI, e.g. http://192.168.1.101:8080
+        :param max_concurrency: most requests this session will have outstanding at once
+        :param session: wrap an existing LFSession instead of creating one
+        Remaining parameters are passed to LFSession.
+        """
+        if not max_concurrency or max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.logger = logging.getLogger(__name__)
+        self.max_concurrency: int = max_concurrency
+        if session:
+            self.session: LFSession = session
+        else:
+            self.session = LFSession(lfclient_url=lfclient_url,
+                                     debug=debug,
+                                     connection_timeout_sec=connection_timeout_sec,
+                                     stream_errors=stream_errors,
+                                     stream_warnings=stream_warnings,
+                                     require_session=require_session,
+                                     exit_on_error=exit_on_error,
+                                     pool_max_connections=max(max_concurrency,
+                                                              LFConnectionPool.Default_Max_Connections))
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max_concurrency,
+                                                               thread_name_prefix="lf_async")
+        self.semaphore: asyncio.Semaphore = None
+
+    async def __aenter__(self) -> 'AsyncLFSession':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def __getattr__(self, name: str):
+        if name.startswith("post_"):
+            return self.find_method(name[len("post_"):])
+        if name.startswith("get_"):
+            return self.find_method("/" + name[len("get_"):].replace("_", "-"))
+        raise AttributeError(f"{self.__class__.__name__} has no attribute '{name}'")
+
+    def find_method(self, cli_name: str = None):
+        """
+        Awaitable counterpart of LFSession.find_method()
+        :param cli_name: CLI command name (add_sta) or query endpoint (/port)
+        :return: coroutine function wrapping the synchronous method
+        """
+        # look in the map first, a miss in LFSession.find_method() prints every method name
+        if cli_name not in self.session.get_method_map():
+            raise AttributeError(f"{self.__class__.__name__}: no method for '{cli_name}'")
+        return self.wrap(self.session.find_method(cli_name))
+
+    def wrap(self, method=None):
+        """
+        :param method: any blocking callable that uses this session
+        :return: coroutine function that runs method on the session thread pool
+        """
+        @functools.wraps(method)
+        async def call(*args, **kwargs):
+            return await self.run(method, *args, **kwargs)
+        return call
+
+    async def run(self, method=None, *args, **kwargs):
+        """
+        Run a blocking method on the session thread pool, limited to max_concurrency at once.
+        """
+        if self.semaphore is None:
+            # created here so it belongs to the running event loop
+            self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self.semaphore:
+            loop = asyncio.get_event_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(method, *args, **kwargs))
+
+    async def get_port(self, **kwargs):
+        return await self.run(self.session.get_query().get_port, **kwargs)
+
+    async def get_endp(self, **kwargs):
+        return await self.run(self.session.get_query().get_endp, **kwargs)
+
+    async def get_cx(self, **kwargs):
+        return await self.run(self.session.get_query().get_cx, **kwargs)
+
+    async def get_events(self, **kwargs):
+        return await self.run(self.session.get_query().get_events, **kwargs)
+
+    async def events_since(self, **kwargs):
+        return await self.run(self.session.get_query().events_since, **kwargs)
+
+    async def events_last_events(self, **kwargs):
+        return await self.run(self.session.get_query().events_last_events, **kwargs)
+
+    def get_pool_stats(self) -> dict:
+        return self.session.get_pool_stats()
+
+    def close(self):
+        """ wait for running requests, then release the thread pool and idle connections """
+        self.executor.shutdown(wait=True)
+        if self.session.get_connection_pool():
+            self.session.get_connection_pool().close()
@@ -686,32 +686,191 @@ def find_port_eids(resource_id=1, base_url="http://localhost:8080", port_names=(
     return port_eids
 
 
-def waitUntilPortsAdminDown(resource_id=1, base_url="http://localhost:8080", port_list=()):
-    return wait_until_ports_admin_down(resource_id=resource_id, base_url=base_url, port_list=port_list)
+# Predicates for PortStateWaiter. Each is handed the port record from /port (a dict
+# of the requested fields) or None when the port was not in the listing.
+def port_is_present(record):
+    return (record is not None) and not record.get('phantom', False)
 
 
-def wait_until_ports_admin_down(resource_id=1, base_url="http://localhost:8080", debug_=False, port_list=(), timeout_sec=360):
-    print("Waiting until ports appear admin-down...")
-    port_url = "/port/1"
-    for _ in range(0, timeout_sec):
-        up_stations = []
-        for port_name in port_list:
-            uri = "%s/%s/%s?fields=device,down" % (port_url, resource_id, port_name)
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug_)
+def port_is_gone(record):
+    return record is None
+
+
+def port_is_admin_up(record):
+    return (record is not None) and not record.get('down', True)
+
+
+def port_is_admin_down(record):
+    # a port that has vanished is not going to be admin-up either
+    return (record is None) or bool(record.get('down', False))
+
+
+def port_is_associated(record):
+    return (record is not None) and record.get('ap', 'NA') not in ('', 'NA', 'Not-Associated')
+
+
+IP_WAITING_STATES = ("0.0.0.0", "NA", "", 'DELETED', 'AUTO')
+
+
+def port_has_ip(record, ipv4=True, ipv6=False):
+    if record is None:
+        return False
+    if ipv4 and record.get('ip', '') in IP_WAITING_STATES:
+        return False
+    if ipv6:
+        ip6a = record.get('ipv6_address', record.get('ipv6 address', 'AUTO'))
+        if ip6a in ('DELETED', 'AUTO') or ip6a.startswith('fe80'):
+            return False
+    return True
+
+
+class PortStateWaiter:
+    """
+    Wait for a predicate to hold for every port in port_list, fetching all of the
+    ports in one /port request per pass instead of one request per port.
+
+    Lists of up to bulk_threshold ports are requested as /port/1/<rid>/<name>,<name>...
+    (one request per resource); longer lists use /port/all and are filtered locally.
+    The polling interval starts at min_interval_sec, grows towards max_interval_sec
+    while no port changes state and drops back when ports make progress.
+    time_to_state records the seconds each port took to first satisfy the predicate.
+
+    Example:
+        waiter = PortStateWaiter(base_url=url, port_list=['1.1.sta0000', '1.1.sta0001'],
+                                 predicate=port_is_admin_up, fields=['down'])
+        if not waiter.wait(timeout_sec=120):
+            print("still down:", waiter.pending)
+    """
+
+    def __init__(self,
+                 base_url="http://localhost:8080",
+                 port_list=(),
+                 predicate=port_is_present,
+                 fields=None,
+                 min_interval_sec=0.25,
+                 max_interval_sec=2.0,
+                 bulk_threshold=32,
+                 on_pass=None,
+                 debug=False):
+        """
+        :param port_list: port EIDs, e.g. 1.1.sta0000, or a single EID string
+        :param predicate: callable(record) -> bool, see port_is_admin_up() and friends
+        :param fields: port columns the predicate needs, 'alias' is always requested
+        :param on_pass: optional callable(waiter, pending_eids, elapsed_sec) run after each pass
+        """
+        if isinstance(port_list, str):
+            port_list = [port_list]
+        self.base_url = base_url
+        self.predicate = predicate
+        self.fields = ['alias'] + [field for field in (fields or []) if field != 'alias']
+        self.min_interval_sec = min_interval_sec
+        self.max_interval_sec = max_interval_sec
+        self.bulk_threshold = bulk_threshold
+        self.on_pass = on_pass
+        self.debug = debug
+        self.eid_map = {}  # normalized shelf.resource.name -> eid as given
+        for port_eid in port_list:
+            eid = name_to_eid(port_eid)
+            self.eid_map["%s.%s.%s" % (eid[0], eid[1], eid[2])] = port_eid
+        self.records = {}
+        self.pending = set(self.eid_map.values())
+        self.time_to_state = {}
+        self.passes = 0
+
+    def query_urls(self):
+        fields = ",".join(self.fields)
+        if len(self.eid_map) > self.bulk_threshold:
+            return ["/port/all?fields=%s" % fields]
+        names_by_resource = {}
+        for key in self.eid_map.keys():
+            shelf, resource, name = key.split('.', 2)
+            names_by_resource.setdefault((shelf, resource), []).append(name)
+        return ["/port/%s/%s/%s?fields=%s" % (shelf, resource, ",".join(names), fields)
+                for ((shelf, resource), names) in names_by_resource.items()]
+
+    def fetch(self):
+        """
+        :return: dict of normalized port EID to port record for every requested port found
+        """
+        found = {}
+        for uri in self.query_urls():
+            lf_r = LFRequest.LFRequest(self.base_url, uri, debug_=self.debug)
             json_response = lf_r.get_as_json()
             if json_response is None:
-                if debug_:
-                    print("port %s disappeared" % port_name)
                 continue
-            if "interface" in json_response:
-                json_response = json_response['interface']
-            if json_response['down'] == "false":
-                up_stations.append(port_name)
-        if len(up_stations) == 0:
+            if ("interface" in json_response) and not uri.startswith("/port/all"):
+                # a single match comes back without its EID, rebuild it from the url
+                shelf, resource = uri.split('/')[2:4]
+                record = json_response["interface"]
+                found["%s.%s.%s" % (shelf, resource, record.get('alias'))] = record
+            elif "interfaces" in json_response:
+                found.update(list_to_alias_map(json_response, from_element="interfaces", debug_=self.debug))
+        return found
+
+    def check(self, elapsed_sec=0.0):
+        """
+        Fetch the ports once and evaluate the predicate over all of them.
+        :return: number of ports that newly satisfied the predicate on this pass
+        """
+        found = self.fetch()
+        self.passes += 1
+        progress = 0
+        pending = set()
+        for (key, port_eid) in self.eid_map.items():
+            record = found.get(key)
+            self.records[port_eid] = record
+            if self.predicate(record):
+                if port_eid not in self.time_to_state:
+                    self.time_to_state[port_eid] = elapsed_sec
+                    progress += 1
+            else:
+                pending.add(port_eid)
+        self.pending = pending
+        return progress
+
+    def wait(self, timeout_sec=300):
+        """
+        :return: True when every port satisfies the predicate on the same pass, False on timeout
+        """
+        if not self.eid_map:
             return True
-        sleep(1)
+        start_time = time.monotonic()
+        interval_sec = self.min_interval_sec
+        while True:
+            elapsed_sec = time.monotonic() - start_time
+            progress = self.check(elapsed_sec=elapsed_sec)
+            if not self.pending:
+                return True
+            if self.on_pass:
+                self.on_pass(self, self.pending, elapsed_sec)
+            if self.debug:
+                logger.debug("PortStateWaiter: %s of %s ports pending after %.1fs"
+                             % (len(self.pending), len(self.eid_map), elapsed_sec))
+            if (time.monotonic() - start_time) >= timeout_sec:
+                return False
+            if progress:
+                interval_sec = self.min_interval_sec
+            else:
+                interval_sec = min(interval_sec * 1.5, self.max_interval_sec)
+            sleep(min(interval_sec, max(0.0, timeout_sec - (time.monotonic() - start_time))))
 
-    return False
+
+def waitUntilPortsAdminDown(resource_id=1, base_url="http://localhost:8080", port_list=()):
+    return wait_until_ports_admin_down(resource_id=resource_id, base_url=base_url, port_list=port_list)
+
+
+def wait_until_ports_admin_down(resource_id=1, base_url="http://localhost:8080", debug_=False, port_list=(), timeout_sec=360):
+    print("Waiting until ports appear admin-down...")
+    port_eids = []
+    for port_name in port_list:
+        eid = name_to_eid(port_name)
+        port_eids.append("%s.%s.%s" % (eid[0], resource_id, eid[2]))
+    waiter = PortStateWaiter(base_url=base_url,
+                             port_list=port_eids,
+                             predicate=port_is_admin_down,
+                             fields=['device', 'down'],
+                             debug=debug_)
+    return waiter.wait(timeout_sec=timeout_sec)
 
 
 def waitUntilPortsAdminUp(resource_id=0, base_url="http://localhost:8080", port_list=()):
@@ -721,55 +880,23 @@ def waitUntilPortsAdminUp(resource_id=0, base_url="http://localhost:8080", port_
 def wait_until_ports_admin_up(resource_id=0, base_url="http://localhost:8080", port_list=(), debug_=False, timeout=300):
     if debug_:
         print("Waiting until %s ports appear admin-up..." % (len(port_list)))
-    down_stations = port_list.copy()
-    port_url = "/port"
-    loops = 0
-
-    # url = /%s/%s?fields=device,down" % (resource_id, port_name)
-    for _ in range(0, timeout):
-        down_stations = []
-        for port_name in port_list:
-            eid = name_to_eid(port_name)
-            rid = resource_id
-            if rid == 0:  # TODO: this allows user to pass in resource_id, but probably should remove resource_id entirely.
-                rid = eid[1]  # use resource-id from the eid instead.
-            uri = "%s/%s/%s/%s?fields=device,down" % (port_url, eid[0], rid, eid[2])
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug_)
-            json_response = lf_r.get_as_json()
-
-            if debug_:
-                print("uri: %s response:\n%s" % (uri, json_response))
-
-            if json_response is None:
-                if debug_:
-                    print("port response is None for port name: %s" % port_name)
-                down_stations.append(port_name)
-                continue
-
-            if "interface" in json_response:
-                json_response = json_response['interface']
-            else:
-                if debug_:
-                    print("interface not found in json response:")
-                    pprint(json_response)
-                down_stations.append(port_name)
-                continue
-
-            if json_response['down']:  # This is a boolean object, not a string
-                if debug_:
-                    logger.info("waiting for port: %s to go admin up." % port_name)
-                down_stations.append(port_name)
-            else:
-                if debug_:
-                    logger.debug("port %s is admin up" % port_name)
-
-        if len(down_stations) > 0:
-            sleep(1)
-        else:
-            return True
-
-        loops += 1
+    port_eids = []
+    for port_name in port_list:
+        eid = name_to_eid(port_name)
+        rid = resource_id
+        if rid == 0:  # TODO: this allows user to pass in resource_id, but probably should remove resource_id entirely.
+            rid = eid[1]  # use resource-id from the eid instead.
+        port_eids.append("%s.%s.%s" % (eid[0], rid, eid[2]))
+    waiter = PortStateWaiter(base_url=base_url,
+                             port_list=port_eids,
+                             predicate=port_is_admin_up,
+                             fields=['device', 'down'],
+                             debug=debug_)
+    if waiter.wait(timeout_sec=timeout):
+        return True
 
+    if debug_:
+        logger.info("ports still admin down: %s" % sorted(waiter.pending))
     logger.warning("Not all ports went admin up within %s+ seconds" % timeout)
     return False
 
@@ -802,68 +929,37 @@ def wait_until_ports_disappear(base_url="http://localhost:8080", port_list=(), d
         return True  # no ports to remove, so we are done
 
     logger.info("LFUtils: Waiting until {len_port_list} ports disappear...".format(len_port_list=len(port_list)))
-    url = "/port/1"
-
-    temp_names_by_resource = {1: []}
-    temp_query_by_resource = {1: ""}
-    for port_eid in port_list:
-        eid = name_to_eid(port_eid)
-        # shelf = eid[0]
-        resource_id = eid[1]
-        if resource_id == 0:
-            continue
-        if resource_id not in temp_names_by_resource.keys():
-            temp_names_by_resource[resource_id] = []
-        port_name = eid[2]
-        temp_names_by_resource[resource_id].append(port_name)
-        temp_query_by_resource[resource_id] = "%s/%s/%s?fields=alias" % (
-            url, resource_id, ",".join(temp_names_by_resource[resource_id]))
-    if debug:
-        logger.debug(pprint.pformat(("temp_query_by_resource", temp_query_by_resource)))
-    sec_elapsed = 0
+
+    port_eids = [port_eid for port_eid in port_list if name_to_eid(port_eid)[1] != 0]
     rm_ports_iteration = math.ceil(timeout_sec / 4)
     if rm_ports_iteration > 30:
         rm_ports_iteration = 30
     if rm_ports_iteration == 0:
         rm_ports_iteration = 1
+    last_removal = {'sec': 0}
 
-    found_stations = []
-    for _ in range(0, timeout_sec):
-        found_stations = []
-        for (resource, check_url) in temp_query_by_resource.items():
-            if debug:
-                pprint.pprint([
-                    ("base_url", base_url),
-                    ("check_url", check_url),
-                ])
-            lf_r = LFRequest.LFRequest(base_url, check_url, debug_=debug)
-            json_response = lf_r.get_as_json()
-            if json_response is None:
-                logger.info("LFUtils::wait_until_ports_disappear:: Request returned None: [{}]".format(base_url + check_url))
-            else:
-                if debug:
-                    pprint.pprint(("wait_until_ports_disappear json_response:", json_response))
-                if "interface" in json_response:
-                    found_stations.append(json_response["interface"])
-                elif "interfaces" in json_response:
-                    mapped_list = list_to_alias_map(json_response, from_element="interfaces", debug_=debug)
-                    found_stations.extend(mapped_list.keys())
-            if debug:
-                logger.debug(pprint.pformat([("port_list", port_list), ("found_stations", found_stations)]))
-        if len(found_stations) > 0:
+    def remove_lingering_ports(waiter, pending, elapsed_sec):
+        if debug:
+            logger.debug(pprint.pformat(("wait_until_ports_disappear found_stations:", pending)))
+        if (elapsed_sec - last_removal['sec']) < rm_ports_iteration:
+            return
+        last_removal['sec'] = elapsed_sec
+        for port_eid in pending:
+            eid = name_to_eid(port_eid)
             if debug:
-                logger.debug(pprint.pformat(("wait_until_ports_disappear found_stations:", found_stations)))
-        else:
-            return True
-
-        if (sec_elapsed + 1) % rm_ports_iteration == 0:
-            for port in found_stations:
-                if debug:
-                    logger.debug('removing port %s' % '.'.join(port))
-                remove_port(port[1], port[2], base_url)
-        sleep(1)  # check for ports once per second
-
-    logger.critical('%s ports were still found' % found_stations)
+                logger.debug('removing port %s' % port_eid)
+            remove_port(eid[1], eid[2], base_url)
+
+    waiter = PortStateWaiter(base_url=base_url,
+                             port_list=port_eids,
+                             predicate=port_is_gone,
+                             on_pass=remove_lingering_ports,
+                             min_interval_sec=1.0,
+                             debug=debug)
+    if waiter.wait(timeout_sec=timeout_sec):
+        return True
+
+    logger.critical('%s ports were still found' % sorted(waiter.pending))
     return False
 
 
@@ -957,11 +1053,8 @@ def wait_until_ports_appear(base_url="http://localhost:8080", port_list=(), debu
         existing_stations = LFRequest.LFRequest(base_url, '/ports', debug_=debug)
         # logger.debug('existing ports')
         # logger.debug(pprint.pformat(existing_stations)) # useless
-    port_url = "/port/1"
     show_url = "/cli-json/show_ports"
-    found_stations = set()
     if base_url.endswith('/'):
-        port_url = port_url[1:]
         show_url = show_url[1:]
     if type(port_list) is not list:
         port_list = [port_list]
@@ -971,40 +1064,32 @@ def wait_until_ports_appear(base_url="http://localhost:8080", port_list=(), debu
         for port in current_ports['interfaces']:
             if list(port.values())[0]['phantom']:
                 logger.debug("LFUtils:waittimeout_until_ports_appear: %s is phantom" % list(port.values())[0]['alias'])
-    for attempt in range(0, int(timeout / 2)):
-        found_stations = set()
-        for port_eid in port_list:
+
+    def probe_missing_ports(waiter, pending, elapsed_sec):
+        # ask the GUI to refresh ports it does not list yet
+        for port_eid in pending:
+            if waiter.records.get(port_eid) is not None:
+                continue
             eid = name_to_eid(port_eid)
-            shelf = eid[0]
-            resource_id = eid[1]
-            port_name = eid[2]
-            # TODO:  If port_name happens to be a number, especialy '1', then the request below
-            # gets a list instead of a single item...and see a few lines down.
-            uri = "%s/%s/%s" % (port_url, resource_id, port_name)
-            #print("port-eid: %s uri: %s" % (port_eid, uri))
-            lf_r = LFRequest.LFRequest(base_url, uri, debug_=debug)
-            json_response = lf_r.get_as_json()
-            if json_response is not None:
-                #pprint.pprint(json_response)
-                # TODO:  If a list was (accidentally) requested, this code below will blow up.
-                # This can currently happen if someone manages to name a port 1.1.vap0, ie using
-                # an EID as a name.
-                # TODO:  Fix name_to_eid to somehow detect this and deal with it.
-                if not json_response['interface']['phantom']:
-                    found_stations.add("%s.%s.%s" % (shelf, resource_id, port_name))
-            else:
-                lf_r = LFRequest.LFRequest(base_url, show_url, debug_=debug)
-                lf_r.addPostData({"shelf": shelf, "resource": resource_id, "port": port_name, "probe_flags": 5})
-                lf_r.jsonPost()
-        if len(found_stations) < len(port_list):
-            sleep(2)
-            logger.info('Found %s out of %s ports in %s out of %s tries in wait_until_ports_appear' % (len(found_stations), len(port_list), attempt, timeout/2))
-        else:
-            logger.info('All %s ports appeared' % len(found_stations))
-            return True
+            lf_r = LFRequest.LFRequest(base_url, show_url, debug_=debug)
+            lf_r.addPostData({"shelf": eid[0], "resource": eid[1], "port": eid[2], "probe_flags": 5})
+            lf_r.jsonPost()
+        logger.info('Found %s out of %s ports after %.1f of %s seconds in wait_until_ports_appear'
+                    % (len(port_list) - len(pending), len(port_list), elapsed_sec, timeout))
+
+    waiter = PortStateWaiter(base_url=base_url,
+                             port_list=port_list,
+                             predicate=port_is_present,
+                             fields=['phantom'],
+                             on_pass=probe_missing_ports,
+                             min_interval_sec=0.5,
+                             debug=debug)
+    if waiter.wait(timeout_sec=timeout):
+        logger.info('All %s ports appeared' % len(port_list))
+        return True
     if debug:
-        logger.debug("These ports appeared: " + ", ".join(found_stations))
-        logger.debug("These ports did not appear: " + ",".join(set(port_list) - set(found_stations)))
+        logger.debug("These ports appeared: " + ", ".join(waiter.time_to_state.keys()))
+        logger.debug("These ports did not appear: " + ",".join(waiter.pending))
         logger.debug(pprint.pformat(LFRequest.LFRequest("%s/ports" % base_url)))
     return False
 
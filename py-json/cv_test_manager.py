@@ -75,6 +75,12 @@ def cv_add_base_parser(parser):
 
 
 class cv_test(Realm):
+    # build_cfg posts config lines in chunks of up to this many bytes, 0 posts one line per request
+    cfg_blob_max_bytes = 8000
+    # create_and_run_test status polling backs off from min to max seconds while nothing changes
+    status_poll_min_sec = 1.0
+    status_poll_max_sec = 10.0
+
     def __init__(self,
                  lfclient_host="localhost",
                  lfclient_port=8080,
@@ -102,6 +108,55 @@ class cv_test(Realm):
 
         self.json_post(req_url, data)
 
+    # Add many config lines to a text blob, as few add_text_blob requests as cfg_blob_max_bytes allows.
+    # Returns the number of requests posted.
+    def create_test_config_lines(self, config_name, blob_test_name, lines):
+        chunks = []
+        chunk = []
+        chunk_bytes = 0
+        for line in lines:
+            line = str(line).rstrip("\r\n")
+            if chunk and chunk_bytes + len(line) + 1 > self.cfg_blob_max_bytes:
+                chunks.append(chunk)
+                chunk = []
+                chunk_bytes = 0
+            chunk.append(line)
+            chunk_bytes += len(line) + 1
+        if chunk:
+            chunks.append(chunk)
+        for chunk in chunks:
+            self.create_test_config(config_name, blob_test_name, "\n".join(chunk))
+        return len(chunks)
+
+    # Text of a Plugin-Settings text blob as the GUI lists it, None when it is not listed
+    def get_test_config_text(self, config_name, blob_test_name):
+        blob_name = str(blob_test_name + config_name)
+        response = self.json_get("/text/Plugin-Settings?fields=name,text", debug_=False)
+        records = [response]
+        while records:
+            record = records.pop()
+            if isinstance(record, list):
+                records.extend(record)
+            elif isinstance(record, dict):
+                if record.get('name') == blob_name and isinstance(record.get('text'), str):
+                    return record['text']
+                records.extend(value for value in record.values() if isinstance(value, (dict, list)))
+        return None
+
+    # Wait for the GUI to list the config text blob ending with lines
+    def wait_for_test_config(self, config_name, blob_test_name, lines, timeout_sec=5.0):
+        expected = [str(line).strip() for line in lines if str(line).strip()]
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            text = self.get_test_config_text(config_name, blob_test_name)
+            if text is not None:
+                listed = [line.strip() for line in text.splitlines() if line.strip()]
+                if listed[len(listed) - len(expected):] == expected:
+                    return True
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(0.25)
+
     # Tell LANforge GUI Chamber View to launch a test
     def create_test(self, test_name, instance, load_old_cfg):
         cmd = "cv create '{0}' '{1}' '{2}'".format(test_name, instance, load_old_cfg)
@@ -150,6 +205,20 @@ class cv_test(Realm):
         # pprint(val)
         return val[0]["LAST"]["response"] == 'StartStop::Stop'
 
+    # Close any popup, then read the report location and whether the test is still running.
+    # These are three separate GUI commands; create_and_run_test backs off between polls to limit GUI load.
+    def get_test_status(self, instance):
+        status = {'dialog': None, 'report_location': None, 'running': None}
+        dialog = self.run_cv_cmd("cv get_and_close_dialog")
+        if dialog and dialog[0]["LAST"]["response"] != "NO-DIALOG":
+            status['dialog'] = dialog[0]["LAST"]["response"]
+        check = self.get_report_location(instance)
+        location = json.dumps(check[0]["LAST"]["response"])
+        if location != '\"Report Location:::\"':
+            status['report_location'] = location
+        status['running'] = self.get_is_running(instance)
+        return status
+
     # To save to html
     def save_html(self, instance):
         cmd = "cv click %s 'Save HTML'" % instance
@@ -261,6 +330,18 @@ class cv_test(Realm):
             cfg_options.append(r[0])
 
     def build_cfg(self, config_name, blob_test, cfg_options):
+        if self.cfg_blob_max_bytes and len(cfg_options) > 1:
+            requests = self.create_test_config_lines(config_name, blob_test, cfg_options)
+            self.show_text_blob(config_name, blob_test, False)
+            if self.wait_for_test_config(config_name, blob_test, cfg_options):
+                logger.info("posted %d config lines in %d requests" % (len(cfg_options), requests))
+                return
+            # the GUI did not take the multi-line text as separate lines, post them one by one
+            logger.warning("config text blob %s%s did not list as expected, posting one line per request"
+                           % (blob_test, config_name))
+            self.cfg_blob_max_bytes = 0
+            self.rm_text_blob(config_name, blob_test)
+
         for value in cfg_options:
             self.create_test_config(config_name, blob_test, value)
 
@@ -327,16 +408,16 @@ class cv_test(Realm):
             exit(1)
 
         not_running = 0
+        poll_sec = self.status_poll_min_sec
         while True:
-            cmd = "cv get_and_close_dialog"
-            dialog = self.run_cv_cmd(cmd)
-            if dialog[0]["LAST"]["response"] != "NO-DIALOG":
+            status = self.get_test_status(instance_name)
+            if status['dialog'] is not None:
                 logger.info("Popup Dialog:\n")
-                logger.info(dialog[0]["LAST"]["response"])
+                logger.info(status['dialog'])
+                poll_sec = self.status_poll_min_sec
 
-            check = self.get_report_location(instance_name)
-            location = json.dumps(check[0]["LAST"]["response"])
-            if location != '\"Report Location:::\"':
+            location = status['report_location']
+            if location is not None:
                 # Please Do not remove or comment out the next line of logger.info it is used
                 # to find the location of the meta file used by LANforge Qualification
                 logger.info(location)  # Do Not comment out or remove
@@ -370,20 +451,23 @@ class cv_test(Realm):
                 
 
             # Of if test stopped for some reason and could not generate report.
-            if not self.get_is_running(instance_name):
+            if status['running'] is False:
                 logger.info("Detected test is not running.")
                 not_running += 1
                 if not_running > 5:
                     break
+                poll_sec = self.status_poll_min_sec
+            elif status['dialog'] is None:
+                poll_sec = min(poll_sec * 2, self.status_poll_max_sec)
 
-            time.sleep(1)
+            time.sleep(poll_sec)
         self.report_name = self.get_report_location(instance_name)
         # Ensure test is closed and cleaned up
         self.delete_instance(instance_name)
 
         # Clean up any remaining popups.
         while True:
-            dialog = self.run_cv_cmd(cmd)
+            dialog = self.run_cv_cmd("cv get_and_close_dialog")
             if dialog[0]["LAST"]["response"] != "NO-DIALOG":
                 logger.info("Popup Dialog:\n")
                 logger.info(dialog[0]["LAST"]["response"])
@@ -1,18 +1,195 @@
+import hashlib
+import logging
+import os
+import posixpath
+import shlex
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import paramiko
 from scp import SCPClient
 
+logger = logging.getLogger(__name__)
+
+
+# file object wrapper counting the bytes read off the ssh channel
+class counting_reader:
+    def __init__(self, fileobj):
+        self.fileobj = fileobj
+        self.count = 0
+
+    def read(self, size=-1):
+        data = self.fileobj.read(size)
+        self.count += len(data)
+        return data
+
 
 class lanforge_reports:
+    # (hostname, port, username) -> connected paramiko.SSHClient, shared by every pull
+    connections = {}
+    connections_lock = threading.Lock()
+
+    @classmethod
+    def get_ssh(cls, hostname="localhost", port=22, username="lanforge", password="lanforge"):
+        key = (hostname, int(port), username)
+        with cls.connections_lock:
+            ssh = cls.connections.get(key)
+            if ssh is not None and ssh.get_transport() is not None and ssh.get_transport().is_active():
+                return ssh
+            ssh = paramiko.SSHClient()
+            ssh.load_system_host_keys()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            ssh.connect(hostname=hostname, username=username, password=password, port=port, allow_agent=False, look_for_keys=False)
+            cls.connections[key] = ssh
+            return ssh
+
+    @classmethod
+    def close_connections(cls):
+        with cls.connections_lock:
+            for ssh in cls.connections.values():
+                ssh.close()
+            cls.connections = {}
 
     @staticmethod
-    def pull_reports(hostname="localhost", port=22, username="lanforge", password="lanforge",
-                     report_location="/home/lanforge/html-reports/",
-                     report_dir="../../../reports/"):
-        ssh = paramiko.SSHClient()
-        ssh.load_system_host_keys()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=hostname, username=username, password=password, port=port, allow_agent=False, look_for_keys=False)
+    def run_remote(ssh, command, stdin_data=None):
+        stdin, stdout, stderr = ssh.exec_command(command)
+        if stdin_data is not None:
+            stdin.write(stdin_data)
+        stdin.channel.shutdown_write()
+        output = stdout.read().decode("utf-8", "replace")
+        if stdout.channel.recv_exit_status() != 0:
+            raise RuntimeError("%s failed: %s" % (command, stderr.read().decode("utf-8", "replace").strip()))
+        return output
 
+    @staticmethod
+    def local_md5(path):
+        md5 = hashlib.md5()
+        with open(path, "rb") as local_file:
+            for block in iter(lambda: local_file.read(1 << 20), b""):
+                md5.update(block)
+        return md5.hexdigest()
+
+    # local path for a remote path relative to the parent of report_location, as scp -r would place it
+    @staticmethod
+    def local_path(local_root, relative_path):
+        parts = relative_path.split("/")[1:]
+        if any(part in ("", ".", "..") for part in parts):
+            raise ValueError("unexpected path in report archive: %s" % relative_path)
+        return os.path.join(local_root, *parts)
+
+    @classmethod
+    def plan_transfer(cls, ssh, parent, name, local_root):
+        """
+        :return: (list of remote paths relative to parent that need pulling, number skipped)
+        """
+        listing = cls.run_remote(ssh, "cd %s && find %s -type f -printf '%%s\\t%%p\\n'"
+                                 % (shlex.quote(parent), shlex.quote(name)))
+        remote_sizes = {}
+        for line in listing.splitlines():
+            size, _, relative_path = line.partition("\t")
+            if relative_path:
+                remote_sizes[relative_path] = int(size)
+        # only files already here with the same size are worth hashing
+        same_size = [relative_path for (relative_path, size) in remote_sizes.items()
+                     if os.path.isfile(cls.local_path(local_root, relative_path))
+                     and os.path.getsize(cls.local_path(local_root, relative_path)) == size]
+        unchanged = set()
+        if same_size:
+            sums = cls.run_remote(ssh, "cd %s && xargs -0 md5sum --" % shlex.quote(parent),
+                                  stdin_data="\0".join(same_size) + "\0")
+            for line in sums.splitlines():
+                remote_md5, _, relative_path = line.partition("  ")
+                if relative_path in remote_sizes and \
+                        cls.local_md5(cls.local_path(local_root, relative_path)) == remote_md5:
+                    unchanged.add(relative_path)
+        return sorted(set(remote_sizes) - unchanged), len(unchanged)
+
+    @classmethod
+    def pull_tar(cls, ssh, report_location, report_dir):
+        """
+        Pull report_location (a directory or a single file) into report_dir as one gzip'd tar
+        stream, skipping files already present locally with the same size and md5.
+        :return: dict of transfer statistics
+        """
+        remote_path = posixpath.normpath(report_location)
+        parent, name = posixpath.split(remote_path)
+        parent = parent or "."
+        # same placement as scp -r: inside report_dir when it is a directory, else as report_dir
+        local_root = os.path.join(report_dir, name) if os.path.isdir(report_dir) else report_dir
+        start_time = time.monotonic()
+        to_pull, skipped = cls.plan_transfer(ssh, parent, name, local_root)
+        stats = {"report_location": report_location, "files": len(to_pull), "skipped": skipped,
+                 "bytes": 0, "wire_bytes": 0}
+        if to_pull:
+            stdin, stdout, stderr = ssh.exec_command("cd %s && tar --null -T - -czf -" % shlex.quote(parent))
+            stdin.write("\0".join(to_pull) + "\0")
+            stdin.channel.shutdown_write()
+            reader = counting_reader(stdout)
+            with tarfile.open(fileobj=reader, mode="r|gz") as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    path = cls.local_path(local_root, member.name)
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    with open(path, "wb") as local_file:
+                        source = archive.extractfile(member)
+                        for block in iter(lambda: source.read(1 << 20), b""):
+                            local_file.write(block)
+                    os.utime(path, (member.mtime, member.mtime))
+                    stats["bytes"] += member.size
+            if stdout.channel.recv_exit_status() != 0:
+                raise RuntimeError("tar of %s failed: %s" % (report_location, stderr.read().decode("utf-8", "replace").strip()))
+            stats["wire_bytes"] = reader.count
+        stats["seconds"] = time.monotonic() - start_time
+        stats["mbps"] = (stats["wire_bytes"] * 8 / 1e6 / stats["seconds"]) if stats["seconds"] > 0 else 0.0
+        logger.info("pulled %s: %d files (%d unchanged skipped), %d bytes as %d on the wire in %.1fs, %.2f Mbps"
+                    % (report_location, stats["files"], skipped, stats["bytes"], stats["wire_bytes"],
+                       stats["seconds"], stats["mbps"]))
+        return stats
+
+    @classmethod
+    def pull_scp(cls, ssh, report_location, report_dir):
+        start_time = time.monotonic()
         with SCPClient(ssh.get_transport()) as scp:
             scp.get(remote_path=report_location, local_path=report_dir, recursive=True)
             scp.close()
+        return {"report_location": report_location, "seconds": time.monotonic() - start_time}
+
+    @classmethod
+    def pull_reports(cls, hostname="localhost", port=22, username="lanforge", password="lanforge",
+                     report_location="/home/lanforge/html-reports/",
+                     report_dir="../../../reports/",
+                     compressed=True):
+        """
+        Copy report_location from the LANforge system into report_dir over a shared ssh connection.
+        compressed=True streams a gzip'd tar and skips files that are already up to date locally,
+        falling back to a plain recursive scp if the remote end cannot do that.
+        :return: dict of transfer statistics
+        """
+        ssh = cls.get_ssh(hostname=hostname, port=port, username=username, password=password)
+        if compressed:
+            try:
+                return cls.pull_tar(ssh, report_location, report_dir)
+            except (RuntimeError, ValueError, tarfile.TarError, paramiko.SSHException) as x:
+                logger.warning("compressed pull of %s failed, using scp: %s" % (report_location, x))
+        return cls.pull_scp(ssh, report_location, report_dir)
+
+    @classmethod
+    def pull_reports_parallel(cls, hostname="localhost", port=22, username="lanforge", password="lanforge",
+                              report_locations=(), report_dir="../../../reports/", compressed=True, max_workers=4):
+        """
+        Pull several report directories at once, each on its own channel of one ssh connection.
+        :return: list of transfer statistics in report_locations order
+        """
+        cls.get_ssh(hostname=hostname, port=port, username=username, password=password)
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(report_locations)))) as executor:
+            futures = [executor.submit(cls.pull_reports, hostname=hostname, port=port, username=username,
+                                       password=password, report_location=report_location,
+                                       report_dir=report_dir, compressed=compressed)
+                       for report_location in report_locations]
+        results = [future.result() for future in futures]
+        wire_bytes = sum(result.get("wire_bytes", 0) for result in results)
+        logger.info("pulled %d report directories, %d bytes on the wire" % (len(results), wire_bytes))
+        return results
@@ -16,6 +16,8 @@ LFCliBase = lfcli_base.LFCliBase
 pandas_extensions = importlib.import_module("py-json.LANforge.pandas_extensions")
 port_probe = importlib.import_module("py-json.port_probe")
 ProbePort = port_probe.ProbePort
+lfdata = importlib.import_module("py-json.lfdata")
+LFTimeSeriesBuffer = lfdata.LFTimeSeriesBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +145,7 @@ class L3CXProfile(LFCliBase):
                 compared_report=None,
                 resource=1,
                 adjust_cx_json=False,  # used for lf_test_max_association.py (removes created_cx from json get to alleviate url > 2048 bytes error)
+                buffer_capacity=LFTimeSeriesBuffer.Default_Capacity,  # rows held in memory before spilling to disk
                 debug=False):
         if duration_sec:
             duration_sec = self.parse_time(duration_sec).seconds
@@ -225,10 +228,13 @@ class L3CXProfile(LFCliBase):
 
         # for x in range(0,int(round(iterations,0))):
         initial_starttime = datetime.datetime.now()
-        timestamp_data = list()
+        # 'Timestamp' is derived from the epoch milliseconds column on export
+        timestamp_data = LFTimeSeriesBuffer(capacity=buffer_capacity,
+                                            epoch_ms_col='Timestamp milliseconds epoch',
+                                            timestamp_col='Timestamp',
+                                            debug=debug)
         while datetime.datetime.now() < end_time:
             t = datetime.datetime.now()
-            timestamp = t.strftime("%m/%d/%Y %I:%M:%S")
             t_to_millisec_epoch = int(self.get_milliseconds(t))
             t_to_sec_epoch = int(self.get_seconds(t))
             time_elapsed = int(self.get_seconds(t)) - int(self.get_seconds(initial_starttime))
@@ -310,13 +316,15 @@ class L3CXProfile(LFCliBase):
             else:
                 timestamp_df = layer3
             probe_port_df_list = list()
+            # probe all stations at once
+            probe_ports = ProbePort.probe_many(lfhost=self.lfclient_host,
+                                               lfport=self.lfclient_port,
+                                               eid_list=sta_list,
+                                               debug=self.debug)
             for station in sta_list:
-                probe_port = ProbePort(lfhost=self.lfclient_host,
-                                       lfport=self.lfclient_port,
-                                       eid_str=station,
-                                       debug=self.debug)
+                probe_port = probe_ports.get(station)
                 probe_results = dict()
-                if (probe_port.refreshProbe()):
+                if probe_port is not None:
                     probe_results['Signal Avg Combined'] = probe_port.getSignalAvgCombined()
                     probe_results['Signal Avg per Chain'] = probe_port.getSignalAvgPerChain()
                     probe_results['Signal Combined'] = probe_port.getSignalCombined()
@@ -369,19 +377,19 @@ class L3CXProfile(LFCliBase):
             if len(probe_port_df_list) > 0:
                 probe_port_df = pd.concat(probe_port_df_list)
                 timestamp_df = pd.merge(timestamp_df, probe_port_df, on='alias')
-                timestamp_df['Timestamp'] = timestamp
+                timestamp_df['Timestamp'] = None
                 timestamp_df['Timestamp milliseconds epoch'] = t_to_millisec_epoch
                 timestamp_df['Timestamp seconds epoch'] = t_to_sec_epoch
                 timestamp_df['Duration elapsed'] = time_elapsed
-                timestamp_data.append(timestamp_df)
+                timestamp_data.append_frame(dataframe=timestamp_df, drop_cols=['alias'])
                 time.sleep(monitor_interval_ms)
                 logger.info("Monitor: {}".format(datetime.datetime.now()))
             else:
                 logger.info("port probe dataframe list is empty.")
         if len(timestamp_data) > 0:
-            df = pd.concat(timestamp_data)
-            df = df.drop('alias', axis=1)
-            df.to_csv(str(report_file), index=False)
+            timestamp_data.to_csv(str(report_file))
+            if output_format.lower() == 'parquet':
+                timestamp_data.to_parquet(report_file.replace('csv', 'parquet', 1))
 
         # comparison to last report / report inputted
         if compared_report:
@@ -389,10 +397,11 @@ class L3CXProfile(LFCliBase):
                                              dataframe_two=pandas_extensions.file_to_df(compared_report))
             # append compared df to created one
             if output_format.lower() != 'csv':
-                pandas_extensions.df_to_file(dataframe=pd.read_csv(report_file), output_f=output_format, save_path=report_file)
+                pandas_extensions.df_to_file(dataframe=timestamp_data.to_pandas(), output_f=output_format, save_path=report_file)
         else:
             if output_format.lower() != 'csv':
-                pandas_extensions.df_to_file(dataframe=pd.read_csv(report_file), output_f=output_format, save_path=report_file)
+                pandas_extensions.df_to_file(dataframe=timestamp_data.to_pandas(), output_f=output_format, save_path=report_file)
+        timestamp_data.close()
 
 
     def refresh_cx(self):
@@ -1018,6 +1027,7 @@ class L3CXProfile(LFCliBase):
                                                  script_name=None,
                                                  arguments=None,
                                                  compared_report=None,
+                                                 time_series=None,  # LFTimeSeriesBuffer to record layer 3 samples into, one is made when None
                                                  debug=False):
         if duration_sec:
             duration_sec = self.parse_time(duration_sec).seconds
@@ -1075,6 +1085,31 @@ class L3CXProfile(LFCliBase):
         time.sleep(10)
         print("current time: ",datetime.datetime.now())
         print("Expected End time: ",end_time)
+        initial_starttime = datetime.datetime.now()
+        own_time_series = time_series is None
+        if own_time_series:
+            time_series = LFTimeSeriesBuffer(epoch_ms_col='Timestamp milliseconds epoch',
+                                             timestamp_col='Timestamp',
+                                             debug=debug)
         while datetime.datetime.now() < end_time:
-            continue
+            t = datetime.datetime.now()
+            layer_3_response = self.json_get("/endp/%s?fields=%s" % (created_cx, layer3_fields))
+            if type(layer_3_response) is dict and 'endpoint' in layer_3_response:
+                if type(layer_3_response['endpoint']) is list:
+                    endpoints = [list(dictionary.values())[0] for dictionary in layer_3_response['endpoint']]
+                else:
+                    endpoints = [layer_3_response['endpoint']]
+                columns = {'Timestamp': None,
+                           'Timestamp milliseconds epoch': int(self.get_milliseconds(t)),
+                           'Timestamp seconds epoch': int(self.get_seconds(t)),
+                           'Duration elapsed': int(self.get_seconds(t)) - int(self.get_seconds(initial_starttime))}
+                for col_name in layer3_cols:
+                    columns['l3-' + col_name] = [endpoint.get(col_name) for endpoint in endpoints]
+                time_series.append_rows(columns=columns, n_rows=len(endpoints))
+            time.sleep(monitor_interval_ms)
         print("End time: ",end_time)
+        if not own_time_series:
+            return time_series
+        samples = time_series.to_pandas()
+        time_series.close()
+        return samples
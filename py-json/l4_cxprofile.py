@@ -14,11 +14,16 @@ sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
 
 lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
 LFCliBase = lfcli_base.LFCliBase
+lfdata = importlib.import_module("py-json.lfdata")
+LFEndpointSampleStore = lfdata.LFEndpointSampleStore
 
 logger = logging.getLogger(__name__)
 
 
 class L4CXProfile(LFCliBase):
+    # layer 4-7 endpoint totals, kept as differences between samples by monitor()
+    counter_cols = ['bytes-rd', 'bytes-wr', 'total-urls', 'total-err']
+
     def __init__(self, lfclient_host, lfclient_port, local_realm, debug_=False):
         super().__init__(lfclient_host, lfclient_port, debug_)
         self.lfclient_url = "http://%s:%s" % (lfclient_host, lfclient_port)
@@ -31,6 +36,7 @@ class L4CXProfile(LFCliBase):
         self.test_type = "urls"
         self.lfclient_port = lfclient_port
         self.lfclient_host = lfclient_host
+        self.sample_store = None
 
     def check_errors(self, debug=False):
         fields_list = ["!conn", "acc.+denied", "bad-proto", "bad-url", "other-err", "total-err", "rslv-p", "rslv-h",
@@ -207,6 +213,21 @@ class L4CXProfile(LFCliBase):
         # created and add that to create_l4.py
         return True
 
+    # (endpoint name, fields) for every endpoint of a /layer4 response
+    @staticmethod
+    def layer4_records(response):
+        endpoints = response.get('endpoint')
+        if isinstance(endpoints, dict):
+            # single CX == 'endpoint':{'bytes-rd': 5535, 'name': 'sta0000_l4'}
+            if 'name' in endpoints:
+                return [(endpoints['name'], endpoints)]
+            endpoints = [endpoints]
+        records = []
+        for datum in endpoints or []:
+            for (name, endpoint_data) in datum.items():
+                records.append((name, endpoint_data))
+        return records
+
     def monitor(self,
                 duration_sec=60,
                 monitor_interval=1,
@@ -218,7 +239,14 @@ class L4CXProfile(LFCliBase):
                 script_name=None,
                 arguments=None,
                 iterations=0,
+                sample_interval=None,
+                rates_file=None,
                 debug=False):
+        """
+        :param sample_interval: seconds between samples, may be below one second; by default
+            samples are taken at the pass/fail check cadence of duration_sec // 5 + monitor_interval
+        :param rates_file: optional csv file for the per-second counter rates of every endpoint
+        """
         if duration_sec:
             duration_sec = LFCliBase.parse_time(duration_sec).seconds
         else:
@@ -237,6 +265,9 @@ class L4CXProfile(LFCliBase):
         if (monitor_interval is None) or (monitor_interval < 1):
             logger.critical("L4CXProfile::monitor wants monitor_interval >= 1 second")
             raise ValueError("L4CXProfile::monitor wants monitor_interval >= 1 second")
+        if (sample_interval is not None) and (sample_interval <= 0):
+            logger.critical("L4CXProfile::monitor wants sample_interval > 0 seconds")
+            raise ValueError("L4CXProfile::monitor wants sample_interval > 0 seconds")
         # verify that the file extension matches the output format    
         if output_format is not None:
             if output_format.lower() != report_file.split('.')[-1]:
@@ -249,7 +280,7 @@ class L4CXProfile(LFCliBase):
         # Step 1 - Assign column names 
 
         if col_names is not None and len(col_names) > 0:
-            header_row = col_names
+            header_row = list(col_names)
         else:
             header_row = list((list(self.json_get("/layer4/all")['endpoint'][0].values())[0].keys()))
         if debug:
@@ -259,99 +290,80 @@ class L4CXProfile(LFCliBase):
         start_time = datetime.datetime.now()
         end_time = start_time + datetime.timedelta(seconds=duration_sec)
         sleep_interval = round(duration_sec // 5)
+        check_interval = sleep_interval + monitor_interval
+        if sample_interval is None:
+            sample_interval = check_interval
         if debug:
             logger.debug("Sleep_interval is %s ", sleep_interval)
+            logger.debug("Sample_interval is %s ", sample_interval)
             logger.debug("Start time is %s ", start_time)
             logger.debug("End time is %s ", end_time)
-        value_map = dict()
+        if self.sample_store is not None:
+            self.sample_store.close()
+        self.sample_store = LFEndpointSampleStore(counter_cols=self.counter_cols, debug=debug)
         passes = 0
         expected_passes = 0
-        timestamps = []
         if self.test_type != 'urls':
             old_rx_values = self.get_bytes()
 
         for test in range(1 + iterations):
-            while datetime.datetime.now() < end_time:
-                if col_names is None:
-                    response = self.json_get("/layer4/all")
-                else:
-                    fields = ",".join(col_names)
-                    response = self.json_get("/layer4/%s?fields=%s" % (created_cx, fields), debug_=self.debug)
-                if debug:
-                    logger.debug(pformat(response))
-                if response is None:
-                    logger.debug(pformat(response))
-                    raise ValueError("Cannot find any endpoints")
-                if monitor:
+            next_sample = datetime.datetime.now()
+            # the first check comes after a full check interval of traffic, as before
+            next_check = next_sample + datetime.timedelta(seconds=check_interval)
+            failed = False
+            while not failed and datetime.datetime.now() < end_time:
+                t = datetime.datetime.now()
+                if t >= next_sample:
+                    if col_names is None:
+                        response = self.json_get("/layer4/all")
+                    else:
+                        fields = ",".join(col_names)
+                        response = self.json_get("/layer4/%s?fields=%s" % (created_cx, fields), debug_=self.debug)
                     if debug:
                         logger.debug(pformat(response))
+                    if response is None:
+                        logger.debug(pformat(response))
+                        raise ValueError("Cannot find any endpoints")
+                    self.sample_store.append_sample(epoch_ms=self.get_milliseconds(t),
+                                                    records=self.layer4_records(response))
+                    next_sample += datetime.timedelta(seconds=sample_interval)
+                    if next_sample < t:
+                        # polling fell behind, do not try to catch up with a burst of samples
+                        next_sample = t + datetime.timedelta(seconds=sample_interval)
+
+                if t >= next_check:
+                    expected_passes += 1
+                    if self.test_type == 'urls':
+                        if self.check_errors(self.debug):
+                            if self.check_request_rate():
+                                passes += 1
+                            else:
+                                self._fail("FAIL: Request rate did not exceed target rate")
+                                failed = True
+                        else:
+                            self._fail("FAIL: Errors found getting to %s " % self.url)
+                            failed = True
 
-                time.sleep(sleep_interval)
-                t = datetime.datetime.now()
-                timestamps.append(t)
-                value_map[t] = response
-                expected_passes += 1
-                if self.test_type == 'urls':
-                    if self.check_errors(self.debug):
-                        if self.check_request_rate():
+                    else:
+                        new_rx_values = self.get_bytes()
+                        if self.compare_vals(old_rx_values, new_rx_values):
                             passes += 1
                         else:
-                            self._fail("FAIL: Request rate did not exceed target rate")
-                            break
-                    else:
-                        self._fail("FAIL: Errors found getting to %s " % self.url)
-                        break
+                            self._fail("FAIL: Not all stations increased traffic")
 
-                else:
-                    new_rx_values = self.get_bytes()
-                    if self.compare_vals(old_rx_values, new_rx_values):
-                        passes += 1
-                    else:
-                        self._fail("FAIL: Not all stations increased traffic")
+                        # self.exit_fail()
+                    next_check = datetime.datetime.now() + datetime.timedelta(seconds=check_interval)
 
-                    # self.exit_fail()
-                time.sleep(monitor_interval)
+                wake_time = min(next_sample, next_check, end_time)
+                time.sleep(max(0.0, (wake_time - datetime.datetime.now()).total_seconds()))
 
-        logger.info(pformat(value_map))
+        logger.info("L4CXProfile::monitor stored %d samples of %d endpoints"
+                    % (self.sample_store.samples, len(self.sample_store.buffers)))
 
         # [further] post-processing data, after test completion
-        full_test_data_list = []
-        for test_timestamp, data in value_map.items():
-            # reduce the endpoint data to single dictionary of dictionaries
-            # for single cx data["endpoint"] string not dict
-            logger.debug("type data['endpoint']  {data}".format(data=type(data['endpoint'])))
-            logger.debug(" data['endpoint'] : {data}".format(data=data['endpoint']))
-
-            for datum in data["endpoint"]:
-                logger.debug("type datum {datum}".format(datum=type(datum)))
-                if type(datum) is str:
-                    # single CX (str)
-                    datum_dict = {data['endpoint']['name'] : data['endpoint']}
-                    logger.debug("datum_dict {datum}".format(datum=datum_dict))
-                    for endpoint_data in datum_dict.values():
-                        logger.debug(endpoint_data)
-                        endpoint_data["Timestamp"] = test_timestamp
-                        full_test_data_list.append(endpoint_data)
-                    # break is needed ,  there is a single CX the json is formatted 
-                    break
-
-                else:
-                    # multiple CS (str)
-                    for endpoint_data in datum.values():
-                        if debug:
-                            logger.debug(endpoint_data)
-                        endpoint_data["Timestamp"] = test_timestamp
-                        full_test_data_list.append(endpoint_data)
-
-        header_row.append("Timestamp")
-        header_row.append('Timestamp milliseconds')
-        df = pd.DataFrame(full_test_data_list)
-
-        df["Timestamp milliseconds"] = [self.get_milliseconds(x) for x in df["Timestamp"]]
-        # round entire column
-        df["Timestamp milliseconds"] = df["Timestamp milliseconds"].astype(int)
-        df["Timestamp"] = df["Timestamp"].apply(lambda x: x.strftime("%m/%d/%Y %I:%M:%S"))
-        df = df[["Timestamp", "Timestamp milliseconds", *header_row[:-2]]]
+        df = self.sample_store.to_pandas(columns=header_row)
+        if rates_file is not None:
+            self.sample_store.rates().to_csv(rates_file, index=False)
         # compare previous data to current data
 
         systeminfo = ast.literal_eval(
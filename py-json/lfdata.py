@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 import datetime
 import logging
+import os
+import shutil
+import tempfile
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +21,408 @@ logger = logging.getLogger(__name__)
 # Websocket class actions:
 # reading data from websockets
 
+
+class LFTimeSeriesBuffer:
+    """
+    Columnar store for monitor samples. Each column is a preallocated numpy array of
+    `capacity` rows; when the arrays fill up the chunk is spilled to a .npz file in
+    `spill_dir` and writing wraps back to row 0. Columns appear in first-seen order and
+    are typed from their values: int64, then float64, then object if strings show up.
+
+    When `epoch_ms_col` and `timestamp_col` are given, the formatted timestamp column
+    is not stored; it is derived from the epoch milliseconds column on export.
+
+    Export with to_pandas(), to_csv() or to_parquet(); iter_frames() yields one
+    DataFrame per chunk and the rows still in memory are exported as views of the
+    column arrays rather than copies.
+    """
+    Default_Capacity = 4096
+
+    def __init__(self,
+                 capacity=Default_Capacity,
+                 spill_dir=None,
+                 epoch_ms_col=None,
+                 timestamp_col=None,
+                 timestamp_format="%m/%d/%Y %I:%M:%S",
+                 debug=False):
+        if not capacity or capacity < 1:
+            raise ValueError("LFTimeSeriesBuffer wants capacity >= 1")
+        self.capacity = int(capacity)
+        self.spill_dir = spill_dir
+        self.own_spill_dir = False
+        self.epoch_ms_col = epoch_ms_col
+        self.timestamp_col = timestamp_col
+        self.timestamp_format = timestamp_format
+        self.debug = debug
+        self.columns = []  # export order, includes the derived timestamp column
+        self.arrays = {}
+        self.size = 0  # rows held in memory
+        self.rows_spilled = 0
+        self.chunk_files = []
+
+    def __len__(self):
+        return self.rows_spilled + self.size
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @staticmethod
+    def _dtype_for(value):
+        if isinstance(value, (bool, np.bool_)) or value is None:
+            return object
+        if isinstance(value, (int, np.integer)):
+            return np.int64
+        if isinstance(value, (float, np.floating)):
+            return np.float64
+        return object
+
+    def _add_column(self, name, value):
+        self.columns.append(name)
+        if name == self.timestamp_col and self.epoch_ms_col:
+            return
+        dtype = self._dtype_for(value)
+        if self.size and dtype is np.int64:
+            # rows before this column existed hold no value
+            dtype = np.float64
+        if dtype is object:
+            self.arrays[name] = np.full(self.capacity, None, dtype=object)
+        else:
+            self.arrays[name] = np.full(self.capacity, np.nan if dtype is np.float64 else 0, dtype=dtype)
+
+    def _promote(self, name, value):
+        array = self.arrays[name]
+        wanted = self._dtype_for(value)
+        if array.dtype == np.int64 and wanted is np.float64:
+            self.arrays[name] = array.astype(np.float64)
+        elif array.dtype != object and wanted is object:
+            self.arrays[name] = array.astype(object)
+
+    def append_row(self, row=None):
+        """
+        :param row: dict of column name to value; missing columns are left empty
+        """
+        self.append_rows(columns={name: [value] for name, value in row.items()}, n_rows=1)
+
+    def append_rows(self, columns=None, n_rows=None):
+        """
+        Append n_rows rows in one call.
+        :param columns: dict of column name to a scalar (repeated on every row) or a sequence of n_rows values
+        :param n_rows: number of rows, taken from the first sequence when not given
+        """
+        if not columns:
+            return
+        if n_rows is None:
+            n_rows = 1
+            for value in columns.values():
+                if isinstance(value, (list, tuple, np.ndarray)):
+                    n_rows = len(value)
+                    break
+        start = 0
+        while start < n_rows:
+            if self.size == self.capacity:
+                self.spill()
+            count = min(n_rows - start, self.capacity - self.size)
+            for name, value in columns.items():
+                sequence = isinstance(value, (list, tuple, np.ndarray))
+                values = value[start:start + count] if sequence else value
+                if name not in self.columns:
+                    self._add_column(name, values[0] if sequence and count else values)
+                if name not in self.arrays:
+                    continue
+                items = values if sequence else [values]
+                for item in items:
+                    if self.arrays[name].dtype == object:
+                        break
+                    if item is None:
+                        self._promote(name, np.nan)
+                    else:
+                        self._promote(name, item)
+                array = self.arrays[name]
+                if array.dtype == np.float64:
+                    values = [np.nan if item is None else item for item in items]
+                    if not sequence:
+                        values = values[0]
+                array[self.size:self.size + count] = values
+            self.size += count
+            start += count
+
+    def append_frame(self, dataframe=None, drop_cols=None):
+        """
+        Append every row of a DataFrame.
+        :param drop_cols: columns of dataframe not to store
+        """
+        drop_cols = drop_cols or []
+        self.append_rows(columns={name: dataframe[name].to_numpy()
+                                  for name in dataframe.columns if name not in drop_cols},
+                         n_rows=dataframe.shape[0])
+
+    def _clear_arrays(self):
+        for name, array in self.arrays.items():
+            if array.dtype == object:
+                array[:self.size] = None
+            elif array.dtype == np.float64:
+                array[:self.size] = np.nan
+            else:
+                array[:self.size] = 0
+        self.size = 0
+
+    def spill(self):
+        """
+        Write the rows held in memory to a chunk file and start over at row 0.
+        """
+        if not self.size:
+            return
+        if self.spill_dir is None:
+            self.spill_dir = tempfile.mkdtemp(prefix="lf_monitor_")
+            self.own_spill_dir = True
+        chunk_path = os.path.join(self.spill_dir, "chunk_%05d.npz" % len(self.chunk_files))
+        with open(chunk_path, 'wb') as chunk_file:
+            np.savez(chunk_file,
+                     __columns__=np.array(list(self.arrays.keys()), dtype=object),
+                     **{"c%d" % index: array[:self.size] for index, array in enumerate(self.arrays.values())})
+        if self.debug:
+            logger.debug("LFTimeSeriesBuffer: spilled {rows} rows to {path}".format(rows=self.size, path=chunk_path))
+        self.chunk_files.append(chunk_path)
+        self.rows_spilled += self.size
+        self._clear_arrays()
+
+    def _frame(self, arrays=None, n_rows=None):
+        import pandas as pd
+        data = {}
+        for name in self.columns:
+            if name in arrays:
+                data[name] = arrays[name]
+            elif name == self.timestamp_col and self.epoch_ms_col in arrays:
+                data[name] = pd.to_datetime(arrays[self.epoch_ms_col], unit='ms').strftime(self.timestamp_format)
+            else:
+                data[name] = np.full(n_rows, None, dtype=object)
+        return pd.DataFrame(data, columns=self.columns, copy=False)
+
+    def iter_frames(self):
+        """
+        Yield one DataFrame per spilled chunk, then one for the rows still in memory.
+        """
+        for chunk_path in self.chunk_files:
+            with np.load(chunk_path, allow_pickle=True) as chunk:
+                names = list(chunk['__columns__'])
+                arrays = {name: chunk["c%d" % index] for index, name in enumerate(names)}
+            yield self._frame(arrays=arrays, n_rows=len(arrays[names[0]]) if names else 0)
+        if self.size:
+            yield self._frame(arrays={name: array[:self.size] for name, array in self.arrays.items()},
+                              n_rows=self.size)
+
+    def to_pandas(self):
+        import pandas as pd
+        frames = list(self.iter_frames())
+        if not frames:
+            return pd.DataFrame(columns=self.columns)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
+
+    def to_csv(self, path=None):
+        """
+        Write all rows to a CSV file one chunk at a time.
+        """
+        header = True
+        for frame in self.iter_frames():
+            frame.to_csv(path, index=False, header=header, mode='w' if header else 'a')
+            header = False
+        if header:
+            self.to_pandas().to_csv(path, index=False)
+
+    def to_parquet(self, path=None):
+        """
+        Write all rows to a Parquet file, one row group per chunk. Requires pyarrow.
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as error:
+            logger.critical("LFTimeSeriesBuffer::to_parquet requires pyarrow")
+            raise ImportError("LFTimeSeriesBuffer::to_parquet requires pyarrow") from error
+        writer = None
+        try:
+            for frame in self.iter_frames():
+                table = pyarrow.Table.from_pandas(frame, preserve_index=False)
+                if writer is None:
+                    writer = pyarrow.parquet.ParquetWriter(path, table.schema)
+                elif table.schema != writer.schema:
+                    table = table.cast(writer.schema)
+                writer.write_table(table)
+        finally:
+            if writer is not None:
+                writer.close()
+        if writer is None:
+            self.to_pandas().to_parquet(path, index=False)
+
+    def close(self):
+        """
+        Drop spilled chunk files.
+        """
+        for chunk_path in self.chunk_files:
+            if os.path.exists(chunk_path):
+                os.remove(chunk_path)
+        self.chunk_files = []
+        self.rows_spilled = 0
+        if self.own_spill_dir and self.spill_dir:
+            shutil.rmtree(self.spill_dir, ignore_errors=True)
+            self.spill_dir = None
+            self.own_spill_dir = False
+
+
+class LFEndpointSampleStore:
+    """
+    Per-endpoint sample store for monitors that poll many endpoints at short intervals.
+    Each endpoint's samples go to their own LFTimeSeriesBuffer, so numeric fields are held
+    in typed arrays and memory stays bounded by `capacity` rows per endpoint.
+
+    Counter columns (monotonic totals such as bytes-rd) are stored as the difference from
+    the endpoint's previous sample. to_pandas() decodes them with a cumulative sum and
+    returns the rows in sample order; rates() turns the stored differences into per-second
+    rates without decoding.
+    """
+    Sample_Col = "__sample"
+    Order_Col = "__order"
+
+    def __init__(self,
+                 counter_cols=None,
+                 capacity=1024,
+                 spill_dir=None,
+                 epoch_ms_col="Timestamp milliseconds",
+                 timestamp_col="Timestamp",
+                 timestamp_format="%m/%d/%Y %I:%M:%S",
+                 debug=False):
+        self.counter_cols = list(counter_cols or [])
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self.epoch_ms_col = epoch_ms_col
+        self.timestamp_col = timestamp_col
+        self.timestamp_format = timestamp_format
+        self.debug = debug
+        self.buffers = {}  # endpoint name -> LFTimeSeriesBuffer
+        self.last_counters = {}  # endpoint name -> {counter column: last value}
+        self.columns = []  # endpoint fields in first-seen order
+        self.samples = 0
+
+    def __len__(self):
+        return sum(len(buffer) for buffer in self.buffers.values())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    def append_sample(self, epoch_ms=None, records=None):
+        """
+        Store one poll of every endpoint.
+        :param epoch_ms: sample time in milliseconds
+        :param records: list of (endpoint name, dict of field to value)
+        """
+        for order, (name, fields) in enumerate(records or []):
+            buffer = self.buffers.get(name)
+            if buffer is None:
+                spill_dir = None
+                if self.spill_dir:
+                    # chunk file names are per buffer, keep each endpoint in its own directory
+                    spill_dir = os.path.join(self.spill_dir, "endp_%05d" % len(self.buffers))
+                    os.makedirs(spill_dir, exist_ok=True)
+                buffer = LFTimeSeriesBuffer(capacity=self.capacity,
+                                            spill_dir=spill_dir,
+                                            epoch_ms_col=self.epoch_ms_col,
+                                            timestamp_col=self.timestamp_col,
+                                            timestamp_format=self.timestamp_format,
+                                            debug=self.debug)
+                self.buffers[name] = buffer
+            last = self.last_counters.setdefault(name, {})
+            # the formatted timestamp is derived from epoch_ms_col on export, not stored
+            row = {self.Sample_Col: self.samples, self.Order_Col: order,
+                   self.timestamp_col: None, self.epoch_ms_col: int(epoch_ms)}
+            for field, value in fields.items():
+                if field not in self.columns:
+                    self.columns.append(field)
+                if field in self.counter_cols:
+                    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+                        row[field] = value - last.get(field, 0)
+                        last[field] = value
+                    else:
+                        row[field] = None
+                else:
+                    row[field] = value
+            buffer.append_row(row)
+        self.samples += 1
+
+    def endpoint_frame(self, name):
+        """
+        :return: DataFrame of one endpoint's samples, counters still as differences
+        """
+        return self.buffers[name].to_pandas()
+
+    def to_pandas(self, columns=None):
+        """
+        :param columns: endpoint fields to return after the timestamp columns, default all in first-seen order
+        :return: DataFrame with one row per endpoint per sample, counters decoded
+        """
+        import pandas as pd
+        columns = list(columns) if columns is not None else list(self.columns)
+        frames = []
+        for name in self.buffers:
+            frame = self.endpoint_frame(name)
+            for counter in self.counter_cols:
+                if counter in frame.columns:
+                    frame[counter] = frame[counter].cumsum()
+            frames.append(frame)
+        out_columns = [self.timestamp_col, self.epoch_ms_col] + columns
+        if not frames:
+            return pd.DataFrame(columns=out_columns)
+        df = pd.concat(frames, ignore_index=True)
+        df = df.sort_values([self.Sample_Col, self.Order_Col], kind="stable").reset_index(drop=True)
+        return df.reindex(columns=out_columns)
+
+    def rates(self, counters=None):
+        """
+        Per-second rate of each counter between consecutive samples of the same endpoint.
+        The first sample of an endpoint and counters that went backwards get NaN.
+        :return: DataFrame of timestamp columns, 'name' and one '<counter>/s' column per counter
+        """
+        import pandas as pd
+        counters = [counter for counter in (counters or self.counter_cols) if counter in self.columns]
+        frames = []
+        for name in self.buffers:
+            frame = self.endpoint_frame(name)
+            epoch_ms = frame[self.epoch_ms_col].to_numpy(dtype=np.float64)
+            seconds = np.diff(epoch_ms, prepend=np.nan) / 1000.0
+            seconds[seconds <= 0] = np.nan
+            data = {self.timestamp_col: frame[self.timestamp_col],
+                    self.epoch_ms_col: frame[self.epoch_ms_col],
+                    'name': name}
+            for counter in counters:
+                deltas = pd.to_numeric(frame[counter], errors='coerce').to_numpy(dtype=np.float64)
+                deltas[deltas < 0] = np.nan
+                data["%s/s" % counter] = deltas / seconds
+            frames.append(pd.DataFrame(data))
+        if not frames:
+            return pd.DataFrame(columns=[self.timestamp_col, self.epoch_ms_col, 'name'] + ["%s/s" % c for c in counters])
+        return pd.concat(frames, ignore_index=True).sort_values(self.epoch_ms_col, kind="stable").reset_index(drop=True)
+
+    def close(self):
+        for buffer in self.buffers.values():
+            buffer.close()
+
+
 class LFDataCollection:
     def __init__(self, local_realm, debug=False):
         self.parent_realm = local_realm
         self.exit_on_error = False
         self.debug = debug or local_realm.debug
+        # monitor_interval() records every endpoint here unless given its own buffer
+        self.time_series = LFTimeSeriesBuffer(debug=self.debug)
 
     def json_get(self, _req_url, debug_=False):
         return self.parent_realm.json_get(_req_url, debug_=debug_)
@@ -51,7 +452,12 @@ class LFDataCollection:
     def monitor_interval(self, header_row_=None,
                          start_time_=None, sta_list_=None,
                          created_cx_=None, layer3_fields_=None,
-                         port_mgr_fields_=None):
+                         port_mgr_fields_=None,
+                         time_series_=None):
+        """
+        Returns the csv row for the first endpoint. A row for every endpoint is also appended
+        to time_series_ (an LFTimeSeriesBuffer), or to self.time_series when it is None.
+        """
 
         # time calculations for while loop and writing to csv
         t = datetime.datetime.now()
@@ -69,14 +475,17 @@ class LFDataCollection:
         self.check_json_validity(keyword="endpoint", json_response=layer_3_response)
         self.check_json_validity(keyword="interfaces", json_response=port_mgr_response)
 
+        if time_series_ is None:
+            time_series_ = self.time_series
+
         # dict manipulation
-        temp_list = []
+        first_row = None
         for endpoint in layer_3_response["endpoint"]:
             if self.debug:
                 logger.debug("Current endpoint values list... ")
                 logger.debug(list(endpoint.values())[0])
             temp_endp_values = list(endpoint.values())[0]  # dict
-            temp_list.extend([timestamp, t_to_millisec_epoch, time_elapsed])
+            temp_list = [timestamp, t_to_millisec_epoch, time_elapsed]
             current_sta = temp_endp_values['name']
             merge = {}
             if port_mgr_fields_ is not None:
@@ -93,6 +502,9 @@ class LFDataCollection:
                                 merge.update(renamed_port_cols)
             for name in header_row_[3:-3]:
                 temp_list.append(merge[name])
-            return temp_list
+            if first_row is None:
+                first_row = temp_list
+            time_series_.append_row(row=dict(zip(header_row_[:3] + header_row_[3:-3], temp_list)))
+        return first_row
 
 # class WebSocket():
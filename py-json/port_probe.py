@@ -4,6 +4,9 @@ from time import sleep
 # import pandas as pd
 import sys
 import os
+import re
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
 import logging
 import traceback
@@ -17,6 +20,117 @@ logger = logging.getLogger(__name__)
 
 # Probe data can change frequently. It is recommended to update
 
+# signal and bitrate lines of the iw station dump in the probe results, matched in one pass
+IW_PROBE_LINE_RE = re.compile(r"^[ \t]*(?P<key>[^:\n]*signal[^:\n]*|[tr]x bitrate)[ \t]*:[ \t]*(?P<value>[^\n]*)$",
+                              re.MULTILINE)
+# fields of a bitrate line, for example:
+#   866.7 MBit/s VHT-MCS 9 80MHz short GI VHT-NSS 2
+#   1200.9 MBit/s 80MHz HE-MCS 11 HE-NSS 2 HE-GI 0 HE-DCM 0
+#   300.0 MBit/s MCS 15 40MHz short GI
+IW_BITRATE_FIELD_RE = re.compile(r"(?P<mbit>[\d.]+) MBit/s"
+                                 r"|(?P<mhz>\d+)MHz"
+                                 r"|(?:(?P<mode>VHT|HE|EHT)-)?MCS (?P<mcs>\d+)"
+                                 r"|(?:VHT|HE|EHT)-NSS (?P<nss>\d+)"
+                                 r"|(?:HE|EHT)-GI (?P<gi>\d)"
+                                 r"|(?P<short_gi>short GI)")
+IW_SIGNAL_RE = re.compile(r"(?P<combined>-?\d+)(?:\s*\[(?P<chains>[^\]]*)\])?")
+
+# one tx or rx bitrate line, gi is in ns and None when not reported
+ProbeBitrate = namedtuple("ProbeBitrate", "bitrate mbit mode mcs nss mhz gi")
+# parsed probe results of a station, signals holds the raw signal lines keyed by name
+ProbeRecord = namedtuple("ProbeRecord", "signals signal signal_chains signal_avg signal_avg_chains "
+                                        "beacon_signal_avg tx rx")
+
+# modulation coded bits per subcarrier and coding rate by MCS (per spatial stream for HT)
+MCS_MODULATION = [(1, 1 / 2), (2, 1 / 2), (2, 3 / 4), (4, 1 / 2), (4, 3 / 4), (6, 2 / 3), (6, 3 / 4), (6, 5 / 6),
+                  (8, 3 / 4), (8, 5 / 6), (10, 3 / 4), (10, 5 / 6), (12, 3 / 4), (12, 5 / 6)]
+# per mode: highest MCS, highest NSS, data subcarriers by channel width, symbol duration (ns), guard intervals (ns)
+PHY_MODES = {
+    'HT': (7, 4, {20: 52, 40: 108, 80: 234, 160: 468}, 3200, (400, 800)),
+    'VHT': (9, 8, {20: 52, 40: 108, 80: 234, 160: 468}, 3200, (400, 800)),
+    'HE': (11, 8, {20: 234, 40: 468, 80: 980, 160: 1960}, 12800, (800, 1600, 3200)),
+    'EHT': (13, 8, {20: 234, 40: 468, 80: 980, 160: 1960, 320: 3920}, 12800, (800, 1600, 3200)),
+}
+# iw HE-GI / EHT-GI index to guard interval in ns
+HE_GI_NS = {0: 800, 1: 1600, 2: 3200}
+
+
+# theoretical phy rate in Mbps by (mode, mcs, nss, mhz, gi ns), HT mcs is the per stream mcs 0 - 7
+def build_phy_rate_table():
+    table = {}
+    for mode, (max_mcs, max_nss, subcarriers, t_dft, gi_list) in PHY_MODES.items():
+        for mcs in range(max_mcs + 1):
+            n_bpscs, r = MCS_MODULATION[mcs]
+            for nss in range(1, max_nss + 1):
+                for mhz, n_sd in subcarriers.items():
+                    for gi in gi_list:
+                        table[(mode, mcs, nss, mhz, gi)] = (n_sd * n_bpscs * r * nss) / (t_dft + gi) * 1000
+    return table
+
+
+PHY_RATE_MBPS = build_phy_rate_table()
+
+
+def phy_rate_mbps(mode, mcs, nss, mhz, gi):
+    return PHY_RATE_MBPS.get((mode, mcs, nss, mhz, gi))
+
+
+def parse_bitrate(value):
+    value = value.replace('\t', ' ').strip(' ')
+    fields = {'mbit': None, 'mhz': None, 'mode': None, 'mcs': None, 'nss': None, 'gi': None}
+    short_gi = False
+    for match in IW_BITRATE_FIELD_RE.finditer(value):
+        key = match.lastgroup
+        if key == 'short_gi':
+            short_gi = True
+        elif key == 'mbit':
+            fields['mbit'] = float(match.group('mbit'))
+        elif key == 'mcs':
+            fields['mode'] = match.group('mode') or 'HT'
+            fields['mcs'] = int(match.group('mcs'))
+        else:
+            fields[key] = int(match.group(key))
+    mode = fields['mode']
+    if mode in ('HE', 'EHT'):
+        fields['gi'] = HE_GI_NS.get(fields['gi'])
+    elif mode is not None:
+        fields['gi'] = 400 if short_gi else 800
+    if mode == 'HT' and fields['nss'] is None:
+        # nss is not present need to derive from MCS for HT
+        fields['nss'] = fields['mcs'] // 8 + 1
+    if fields['mhz'] is None:
+        # rx will received : 6Mbps encoding is legacy frame, for 24g - MHz is 20
+        fields['mhz'] = 20
+    return ProbeBitrate(bitrate=value, **fields)
+
+
+def parse_signal(value):
+    match = IW_SIGNAL_RE.search(value or '')
+    if match is None:
+        return None, []
+    chains = [int(chain) for chain in re.findall(r"-?\d+", match.group('chains') or '')]
+    return int(match.group('combined')), chains
+
+
+# parse the 'probe results' text of a station in a single pass
+def parse_probe_results(text):
+    signals = {}
+    bitrates = {}
+    for match in IW_PROBE_LINE_RE.finditer(text):
+        key = match.group('key').strip(' \t')
+        value = match.group('value')
+        if key in ('tx bitrate', 'rx bitrate'):
+            bitrates[key] = parse_bitrate(value)
+        else:
+            signals[key] = value.replace('\t', '').strip('dBm').strip(' ')
+    signal, signal_chains = parse_signal(signals.get('signal'))
+    signal_avg, signal_avg_chains = parse_signal(signals.get('signal avg'))
+    beacon_signal_avg, _ = parse_signal(signals.get('beacon signal avg'))
+    return ProbeRecord(signals=signals, signal=signal, signal_chains=signal_chains,
+                       signal_avg=signal_avg, signal_avg_chains=signal_avg_chains,
+                       beacon_signal_avg=beacon_signal_avg,
+                       tx=bitrates.get('tx bitrate'), rx=bitrates.get('rx bitrate'))
+
 
 class ProbePort(LFCliBase):
     def __init__(self,
@@ -31,6 +145,7 @@ class ProbePort(LFCliBase):
         self.eid_str = eid_str
         self.probepath = "/probe/1/%s/%s" % (hunks[-2], hunks[-1])
         self.response = None
+        self.record = None
         self.signals = None
         self.ofdma = False
 
@@ -59,116 +174,92 @@ class ProbePort(LFCliBase):
         self.data_rate = None
         # folder = os.path.dirname(__file__)
 
-    def refreshProbe(self):
+    # Probe many stations at once: every probe is requested before a single wait,
+    # then the results are read and parsed. Returns {eid: ProbePort} of the stations
+    # whose probe results were read, in the order of eid_list.
+    @staticmethod
+    def probe_many(lfhost=None, lfport='8080', eid_list=None, debug=False, max_workers=16):
+        probe_ports = [ProbePort(lfhost=lfhost, lfport=lfport, eid_str=eid, debug=debug) for eid in eid_list or []]
+        if not probe_ports:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(probe_ports))) as executor:
+            list(executor.map(ProbePort.request_probe, probe_ports))
+            sleep(0.2)
+            refreshed = list(executor.map(ProbePort.read_probe, probe_ports))
+        return {probe_port.eid_str: probe_port for probe_port, ok in zip(probe_ports, refreshed) if ok}
+
+    def request_probe(self):
         self.json_post(self.probepath, {})
-        sleep(0.2)
-        response = self.json_get(self.probepath)
-        self.response = response
-        if self.debug:
-            logger.debug("probepath (eid): {probepath}".format(probepath=self.probepath))
-            logger.debug(pformat("Probe response: {response}".format(response=self.response)))
-        text = self.response['probe-results'][0][self.eid_str]['probe results'].split('\n')
-        signals = [x.strip('\t').split(':') for x in text if 'signal' in x]
-        updated_s = [[sublist[0], sublist[1].replace('\t', '')] for sublist in signals]
-        keys = [x[0].strip(' ').strip(':') for x in updated_s]
-        values = [x[1].strip('dBm').strip(' ') for x in updated_s]
-        if self.debug:
-            logger.debug("signals keys: {keys}".format(keys=keys))
-            logger.debug("signals values: {values}".format(values=values))
-        self.signals = dict(zip(keys, values))
-        logger.debug(self.signals)
 
+    def read_probe(self):
         try:
-            tx_bitrate = [x for x in text if 'tx bitrate' in x][0].replace('\t', ' ')
-            # if 'HE' in tx_bitrate:
-            #    logger.info("HE not supported ")
-            logger.debug("tx_bitrate {tx_bitrate}".format(tx_bitrate=tx_bitrate))
-            self.tx_bitrate = tx_bitrate.split(':')[-1].strip(' ')
-            if 'MHz' in tx_bitrate:
-                self.tx_mhz = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split('MHz')[0].rsplit(' ')[-1].strip(
-                    ' ')
-                logger.debug("tx_mhz {tx_mhz}".format(tx_mhz=self.tx_mhz))
-            else:
-                self.tx_mhz = 20
-                logger.debug("HT: tx_mhz {tx_mhz}".format(tx_mhz=self.tx_mhz))
-            tx_mcs = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split(':')[1].strip('\t')
-            if 'MCS' in tx_mcs:
-                self.tx_mcs = int(tx_mcs.split('MCS')[1].strip(' ').split(' ')[0])
-                logger.debug("self.tx_mcs {tx_mcs}".format(tx_mcs=self.tx_mcs))
-                if 'NSS' in text:
-                    self.tx_nss = [x.strip('\t') for x in text if 'tx bitrate' in x][0].split('NSS')[1].strip(' ')
-                else:
-                    # nss is not present need to derive from MCS for HT
-                    if 0 <= self.tx_mcs <= 7:
-                        self.tx_nss = 1
-                    elif 8 <= self.tx_mcs <= 15:
-                        self.tx_nss = 2
-                    elif 16 <= self.tx_mcs <= 23:
-                        self.tx_nss = 3
-                    elif 24 <= self.tx_mcs <= 31:
-                        self.tx_nss = 4
-                logger.debug("tx_nss {tx_nss}".format(tx_nss=self.tx_nss))
-                self.tx_mbit = float(self.tx_bitrate.split(' ')[0])
-                logger.debug("tx_mbit {tx_mbit}".format(tx_mbit=self.tx_mbit))
-                if 'HE' in tx_bitrate:
-                    self.calculated_data_rate_tx_HE()
-                elif 'VHT' in tx_bitrate:
-                    self.calculated_data_rate_tx_VHT()
-                else:
-                    self.calculated_data_rate_tx_HT()
-            else:
-                logger.debug("No tx MCS value:{tx_bitrate}".format(tx_bitrate=tx_bitrate))
-
-            rx_bitrate = [x for x in text if 'rx bitrate' in x][0].replace('\t', ' ')
-            logger.debug("rx_bitrate {rx_bitrate}".format(rx_bitrate=rx_bitrate))
-            self.rx_bitrate = rx_bitrate.split(':')[-1].strip(' ')
-            logger.debug("self.rx_bitrate {rx_bitrate}".format(rx_bitrate=self.rx_bitrate))
-            # rx will received : 6Mbps encoding is legacy frame
-            # for 24g - MHz is 20
-            # try:
-            if 'MHz' in rx_bitrate:
-                self.rx_mhz = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split('MHz')[0].rsplit(' ')[
-                    -1].strip(' ')
-                logger.debug("rx_mhz {rx_mhz}".format(rx_mhz=self.rx_mhz))
-            else:
-                self.rx_mhz = 20
-
-            rx_mcs = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split(':')[1].strip('\t')
-            # MCS is not in the 6.0MBit/s frame
-            if 'MCS' in rx_mcs:
-                self.rx_mcs = int(rx_mcs.split('MCS')[1].strip(' ').split(' ')[0])
-                logger.debug("self.rx_mcs {rx_mcs}".format(rx_mcs=self.rx_mcs))
-                if 'NSS' in text:
-                    self.rx_nss = [x.strip('\t') for x in text if 'rx bitrate' in x][0].split('NSS')[1].strip(' ')
-                else:
-                    # nss is not present need to derive from MCS for HT
-                    if 0 <= self.rx_mcs <= 7:
-                        self.rx_nss = 1
-                    elif 8 <= self.rx_mcs <= 15:
-                        self.rx_nss = 2
-                    elif 16 <= self.rx_mcs <= 23:
-                        self.rx_nss = 3
-                    elif 24 <= self.rx_mcs <= 31:
-                        self.rx_nss = 4
-
-                self.rx_mbit = self.rx_bitrate.split(' ')[0]
-                logger.debug("rx_nss {rx_nss}".format(rx_nss=self.rx_nss))
-                self.rx_mbit = float(self.rx_bitrate.split(' ')[0])
-                logger.debug("rx_mbit {rx_mbit}".format(rx_mbit=self.rx_mbit))
-                if 'HE' in rx_bitrate:
-                    self.calculated_data_rate_rx_HE()
-                elif 'VHT' in rx_bitrate:
-                    self.calculated_data_rate_rx_VHT()
-                else:
-                    self.calculated_data_rate_rx_HT()
-            else:
-                logger.debug("No rx MCS value:{rx_bitrate}".format(rx_bitrate=rx_bitrate))
+            response = self.json_get(self.probepath)
+            self.response = response
+            if self.debug:
+                logger.debug("probepath (eid): {probepath}".format(probepath=self.probepath))
+                logger.debug(pformat("Probe response: {response}".format(response=self.response)))
+            self.set_probe_record(parse_probe_results(self.response['probe-results'][0][self.eid_str]['probe results']))
             return True
         except Exception as x:
             logger.warning("Probe response list was empty.")
             traceback.print_exception(Exception, x, x.__traceback__, chain=True)
             return False
 
+    def refreshProbe(self):
+        self.request_probe()
+        sleep(0.2)
+        return self.read_probe()
+
+    def set_probe_record(self, record):
+        self.record = record
+        self.signals = record.signals
+        if self.debug:
+            logger.debug("signals keys: {keys}".format(keys=list(self.signals.keys())))
+            logger.debug("signals values: {values}".format(values=list(self.signals.values())))
+        logger.debug(self.signals)
+        if record.tx is None or record.rx is None:
+            raise ValueError("{eid} probe results missing tx or rx bitrate".format(eid=self.eid_str))
+        for direction, bitrate in (('tx', record.tx), ('rx', record.rx)):
+            logger.debug("{direction}_bitrate {bitrate}".format(direction=direction, bitrate=bitrate))
+            setattr(self, direction + '_bitrate', bitrate.bitrate)
+            setattr(self, direction + '_mhz', bitrate.mhz)
+            setattr(self, direction + '_mbit', bitrate.mbit)
+            if bitrate.mcs is None:
+                # MCS is not in the 6.0MBit/s frame
+                logger.debug("No {direction} MCS value:{bitrate}".format(direction=direction, bitrate=bitrate.bitrate))
+                continue
+            setattr(self, direction + '_mcs', bitrate.mcs)
+            setattr(self, direction + '_nss', bitrate.nss)
+            self.calculated_data_rate(direction)
+
+    # theoretical data rate from the phy rate table, short and long are the shortest and longest
+    # guard interval of the mode, the calculated rate uses the reported guard interval or the one closest to the bitrate
+    def calculated_data_rate(self, direction):
+        bitrate = getattr(self.record, direction)
+        mode = bitrate.mode
+        mhz = bitrate.mhz
+        if mhz not in PHY_MODES[mode][2]:
+            logger.info("For {mode} if cannot be read bw is assumed to be 20".format(mode=mode))
+            mhz = 20
+            setattr(self, direction + '_mhz', mhz)
+        # HT mcs 8 - 31 carry the spatial streams, the rate table is per stream mcs
+        mcs = bitrate.mcs % 8 if mode == 'HT' else bitrate.mcs
+        gi_list = PHY_MODES[mode][4]
+        rates = {gi: phy_rate_mbps(mode, mcs, bitrate.nss, mhz, gi) for gi in gi_list}
+        logger.debug("{direction}: mode {mode} mcs {mcs} nss {nss} mhz {mhz} rates {rates}".format(
+            direction=direction, mode=mode, mcs=bitrate.mcs, nss=bitrate.nss, mhz=mhz, rates=rates))
+        setattr(self, direction + '_data_rate_gi_short_Mbps', rates[gi_list[0]])
+        setattr(self, direction + '_data_rate_gi_long_Mbps', rates[gi_list[-1]])
+        if None in rates.values():
+            logger.info("{direction} {mode} mcs {mcs} nss {nss} not in phy rate table".format(
+                direction=direction, mode=mode, mcs=bitrate.mcs, nss=bitrate.nss))
+            return
+        gi = bitrate.gi
+        if gi not in rates:
+            gi = min(gi_list, key=lambda gi_ns: abs((bitrate.mbit or 0) - rates[gi_ns]))
+        setattr(self, direction + '_mbit_calc', rates[gi])
+        setattr(self, direction + '_gi', gi * 10 ** -9)
+
     def getSignalAvgCombined(self):
         return self.signals['signal avg'].split(' ')[0]
 
@@ -183,538 +274,3 @@ class ProbePort(LFCliBase):
 
     def getBeaconSignalAvg(self):
         return ' '.join(self.signals['beacon signal avg']).replace(' ', '')
-
-    def calculated_data_rate_tx_HT(self):
-        logger.info("calculated_data_rate_tx_HT")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0 or self.tx_mcs == 8 or self.tx_mcs == 16 or self.tx_mcs == 24:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1 or self.tx_mcs == 9 or self.tx_mcs == 17 or self.tx_mcs == 25:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2 or self.tx_mcs == 10 or self.tx_mcs == 18 or self.tx_mcs == 26:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3 or self.tx_mcs == 11 or self.tx_mcs == 19 or self.tx_mcs == 27:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4 or self.tx_mcs == 12 or self.tx_mcs == 20 or self.tx_mcs == 28:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5 or self.tx_mcs == 13 or self.tx_mcs == 21 or self.tx_mcs == 29:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6 or self.tx_mcs == 14 or self.tx_mcs == 22 or self.tx_mcs == 30:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7 or self.tx_mcs == 15 or self.tx_mcs == 23 or self.tx_mcs == 31:
-            R = 5 / 6
-            N_bpscs = 6
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.info("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
-
-    def calculated_data_rate_rx_HT(self):
-        logger.info("calculated_data_rate_rx_HT")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0 or self.rx_mcs == 8 or self.rx_mcs == 16 or self.rx_mcs == 24:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1 or self.rx_mcs == 9 or self.rx_mcs == 17 or self.rx_mcs == 25:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2 or self.rx_mcs == 10 or self.rx_mcs == 18 or self.rx_mcs == 26:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3 or self.rx_mcs == 11 or self.rx_mcs == 19 or self.rx_mcs == 27:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4 or self.rx_mcs == 12 or self.rx_mcs == 20 or self.rx_mcs == 28:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5 or self.rx_mcs == 13 or self.rx_mcs == 21 or self.rx_mcs == 29:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6 or self.rx_mcs == 14 or self.rx_mcs == 22 or self.rx_mcs == 30:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7 or self.rx_mcs == 15 or self.rx_mcs == 23 or self.rx_mcs == 31:
-            R = 5 / 6
-            N_bpscs = 6
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
-
-    def calculated_data_rate_tx_VHT(self):
-        logger.info("calculated_data_rate_tx_VHT")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.tx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.tx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
-
-    def calculated_data_rate_rx_VHT(self):
-        logger.info("calculated_data_rate_rx_VHT")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.rx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.rx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
-        ##########################################
-        #
-        # HE no OFDMA - changes the calculations
-        #
-        ###########################################
-
-    def calculated_data_rate_tx_HE(self):
-        logger.info("calculated_data_rate_tx_HE")
-        # TODO compare with standard for 40 MHz if values change
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        bw = 20
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.tx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.tx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.tx_mhz = 20
-
-        # NSS
-        N_ss = self.tx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.tx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.tx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.tx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.tx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.tx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.tx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.tx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.tx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.tx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.tx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-
-        self.tx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("tx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.tx_data_rate_gi_short_Mbps))
-
-        logger.debug(
-            "tx: mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.tx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-
-        self.tx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("data_rate gi_long {data_rate} Mbps".format(data_rate=self.tx_data_rate_gi_long_Mbps))
-
-        if abs(self.tx_mbit - self.tx_data_rate_gi_short_Mbps) <= abs(self.tx_mbit - self.tx_data_rate_gi_long_Mbps):
-            self.tx_mbit_calc = self.tx_data_rate_gi_short_Mbps
-            self.tx_gi = T_gi_short
-        else:
-            self.tx_mbit_calc = self.tx_data_rate_gi_long_Mbps
-            self.tx_gi = T_gi_long
-
-    def calculated_data_rate_rx_HE(self):
-        logger.info("calculated_data_rate_rx_HE")
-        N_sd = 0  # Number of Data Subcarriers based on modulation and bandwith
-        N_bpscs = 0  # Number of coded bits per Subcarrier(Determined by the modulation, MCS)
-        R = 0  # coding ,  (Determined by the modulation, MCS )
-        N_ss = 0  # Number of Spatial Streams
-        T_dft = 3.2 * 10 ** -6  # Constant for HT
-        T_gi_short = .4 * 10 ** -6  # Guard index.
-        T_gi_long = .8 * 10 ** -6  # Guard index.
-        # Note the T_gi is not exactly know so need to calculate bothh with .4 and .8
-        # the nubmer of Data Subcarriers is based on modulation and bandwith
-        bw = int(self.rx_mhz)
-        logger.info("Mhz {Mhz}".format(Mhz=self.rx_mhz))
-        if bw == 20:
-            N_sd = 52
-        elif bw == 40:
-            N_sd = 108
-        elif bw == 80:
-            N_sd = 234
-        elif bw == 160:
-            N_sd = 468
-        else:
-            logger.info("For HT if cannot be read bw is assumed to be 20")
-            N_sd = 52
-            self.rx_mhz = 20
-        # NSS
-        N_ss = self.rx_nss
-        # MCS (Modulation Coding Scheme) determines the constands
-        # MCS 0 == Modulation BPSK R = 1/2 ,  N_bpscs = 1,
-        # Only for HT configuration
-        if self.rx_mcs == 0:
-            R = 1 / 2
-            N_bpscs = 1
-        # MCS 1 == Modulation QPSK R = 1/2 , N_bpscs = 2
-        elif self.rx_mcs == 1:
-            R = 1 / 2
-            N_bpscs = 2
-        # MCS 2 == Modulation QPSK R = 3/4 , N_bpscs = 2
-        elif self.rx_mcs == 2:
-            R = 3 / 4
-            N_bpscs = 2
-        # MCS 3 == Modulation 16-QAM R = 1/2 , N_bpscs = 4
-        elif self.rx_mcs == 3:
-            R = 1 / 2
-            N_bpscs = 4
-        # MCS 4 == Modulation 16-QAM R = 3/4 , N_bpscs = 4
-        elif self.rx_mcs == 4:
-            R = 3 / 4
-            N_bpscs = 4
-        # MCS 5 == Modulation 64-QAM R = 2/3 , N_bpscs = 6
-        elif self.rx_mcs == 5:
-            R = 2 / 3
-            N_bpscs = 6
-        # MCS 6 == Modulation 64-QAM R = 3/4 , N_bpscs = 6
-        elif self.rx_mcs == 6:
-            R = 3 / 4
-            N_bpscs = 6
-        # MCS 7 == Modulation 64-QAM R = 5/6 , N_bpscs = 6
-        elif self.rx_mcs == 7:
-            R = 5 / 6
-            N_bpscs = 6
-        # MCS 8 == Modulation 256-QAM R = 3/4 , N_bpscs = 8
-        elif self.rx_mcs == 8:
-            R = 3 / 4
-            N_bpscs = 8
-        # MCS 9 == Modulation 256-QAM R = 5/6 , N_bpscs = 8
-        elif self.rx_mcs == 9:
-            R = 5 / 6
-            N_bpscs = 8
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_short {T_gi_short}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_short=T_gi_short))
-        self.rx_data_rate_gi_short_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_short)) / 1000000
-        logger.debug("rx_data_rate gi_short {data_rate} Mbit/s".format(data_rate=self.rx_data_rate_gi_short_Mbps))
-        logger.debug(
-            "mcs {mcs} N_sd {N_sd} N_bpscs {N_bpscs} R {R} N_ss {N_ss}  T_dft {T_dft} T_gi_long {T_gi_long}".format(
-                mcs=self.rx_mcs, N_sd=N_sd, N_bpscs=N_bpscs, R=R, N_ss=N_ss, T_dft=T_dft, T_gi_long=T_gi_long))
-        self.rx_data_rate_gi_long_Mbps = ((N_sd * N_bpscs * R * float(N_ss)) / (T_dft + T_gi_long)) / 1000000
-        logger.debug("rx_data_rate gi_long {data_rate} Mbps".format(data_rate=self.rx_data_rate_gi_long_Mbps))
-        if abs(self.rx_mbit - self.rx_data_rate_gi_short_Mbps) <= abs(
-                self.rx_mbit - self.rx_data_rate_gi_long_Mbps):
-            self.rx_mbit_calc = self.rx_data_rate_gi_short_Mbps
-            self.rx_gi = T_gi_short
-        else:
-            self.rx_mbit_calc = self.rx_data_rate_gi_long_Mbps
-            self.rx_gi = T_gi_long
@@ -64,6 +64,8 @@ lfdata = importlib.import_module("py-json.lfdata")
 LFDataCollection = lfdata.LFDataCollection
 vr_profile2 = importlib.import_module("py-json.vr_profile2")
 VRProfile = vr_profile2.VRProfile
+teardown_profile = importlib.import_module("py-json.teardown_profile")
+TeardownProfile = teardown_profile.TeardownProfile
 
 
 
@@ -842,66 +844,32 @@ class Realm(LFCliBase):
             if debug:
                 logger.debug("Auto-Timeout requested, using: %s" % timeout_sec)
 
-        stas_without_ip4s = {}
-        stas_without_ip6s = {}
-
-        sec_elapsed = 0
-        start_time = int(time.time())
-        # logger.info(station_list)
-        waiting_states = ["0.0.0.0", "NA", "", 'DELETED', 'AUTO']
         if (station_list is None) or (len(station_list) < 1):
             logger.critical("wait_for_ip: expects non-empty list of ports")
             raise ValueError("wait_for_ip: expects non-empty list of ports")
 
-        wait_more = True
-        while wait_more:
-            wait_more = False
-            stas_without_ip4s = {}
-            stas_without_ip6s = {}
-
-            for sta_eid in station_list:
-                eid = self.name_to_eid(sta_eid)
+        # all stations are fetched with one /port request per pass
+        waiter = LFUtils.PortStateWaiter(base_url=self.lfclient_url,
+                                         port_list=station_list,
+                                         predicate=lambda record: LFUtils.port_has_ip(record, ipv4=ipv4, ipv6=ipv6),
+                                         fields=['ip', 'port type', 'ipv6 address'],
+                                         min_interval_sec=0.5,
+                                         debug=debug)
+        waiter.wait(timeout_sec=timeout_sec)
 
-                response = super().json_get("/port/%s/%s/%s?fields=alias,ip,port+type,ipv6+address" %
-                                            (eid[0], eid[1], eid[2]))
-                # logger.info(pformat(response))
-
-                if (response is None) or ("interface" not in response):
-                    logger.info("station_list: incomplete response for eid: %s:  wait longer" % sta_eid)
-                    logger.info(pformat(response))
-                    wait_more = True
-                    break
-
-                if ipv4:
-                    v = response['interface']
-                    if v['ip'] in waiting_states:
-                        wait_more = True
-                        stas_without_ip4s[sta_eid] = True
-                        if debug:
-                            logger.debug("Waiting for port %s to get IPv4 Address try %s / %s" % (sta_eid, sec_elapsed, timeout_sec))
-                    else:
-                        if debug:
-                            logger.debug("Found IP: %s on port: %s" % (v['ip'], sta_eid))
-
-                if ipv6:
-                    v = response['interface']
-                    # logger.info(v)
-                    ip6a = v['ipv6_address']
-                    if ip6a != 'DELETED' and not ip6a.startswith('fe80') and ip6a != 'AUTO':
-                        if debug:
-                            logger.debug("Found IPv6: %s on port: %s" % (ip6a, sta_eid))
-                    else:
-                        stas_without_ip6s[sta_eid] = True
-                        wait_more = True
-                        if debug:
-                            logger.debug("Waiting for port %s to get IPv6 Address try %s / %s, reported: %s." % (sta_eid, sec_elapsed, timeout_sec, ip6a))
-
-            # Check if we need to wait more but timed out. Otherwise, continue polling
-            cur_time = int(time.time())
-            if wait_more and (cur_time - start_time) > timeout_sec:
-                break # Timed out. Exit while loop
-            else:
-                sec_elapsed += 1
+        stas_without_ip4s = {}
+        stas_without_ip6s = {}
+        for sta_eid in waiter.pending:
+            record = waiter.records.get(sta_eid)
+            if record is None:
+                logger.info("station_list: incomplete response for eid: %s" % sta_eid)
+            if ipv4 and not LFUtils.port_has_ip(record, ipv4=True, ipv6=False):
+                stas_without_ip4s[sta_eid] = True
+            if ipv6 and not LFUtils.port_has_ip(record, ipv4=False, ipv6=True):
+                stas_without_ip6s[sta_eid] = True
+        if debug:
+            for (sta_eid, elapsed_sec) in sorted(waiter.time_to_state.items(), key=lambda item: item[1]):
+                logger.debug("Found IP on port: %s after %.1f sec" % (sta_eid, elapsed_sec))
 
         # If not all ports got IP addresses before timeout, and debugging is enabled, then
         # add logging.
@@ -1015,67 +983,41 @@ class Realm(LFCliBase):
         return duration_sec
 
     def remove_all_stations(self, resource):
-        port_list = self.station_list()
-        sta_list = []
-        if port_list:
+        teardown = self.new_teardown_profile()
+        sta_list = [port_eid for (port_eid, port) in teardown.list_ports().items()
+                    if "sta" in self.name_to_eid(port_eid)[2] and port['resource'] == str(resource)]
+        if sta_list:
             logger.info("Removing all stations")
-            for item in list(port_list):
-                if "sta" in list(item)[0]:
-                    sta_list.append(self.name_to_eid(list(item)[0])[2])
-
-            for sta_name in sta_list:
-                req_url = "cli-json/rm_vlan"
-                data = {
-                    "shelf": 1,
-                    "resource": resource,
-                    "port": sta_name
-                }
-                self.json_post(req_url, data)
+        return teardown.teardown(port_eids=sta_list)['port']
 
     def remove_all_endps(self):
-        endp_list = self.json_get("/endp/list")
-        if "items" in endp_list or "empty" in endp_list:
-            return
-        if endp_list:
-            logger.info("Removing all endps")
-            endp_list = list(endp_list['endpoint'])
-            for endp_name in range(len(endp_list)):
-                name = list(endp_list[endp_name])[0]
-                req_url = "cli-json/rm_endp"
-                data = {
-                    "endp_name": name
-                }
-                self.json_post(req_url, data)
+        teardown = self.new_teardown_profile()
+        endp_list = list(teardown.list_endps())
+        if not endp_list:
+            return []
+        logger.info("Removing all endps")
+        not_removed = teardown.teardown(endp_names=endp_list)
+        return not_removed['cx'] + not_removed['endp']
 
     def remove_all_cxs(self, remove_all_endpoints=False):
-        # remove cross connects
-        # remove endpoints
+        # remove cross connects, then their endpoints, in one teardown
         # nc show endpoints
-        # nc show cross connects
-        if self.cx_list():
-            cx_list = list(self.cx_list())
-            not_cx = ['warnings', 'errors', 'handler', 'uri', 'items', 'empty']
-            if cx_list:
-                logger.info("Removing all cxs")
-                for cx_name in cx_list:
-                    if cx_name in not_cx:
-                        continue
-                    req_url = "cli-json/rm_cx"
-                    data = {
-                        "test_mgr": "default_tm",
-                        "cx_name": cx_name
-                    }
-                    self.json_post(req_url, data)
+        teardown = self.new_teardown_profile()
+        cx_list = list(teardown.list_cxs())
+        endp_list = list(teardown.list_endps()) if remove_all_endpoints else []
+        if cx_list:
+            logger.info("Removing all cxs")
         else:
             logger.info("no cxs to remove")
+        not_removed = teardown.teardown(cx_names=cx_list, endp_names=endp_list)
 
         if remove_all_endpoints:
-            self.remove_all_endps()
             req_url = "cli-json/nc_show_endpoints"
             data = {
                 "endpoint": "all"
             }
             self.json_post(req_url, data)
+        return not_removed['cx'] + not_removed['endp']
 
     def set_custom_wifi(self, resource, station, cmd):  # bg-scanning
         bg_scan = {
@@ -1124,6 +1066,9 @@ class Realm(LFCliBase):
                            debug_=self.debug,
                            report_timer_=3000)
 
+    def new_teardown_profile(self, **kwargs):
+        return TeardownProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug, **kwargs)
+
     def new_l4_cx_profile(self):
         return L4CXProfile(self.lfclient_host, self.lfclient_port, local_realm=self, debug_=self.debug)
 
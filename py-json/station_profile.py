@@ -3,6 +3,8 @@ import pprint
 import sys
 import os
 import importlib
+import copy
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pformat
 import time
 import datetime
@@ -448,7 +450,12 @@ class StationProfile:
                use_radius=False,
                hs20_enable=False,
                sleep_time=0.02,
-               timeout=300):
+               timeout=300,
+               wait_for_ports=True):
+        """
+        :param wait_for_ports: when False, return after the stations are requested without
+        waiting for them to appear or setting them admin-up; create_many() waits once for all radios
+        """
         if debug:
             logger.debug('Start station_profile.create')
             logger.debug(pformat('Current ports:{ports}'.format(ports=LFRequest.LFRequest(self.lfclient_url + '/ports', debug_=debug))))
@@ -617,6 +624,9 @@ class StationProfile:
             self.station_names.append("%s.%s.%s" % (radio_shelf, radio_resource, name))
             time.sleep(sleep_time)
 
+        if not wait_for_ports:
+            return True
+
         logger.debug('StationProfile.create debug: {port}'.format(port=pformat(self.local_realm.json_get('/port/'))))
         logger.debug("- ~3287 - waitUntilPortsAppear - - - - - - - - - - - - - - - - - - ")
 
@@ -643,6 +653,95 @@ class StationProfile:
             logger.debug("created {num} stations".format(num=num))
         return True
 
+    def _clone_for_radio(self):
+        # copy of this profile whose command data can be changed by create() without
+        # disturbing creates running on other radios
+        clone = copy.copy(self)
+        for attr in ("add_sta_data", "set_port_data", "wifi_extra_data", "wifi_txo_data",
+                     "reset_port_extra_data", "desired_add_sta_flags", "desired_add_sta_flags_mask",
+                     "desired_set_port_cmd_flags", "desired_set_port_current_flags",
+                     "desired_set_port_interest_flags"):
+            setattr(clone, attr, copy.deepcopy(getattr(self, attr)))
+        clone.station_names = list(self.station_names)
+        return clone
+
+    def create_many(self,
+                    radio_to_count=None,
+                    max_workers=4,
+                    up_=None,
+                    debug=False,
+                    suppress_related_commands_=True,
+                    use_radius=False,
+                    hs20_enable=False,
+                    sleep_time=0.02,
+                    timeout=300):
+        """
+        Create stations on several radios at once, then wait once for all of them to appear
+        and, when the profile is up, to come admin-up. Every radio gets this profile's ssid,
+        security, mode and flags.
+        :param radio_to_count: dict of radio EID (1.1.wiphy0) to a number of stations or a list of station names.
+        Numbered stations continue the series per resource, so two radios on one resource do not reuse names.
+        :param max_workers: most radios creating stations at the same time
+        :return: True if every station appeared (and came up), False otherwise
+        """
+        if not radio_to_count:
+            logger.critical("StationProfile.create_many needs radio_to_count")
+            raise ValueError("StationProfile.create_many needs radio_to_count")
+        if up_ is not None:
+            self.up = up_
+
+        next_number = {}  # (shelf, resource) -> next station number
+        radio_to_names = {}
+        for (radio, count_or_names) in radio_to_count.items():
+            radio_eid = self.local_realm.name_to_eid(radio)
+            if isinstance(count_or_names, int):
+                key = (radio_eid[0], radio_eid[1])
+                start_id = next_number.get(key, int(self.number_template))
+                radio_to_names[radio] = LFUtils.port_name_series(prefix="sta",
+                                                                 start_id=start_id,
+                                                                 end_id=start_id + count_or_names - 1,
+                                                                 padding_number=10000,
+                                                                 radio=radio)
+                next_number[key] = start_id + count_or_names
+            else:
+                radio_to_names[radio] = list(count_or_names)
+
+        def create_radio(radio):
+            worker = self._clone_for_radio()
+            worker.create(radio=radio,
+                          sta_names_=radio_to_names[radio],
+                          up_=self.up,
+                          debug=debug,
+                          suppress_related_commands_=suppress_related_commands_,
+                          use_radius=use_radius,
+                          hs20_enable=hs20_enable,
+                          sleep_time=sleep_time,
+                          timeout=timeout,
+                          wait_for_ports=False)
+            return [eid for eid in worker.station_names if eid not in self.station_names]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(radio_to_names)))) as executor:
+            for station_names in executor.map(create_radio, list(radio_to_names.keys())):
+                for eid in station_names:
+                    if eid not in self.station_names:
+                        self.station_names.append(eid)
+
+        wanted_eids = []
+        for (radio, names) in radio_to_names.items():
+            radio_eid = self.local_realm.name_to_eid(radio)
+            for name in names:
+                wanted_eids.append("%s.%s.%s" % (radio_eid[0], radio_eid[1], LFUtils.name_to_eid(name)[2]))
+        if not LFUtils.wait_until_ports_appear(self.lfclient_url, wanted_eids, debug=debug, timeout=timeout):
+            logger.error('ERROR: Failed to create all ports, Desired stations: {eids}'.format(eids=wanted_eids))
+            return False
+        if not self.up:
+            return True
+        self.admin_up()
+        return LFUtils.wait_until_ports_admin_up(base_url=self.lfclient_url,
+                                                 port_list=wanted_eids,
+                                                 debug_=debug,
+                                                 timeout=timeout)
+
     def modify(self, radio):
         for station in self.station_names:
             logger.info(f"modifying station {station}")
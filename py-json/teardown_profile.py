@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+NAME: teardown_profile.py
+
+PURPOSE: Bulk removal of cross connects, endpoints and ports.
+
+    Deletions are planned by dependency: a cross connect is removed before the endpoints
+    it uses, and endpoints before ports. Each stage is posted per resource in batches,
+    with several batches in flight per resource. Objects still present are found with
+    one listing per pass, not one query per object. Whatever cannot be removed before
+    the timeout is returned to the caller.
+
+EXAMPLE:
+    teardown = realm.new_teardown_profile()
+    not_removed = teardown.teardown(cx_names=['udp-0'], port_eids=['1.1.sta0000', '1.2.sta0000'])
+    if any(not_removed.values()):
+        print(not_removed)
+
+LICENSE:
+    Free to distribute and modify. LANforge systems must be licensed.
+    Copyright 2023 Candela Technologies Inc
+"""
+import sys
+import os
+import importlib
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+
+sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
+
+lfcli_base = importlib.import_module("py-json.LANforge.lfcli_base")
+LFCliBase = lfcli_base.LFCliBase
+LFUtils = importlib.import_module("py-json.LANforge.LFUtils")
+
+logger = logging.getLogger(__name__)
+
+# keys of a /cx or /endp response that are not objects
+NOT_ITEMS = ('handler', 'uri', 'warnings', 'errors', 'items', 'empty')
+# the /cx column "endpoints (a <-> b)", non-breaking spaces around the arrow, holding "<endp a> <-> <endp b>"
+CX_ENDPOINTS_FIELD = "endpoints+%28a%C2%A0%E2%86%94%C2%A0b%29"
+
+
+def eid_resource(eid, default=1):
+    """
+    :param eid: entity id like 1.2.sta0000 or 1.2.3.4
+    :return: the resource number as a string
+    """
+    parts = str(eid).split('.')
+    if len(parts) > 1 and parts[1].isdigit():
+        return parts[1]
+    return str(default)
+
+
+class TeardownProfile(LFCliBase):
+    STAGES = ('cx', 'endp', 'port')
+
+    def __init__(self, lfclient_host, lfclient_port,
+                 local_realm=None,
+                 batch_size=50,
+                 max_in_flight=4,
+                 max_workers=16,
+                 pass_interval_sec=1.0,
+                 retry_interval_sec=10.0,
+                 timeout_sec=120,
+                 debug_=False):
+        """
+        :param batch_size: removal commands posted back to back by one worker
+        :param max_in_flight: batches outstanding at once on any one resource
+        :param max_workers: batches outstanding at once over all resources
+        :param pass_interval_sec: seconds between listings while waiting for a stage
+        :param retry_interval_sec: removals still listed after this long are posted again
+        :param timeout_sec: seconds to wait for each stage before giving up on what is left
+        """
+        super().__init__(lfclient_host, lfclient_port, debug_)
+        self.local_realm = local_realm
+        self.batch_size = max(1, int(batch_size))
+        self.max_in_flight = max(1, int(max_in_flight))
+        self.max_workers = max(1, int(max_workers))
+        self.pass_interval_sec = pass_interval_sec
+        self.retry_interval_sec = retry_interval_sec
+        self.timeout_sec = timeout_sec
+        self.not_removed = {stage: [] for stage in self.STAGES}
+        self.posted = 0
+
+    # cx name -> {'resource', 'endpoints'}, one request for every cross connect
+    def list_cxs(self):
+        cx_json = self.json_get("/cx/all?fields=name,entity+id," + CX_ENDPOINTS_FIELD, debug_=self.debug)
+        cxs = {}
+        if not cx_json:
+            return cxs
+        for (name, record) in cx_json.items():
+            if name in NOT_ITEMS or not isinstance(record, dict):
+                continue
+            endpoints = next((value for (key, value) in record.items() if key.startswith('endpoints')), None) or []
+            if isinstance(endpoints, str):
+                endpoints = endpoints.split('\u2194')
+            cxs[name] = {'resource': eid_resource(record.get('entity id')),
+                         'endpoints': [endp.strip() for endp in endpoints if endp.strip()]}
+        return cxs
+
+    # endp name -> {'resource'}, one request for every endpoint
+    def list_endps(self):
+        endp_json = self.json_get("/endp/all?fields=name,eid", debug_=self.debug)
+        endps = {}
+        if not endp_json or 'endpoint' not in endp_json:
+            return endps
+        records = endp_json['endpoint']
+        if isinstance(records, dict):
+            # a single endpoint comes back without the name -> record wrapper
+            records = [{records.get('name', ''): records}]
+        for record in records:
+            for (name, values) in record.items():
+                if not name or not values.get('name', name):
+                    continue
+                endps[name] = {'resource': eid_resource(values.get('eid'))}
+        return endps
+
+    # port eid -> {'resource', 'port type'}, one request for every port
+    def list_ports(self):
+        port_json = self.json_get("/port/all?fields=alias,port+type", debug_=self.debug)
+        ports = {}
+        if not port_json or 'interfaces' not in port_json:
+            return ports
+        for record in port_json['interfaces']:
+            for (port_eid, values) in record.items():
+                ports[port_eid] = {'resource': eid_resource(port_eid),
+                                   'port type': values.get('port type')}
+        return ports
+
+    def list_stage(self, stage):
+        if stage == 'cx':
+            return self.list_cxs()
+        if stage == 'endp':
+            return self.list_endps()
+        return self.list_ports()
+
+    def plan(self, cx_names=None, endp_names=None, port_eids=None, cx_map=None):
+        """
+        Order the removals: an endpoint still used by a cross connect takes that cross connect
+        with it, and the cross connects go first.
+        :param cx_map: list_cxs() result if the caller already has one
+        :return: dict of stage -> list of names, in removal order
+        """
+        cx_names = list(cx_names or [])
+        endp_names = list(endp_names or [])
+        if endp_names:
+            if cx_map is None:
+                cx_map = self.list_cxs()
+            wanted_endps = set(endp_names)
+            for (cx_name, cx) in cx_map.items():
+                endpoints = cx['endpoints']
+                if not endpoints:
+                    # layer-3 endpoints are named <cx>-A/<cx>-B, layer 4-7 cross connects CX_<endp>
+                    endpoints = [cx_name + "-A", cx_name + "-B"]
+                    if cx_name.startswith("CX_"):
+                        endpoints.append(cx_name[len("CX_"):])
+                if cx_name not in cx_names and wanted_endps.intersection(endpoints):
+                    cx_names.append(cx_name)
+        return {'cx': list(dict.fromkeys(cx_names)),
+                'endp': list(dict.fromkeys(endp_names)),
+                'port': list(dict.fromkeys(port_eids or []))}
+
+    def rm_command(self, stage, name):
+        if stage == 'cx':
+            return "cli-json/rm_cx", {"test_mgr": "all", "cx_name": name}
+        if stage == 'endp':
+            return "cli-json/rm_endp", {"endp_name": name}
+        eid = LFUtils.name_to_eid(name)
+        return "cli-json/rm_vlan", {"shelf": eid[0], "resource": eid[1], "port": eid[2]}
+
+    def post_batch(self, stage, names, slot):
+        try:
+            for name in names:
+                (req_url, data) = self.rm_command(stage, name)
+                self.json_post(req_url, data, debug_=self.debug, suppress_related_commands_=True)
+        finally:
+            slot.release()
+        return len(names)
+
+    def submit(self, stage, names, resources=None):
+        """
+        Post removal commands for names, batch_size at a time per resource and no more than
+        max_in_flight batches per resource at once. Returns once every command is posted.
+        :param resources: dict of name -> resource, names not in it are keyed by their eid
+        """
+        resources = resources or {}
+        by_resource = {}
+        for name in names:
+            resource = resources.get(name) or eid_resource(name)
+            by_resource.setdefault(resource, []).append(name)
+        resource_batches = [[(resource, resource_names[start:start + self.batch_size])
+                             for start in range(0, len(resource_names), self.batch_size)]
+                            for (resource, resource_names) in by_resource.items()]
+        # interleave the resources so one busy resource does not hold up the rest
+        batches = [batch for round_batches in zip_longest(*resource_batches) for batch in round_batches if batch]
+        slots = {resource: threading.BoundedSemaphore(self.max_in_flight) for resource in by_resource}
+        futures = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(1, len(batches)))) as executor:
+            for (resource, batch) in batches:
+                slots[resource].acquire()
+                futures.append(executor.submit(self.post_batch, stage, batch, slots[resource]))
+        posted = sum(future.result() for future in futures)
+        self.posted += posted
+        logger.info("teardown: posted %d %s removals over %d resources" % (posted, stage, len(by_resource)))
+        return posted
+
+    def wait_stage(self, stage, names, resources=None):
+        """
+        List the stage once per pass until none of names remain, posting removals again
+        for any that linger past retry_interval_sec.
+        :return: sorted list of names still present at the timeout
+        """
+        pending = set(names)
+        start_time = time.monotonic()
+        last_retry = start_time
+        while pending:
+            present = self.list_stage(stage)
+            pending = pending.intersection(present)
+            if not pending:
+                break
+            now = time.monotonic()
+            if now - start_time > self.timeout_sec:
+                logger.warning("teardown: %d %s objects not removed after %ss: %s"
+                               % (len(pending), stage, self.timeout_sec, sorted(pending)))
+                break
+            if now - last_retry > self.retry_interval_sec:
+                last_retry = now
+                self.submit(stage, sorted(pending), resources)
+            time.sleep(self.pass_interval_sec)
+        return sorted(pending)
+
+    def teardown(self, cx_names=None, endp_names=None, port_eids=None, wait=True):
+        """
+        Remove the objects in dependency order, waiting for each stage to clear before the next.
+        :return: dict of stage -> names that could not be removed
+        """
+        cx_map = self.list_cxs() if (cx_names or endp_names) else {}
+        plan = self.plan(cx_names=cx_names, endp_names=endp_names, port_eids=port_eids, cx_map=cx_map)
+        self.not_removed = {stage: [] for stage in self.STAGES}
+        for stage in self.STAGES:
+            names = plan[stage]
+            if not names:
+                continue
+            resources = {}
+            if stage == 'cx':
+                resources = {name: cx['resource'] for (name, cx) in cx_map.items()}
+            elif stage == 'endp':
+                resources = {name: endp['resource'] for (name, endp) in self.list_endps().items()}
+            self.submit(stage, names, resources)
+            if wait:
+                self.not_removed[stage] = self.wait_stage(stage, names, resources)
+        return self.not_removed
+
+    def remove_all(self, resources=None, cxs=True, endps=True, port_filter=None):
+        """
+        Remove every cross connect and endpoint, and the ports port_filter accepts.
+        :param resources: resource numbers to clean, None or 'all' for every resource
+        :param port_filter: callable(port_eid, port_record) -> bool, None removes no ports
+        :return: dict of stage -> names that could not be removed
+        """
+        def selected(resource):
+            return (resources is None) or ('all' in resources) or (str(resource) in resources)
+
+        if isinstance(resources, (str, int)):
+            resources = [str(resources)] if str(resources) == 'all' else str(resources).split(',')
+        cx_names = []
+        endp_names = []
+        port_eids = []
+        if cxs:
+            cx_names = [name for (name, cx) in self.list_cxs().items() if selected(cx['resource'])]
+        if endps:
+            endp_names = [name for (name, endp) in self.list_endps().items() if selected(endp['resource'])]
+        if port_filter is not None:
+            port_eids = [port_eid for (port_eid, port) in self.list_ports().items()
+                         if selected(port['resource']) and port_filter(port_eid, port)]
+        return self.teardown(cx_names=cx_names, endp_names=endp_names, port_eids=port_eids)
@@ -7,17 +7,450 @@ Info : Standard Script for WLAN Capaity Calculator
 Date :
 Author : Anjali Rahamatkar
 
-This Script has three classes :
+This Script has four classes :
           1. abg11_calculator : It will take all the user input of 802.11a/b/g station,calculate Intermediate values and Theoretical values.
           2. n11_calculator : It will take all the user input of 802.11n station,calculate Intermediate values and Theoretical values.
           3. ac11_calculator : It will take all the user input of 802.11ac station,calculate Intermediate values and Theoretical values.
-All classes have different functions: input_parameter() that calculates intermediate values and generate theroretical data
+          4. ax11_calculator : It will take all the user input of 802.11ax station,calculate Intermediate values and Theoretical values.
+All classes have a calculate() function that evaluates their configuration with theoretical_throughput(), the numpy
+engine that also calculates whole grids of configurations (PHY, MCS, streams, bandwidth, guard interval, frame size...)
+in one call.
 
 """
 
 import argparse
 import json
 
+import numpy as np
+
+# ************************************* Theoretical rate engine *************************************
+# theoretical_throughput() evaluates every combination of its array arguments in one numpy pass, the
+# calculator classes below evaluate a single configuration with it. Example, 11ax goodput for MCS 0-11 by 1-8 streams:
+#
+#   result = theoretical_throughput(phy='11ax', mcs=np.arange(12)[:, None], nss=np.arange(1, 9), bandwidth=80,
+#                                   guard_interval=800, frame_size=1518, ampdu=64)
+#   result['mac_goodput_mbps']  # shape (12, 8)
+
+PHY_TYPES = ['11abg', '11n', '11ac', '11ax']
+RESULT_KEYS = ['interval_us', 'ppdu_rate', 'mpdu_rate', 'msdu_rate', 'mac_data_rate_mbps', 'mac_goodput_mbps',
+               'goodput_per_client_mbps', 'offered_load_8023_mbps', 'ip_goodput_mbps', 'r_value', 'mos',
+               'voice_calls']
+
+SIFS = 16.00
+DIFS = 34.00
+Slot_Time = 9.00
+DSSS_RATES = [1, 2, 5.5, 11]
+# PHY_Bit_Rate as an int (5.5 -> 5) at which a DSSS rate becomes usable
+DSSS_THRESHOLDS = [1, 2, 5, 11]
+OFDM_RATES = [6, 9, 12, 18, 24, 36, 48, 54]
+# control frame rate for an OFDM data rate when it is not a basic rate and no OFDM basic rate is set
+OFDM_MANDATORY_RATES = [6, 6, 12, 12, 24, 24, 24, 24]
+ENCRYPT_HDR = {'None': 0, 'WEP': 8, 'TKIP': 20}
+ENCRYPT_HDR_CCMP = 16
+# codec : (IP packet size, frame rate, maximum theoretical R-value)
+CODECS = {'G.711': (200, 100, 85.9), 'G.723': (60, 67, 72.9), 'G.729': (60, 100, 81.7)}
+CODEC_NONE = (0, 0, 93.2)
+# voice call capacity is read at the client count bucket holding the 1 client call capacity
+VOICE_CLIENT_BUCKETS = [1, 2, 5, 10, 20, 50]
+VOICE_CLIENT_MAX = 100
+
+# 802.11n, indexed by MCS % 8 and MCS // 8
+HT_NON_HT_REF = [6, 12, 18, 24, 36, 48, 54, 54]
+HT_LTFS = [0, 1, 3, 3]
+HT_NDBPS = {20: [26, 52, 78, 104, 156, 208, 234, 260],
+            40: [54, 108, 162, 216, 324, 432, 486, 540]}
+HT_NES = [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 2, 2, 2, 2]
+
+# 802.11ac, indexed by MCS and spatial streams - 1
+VHT_NON_HT_REF = [6, 12, 18, 24, 36, 48, 54, 54, 54, 54]
+VHT_LTFS = [1, 2, 4, 4]
+VHT_NDBPS = {20: [26, 52, 78, 104, 156, 208, 234, 260, 312, 1040],
+             40: [54, 108, 162, 216, 324, 432, 486, 540, 648, 720],
+             80: [117, 234, 351, 468, 702, 936, 1053, 1170, 1404, 1560]}
+# BCC encoders by spatial streams, each list indexed by bandwidth (20, 40, 80) * 10 + MCS
+VHT_NES = [[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 2, 2, 2],
+           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 2, 2, 2, 2, 3],
+           [1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 2, 2, 2, 3, 3, 3]]
+
+# 802.11ax SU PPDU, LDPC coded (no tail bits) and no packet extension, indexed by MCS and spatial streams - 1
+HE_NON_HT_REF = [6, 12, 18, 24, 36, 48, 54, 54, 54, 54, 54, 54]
+HE_NBPSCS = [1, 2, 2, 4, 4, 6, 6, 6, 8, 8, 10, 10]
+HE_CODE_RATE = [(1, 2), (1, 2), (3, 4), (1, 2), (3, 4), (2, 3), (3, 4), (5, 6), (3, 4), (5, 6), (3, 4), (5, 6)]
+HE_DATA_SUBCARRIERS = {20: 234, 40: 468, 80: 980, 160: 1960}
+HE_LTFS = [1, 2, 4, 4, 6, 6, 8, 8]
+HE_GUARD_INTERVALS = [800, 1600, 3200]
+# L-STF, L-LTF, L-SIG, RL-SIG, HE-SIG-A and HE-STF
+HE_PREAMBLE = 36.00
+HE_SYMBOL = 12.80
+# BlockAck with a 64 bit bitmap, or 256 bit bitmap for A-MPDUs over 64 frames
+HE_BLOCKACK_SIZE = 32
+HE_BLOCKACK_256_SIZE = 56
+
+
+def _contains(values, text):
+    """True where a string value contains text, like the "Yes" in self.QoS checks; bools pass through"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'OUS':
+        return np.char.find(values.astype(str), text) >= 0
+    return values.astype(bool)
+
+
+def _lookup(values, table, default):
+    """Value of the first table key contained in each string value, default where none is"""
+    values = np.asarray(values)
+    if values.dtype.kind not in 'OUS':
+        return values.astype(float)
+    values = values.astype(str)
+    result = np.full(values.shape, default, dtype=float)
+    for key, value in reversed(list(table.items())):
+        result = np.where(np.char.find(values, key) >= 0, value, result)
+    return result
+
+
+def _int(values):
+    """int() of each value, NaN stays NaN (+ 0.0 turns the -0.0 of truncating -0.x into 0 like int() does)"""
+    return np.trunc(values) + 0.0
+
+
+def _take(table, index):
+    """table[index] for an array of indices, NaN where the index is not in the table"""
+    table = np.asarray(table, dtype=float)
+    index = np.asarray(index, dtype=float)
+    position = np.nan_to_num(index, nan=-1).astype(int)
+    inside = (position >= 0) & (position < len(table)) & (position == index)
+    return np.where(inside, table[np.clip(position, 0, len(table) - 1)], np.nan)
+
+
+def _take_by_bandwidth(tables, bandwidth, index):
+    return np.select([bandwidth == mhz for mhz in tables], [_take(table, index) for table in tables.values()],
+                     np.nan)
+
+
+def _basic_rate_set(basic_rates):
+    if basic_rates is None:
+        return frozenset()
+    if isinstance(basic_rates, str):
+        basic_rates = basic_rates.split()
+    return frozenset(float(rate) for rate in basic_rates)
+
+
+def _ofdm_txtime(frame_size, rate):
+    """Transmit time (usec) of a legacy OFDM frame of frame_size bytes at rate Mb/s"""
+    return np.floor((22 + frame_size * 8 + rate * 4 - 1) / (rate * 4)) * 4 + 20
+
+
+def _ht_control_rate(non_ht, basic_rates):
+    """PHY bit rate of the control frames answering HT/VHT/HE data sent at the non-HT reference rate"""
+    ofdm_basic = any(rate in basic_rates for rate in OFDM_RATES)
+    control_rate = np.full(np.shape(non_ht), 6.0)
+    for rate, mandatory in zip(OFDM_RATES, OFDM_MANDATORY_RATES):
+        if rate in basic_rates:
+            allowed = rate
+        elif not ofdm_basic:
+            allowed = mandatory
+        else:
+            continue
+        control_rate = np.where(non_ht >= rate, np.maximum(control_rate, allowed), control_rate)
+    return control_rate
+
+
+def _ht_mpdu_size(params, qos_hdr):
+    """MAC MPDU size of data traffic, or of voice packets aggregated params['amsdu'] per A-MSDU"""
+    voice_mpdu = params['codec_size'] + 28 + qos_hdr + params['encrypt_hdr'] + 8
+    amsdu = params['amsdu']
+    aggregated = _int((voice_mpdu + amsdu * (14 + 3)) / np.where(amsdu == 0, 1, amsdu))
+    return np.where(params['voice'], np.where(amsdu == 0, voice_mpdu, aggregated), _int(params['frame_size']))
+
+
+def _ht_msdu_size(params, mpdu, qos_hdr):
+    amsdu = params['amsdu']
+    payload = mpdu - 28 - qos_hdr - params['encrypt_hdr']
+    return np.where(amsdu == 0, payload, (payload - amsdu * (14 + 3)) / np.where(amsdu == 0, 1, amsdu))
+
+
+def _ampdu_bits(mpdu, ampdu):
+    """Nbits, bits per MAC PPDU carrying ampdu MPDUs (0 for no A-MPDU)"""
+    mpdu_pad = (4 - mpdu % 4) % 4
+    return np.where(ampdu == 0, mpdu * 8, ((mpdu + 4) * ampdu + mpdu_pad * (ampdu - 1)) * 8)
+
+
+def _ht_fixed_interval(params, ttxframe, control_rate, blockack_size=32):
+    """MAC PPDU interval (usec) without the backoff: protection, data, Ack or BlockAck and DIFS"""
+    narrow = params['bandwidth'] == 20
+    rts_cts = params['rts_cts']
+    rts_overhead = np.where(narrow, 2 * 20 + 4 * np.floor((22 + (20 + 14) * 8 + 24 * 4 - 1) / (24 * 4)),
+                            2 * 20 + np.floor((22 + (20 + 14) * 8 + 24 - 1) / 24) * 4) + 2 * SIFS
+    cts_overhead = np.where(narrow, 20 + 4 * np.floor((22 + 14 * 8 + 24 * 4 - 1) / (24 * 4)),
+                            20 + np.floor((22 + 14 * 8 + 24 - 1) / 24) * 4) + SIFS
+    use_blockack = params['ampdu'] != 0
+    ack_overhead = np.where(use_blockack, 0, SIFS + _ofdm_txtime(14, control_rate))
+    blockack_overhead = np.where(use_blockack, SIFS + _ofdm_txtime(blockack_size, control_rate), 0)
+    return (np.where(rts_cts, rts_overhead, 0) + np.where(rts_cts | ~params['cts_to_self'], 0, cts_overhead)
+            + ttxframe + ack_overhead + blockack_overhead + DIFS)
+
+
+def _ht_frame(params, fixed_interval, mpdu, msdu):
+    ip_packet = msdu - 8
+    ip_valid = ip_packet >= 20
+    amsdu = params['amsdu']
+    ampdu = params['ampdu']
+    return {'fixed_interval': fixed_interval,
+            'mean_backoff': params['cwmin'] * Slot_Time / 2,
+            'ampdu': np.where(ampdu > 0, ampdu, 1),
+            'amsdu': np.where(amsdu > 0, amsdu, 1),
+            'mpdu_size': mpdu,
+            'goodput_bits': msdu * 8,
+            'ethernet_size': np.where(ip_valid, np.maximum(ip_packet + 18, 64), np.nan),
+            'ip_size': np.where(ip_valid, ip_packet, np.nan),
+            'round_voice_rate': False}
+
+
+# 802.11a/b/g, one MPDU per PPDU
+def _abg11_frame(params, basic_rates):
+    phy_bit_rate = _int(params['phy_bit_rate'])
+    dsss = np.isin(phy_bit_rate, DSSS_THRESHOLDS)
+    rate = np.select([phy_bit_rate < 5, phy_bit_rate == 5, np.isin(phy_bit_rate, [6, 9, 11, 12, 18, 24, 36, 48]),
+                      phy_bit_rate < 12], [phy_bit_rate, 5.5, phy_bit_rate, np.nan], 54.0)
+    encrypt_hdr = params['encrypt_hdr']
+    qos_hdr = np.where(params['qos'], 2, 0)
+    frame_size = params['frame_size']
+    ip_packet = _int(_int(frame_size) - 36 - encrypt_hdr - qos_hdr)
+    ethernet = np.maximum(frame_size - 24 - 8 + 14 - encrypt_hdr - qos_hdr, 64)
+
+    # PHY Bit Rate of Control Frames, the highest usable basic rate or else mandatory rate
+    if basic_rates:
+        control_rate = np.where(dsss, 1.0, 6.0)
+        for basic_rate, threshold in zip(DSSS_RATES + OFDM_RATES, DSSS_THRESHOLDS + OFDM_RATES):
+            if basic_rate in basic_rates:
+                control_rate = np.where(rate >= threshold, np.maximum(control_rate, basic_rate), control_rate)
+    else:
+        control_rate = np.zeros(np.shape(rate))
+        for mandatory, threshold in zip(DSSS_RATES, DSSS_THRESHOLDS):
+            control_rate = np.where((phy_bit_rate <= 11) & (rate >= threshold),
+                                    np.maximum(control_rate, mandatory), control_rate)
+        for mandatory, threshold in zip(OFDM_MANDATORY_RATES, OFDM_RATES):
+            control_rate = np.where((phy_bit_rate >= 6) & (rate >= threshold),
+                                    np.maximum(control_rate, mandatory), control_rate)
+    control_dsss = np.isin(control_rate, DSSS_RATES)
+
+    dsss_basic_only = (any(rate in basic_rates for rate in DSSS_RATES)
+                       and not any(rate in basic_rates for rate in OFDM_RATES))
+    cwmin = np.where(dsss | dsss_basic_only, 31, 15)
+    mpdu = np.where(params['voice'], params['codec_size'] + 28 + encrypt_hdr + qos_hdr + 8, _int(frame_size))
+    preamble = np.where(params['short_preamble'], 96.0, 192.0)
+    sifs = np.where(dsss, 10.0, 16.0)
+    ttxframe_ack = np.where(control_dsss, (14 * 8) / control_rate + preamble, _ofdm_txtime(14, control_rate))
+    rts_cts_handshake = np.where(control_dsss, ((20 + 14) * 8) / control_rate + preamble,
+                                 np.floor(((20 + 14) * 8 + 22 + control_rate * 4 - 1) / (control_rate * 4)) * 4 + 2 * 20)
+    rts_cts_overhead = np.where(params['rts_cts'], rts_cts_handshake + 2 * sifs, 0)
+    cts_to_self_overhead = np.where(params['rts_cts'] | ~params['cts_to_self'], 0,
+                                    np.where(control_dsss, (14 * 8) / control_rate + preamble + sifs,
+                                             _ofdm_txtime(14, control_rate) + sifs))
+    long_slot = dsss | ~params['short_slot']
+    difs = np.where(long_slot, 50.0, 34.0)
+    mean_backoff = np.where(long_slot, cwmin * 20 / 2, cwmin * 9 / 2)
+
+    # Ttxframe (DATA), Tmac time for MAC frame and Tplcp time for MAC PLCP
+    ndbps = rate * 4
+    nbits = mpdu * 8
+    tmac = np.where(dsss, nbits / rate, np.floor((nbits + 22 + ndbps) / ndbps) * 4)
+    ttxframe_data = tmac + np.where(dsss, preamble, 20.0)
+    return {'fixed_interval': ttxframe_data + sifs + ttxframe_ack + difs + rts_cts_overhead + cts_to_self_overhead,
+            'mean_backoff': mean_backoff,
+            'ampdu': 1,
+            'amsdu': 1,
+            'mpdu_size': mpdu,
+            'goodput_bits': nbits,
+            'ethernet_size': ethernet,
+            'ip_size': np.where(ip_packet >= 20, ip_packet, np.nan),
+            'round_voice_rate': True}
+
+
+# 802.11n, MCS 0-31 selects the spatial streams
+def _n11_frame(params, basic_rates):
+    mcs = params['mcs']
+    stream_mcs = mcs % 8
+    streams = np.floor(mcs / 8) + 1
+    greenfield = params['greenfield']
+    control_rate = _ht_control_rate(_take(HT_NON_HT_REF, stream_mcs), basic_rates)
+    qos_hdr = np.where(params['qos'] | (params['amsdu'] > 1), 2, 0)
+    mpdu = _ht_mpdu_size(params, qos_hdr)
+    msdu = _int(_ht_msdu_size(params, mpdu, qos_hdr))
+    msdu = np.where(msdu <= -10, msdu - 1, msdu)
+
+    tppdu_fixed = np.where(greenfield, 24.0, 36.0) + 4 * _take(HT_LTFS, streams - 1)
+    data_bits = _take_by_bandwidth(HT_NDBPS, params['bandwidth'], stream_mcs) * streams
+    short_gi = params['guard_interval'] == 400
+    tsymbol = np.where(short_gi & (((mcs > 7) & greenfield) | ~greenfield), 3.60, 4)
+    tsymbol = np.where(short_gi | (params['guard_interval'] == 800), tsymbol, np.nan)
+    offset = np.where(params['bandwidth'] == 40, 6 * _take(HT_NES, mcs), 6)
+    nbits = _ampdu_bits(mpdu, params['ampdu'])
+    ttxframe = np.round(tppdu_fixed + np.floor((16 + offset + nbits + data_bits - 1) / data_bits) * tsymbol, 2)
+    return _ht_frame(params, _ht_fixed_interval(params, ttxframe, control_rate), mpdu, msdu)
+
+
+# 802.11ac, MCS 0-9 and 1-4 spatial streams
+def _ac11_frame(params, basic_rates):
+    mcs = params['mcs']
+    streams = params['nss']
+    greenfield = params['greenfield']
+    control_rate = _ht_control_rate(_take(VHT_NON_HT_REF, mcs), basic_rates)
+    qos_hdr = np.where(params['qos'] | (params['amsdu'] > 1), 2, 0)
+    mpdu = _ht_mpdu_size(params, qos_hdr)
+    msdu = _int(_ht_msdu_size(params, mpdu, qos_hdr))
+    msdu = np.where(msdu < 0, msdu - 1, msdu)
+
+    tppdu_fixed = 36 + _take(VHT_LTFS, streams - 1) * 4
+    ndbps = _take_by_bandwidth(VHT_NDBPS, params['bandwidth'], mcs) * streams
+    short_gi = params['guard_interval'] == 400
+    tsymbol = np.where(short_gi & (((mcs > 7) & greenfield) | ~greenfield), 3.60, 4)
+    tsymbol = np.where(short_gi | (params['guard_interval'] == 800), tsymbol, np.nan)
+    bandwidth_index = np.select([params['bandwidth'] == mhz for mhz in VHT_NDBPS], range(len(VHT_NDBPS)), np.nan)
+    valid_mcs = (mcs >= 0) & (mcs < len(VHT_NON_HT_REF))
+    nes = _take(np.ravel(VHT_NES), np.where(valid_mcs, (streams - 1) * 30 + bandwidth_index * 10 + mcs, np.nan))
+    nbits = _ampdu_bits(mpdu, params['ampdu'])
+    ttxframe = tppdu_fixed + np.floor((16 + 6 * nes + nbits + ndbps - 1) / ndbps) * tsymbol
+    return _ht_frame(params, _ht_fixed_interval(params, ttxframe, control_rate), mpdu, msdu)
+
+
+# 802.11ax, MCS 0-11, 1-8 spatial streams, 20-160 MHz and 800/1600/3200 ns guard interval
+def _ax11_frame(params, basic_rates):
+    mcs = params['mcs']
+    streams = params['nss']
+    guard_interval = params['guard_interval']
+    control_rate = _ht_control_rate(_take(HE_NON_HT_REF, mcs), basic_rates)
+    qos_hdr = np.where(params['qos'] | (params['amsdu'] > 1), 2, 0)
+    mpdu = _ht_mpdu_size(params, qos_hdr)
+    msdu = _int(_ht_msdu_size(params, mpdu, qos_hdr))
+
+    subcarriers = np.select([params['bandwidth'] == mhz for mhz in HE_DATA_SUBCARRIERS],
+                            list(HE_DATA_SUBCARRIERS.values()), np.nan)
+    code_rate = _take([numerator for numerator, _ in HE_CODE_RATE], mcs) / _take(
+        [denominator for _, denominator in HE_CODE_RATE], mcs)
+    ndbps = np.floor(subcarriers * _take(HE_NBPSCS, mcs) * streams * code_rate + 1e-9)
+    guard_us = np.where(np.isin(guard_interval, HE_GUARD_INTERVALS), guard_interval / 1000, np.nan)
+    # HE-LTF is 2x (6.4 usec) with the 0.8 and 1.6 usec guard intervals, 4x (12.8 usec) with 3.2 usec
+    he_ltf = np.where(guard_interval == 3200, 12.8, 6.4) + guard_us
+    tppdu_fixed = HE_PREAMBLE + _take(HE_LTFS, streams - 1) * he_ltf
+    nbits = _ampdu_bits(mpdu, params['ampdu'])
+    ttxframe = tppdu_fixed + np.floor((16 + nbits + ndbps - 1) / ndbps) * (HE_SYMBOL + guard_us)
+    blockack_size = np.where(params['ampdu'] > 64, HE_BLOCKACK_256_SIZE, HE_BLOCKACK_SIZE)
+    return _ht_frame(params, _ht_fixed_interval(params, ttxframe, control_rate, blockack_size), mpdu, msdu)
+
+
+PHY_FRAMES = [_abg11_frame, _n11_frame, _ac11_frame, _ax11_frame]
+
+
+def _frame_rates(frame, clients):
+    """MAC PPDU interval and PPDU, MPDU and MSDU rates with the mean backoff shared by clients"""
+    interval = frame['fixed_interval'] + frame['mean_backoff'] / clients
+    ppdu_rate = 1000000 / interval
+    mpdu_rate = frame['ampdu'] * ppdu_rate
+    return interval, ppdu_rate, mpdu_rate, frame['amsdu'] * mpdu_rate
+
+
+def _frame_results(frame, params):
+    interval, ppdu_rate, mpdu_rate, msdu_rate = _frame_rates(frame, params['clients'])
+    mac_goodput = frame['goodput_bits'] * msdu_rate / 1000000
+    results = {'interval_us': interval,
+               'ppdu_rate': ppdu_rate,
+               'mpdu_rate': mpdu_rate,
+               'msdu_rate': msdu_rate,
+               'mac_data_rate_mbps': mpdu_rate * frame['mpdu_size'] * 8 / 1000000,
+               'mac_goodput_mbps': mac_goodput,
+               'goodput_per_client_mbps': mac_goodput / params['clients'],
+               'offered_load_8023_mbps': msdu_rate * frame['ethernet_size'] * 8 / 1000000,
+               'ip_goodput_mbps': msdu_rate * frame['ip_size'] * 8 / 1000000}
+
+    # Theoretical Voice Call Capacity
+    voice = params['voice']
+    codec_frame_rate = params['codec_frame_rate']
+    r_value = params['r_value']
+    mos = 1 + 0.035 * r_value + r_value * (r_value - 60) * (100 - r_value) * 7 * 0.000001
+    mos = np.select([r_value < 0, r_value > 100], [1, 4.5], mos)
+    voice_call_range = np.round(_frame_rates(frame, 1)[1] / codec_frame_rate)
+    voice_clients = np.select([voice_call_range <= bucket for bucket in VOICE_CLIENT_BUCKETS],
+                              VOICE_CLIENT_BUCKETS, VOICE_CLIENT_MAX)
+    _, voice_ppdu_rate, _, voice_msdu_rate = _frame_rates(frame, voice_clients)
+    if frame['round_voice_rate']:
+        voice_msdu_rate = np.round(voice_ppdu_rate)
+    results['r_value'] = np.where(voice, r_value, np.nan)
+    results['mos'] = np.where(voice, mos, np.nan)
+    results['voice_calls'] = np.where(voice, voice_msdu_rate / codec_frame_rate, np.nan)
+    return results
+
+
+def theoretical_throughput(phy='11ac', traffic='Data', mcs=9, nss=1, bandwidth=80, guard_interval=800,
+                           frame_size=1518, encryption='None', qos='Yes', amsdu=0, ampdu=64, phy_bit_rate=54,
+                           cwmin=15, plcp='Mixed', codec='G.711', preamble='Short', slot='Short', rts_cts='No',
+                           cts_to_self='No', basic_rates=('6', '12', '24'), clients=1):
+    """
+    Theoretical maximum offered load and voice call capacity of every station configuration in the
+    broadcast of the array arguments, e.g. mcs=np.arange(10)[:, None] with nss=[1, 2, 3, 4] gives (10, 4) results.
+
+    :param phy: '11abg', '11n', '11ac' or '11ax'
+    :param traffic: 'Data' or 'Voice'
+    :param mcs: Data/Voice MCS index, 0-31 for 11n (selects the streams), 0-9 for 11ac, 0-11 for 11ax
+    :param nss: spatial streams of 11ac (1-4) and 11ax (1-8)
+    :param bandwidth: channel bandwidth MHz, 20/40 for 11n, 20/40/80 for 11ac, 20/40/80/160 for 11ax
+    :param guard_interval: ns, 400/800 for 11n and 11ac, 800/1600/3200 for 11ax
+    :param frame_size: 802.11 MAC frame size (11abg) or MAC MPDU size of data traffic
+    :param encryption: 'None', 'WEP', 'TKIP' or 'CCMP'
+    :param amsdu: IP packets per A-MSDU, 0 for no A-MSDU
+    :param ampdu: MAC frames per A-MPDU, 0 for no A-MPDU
+    :param phy_bit_rate: PHY bit rate of 11abg data frames
+    :param cwmin: CWmin of 11n/11ac/11ax, 11abg derives it from the PHY and basic rates
+    :param plcp: 'Mixed' or 'Greenfield' (11n, 11ac)
+    :param codec: voice codec 'G.711', 'G.723' or 'G.729' (11ac always uses G.711)
+    :param preamble: 11abg 'Short' or 'Long' DSSS preamble
+    :param slot: 11abg 'Short' or 'Long' slot time
+    :param rts_cts: RTS/CTS handshake, 'Yes'/'No' or bool
+    :param cts_to_self: CTS-to-self protection, 'Yes'/'No' or bool
+    :param basic_rates: basic rate set, a list of rates (not broadcast)
+    :param clients: number of clients sharing the mean backoff
+    :return: dict of RESULT_KEYS to float arrays (rates per second, Mb/s), NaN where a value is N/A or
+        the configuration is not valid for its PHY
+    """
+    columns = {'phy': _lookup(phy, dict(zip(PHY_TYPES, range(len(PHY_TYPES)))), np.nan),
+               'voice': ~_contains(traffic, 'Data'),
+               'mcs': np.asarray(mcs, dtype=float),
+               'nss': np.asarray(nss, dtype=float),
+               'bandwidth': np.asarray(bandwidth, dtype=float),
+               'guard_interval': np.asarray(guard_interval, dtype=float),
+               'frame_size': np.asarray(frame_size, dtype=float),
+               'encrypt_hdr': _lookup(encryption, ENCRYPT_HDR, ENCRYPT_HDR_CCMP),
+               'qos': _contains(qos, 'Yes'),
+               'amsdu': np.asarray(amsdu, dtype=float),
+               'ampdu': np.asarray(ampdu, dtype=float),
+               'phy_bit_rate': np.asarray(phy_bit_rate, dtype=float),
+               'cwmin': np.asarray(cwmin, dtype=float),
+               'greenfield': _contains(plcp, 'Greenfield') & ~_contains(plcp, 'Mixed'),
+               'codec_size': _lookup(codec, {name: value[0] for name, value in CODECS.items()}, CODEC_NONE[0]),
+               'codec_frame_rate': _lookup(codec, {name: value[1] for name, value in CODECS.items()}, CODEC_NONE[1]),
+               'r_value': _lookup(codec, {name: value[2] for name, value in CODECS.items()}, CODEC_NONE[2]),
+               'short_preamble': _contains(preamble, 'Short'),
+               'short_slot': _contains(slot, 'Short'),
+               'rts_cts': _contains(rts_cts, 'Yes'),
+               'cts_to_self': _contains(cts_to_self, 'Yes'),
+               'clients': np.asarray(clients, dtype=float)}
+    params = dict(zip(columns, np.broadcast_arrays(*columns.values())))
+    basic_rates = _basic_rate_set(basic_rates)
+
+    shape = params['phy'].shape
+    results = {key: np.full(shape, np.nan) for key in RESULT_KEYS}
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for phy_index, phy_frame in enumerate(PHY_FRAMES):
+            selected = params['phy'] == phy_index
+            if not selected.any():
+                continue
+            subset = {name: column[selected] for name, column in params.items()}
+            for key, value in _frame_results(phy_frame(subset, basic_rates), subset).items():
+                results[key][selected] = value
+    return results
+
+
+
 
 # Class to take all user input (802.11a/b/g Standard)
 
@@ -53,7 +486,7 @@ class abg11_calculator:
 
         # Station : 11abg
 
-        ap.add_argument("-sta", "--station", help="Enter Station Name : [11abg,11n,11ac](by Default 11abg)")
+        ap.add_argument("-sta", "--station", help="Enter Station Name : [11abg,11n,11ac,11ax](by Default 11abg)")
         ap.add_argument("-t", "--traffic", help="Enter the Traffic Type : [Data,Voice](by Default Data)")
         ap.add_argument("-p", "--phy",
                         help="Enter the PHY Bit Rate of Data Flow : [1, 2, 5.5, 11, 6, 9, 12, 18, 24, 36, 48, 54](by Default 54)")
@@ -68,21 +501,22 @@ class abg11_calculator:
         ap.add_argument("-pre", "--preamble", help="Enter Preamble value : [ Short, Long, N/A](by Default Short)")
         ap.add_argument("-s", "--slot", help="Enter the Slot Time  : [Short,  Long, N/A](by Default Short)")
         ap.add_argument("-co", "--codec", help="Enter the Codec Type (Voice Traffic): {[ G.711 ,  G.723 ,  G.729]"
-                                               "by Default G.723 for 11abg, G.711 for 11n} and"
+                                               "by Default G.723 for 11abg, G.711 for 11n/11ax} and"
                                                "{['Mixed','Greenfield'] by Default Mixed for 11ac}")
         ap.add_argument("-r", "--rts", help="Enter the RTS/CTS Handshake : [No,  Yes](by Default No)")
         ap.add_argument("-c", "--cts", help="Enter the CTS-to-self (protection)	: [No,  Yes](by Default No)")
 
-        # Station : 11n and 11ac
+        # Station : 11n, 11ac and 11ax
 
         ap.add_argument("-d", "--data",
                         help="Enter the Data/Voice MCS Index : ['0','1','2','3','4','5','6','7','8','9','10',"
                              "'11','12','13','14','15','16','17','18','19','20','21','22','23','24','25','26',"
-                             "'27','28','29','30','31']by Default 7")
+                             "'27','28','29','30','31']by Default 7, [0-9] for 11ac, [0-11] for 11ax")
         ap.add_argument("-ch", "--channel",
                         help="Enter the Channel Bandwidth = : ['20','40'] by Default 40 for 11n and "
-                             "['20','40','80'] by Default 80 for 11ac")
-        ap.add_argument("-gu", "--guard", help="Enter the Guard Interval = : ['400','800'] (by Default 400)")
+                             "['20','40','80'] by Default 80 for 11ac and ['20','40','80','160'] by Default 80 for 11ax")
+        ap.add_argument("-gu", "--guard", help="Enter the Guard Interval = : ['400','800'] (by Default 400) and "
+                                               "['800','1600','3200'] for 11ax (by Default 800)")
         ap.add_argument("-high", "--highest",
                         help="Enter the Highest Basic MCS = : ['0','1','2','3','4','5','6','7','8','9',"
                              "'10','11','12','13','14','15','16','17','18','19','20','21','22','23','24',"
@@ -97,550 +531,49 @@ class abg11_calculator:
                              "'9','10','11','12','13','14','15','16','17','18','19','20','21','22','23',"
                              "'24','25','26','27','28','29','30','31','32','33','34','35','36','37','38',"
                              "'39','40','41','42','43','44','45','46','47','48','49','50','51','52','53',"
-                             "'54','55','56','57','58','59','60','61','62','63','64'](by Default [42 for 11n] and [64 for 11ac])")
+                             "'54','55','56','57','58','59','60','61','62','63','64'](by Default [42 for 11n] and [64 for 11ac/11ax]),"
+                             " up to 256 for 11ax")
         ap.add_argument("-cw", "--cwin",
                         help="Enter the CWmin (leave alone for default) = : [Any Value] (by Default 15)")
-        ap.add_argument("-spa", "--spatial", help="Enter the Spatial Streams  = [1,2,3,4] (by Default 4)")
+        ap.add_argument("-spa", "--spatial", help="Enter the Spatial Streams  = [1,2,3,4] (by Default 4), up to 8 for 11ax")
         ap.add_argument("-rc", "--rtscts", help="Enter the RTS/CTS Handshake and CTS-to-self "
                                                 "  = ['No','Yes'] (by Default No for 11ac)")
         return ap
 
     def calculate(self):
 
-        PHY_Bit_Rate_float = float(self.PHY_Bit_Rate)
-        PHY_Bit_Rate_int = int(PHY_Bit_Rate_float)
-        if PHY_Bit_Rate_int < 12:
-            if PHY_Bit_Rate_int < 5:
-                yellow_cell = PHY_Bit_Rate_int
-            else:
-                if PHY_Bit_Rate_int == 5:
-                    yellow_cell = 5.5
-                else:
-                    if PHY_Bit_Rate_int == 11:
-                        yellow_cell = 11
-                    else:
-                        if PHY_Bit_Rate_int == 6:
-                            yellow_cell = 6
-                        else:
-                            if PHY_Bit_Rate_int == 9:
-                                yellow_cell = 9
-        else:
-            if PHY_Bit_Rate_int == 12:
-                yellow_cell = 12
-            else:
-                if PHY_Bit_Rate_int == 18:
-                    yellow_cell = 18
-                else:
-                    if PHY_Bit_Rate_int == 24:
-                        yellow_cell = 24
-                    else:
-                        if PHY_Bit_Rate_int == 36:
-                            yellow_cell = 36
-                        else:
-                            if PHY_Bit_Rate_int == 48:
-                                yellow_cell = 48
-                            else:
-                                yellow_cell = 54
-
-        # (IP Packet)
-
-        if "None" in self.Encryption:
-            Enc_value = 0
-        else:
-            if "WEP" in self.Encryption:
-                Enc_value = 8
-            else:
-                if "TKIP" in self.Encryption:
-                    Enc_value = 20
-                else:
-                    Enc_value = 16
-        if "Yes" in self.QoS:
-            Qos_value = 2
-        else:
-            Qos_value = 0
-        ip_packet_1 = int(self.MAC_Frame_802_11) - 36 - float(Enc_value) - float(Qos_value)
-        ip_packet = int(ip_packet_1)
-        if ip_packet < 20:
-            get_ip_packet = "N/A"
-            ip = 0
-        else:
-            get_ip_packet = ip_packet
-            ip = 1
-
-        # (Ethernet MAC Frame)
-
-        encrpt = float(self.MAC_Frame_802_11) - 24 - 8 + 14 - float(Enc_value) - float(Qos_value)
-        Ethernet_MAC_Frame_int = max(encrpt, 64)
-        Ethernet_value = int(Ethernet_MAC_Frame_int)
-        get_ethernet = Ethernet_value
-
-        # Usable Basic Rates
-
-        if "1" in self.Basic_Rate_Set:
-            if "1" in self.Basic_Rate_Set and yellow_cell >= 1:
-                Usable_Basic_Rates_1 = 1
-            else:
-                Usable_Basic_Rates_1 = 0
-        else:
-            Usable_Basic_Rates_1 = 0
-
-        if "2" in self.Basic_Rate_Set:
-            if "2" in self.Basic_Rate_Set and yellow_cell >= 2:
-                Usable_Basic_Rates_2 = 2
-            else:
-                Usable_Basic_Rates_2 = 0
-        else:
-            Usable_Basic_Rates_2 = 0
-
-        if "5.5" in self.Basic_Rate_Set:
-            if "5.5" in self.Basic_Rate_Set and yellow_cell >= 5:
-                Usable_Basic_Rates_5 = 5.5
-            else:
-                Usable_Basic_Rates_5 = 0
-        else:
-            Usable_Basic_Rates_5 = 0
-
-        if "11" in self.Basic_Rate_Set:
-            if "11" in self.Basic_Rate_Set and yellow_cell >= 11:
-                Usable_Basic_Rates_11 = 11
-            else:
-                Usable_Basic_Rates_11 = 0
-        else:
-            Usable_Basic_Rates_11 = 0
-
-        if "6" in self.Basic_Rate_Set:
-            if "6" in self.Basic_Rate_Set and yellow_cell >= 6:
-                Usable_Basic_Rates_6 = 6
-            else:
-                Usable_Basic_Rates_6 = 0
-        else:
-            Usable_Basic_Rates_6 = 0
-
-        if "9" in self.Basic_Rate_Set:
-            if "9" in self.Basic_Rate_Set and yellow_cell >= 9:
-                Usable_Basic_Rates_9 = 9
-            else:
-                Usable_Basic_Rates_9 = 0
-        else:
-            Usable_Basic_Rates_9 = 0
-
-        if "12" in self.Basic_Rate_Set:
-            if "12" in self.Basic_Rate_Set and yellow_cell >= 12:
-                Usable_Basic_Rates_12 = 12
-            else:
-                Usable_Basic_Rates_12 = 0
-        else:
-            Usable_Basic_Rates_12 = 0
-
-        if "18" in self.Basic_Rate_Set:
-            if "18" in self.Basic_Rate_Set and yellow_cell >= 18:
-                Usable_Basic_Rates_18 = 18
-            else:
-                Usable_Basic_Rates_18 = 0
-        else:
-            Usable_Basic_Rates_18 = 0
-
-        if "24" in self.Basic_Rate_Set:
-            if "24" in self.Basic_Rate_Set and yellow_cell >= 24:
-                Usable_Basic_Rates_24 = 24
-            else:
-                Usable_Basic_Rates_24 = 0
-        else:
-            Usable_Basic_Rates_24 = 0
-
-        if "36" in self.Basic_Rate_Set:
-            if "36" in self.Basic_Rate_Set and yellow_cell >= 36:
-                Usable_Basic_Rates_36 = 36
-            else:
-                Usable_Basic_Rates_36 = 0
-        else:
-            Usable_Basic_Rates_36 = 0
-
-        if "48" in self.Basic_Rate_Set:
-            if "48" in self.Basic_Rate_Set and yellow_cell >= 48:
-                Usable_Basic_Rates_48 = 48
-            else:
-                Usable_Basic_Rates_48 = 0
-        else:
-            Usable_Basic_Rates_48 = 0
-
-        if "54" in self.Basic_Rate_Set:
-            if "54" in self.Basic_Rate_Set and yellow_cell >= 54:
-                Usable_Basic_Rates_54 = 54
-            else:
-                Usable_Basic_Rates_54 = 0
-        else:
-            Usable_Basic_Rates_54 = 0
-
-        # Usable Mandatory Rates
-
-        if (PHY_Bit_Rate_int <= 11) and yellow_cell >= 1:
-            Mandatory_1 = 1
-        else:
-            Mandatory_1 = 0
-        if (PHY_Bit_Rate_int <= 11) and yellow_cell >= 2:
-            Mandatory_2 = 2
-        else:
-            Mandatory_2 = 0
-        if (PHY_Bit_Rate_int <= 11) and yellow_cell >= 5:
-            Mandatory_5 = 5.5
-        else:
-            Mandatory_5 = 0
-        if (PHY_Bit_Rate_int <= 11) and yellow_cell >= 11:
-            Mandatory_11 = 11
-        else:
-            Mandatory_11 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 6:
-            Mandatory_6 = 6
-        else:
-            Mandatory_6 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 9:
-            Mandatory_9 = 6
-        else:
-            Mandatory_9 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 12:
-            Mandatory_12 = 12
-        else:
-            Mandatory_12 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 18:
-            Mandatory_18 = 12
-        else:
-            Mandatory_18 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 24:
-            Mandatory_24 = 24
-        else:
-            Mandatory_24 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 36:
-            Mandatory_36 = 24
-        else:
-            Mandatory_36 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 48:
-            Mandatory_48 = 24
-        else:
-            Mandatory_48 = 0
-        if (PHY_Bit_Rate_int >= 6) and yellow_cell >= 54:
-            Mandatory_54 = 24
-        else:
-            Mandatory_54 = 0
-
-        # CWmin_str (leave alone for default)
-
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            CWmin_str = 31
-        else:
-            if (
-                    "1" in self.Basic_Rate_Set or "2" in self.Basic_Rate_Set or "5.5" in self.Basic_Rate_Set or "11" in self.Basic_Rate_Set) \
-                    and (not ("6" in self.Basic_Rate_Set or "9" in self.Basic_Rate_Set or "12" in self.Basic_Rate_Set or
-                              "18" in self.Basic_Rate_Set or "24" in self.Basic_Rate_Set or "36" in self.Basic_Rate_Set or "48" in self.Basic_Rate_Set or "54" in self.Basic_Rate_Set)):
-                CWmin_str = 31
-            else:
-                CWmin_str = 15
-
-        # MAC MPDU Size
-
-        if "G.711" in self.Codec_Type:
-            Codec_IP_Packet_Size = 200
-            Codec_Frame_rate = 100
-        else:
-            if "G.723" in self.Codec_Type:
-                Codec_IP_Packet_Size = 60
-                Codec_Frame_rate = 67
-            elif "G.729" in self.Codec_Type:
-                Codec_IP_Packet_Size = 60
-                Codec_Frame_rate = 100
-            else:
-                Codec_IP_Packet_Size = 0
-                Codec_Frame_rate = 0
-
-        if "Data" in self.Traffic_Type:
-            MAC_MPDU_Size = int(self.MAC_Frame_802_11)
-        else:
-            if "None" in self.Encryption:
-                result = Codec_IP_Packet_Size + 28 + 0
-            elif "WEP" in self.Encryption:
-                result = Codec_IP_Packet_Size + 28 + 8
-            elif "TKIP" in self.Encryption:
-                result = Codec_IP_Packet_Size + 28 + 20
-            else:
-                result = Codec_IP_Packet_Size + 28 + 16
-            if "Yes" in self.QoS:
-                final_result = result + 2
-            else:
-                final_result = result + 0
-
-            MAC_MPDU_Size = final_result + 8
-
-        # PHY Bit Rate of Control Frames
-
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            data = 1
-        else:
-            data = 6
-
-        if len(self.Basic_Rate_Set) == 0:
-            present_BasicRate = 0
-        else:
-            present_BasicRate = 1
-
-        if present_BasicRate == 1:
-            PHY_Bit = max(Usable_Basic_Rates_1, Usable_Basic_Rates_2, Usable_Basic_Rates_5,
-                          Usable_Basic_Rates_11, Usable_Basic_Rates_6,
-                          Usable_Basic_Rates_9, Usable_Basic_Rates_12, Usable_Basic_Rates_18,
-                          Usable_Basic_Rates_24, Usable_Basic_Rates_36, Usable_Basic_Rates_48,
-                          Usable_Basic_Rates_54, data)
-
-
-        else:
-            PHY_Bit = max(Mandatory_1, Mandatory_2, Mandatory_5, Mandatory_11, Mandatory_6, Mandatory_9,
-                          Mandatory_12, Mandatory_18, Mandatory_24, Mandatory_36, Mandatory_48, Mandatory_54)
-
-        # Ttxframe (ACK)
-
-        if "Short" in self.Preamble:
-            Preamble_1 = float(96)
-        else:
-            Preamble_1 = float(192)
-
-        if (PHY_Bit == 1) or (PHY_Bit == 2) or (PHY_Bit == 5.5) or (PHY_Bit == 11):
-            Ttxframe = (14 * 8) / PHY_Bit + Preamble_1
-
-            Ttxframe_new = format(Ttxframe, '.2f')
-        else:
-            Ttxframe = int((14 * 8 + 22 + PHY_Bit * 4 - 1) / (PHY_Bit * 4)) * 4 + 20
-            Ttxframe_new = format(Ttxframe, '.2f')
-
-        # RTS/CTS Handshake Overhead
-
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            SIFS_value = float(10)
-        else:
-            SIFS_value = float(16)
-
-        if "No" in self.RTS_CTS_Handshake:
-            RTS_CTS_Handshake_Overhead = 0
-
-        elif "Yes" in self.RTS_CTS_Handshake:
-            if (PHY_Bit == 1) or (PHY_Bit == 2) or (PHY_Bit == 5.5) or (PHY_Bit == 11):
-                RTS_CTS_Handshake = ((20 + 14) * 8) / PHY_Bit + Preamble_1
-
-            else:
-                RTS_CTS_Handshake = int(((20 + 14) * 8 + 22 + PHY_Bit * 4 - 1) / (PHY_Bit * 4)) * 4 + 2 * 20
-
-            RTS_CTS_Handshake_Overhead = RTS_CTS_Handshake + (2 * SIFS_value)
-
-        # c22 CTS-to-self Handshake Overhead
-
-        if ("Yes" in self.CTS_to_self) and ("Yes" in self.RTS_CTS_Handshake):
-            CTS_to_self_Handshake = 0
-        else:
-            if ("No" in self.CTS_to_self) or ("Yes" in self.RTS_CTS_Handshake):
-                CTS_to_self_Handshake = 0
-            else:
-                if (PHY_Bit == 1) or (PHY_Bit == 2) or (PHY_Bit == 5.5) or (PHY_Bit == 11):
-                    CTS_to_self_Handshake = (14 * 8) / PHY_Bit + Preamble_1 + SIFS_value
-                else:
-                    CTS_to_self_Handshake = int(
-                        (14 * 8 + 22 + PHY_Bit * 4 - 1) / (PHY_Bit * 4)) * 4 + 20 + SIFS_value
-
-        # DIFS calulation
-
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            DIFS_value = 50
-        elif "Short" in self.slot_name:
-            DIFS_value = 34
-        else:
-            DIFS_value = 50
-
-        # MeanBackoff calculation
-
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            c4 = (CWmin_str * 20 / 2)
-            MeanBackoff_value = float(c4)
-        elif "Short" in self.slot_name:
-            d2 = (CWmin_str * 9 / 2)
-            MeanBackoff_value = float(d2)
-        else:
-            d3 = (CWmin_str * 20 / 2)
-            MeanBackoff_value = float(d3)
-
-        # c27 Ndbps, MAC data bits per symbol
-        Ndbps_value = yellow_cell * 4
-
-        # Nbits, bits in MAC frame
-        Nbits_value = (MAC_MPDU_Size * 8)
-
-        # Tmac, time for MAC frame and  Tplcp, time for MAC PLCP
-        if PHY_Bit_Rate_int == 1 or PHY_Bit_Rate_int == 2 or PHY_Bit_Rate_int == 5 or PHY_Bit_Rate_int == 11:
-            Tmac_value = Nbits_value / yellow_cell
-            if "Short" in self.Preamble:
-                Tplcp = float(96)
-            else:
-                Tplcp = float(192)
-        else:
-            Tmac_value = int((Nbits_value + 22 + Ndbps_value) / Ndbps_value) * 4
-            Tplcp = float(20)
-
-        # Ttxframe (DATA)
-
-        Ttxframe_data = Tmac_value + Tplcp
-
-        Client_1 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value
-        Client_2 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 2
-        Client_3 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 5
-        Client_4 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 10
-        Client_5 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 20
-        Client_6 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 50
-        Client_7 = Ttxframe_data + SIFS_value + Ttxframe + DIFS_value + RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake + MeanBackoff_value / 100
-        self.Client_1_new = format(Client_1, '.2f')
-        Client_2_new = format(Client_2, '.4f')
-        Client_3_new = format(Client_3, '.4f')
-        Client_4_new = format(Client_4, '.4f')
-        Client_5_new = format(Client_5, '.4f')
-        Client_6_new = format(Client_6, '.4f')
-        Client_7_new = round(Client_7)
-
-        # Max Frame Rate
-
-        Max_Frame_Rate_C1 = 1000000 / Client_1
-        self.Max_Frame_Rate_C1_round = round(Max_Frame_Rate_C1)
-        Max_Frame_Rate_C2 = 1000000 / Client_2
-        Max_Frame_Rate_C2_round = round(Max_Frame_Rate_C2)
-        Max_Frame_Rate_C3 = 1000000 / Client_3
-        Max_Frame_Rate_C3_round = round(Max_Frame_Rate_C3)
-        Max_Frame_Rate_C4 = 1000000 / Client_4
-        Max_Frame_Rate_C4_round = round(Max_Frame_Rate_C4)
-        Max_Frame_Rate_C5 = 1000000 / Client_5
-        Max_Frame_Rate_C5_round = round(Max_Frame_Rate_C5)
-        Max_Frame_Rate_C6 = 1000000 / Client_6
-        Max_Frame_Rate_C6_round = round(Max_Frame_Rate_C6)
-        Max_Frame_Rate_C7 = 1000000 / Client_7
-        Max_Frame_Rate_C7_round = round(Max_Frame_Rate_C7)
-
-        # Max. Offered Load (802.11)
-
-        Max_Offered_Load_C1 = Max_Frame_Rate_C1 * Nbits_value / 1000000
-        self.Max_Offered_Load_C1_new = format(Max_Offered_Load_C1, '.3f')
-        Max_Offered_Load_C2 = Max_Frame_Rate_C2 * Nbits_value / 1000000
-        Max_Offered_Load_C2_new = format(Max_Offered_Load_C2, '.3f')
-        Max_Offered_Load_C3 = Max_Frame_Rate_C3 * Nbits_value / 1000000
-        Max_Offered_Load_C3_new = format(Max_Offered_Load_C3, '.3f')
-        Max_Offered_Load_C4 = Max_Frame_Rate_C4 * Nbits_value / 1000000
-        Max_Offered_Load_C4_new = format(Max_Offered_Load_C4, '.3f')
-        Max_Offered_Load_C5 = Max_Frame_Rate_C5 * Nbits_value / 1000000
-        Max_Offered_Load_C5_new = format(Max_Offered_Load_C5, '.3f')
-        Max_Offered_Load_C6 = Max_Frame_Rate_C6 * Nbits_value / 1000000
-        Max_Offered_Load_C6_new = format(Max_Offered_Load_C6, '.3f')
-        Max_Offered_Load_C7 = Max_Frame_Rate_C7 * Nbits_value / 1000000
-        Max_Offered_Load_C7_new = format(Max_Offered_Load_C7, '.3f')
-
-        # Offered Load Per 802.11 Client
-
-        Offered_Load_Per_Client1 = Max_Offered_Load_C1 / 1
-        self.Offered_Load_Per_Client1_new = format(Offered_Load_Per_Client1, '.3f')
-        Offered_Load_Per_Client2 = Max_Offered_Load_C2 / 2
-        Offered_Load_Per_Client2_new = format(Offered_Load_Per_Client2, '.3f')
-        Offered_Load_Per_Client3 = Max_Offered_Load_C3 / 5
-        Offered_Load_Per_Client3_new = format(Offered_Load_Per_Client3, '.3f')
-        Offered_Load_Per_Client4 = Max_Offered_Load_C4 / 10
-        Offered_Load_Per_Client4_new = format(Offered_Load_Per_Client4, '.3f')
-        Offered_Load_Per_Client5 = Max_Offered_Load_C5 / 20
-        Offered_Load_Per_Client5_new = format(Offered_Load_Per_Client5, '.3f')
-        Offered_Load_Per_Client6 = Max_Offered_Load_C6 / 50
-        Offered_Load_Per_Client6_new = format(Offered_Load_Per_Client6, '.3f')
-        Offered_Load_Per_Client7 = Max_Offered_Load_C7 / 100
-        Offered_Load_Per_Client7_new = format(Offered_Load_Per_Client7, '.3f')
-
-        # Offered Load (802.3 Side)
-
-        Offered_Load_C1 = Max_Frame_Rate_C1 * Ethernet_MAC_Frame_int * 8 / 1000000
-        self.Offered_Load_C1_new = format(Offered_Load_C1, '.3f')
-        Offered_Load_C2 = Max_Frame_Rate_C2 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C2_new = format(Offered_Load_C2, '.3f')
-        Offered_Load_C3 = Max_Frame_Rate_C3 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C3_new = format(Offered_Load_C3, '.3f')
-        Offered_Load_C4 = Max_Frame_Rate_C4 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C4_new = format(Offered_Load_C4, '.3f')
-        Offered_Load_C5 = Max_Frame_Rate_C5 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C5_new = format(Offered_Load_C5, '.3f')
-        Offered_Load_C6 = Max_Frame_Rate_C6 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C6_new = format(Offered_Load_C6, '.3f')
-        Offered_Load_C7 = Max_Frame_Rate_C7 * Ethernet_MAC_Frame_int * 8 / 1000000
-        Offered_Load_C7_new = format(Offered_Load_C7, '.3f')
-
-        # IP Throughput (802.11 -> 802.3)
-
-        if ip == 1:
-            IP_Throughput_C1 = Max_Frame_Rate_C1 * ip_packet * 8 / 1000000
-            self.IP_Throughput_C1_new = format(IP_Throughput_C1, '.3f')
-            IP_Throughput_C2 = Max_Frame_Rate_C2 * ip_packet * 8 / 1000000
-            IP_Throughput_C2_new = format(IP_Throughput_C2, '.3f')
-            IP_Throughput_C3 = Max_Frame_Rate_C3 * ip_packet * 8 / 1000000
-            IP_Throughput_C3_new = format(IP_Throughput_C3, '.3f')
-            IP_Throughput_C4 = Max_Frame_Rate_C4 * ip_packet * 8 / 1000000
-            IP_Throughput_C4_new = format(IP_Throughput_C4, '.3f')
-            IP_Throughput_C5 = Max_Frame_Rate_C5 * ip_packet * 8 / 1000000
-            IP_Throughput_C5_new = format(IP_Throughput_C5, '.3f')
-            IP_Throughput_C6 = Max_Frame_Rate_C6 * ip_packet * 8 / 1000000
-            IP_Throughput_C6_new = format(IP_Throughput_C6, '.3f')
-            IP_Throughput_C7 = Max_Frame_Rate_C7 * ip_packet * 8 / 1000000
-            IP_Throughput_C7_new = format(IP_Throughput_C7, '.3f')
-        else:
+        result = self.theoretical_values(phy='11abg', traffic=self.Traffic_Type,
+                                         phy_bit_rate=float(self.PHY_Bit_Rate), encryption=self.Encryption,
+                                         qos=self.QoS, frame_size=float(self.MAC_Frame_802_11),
+                                         basic_rates=self.Basic_Rate_Set, preamble=self.Preamble,
+                                         slot=self.slot_name, codec=self.Codec_Type,
+                                         rts_cts="Yes" in self.RTS_CTS_Handshake,
+                                         cts_to_self="No" not in self.CTS_to_self)
+
+        self.Client_1_new = format(result['interval_us'], '.2f')
+        self.Max_Frame_Rate_C1_round = round(result['ppdu_rate'])
+        self.Max_Offered_Load_C1_new = format(result['mac_data_rate_mbps'], '.3f')
+        self.Offered_Load_Per_Client1_new = format(result['goodput_per_client_mbps'], '.3f')
+        self.Offered_Load_C1_new = format(result['offered_load_8023_mbps'], '.3f')
+        if np.isnan(result['ip_goodput_mbps']):
             self.IP_Throughput_C1_new = "N/A"
-            IP_Throughput_C2_new = "N/A"
-            IP_Throughput_C3_new = "N/A"
-            IP_Throughput_C4_new = "N/A"
-            IP_Throughput_C5_new = "N/A"
-            IP_Throughput_C6_new = "N/A"
-            IP_Throughput_C7_new = "N/A"
-
-        Voice_Call = Max_Frame_Rate_C1 / Codec_Frame_rate
-        Voice_Call_value = round(Voice_Call)
-
-        if "Data" in self.Traffic_Type:
-            self.Maximum_Theoretical_R_value = "N/A"
         else:
-            if "G.711" in self.Codec_Type:
-                self.Maximum_Theoretical_R_value = 85.9
-            else:
-                if "G.723" in self.Codec_Type:
-                    self.Maximum_Theoretical_R_value = 72.9
-                else:
-                    if "G.729" in self.Codec_Type:
-                        self.Maximum_Theoretical_R_value = 81.7
-                    else:
-                        self.Maximum_Theoretical_R_value = 93.2
+            self.IP_Throughput_C1_new = format(result['ip_goodput_mbps'], '.3f')
 
         if "Data" in self.Traffic_Type:
+            self.Maximum_Theoretical_R_value = "N/A"
             self.Estimated_MOS_Score = "N/A"
             self.Maximum_Bidirectional_Voice_Calls = "N/A"
         else:
-            if Voice_Call_value <= 1:
-                Maximum_Bidirectional_Voice_Calls1 = self.Max_Frame_Rate_C1_round / Codec_Frame_rate
-            elif Voice_Call_value <= 2:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C2_round / Codec_Frame_rate
-            elif Voice_Call_value <= 5:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C3_round / Codec_Frame_rate
-
-            elif Voice_Call_value <= 10:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C4_round / Codec_Frame_rate
-            elif Voice_Call_value <= 20:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C5_round / Codec_Frame_rate
-            elif Voice_Call_value <= 50:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C6_round / Codec_Frame_rate
-            else:
-                Maximum_Bidirectional_Voice_Calls1 = Max_Frame_Rate_C7_round / Codec_Frame_rate
-            self.Maximum_Bidirectional_Voice_Calls = round(Maximum_Bidirectional_Voice_Calls1, 2)
-            if self.Maximum_Theoretical_R_value < 0:
-                self.Estimated_MOS_Score = 1
-            else:
-                if self.Maximum_Theoretical_R_value > 100:
-                    self.Estimated_MOS_Score = 4.5
-
-                else:
-                    Estimated_MOS_Score_1 = 1 + 0.035 * self.Maximum_Theoretical_R_value + self.Maximum_Theoretical_R_value * (
-                            self.Maximum_Theoretical_R_value - 60) * (
-                                                    100 - self.Maximum_Theoretical_R_value) * 7 * 0.000001
-                    self.Estimated_MOS_Score = round(Estimated_MOS_Score_1, 2)
+            self.Maximum_Theoretical_R_value = result['r_value']
+            self.Estimated_MOS_Score = round(result['mos'], 2)
+            self.Maximum_Bidirectional_Voice_Calls = round(result['voice_calls'], 2)
+
+    # Evaluate this single configuration with theoretical_throughput()
+
+    @staticmethod
+    def theoretical_values(**kwargs):
+        return {key: value.item() for key, value in theoretical_throughput(**kwargs).items()}
 
     def get_result(self):
 
@@ -666,6 +599,7 @@ class abg11_calculator:
 ##Class to take all user input (802.11n Standard)
 
 class n11_calculator(abg11_calculator):
+    calculator_name = "11nCalculator"
 
     def __init__(self, Traffic_Type, Data_Voice_MCS, Channel_Bandwidth, Guard_Interval_value, Highest_Basic_str,
                  Encryption, QoS,
@@ -688,772 +622,56 @@ class n11_calculator(abg11_calculator):
     # This function is for calculate intermediate values and Theoretical values
 
     def calculate(self):
-        global HT_data_temp
-        global temp_value
-        SIFS = 16.00
-        DIFS = 34.00
-        Slot_Time = 9.00
-        Tsymbol_Control = 4.00
-        # *********************************************Auxilliary  Data***********************************************
-        Non_HT_Ref = ['6', '12', '18', '24', '36', '48', '54', '54', '6', '12', '18', '24', '36', '48', '54', '54', '6',
-                      '12', '18', '24', '36', '48', '54', '54', '6', '12', '18', '24', '36', '48', '54', '54']
-        HT_LTFs = ['0', '1', '3', '3']
-        Ndbps_20MHz = ['26', '52', '78', '104', '156', '208', '234', '260']
-        Ndbps_40MHz = ['54', '108', '162', '216', '324', '432', '486', '540']
-        Nes = ['1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1',
-               '2', '2', '2', '1', '1', '1', '1', '2', '2', '2', '2', ]
-
-        Data_Voice_MCS_int = int(self.Data_Voice_MCS)
-        IP_Packets_MSDU = int(self.IP_Packets_MSDU_str)
-        IP_Packets_MSDU_loc = IP_Packets_MSDU + 1
-        Highest_Basic = int(self.Highest_Basic_str)
-
-        i = 0
-        while True:
-            if Data_Voice_MCS_int == i:
-                Non_HT = Non_HT_Ref[i]
-                break
-            i = i + 1
-
-        Non_HT_value = int(Non_HT)
-
-        if Non_HT_value >= 6:
-            if "6" in self.BSS_Basic_Rate:
-                Allowed_control6 = 6
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control6 = 6
-                else:
-                    Allowed_control6 = 0
-        else:
-            Allowed_control6 = 0
-
-        if Non_HT_value >= 9:
-            if "9" in self.BSS_Basic_Rate:
-                Allowed_control9 = 9
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control9 = 6
-                else:
-                    Allowed_control9 = 0
-        else:
-            Allowed_control9 = 0
-
-        if Non_HT_value >= 12:
-            if "12" in self.BSS_Basic_Rate:
-                Allowed_control12 = 12
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control12 = 12
-                else:
-                    Allowed_control12 = 0
-        else:
-            Allowed_control12 = 0
-
-        if Non_HT_value >= 18:
-            if "18" in self.BSS_Basic_Rate:
-                Allowed_control18 = 18
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control18 = 12
-                else:
-                    Allowed_control18 = 0
-        else:
-            Allowed_control18 = 0
-
-        if Non_HT_value >= 24:
-            if "24" in self.BSS_Basic_Rate:
-                Allowed_control24 = 24
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control24 = 24
-                else:
-                    Allowed_control24 = 0
-        else:
-            Allowed_control24 = 0
-
-        if Non_HT_value >= 36:
-            if "36" in self.BSS_Basic_Rate:
-                Allowed_control36 = 36
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control36 = 24
-                else:
-                    Allowed_control36 = 0
-        else:
-            Allowed_control36 = 0
-
-        if Non_HT_value >= 48:
-            if "48" in self.BSS_Basic_Rate:
-                Allowed_control48 = 48
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control48 = 24
-                else:
-                    Allowed_control48 = 0
-        else:
-            Allowed_control48 = 0
-
-        if Non_HT_value >= 54:
-            if "54" in self.BSS_Basic_Rate:
-                Allowed_control54 = 54
-            else:
-                if (not (
-                        "6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate or "18" in self.BSS_Basic_Rate or
-                        "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    Allowed_control54 = 24
-                else:
-                    Allowed_control54 = 0
-        else:
-            Allowed_control54 = 0
-
-        # g24 QoS Hdr
-        if "Yes" in self.QoS:
-            QoS_1 = 1
-        elif "No" in self.QoS:
-            QoS_1 = 0
-        if (QoS_1 == 1) or (IP_Packets_MSDU > 1):
-            QoS_Hdr = 2
-        else:
-            QoS_Hdr = 0
-
-        # g23 Encrypt Hdr
-
-        if "None" in self.Encryption:
-            Encrypt_Hdr = 0
-        else:
-            if "WEP" in self.Encryption:
-                Encrypt_Hdr = 8
-            elif "TKIP" in self.Encryption:
-                Encrypt_Hdr = 20
-            else:
-                Encrypt_Hdr = 16
-        # c36 Codec IP Packet Size
-
-        if "G.711" in self.Codec_Type:
-            Codec_IP_Packet_Size = 200
-            Codec_Frame_Rate = 100
-
-        else:
-            if "G.723" in self.Codec_Type:
-                Codec_IP_Packet_Size = 60
-                Codec_Frame_Rate = 67
-
-            else:
-                if "G.729" in self.Codec_Type:
-                    Codec_IP_Packet_Size = 60
-                    Codec_Frame_Rate = 100
-
-                else:
-                    Codec_IP_Packet_Size = 0
-                    Codec_Frame_Rate = 0
-
-        # c17  MAC MPDU Size
-
-        if "Data" in self.Traffic_Type:
-            MAC_MPDU_Size = int(self.MAC_MPDU_Size_Data_Traffic)
-
-        else:
-            if IP_Packets_MSDU == 0:
-                MAC_MPDU_Size = (Codec_IP_Packet_Size + 28 + QoS_Hdr + Encrypt_Hdr + 8)
-
-            else:
-                MAC_MPDU_Size_1 = (Codec_IP_Packet_Size + 28 + QoS_Hdr + Encrypt_Hdr + 8 + (IP_Packets_MSDU_loc - 1) * (
-                        14 + 3))
-                MAC_MPDU_Size = int(MAC_MPDU_Size_1 / (IP_Packets_MSDU_loc - 1))
-
-        # MSDU Size
-
-        if IP_Packets_MSDU == 0:
-            MSDU_final = MAC_MPDU_Size - 28 - QoS_Hdr - Encrypt_Hdr
-
-
-        else:
-            MSDU_1 = (MAC_MPDU_Size - 28 - QoS_Hdr - Encrypt_Hdr - IP_Packets_MSDU * (14 + 3))
-            MSDU_final = MSDU_1 / IP_Packets_MSDU
-
-        if MSDU_final < 0:
-            msdu_str = str(MSDU_final)
-            x = msdu_str.split(".")
-            sec = len(x[0])
-            if sec > 2:
-                MSDU = int(MSDU_final) - 1
-            else:
-                MSDU = int(MSDU_final)
-        else:
-            MSDU = int(MSDU_final)
-
-        if (MSDU - 8) < 20:
-            IP_Packet_value = "N/A"
-            ip_value = 0
-        else:
-            IP_Packet_value = MSDU - 8
-            ip_value = 1
-
-        if ip_value == 0:
-            Ethernet_value = "N/A"
-            eth_value = 0
-        else:
-            ip_1 = int(IP_Packet_value)
-            Ethernet_value = max(ip_1 + 18, 64)
-            eth_value = 1
-
-        # HT-LTFs
-
-        temp_value = int(Data_Voice_MCS_int / 8)
-
-        def HT_value_func():
-            if temp_value == 0:
-                HT_data_temp = HT_LTFs[0]
-            elif temp_value == 1:
-                HT_data_temp = HT_LTFs[1]
-            elif temp_value == 2:
-                HT_data_temp = HT_LTFs[2]
-            elif temp_value == 3:
-                HT_data_temp = HT_LTFs[3]
-            return HT_data_temp
-
-        HT_data = HT_value_func()
-        HT_data_1 = int(HT_data)
-
-        # c20 Tppdu_fixed (HT Data Frames)
-
-        if "Mixed" in self.PLCP:
-            Tppdu_fixed_Data_Frame = float(36 + 4 * HT_data_1)
-            PLCP_Configuration_int = 1
-        elif "Greenfield" in self.PLCP:
-            Tppdu_fixed_Data_Frame = float(24 + 4 * HT_data_1)
-            PLCP_Configuration_int = 2
-
-        # c21 Tppdu_fixed (HT Control Frames)
-
-        Data_min = min(Data_Voice_MCS_int, Highest_Basic)
-        temp_value = int(Data_min / 8) + 1
-        HT_data_temp_1 = HT_value_func()
-        HT_data_2 = int(HT_data_temp_1)
-
-        if "Mixed" in self.PLCP:
-            Tppdu_fixed_Control_Frames = float(36 + 4 * HT_data_2)
-
-        elif "Greenfield" in self.PLCP:
-            Tppdu_fixed_Control_Frames = float(24 + 4 * HT_data_2)
-
-        # Non-HT Reference Rate
-        # Offset calculation
-
-        i = 0
-        while True:
-            if Data_Voice_MCS_int == i:
-                Non_HT = Non_HT_Ref[i]
-                Nes_data = Nes[i]
-                break
-            i = i + 1
-
-        # PHY Bit Rate of Control Frames
-
-        PHY_Bit_Rate_of_Control_Frames = max(Allowed_control6, Allowed_control9,
-                                             Allowed_control12, Allowed_control18,
-                                             Allowed_control24, Allowed_control36,
-                                             Allowed_control48, Allowed_control54, 6)
-
-        # Ndbps, data bits per symbol (Data)
-
-        def Ndbps_fun():
-            if Data_Voice_MCS_int == 0 or Data_Voice_MCS_int == 8 or Data_Voice_MCS_int == 16 or Data_Voice_MCS_int == 24:
-                Ndbps_20 = Ndbps_20MHz[0]
-                Ndbps_40 = Ndbps_40MHz[0]
-            elif Data_Voice_MCS_int == 1 or Data_Voice_MCS_int == 9 or Data_Voice_MCS_int == 17 or Data_Voice_MCS_int == 25:
-                Ndbps_20 = Ndbps_20MHz[1]
-                Ndbps_40 = Ndbps_40MHz[1]
-            elif Data_Voice_MCS_int == 2 or Data_Voice_MCS_int == 10 or Data_Voice_MCS_int == 18 or Data_Voice_MCS_int == 26:
-                Ndbps_20 = Ndbps_20MHz[2]
-                Ndbps_40 = Ndbps_40MHz[2]
-
-            elif Data_Voice_MCS_int == 3 or Data_Voice_MCS_int == 11 or Data_Voice_MCS_int == 19 or Data_Voice_MCS_int == 27:
-                Ndbps_20 = Ndbps_20MHz[3]
-                Ndbps_40 = Ndbps_40MHz[3]
-            elif Data_Voice_MCS_int == 4 or Data_Voice_MCS_int == 12 or Data_Voice_MCS_int == 20 or Data_Voice_MCS_int == 28:
-                Ndbps_20 = Ndbps_20MHz[4]
-                Ndbps_40 = Ndbps_40MHz[4]
-            elif Data_Voice_MCS_int == 5 or Data_Voice_MCS_int == 13 or Data_Voice_MCS_int == 21 or Data_Voice_MCS_int == 29:
-                Ndbps_20 = Ndbps_20MHz[5]
-                Ndbps_40 = Ndbps_40MHz[5]
-            elif Data_Voice_MCS_int == 6 or Data_Voice_MCS_int == 14 or Data_Voice_MCS_int == 22 or Data_Voice_MCS_int == 30:
-                Ndbps_20 = Ndbps_20MHz[6]
-                Ndbps_40 = Ndbps_40MHz[6]
-            elif Data_Voice_MCS_int == 7 or Data_Voice_MCS_int == 15 or Data_Voice_MCS_int == 23 or Data_Voice_MCS_int == 31:
-                Ndbps_20 = Ndbps_20MHz[7]
-                Ndbps_40 = Ndbps_40MHz[7]
-            Ndbps_20_int = int(Ndbps_20)
-            Ndbps_40_int = int(Ndbps_40)
-            return Ndbps_20_int, Ndbps_40_int
-
-        if "20" in self.Channel_Bandwidth:
-
-            if Data_Voice_MCS_int >= 0 and Data_Voice_MCS_int < 8:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_20_int * 1
-            if Data_Voice_MCS_int >= 8 and Data_Voice_MCS_int < 16:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_20_int * 2
-            if Data_Voice_MCS_int >= 16 and Data_Voice_MCS_int < 24:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_20_int * 3
-            if Data_Voice_MCS_int >= 24 and Data_Voice_MCS_int < 32:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_20_int * 4
-
-
-        elif "40" in self.Channel_Bandwidth:
-
-            if Data_Voice_MCS_int >= 0 and Data_Voice_MCS_int < 8:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_40_int * 1
-            if Data_Voice_MCS_int >= 8 and Data_Voice_MCS_int < 16:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_40_int * 2
-            if Data_Voice_MCS_int >= 16 and Data_Voice_MCS_int < 24:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_40_int * 3
-            if Data_Voice_MCS_int >= 24 and Data_Voice_MCS_int < 32:
-                Ndbps_20_int, Ndbps_40_int = Ndbps_fun()
-                data_bits = Ndbps_40_int * 4
-
-        # Ndbps, data bits per symbol (Control)
-
-        if PHY_Bit_Rate_of_Control_Frames < 7:
-            if PHY_Bit_Rate_of_Control_Frames < 3:
-                PHY = PHY_Bit_Rate_of_Control_Frames
-            else:
-                if PHY_Bit_Rate_of_Control_Frames == 3:
-                    PHY = 5.5
-                else:
-                    if PHY_Bit_Rate_of_Control_Frames == 4:
-                        PHY = 11
-                    else:
-                        if PHY_Bit_Rate_of_Control_Frames == 5:
-                            PHY = 6
-                        else:
-                            if PHY_Bit_Rate_of_Control_Frames == 6:
-                                PHY = 9
-        else:
-            if PHY_Bit_Rate_of_Control_Frames == 8:
-                PHY = 18
-            else:
-                if PHY_Bit_Rate_of_Control_Frames == 9:
-                    PHY = 24
-                else:
-                    if PHY_Bit_Rate_of_Control_Frames == 10:
-                        PHY = 36
-                    else:
-                        if PHY_Bit_Rate_of_Control_Frames == 11:
-                            PHY = 48
-                        else:
-                            PHY = 54
-        Ndbps_data_bits_per_symbol_Control = PHY * 4
-        MAC_Frames_per_A_MPDU = int(self.MAC_Frames_per_A_MPDU_str)
-
-        # g22 A-MPDU Pad
-
-        if MAC_Frames_per_A_MPDU == 0:
-            MPDU_Pad = int(0)
-
-        else:
-            x = int((MAC_MPDU_Size % 4))
-            y = int((4 - x))
-            MPDU_Pad = int((y % 4))
-
-        # c26 Nbits, Bits per MAC PPDU
-
-        MAC_Frames_per_A_MPDU_loc = MAC_Frames_per_A_MPDU + 1
-        if MAC_Frames_per_A_MPDU == 0:
-            Nbits_Bits_per_MAC_PPDU = MAC_MPDU_Size * 8
-
-        else:
-            Nbits_Bits_per_MAC_PPDU = ((MAC_MPDU_Size + 4) * (MAC_Frames_per_A_MPDU_loc - 1) + MPDU_Pad * (
-                    MAC_Frames_per_A_MPDU_loc - 2)) * 8
-
-        # c27 Tsymbol(Data), Data Symbol Period
-
-        if "400" in self.Guard_Interval_value:
-            Guard_Interval_1 = 1
-        elif "800" in self.Guard_Interval_value:
-            Guard_Interval_1 = 0
-        calculation = ((Data_Voice_MCS_int > 7 and PLCP_Configuration_int == 2) or PLCP_Configuration_int == 1)
-        if (Guard_Interval_1 == 1) and calculation:
-            Tsymbol_Data_Symbol_Period = 3.60
-
-        else:
-            Tsymbol_Data_Symbol_Period = 4
-
-        Nes_data_int = int(Nes_data)
-
-        # Ttxframe (DATA)
-
-        if "40" in self.Channel_Bandwidth:
-            offset = 6 * Nes_data_int
-        else:
-            offset = 6
 
-        Ttxframe_1 = Tppdu_fixed_Data_Frame + int(
-            (16 + offset + Nbits_Bits_per_MAC_PPDU + data_bits - 1) / data_bits) * Tsymbol_Data_Symbol_Period
-        Ttxframe_2 = format(Ttxframe_1, '.2f')
-        Ttxframe = float(Ttxframe_2)
-
-        # c30 Ttxframe (Ack)
-
-        Ttxframe_Ack = int(
-            (22 + 14 * 8 + PHY_Bit_Rate_of_Control_Frames * 4 - 1) / (PHY_Bit_Rate_of_Control_Frames * 4)) * 4 + 20
-
-        # c31 Ttxframe (Compressed BlockAck)
-
-        Ttxframe_Compressed_BlockAck = int(
-            (22 + 32 * 8 + PHY_Bit_Rate_of_Control_Frames * 4 - 1) / (PHY_Bit_Rate_of_Control_Frames * 4)) * 4 + 20
-
-        # g20 Use BlockAck
-        if MAC_Frames_per_A_MPDU == 0:
-            Use_BlockAck = False
-
-        else:
-            Use_BlockAck = True
-
-        # c34 Ack Response Overhead
-        if Use_BlockAck:
-            Ack_Response_Overhead = 0
-
-        else:
-            Ack_Response_Overhead = SIFS + Ttxframe_Ack
-
-        # c35 BlockAck Response Overhead
-
-        if Use_BlockAck:
-            BlockAck_Response_Overhead = SIFS + Ttxframe_Compressed_BlockAck
-
-        else:
-            BlockAck_Response_Overhead = 0
-        CWmin_leave_alone_for_default = int(self.CWmin)
-        MeanBackoff = CWmin_leave_alone_for_default * Slot_Time / 2
-
-        # c32 RTS/CTS Handshake Overhead
-
-        if "Yes" in self.RTS_CTS_Handshake:
-            if "20" in self.Channel_Bandwidth:
-                RTS_CTS_Handshake_Overhead = 2 * 20 + 4 * int((22 + (20 + 14) * 8 + 24 * 4 - 1) / (24 * 4)) + 2 * SIFS
-
-            else:
-                RTS_CTS_Handshake_Overhead = 2 * 20 + int(
-                    (22 + (20 + 14) * 8 + 24 - 1) / 24) * Tsymbol_Control + 2 * SIFS
-
-        else:
-            RTS_CTS_Handshake_Overhead = 0
-
-        # c33CTS-to-self Handshake Overhead
-
-        if "Yes" in self.RTS_CTS_Handshake:
-            CTS_to_self_Handshake_Overhead = 0
-
-        else:
-            if "Yes" in self.CTS_to_self:
-                if "20" in self.Channel_Bandwidth:
-                    CTS_to_self_Handshake_Overhead = 20 + 4 * int((22 + 14 * 8 + 24 * 4 - 1) / (24 * 4)) + SIFS
-
-                else:
-                    CTS_to_self_Handshake_Overhead = 20 + int((22 + 14 * 8 + 24 - 1) / 24) * Tsymbol_Control + SIFS
-
-            else:
-                CTS_to_self_Handshake_Overhead = 0
-
-        # MAC PPDU Interval
-
-        # MeanBackoff
-
-        MAC_PPDU_Interval_1 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 1)
-        self.Client_1_new = format(MAC_PPDU_Interval_1, '.2f')
-        MAC_PPDU_Interval_2 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 2)
-        Client_2_new = format(MAC_PPDU_Interval_2, '.2f')
-        MAC_PPDU_Interval_3 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 5)
-        Client_3_new = format(MAC_PPDU_Interval_3, '.2f')
-        MAC_PPDU_Interval_4 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 10)
-        Client_4_new = format(MAC_PPDU_Interval_4, '.2f')
-        MAC_PPDU_Interval_5 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 20)
-        Client_5_new = format(MAC_PPDU_Interval_5, '.2f')
-        MAC_PPDU_Interval_6 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 50)
-        Client_6_new = format(MAC_PPDU_Interval_6, '.2f')
-        MAC_PPDU_Interval_7 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 100)
-        Client_7_new = format(MAC_PPDU_Interval_7, '.3f')
-
-        # Max PPDU Rate
-
-        Max_PPDU_Rate_1 = 1000000 / MAC_PPDU_Interval_1
-        self.Client_8_new = format(Max_PPDU_Rate_1, '.2f')
-        Max_PPDU_Rate_2 = 1000000 / MAC_PPDU_Interval_2
-        Client_9_new = format(Max_PPDU_Rate_2, '.2f')
-        Max_PPDU_Rate_3 = 1000000 / MAC_PPDU_Interval_3
-        Client_10_new = format(Max_PPDU_Rate_3, '.2f')
-        Max_PPDU_Rate_4 = 1000000 / MAC_PPDU_Interval_4
-        Client_11_new = format(Max_PPDU_Rate_4, '.2f')
-        Max_PPDU_Rate_5 = 1000000 / MAC_PPDU_Interval_5
-        Client_12_new = format(Max_PPDU_Rate_5, '.2f')
-        Max_PPDU_Rate_6 = 1000000 / MAC_PPDU_Interval_6
-        Client_13_new = format(Max_PPDU_Rate_6, '.2f')
-        Max_PPDU_Rate_7 = 1000000 / MAC_PPDU_Interval_7
-        Client_14_new = format(Max_PPDU_Rate_7, '.2f')
-
-        # c44 Max_MAC_MPDU_Rate_1
-        if MAC_Frames_per_A_MPDU > 0:
-            Max_MAC_MPDU_Rate_1 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_1
-            Max_MAC_MPDU_Rate_2 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_2
-            Max_MAC_MPDU_Rate_3 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_3
-            Max_MAC_MPDU_Rate_4 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_4
-            Max_MAC_MPDU_Rate_5 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_5
-            Max_MAC_MPDU_Rate_6 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_6
-            Max_MAC_MPDU_Rate_7 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_7
-        else:
-            Max_MAC_MPDU_Rate_1 = Max_PPDU_Rate_1
-            Max_MAC_MPDU_Rate_2 = Max_PPDU_Rate_2
-            Max_MAC_MPDU_Rate_3 = Max_PPDU_Rate_3
-            Max_MAC_MPDU_Rate_4 = Max_PPDU_Rate_4
-            Max_MAC_MPDU_Rate_5 = Max_PPDU_Rate_5
-            Max_MAC_MPDU_Rate_6 = Max_PPDU_Rate_6
-            Max_MAC_MPDU_Rate_7 = Max_PPDU_Rate_7
-
-        self.Client_15_new = round(Max_MAC_MPDU_Rate_1)
-        Client_16_new = round(Max_MAC_MPDU_Rate_2)
-        Client_17_new = round(Max_MAC_MPDU_Rate_3)
-        Client_18_new = round(Max_MAC_MPDU_Rate_4)
-        Client_19_new = round(Max_MAC_MPDU_Rate_5)
-        Client_20_new = round(Max_MAC_MPDU_Rate_6)
-        Client_21_new = round(Max_MAC_MPDU_Rate_7)
-
-        # Max MAC MSDU Rate
-
-        if IP_Packets_MSDU > 0:
-            Max_MAC_MSDU_Rate_1 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_1
-            Max_MAC_MSDU_Rate_2 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_2
-            Max_MAC_MSDU_Rate_3 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_3
-            Max_MAC_MSDU_Rate_4 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_4
-            Max_MAC_MSDU_Rate_5 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_5
-            Max_MAC_MSDU_Rate_6 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_6
-            Max_MAC_MSDU_Rate_7 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_7
-
-        else:
-            Max_MAC_MSDU_Rate_1 = Max_MAC_MPDU_Rate_1
-            Max_MAC_MSDU_Rate_2 = Max_MAC_MPDU_Rate_2
-            Max_MAC_MSDU_Rate_3 = Max_MAC_MPDU_Rate_3
-            Max_MAC_MSDU_Rate_4 = Max_MAC_MPDU_Rate_4
-            Max_MAC_MSDU_Rate_5 = Max_MAC_MPDU_Rate_5
-            Max_MAC_MSDU_Rate_6 = Max_MAC_MPDU_Rate_6
-            Max_MAC_MSDU_Rate_7 = Max_MAC_MPDU_Rate_7
-
-        self.Client_22_new = round(Max_MAC_MSDU_Rate_1)
-        Client_23_new = round(Max_MAC_MSDU_Rate_2)
-        Client_24_new = round(Max_MAC_MSDU_Rate_3)
-        Client_25_new = round(Max_MAC_MSDU_Rate_4)
-        Client_26_new = round(Max_MAC_MSDU_Rate_5)
-        Client_27_new = round(Max_MAC_MSDU_Rate_6)
-        Client_28_new = round(Max_MAC_MSDU_Rate_7)
-
-        # Max. 802.11 MAC Frame Data Rate
-        Max_802_11_MAC_Frame_Data_Rate_1 = Max_MAC_MPDU_Rate_1 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_2 = Max_MAC_MPDU_Rate_2 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_3 = Max_MAC_MPDU_Rate_3 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_4 = Max_MAC_MPDU_Rate_4 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_5 = Max_MAC_MPDU_Rate_5 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_6 = Max_MAC_MPDU_Rate_6 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_7 = Max_MAC_MPDU_Rate_7 * MAC_MPDU_Size * 8 / 1000000
-
-        self.Client_29_new = format(Max_802_11_MAC_Frame_Data_Rate_1, '.3f')
-        Client_30_new = format(Max_802_11_MAC_Frame_Data_Rate_2, '.3f')
-        Client_31_new = format(Max_802_11_MAC_Frame_Data_Rate_3, '.3f')
-        Client_32_new = format(Max_802_11_MAC_Frame_Data_Rate_4, '.3f')
-        Client_33_new = format(Max_802_11_MAC_Frame_Data_Rate_5, '.3f')
-        Client_34_new = format(Max_802_11_MAC_Frame_Data_Rate_6, '.3f')
-        Client_35_new = format(Max_802_11_MAC_Frame_Data_Rate_7, '.3f')
-
-        # Max. 802.11 MAC Payload Goodput
-
-        Max_802_11_MAC_Payload_Goodput_1 = MSDU * 8 * Max_MAC_MSDU_Rate_1 / 1000000
-        Max_802_11_MAC_Payload_Goodput_2 = MSDU * 8 * Max_MAC_MSDU_Rate_2 / 1000000
-        Max_802_11_MAC_Payload_Goodput_3 = MSDU * 8 * Max_MAC_MSDU_Rate_3 / 1000000
-        Max_802_11_MAC_Payload_Goodput_4 = MSDU * 8 * Max_MAC_MSDU_Rate_4 / 1000000
-        Max_802_11_MAC_Payload_Goodput_5 = MSDU * 8 * Max_MAC_MSDU_Rate_5 / 1000000
-        Max_802_11_MAC_Payload_Goodput_6 = MSDU * 8 * Max_MAC_MSDU_Rate_6 / 1000000
-        Max_802_11_MAC_Payload_Goodput_7 = MSDU * 8 * Max_MAC_MSDU_Rate_7 / 1000000
-
-        self.Client_36_new = format(Max_802_11_MAC_Payload_Goodput_1, '.3f')
-        Client_37_new = format(Max_802_11_MAC_Payload_Goodput_2, '.3f')
-        Client_38_new = format(Max_802_11_MAC_Payload_Goodput_3, '.3f')
-        Client_39_new = format(Max_802_11_MAC_Payload_Goodput_4, '.3f')
-        Client_40_new = format(Max_802_11_MAC_Payload_Goodput_5, '.3f')
-        Client_41_new = format(Max_802_11_MAC_Payload_Goodput_6, '.3f')
-        Client_42_new = format(Max_802_11_MAC_Payload_Goodput_7, '.3f')
-
-        # MAC Goodput Per 802.11 Client
-
-        MAC_Goodput_Per_802_11_Client_1 = Max_802_11_MAC_Payload_Goodput_1 / 1
-        MAC_Goodput_Per_802_11_Client_2 = Max_802_11_MAC_Payload_Goodput_2 / 2
-        MAC_Goodput_Per_802_11_Client_3 = Max_802_11_MAC_Payload_Goodput_3 / 5
-        MAC_Goodput_Per_802_11_Client_4 = Max_802_11_MAC_Payload_Goodput_4 / 10
-        MAC_Goodput_Per_802_11_Client_5 = Max_802_11_MAC_Payload_Goodput_5 / 20
-        MAC_Goodput_Per_802_11_Client_6 = Max_802_11_MAC_Payload_Goodput_6 / 50
-        MAC_Goodput_Per_802_11_Client_7 = Max_802_11_MAC_Payload_Goodput_7 / 100
-
-        self.Client_43_new = format(MAC_Goodput_Per_802_11_Client_1, '.3f')
-        Client_44_new = format(MAC_Goodput_Per_802_11_Client_2, '.3f')
-        Client_45_new = format(MAC_Goodput_Per_802_11_Client_3, '.3f')
-        Client_46_new = format(MAC_Goodput_Per_802_11_Client_4, '.3f')
-        Client_47_new = format(MAC_Goodput_Per_802_11_Client_5, '.3f')
-        Client_48_new = format(MAC_Goodput_Per_802_11_Client_6, '.3f')
-        Client_49_new = format(MAC_Goodput_Per_802_11_Client_7, '.3f')
-
-        # Offered Load (802.3 Side)
-
-        # c49
-        if eth_value != 0:
-
-            Offered_Load_8023_Side_1 = Max_MAC_MSDU_Rate_1 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_2 = Max_MAC_MSDU_Rate_2 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_3 = Max_MAC_MSDU_Rate_3 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_4 = Max_MAC_MSDU_Rate_4 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_5 = Max_MAC_MSDU_Rate_5 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_6 = Max_MAC_MSDU_Rate_6 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_7 = Max_MAC_MSDU_Rate_7 * Ethernet_value * 8 / 1000000
-            self.Client_50_new = format(Offered_Load_8023_Side_1, '.3f')
-            Client_51_new = format(Offered_Load_8023_Side_2, '.3f')
-            Client_52_new = format(Offered_Load_8023_Side_3, '.3f')
-            Client_53_new = format(Offered_Load_8023_Side_4, '.3f')
-            Client_54_new = format(Offered_Load_8023_Side_5, '.3f')
-            Client_55_new = format(Offered_Load_8023_Side_6, '.3f')
-            Client_56_new = format(Offered_Load_8023_Side_7, '.3f')
-
-        else:
+        result = self.theoretical_values(phy='11n', traffic=self.Traffic_Type, mcs=int(self.Data_Voice_MCS),
+                                         bandwidth=self.bandwidth_mhz(['20', '40']),
+                                         guard_interval=self.guard_interval_ns(['400', '800']),
+                                         encryption=self.Encryption, qos=self.QoS,
+                                         amsdu=int(self.IP_Packets_MSDU_str),
+                                         ampdu=int(self.MAC_Frames_per_A_MPDU_str), basic_rates=self.BSS_Basic_Rate,
+                                         frame_size=int(self.MAC_MPDU_Size_Data_Traffic), codec=self.Codec_Type,
+                                         plcp=self.PLCP, cwmin=int(self.CWmin), rts_cts=self.RTS_CTS_Handshake,
+                                         cts_to_self=self.CTS_to_self)
+        self.set_theoretical_values(result)
+
+    # Channel_Bandwidth / Guard_Interval_value as a number, the first of choices the string contains
+
+    def bandwidth_mhz(self, choices):
+        return next((int(mhz) for mhz in choices if mhz in self.Channel_Bandwidth), np.nan)
+
+    def guard_interval_ns(self, choices):
+        return next((int(ns) for ns in choices if ns in self.Guard_Interval_value), np.nan)
+
+    def set_theoretical_values(self, result):
+        self.Client_1_new = format(result['interval_us'], '.2f')
+        self.Client_8_new = format(result['ppdu_rate'], '.2f')
+        self.Client_15_new = round(result['mpdu_rate'])
+        self.Client_22_new = round(result['msdu_rate'])
+        self.Client_29_new = format(result['mac_data_rate_mbps'], '.3f')
+        self.Client_36_new = format(result['mac_goodput_mbps'], '.3f')
+        self.Client_43_new = format(result['goodput_per_client_mbps'], '.3f')
+        if np.isnan(result['offered_load_8023_mbps']):
             self.Client_50_new = "N/A"
-            Client_51_new = "N/A"
-            Client_52_new = "N/A"
-            Client_53_new = "N/A"
-            Client_54_new = "N/A"
-            Client_55_new = "N/A"
-            Client_56_new = "N/A"
-
-        IP_Packet_value_str = str(IP_Packet_value)
-        if "N/A" not in IP_Packet_value_str:
-            IP_Goodput_802_11_8023_1 = Max_MAC_MSDU_Rate_1 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_2 = Max_MAC_MSDU_Rate_2 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_3 = Max_MAC_MSDU_Rate_3 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_4 = Max_MAC_MSDU_Rate_4 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_5 = Max_MAC_MSDU_Rate_5 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_6 = Max_MAC_MSDU_Rate_6 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_7 = Max_MAC_MSDU_Rate_7 * ip_1 * 8 / 1000000
-            self.Client_57_new = format(IP_Goodput_802_11_8023_1, '.3f')
-            Client_58_new = format(IP_Goodput_802_11_8023_2, '.3f')
-            Client_59_new = format(IP_Goodput_802_11_8023_3, '.3f')
-            Client_60_new = format(IP_Goodput_802_11_8023_4, '.3f')
-            Client_61_new = format(IP_Goodput_802_11_8023_5, '.3f')
-            Client_62_new = format(IP_Goodput_802_11_8023_6, '.3f')
-            Client_63_new = format(IP_Goodput_802_11_8023_7, '.3f')
-
         else:
+            self.Client_50_new = format(result['offered_load_8023_mbps'], '.3f')
+        if np.isnan(result['ip_goodput_mbps']):
             self.Client_57_new = "N/A"
-            Client_58_new = "N/A"
-            Client_59_new = "N/A"
-            Client_60_new = "N/A"
-            Client_61_new = "N/A"
-            Client_62_new = "N/A"
-            Client_63_new = "N/A"
+        else:
+            self.Client_57_new = format(result['ip_goodput_mbps'], '.3f')
 
         # Theoretical Voice Call Capacity
-
-        # c53
         if "Data" in self.Traffic_Type:
             self.Maximum_Theoretical_R_value = "N/A"
             self.Estimated_MOS_Score = "N/A"
-        else:
-            if "G.711" in self.Codec_Type:
-                self.Maximum_Theoretical_R_value = 85.9
-            else:
-                if "G.723" in self.Codec_Type:
-                    self.Maximum_Theoretical_R_value = 72.9
-                else:
-                    if "G.729" in self.Codec_Type:
-                        self.Maximum_Theoretical_R_value = 81.7
-                    else:
-                        self.Maximum_Theoretical_R_value = 93.2
-
-            if self.Maximum_Theoretical_R_value < 0:
-                self.Estimated_MOS_Score = 1
-            else:
-                if self.Maximum_Theoretical_R_value > 100:
-                    self.Estimated_MOS_Score = 4.5
-                else:
-                    self.Estimated_MOS_Score_1 = (
-                            1 + 0.035 * self.Maximum_Theoretical_R_value + self.Maximum_Theoretical_R_value * (
-                            self.Maximum_Theoretical_R_value - 60) * (
-                                    100 - self.Maximum_Theoretical_R_value) * 7 * 0.000001)
-                    self.Estimated_MOS_Score = format(self.Estimated_MOS_Score_1, '.2f')
-
-        # Voice_Call_Range
-        try:
-            Voice_Call_Range = round(Max_PPDU_Rate_1 / Codec_Frame_Rate)
-
-            # c55 Maximum Bidirectional Voice Calls
-            if Voice_Call_Range <= 1:
-                Maximum_Bidirectional = Max_MAC_MSDU_Rate_1 / Codec_Frame_Rate
-
-            else:
-                if Voice_Call_Range <= 2:
-                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_2 / Codec_Frame_Rate
-
-                else:
-                    if Voice_Call_Range <= 5:
-                        Maximum_Bidirectional = Max_MAC_MSDU_Rate_3 / Codec_Frame_Rate
-
-                    else:
-                        if Voice_Call_Range <= 10:
-                            Maximum_Bidirectional = Max_MAC_MSDU_Rate_4 / Codec_Frame_Rate
-
-                        else:
-                            if Voice_Call_Range <= 20:
-                                Maximum_Bidirectional = Max_MAC_MSDU_Rate_5 / Codec_Frame_Rate
-
-                            else:
-                                if Voice_Call_Range <= 50:
-                                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_6 / Codec_Frame_Rate
-
-                                else:
-
-                                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_7 / Codec_Frame_Rate
-        except ZeroDivisionError:
-            pass
-
-        if "Data" in self.Traffic_Type:
             self.Maximum_Bidirectional_Voice_Calls = "N/A"
         else:
-            self.Maximum_Bidirectional_Voice_Calls = round(Maximum_Bidirectional, 2)
+            self.Maximum_Theoretical_R_value = result['r_value']
+            self.Estimated_MOS_Score = format(result['mos'], '.2f')
+            self.Maximum_Bidirectional_Voice_Calls = round(result['voice_calls'], 2)
 
     def get_result(self):
 
-        print("\n" + "******************Station : 11nCalculator*****************************" + "\n")
+        print("\n" + "******************Station : " + self.calculator_name + "*****************************" + "\n")
         print("Theoretical Maximum Offered Load" + "\n")
         print("1 Client:")
         All_theoretical_output = {'MAC PPDU Interval(usec)': self.Client_1_new,
@@ -1478,6 +696,7 @@ class n11_calculator(abg11_calculator):
 ##Class to take all user input (802.11ac Standard)
 
 class ac11_calculator(n11_calculator):
+    calculator_name = "11ac Calculator"
 
     def __init__(self, Traffic_Type, Data_Voice_MCS, spatial, Channel_Bandwidth, Guard_Interval_value,
                  Highest_Basic_str, Encryption, QoS, IP_Packets_MSDU_str, MAC_Frames_per_A_MPDU_str, BSS_Basic_Rate,
@@ -1491,731 +710,65 @@ class ac11_calculator(n11_calculator):
         self.spatial = spatial
         self.RTS_CTS = RTS_CTS
 
-    # This function is for calculate intermediate values and Theoretical values
+    # This function is for calculate intermediate values and Theoretical values, the PLCP configuration
+    # is taken from Codec_Type and voice always uses G.711
 
     def calculate(self):
 
-        SIFS = 16.00
-        DIFS = 34.00
-        Slot_Time = 9.00
-        Tsymbol_control_Symbol_Period = 4.00
-        Codec_IP_Packet_Size = 200
-        Codec_Frame_Rate = 100
-        # ********************Auxilliary data****************************
-
-        HT_LTFs = ['1', '2', '4', '4']
-        Ndbps_20MHz = ['26', '52', '78', '104', '156', '208', '234', '260', '312', '1040']
-        Ndbps_40MHz = ['54', '108', '162', '216', '324', '432', '486', '540', '648', '720']
-        Ndbps_80MHz = ['117', '234', '351', '468', '702', '936', '1053', '1170', '1404', '1560']
-        Non_HT_Ref = ['6', '12', '18', '24', '36', '48', '54', '54', '54', '54']
-        Nes1 = ['1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1',
-                '1', '1', '1', '1', '1', '1', '1', '1', '1']
-        Nes2 = ['1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1',
-                '2', '2', '2', '1', '1', '1', '2', '2', '2']
-        Nes3 = ['1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1',
-                '2', '2', '2', '1', '2', '2', '2', '2', '3']
-        Nes4 = ['1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '1', '2', '2', '1',
-                '1', '1', '1', '2', '2', '2', '3', '3', '3']
-
-        Data_Voice_MCS_int = int(self.Data_Voice_MCS)
-        CWmin_leave_alone_for_default = int(self.CWmin)
-        spatial_int = int(self.spatial)
-        MAC_Frames_per_A_MPDU = int(self.MAC_Frames_per_A_MPDU_str)
-
-        i = 0
-        while True:
-            if Data_Voice_MCS_int == i:
-                Non_HT = Non_HT_Ref[i]
-                break
-            i = i + 1
-
-        Non_HT_value = int(Non_HT)
-
-        if Non_HT_value >= 6:
-            if "6" in self.BSS_Basic_Rate:
-                allowed_control6 = 6
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control6 = 6
-                else:
-                    allowed_control6 = 0
-        else:
-            allowed_control6 = 0
-
-        if Non_HT_value >= 9:
-            if "9" in self.BSS_Basic_Rate:
-                allowed_control9 = 9
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control9 = 6
-                else:
-                    allowed_control9 = 0
-        else:
-            allowed_control9 = 0
-
-        if Non_HT_value >= 12:
-            if "12" in self.BSS_Basic_Rate:
-                allowed_control12 = 12
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control12 = 12
-                else:
-                    allowed_control12 = 0
-        else:
-            allowed_control12 = 0
-
-        if Non_HT_value >= 18:
-            if "18" in self.BSS_Basic_Rate:
-                allowed_control18 = 18
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control18 = 12
-                else:
-                    allowed_control18 = 0
-        else:
-            allowed_control18 = 0
-
-        if Non_HT_value >= 24:
-            if "24" in self.BSS_Basic_Rate:
-                allowed_control24 = 24
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control24 = 24
-                else:
-                    allowed_control24 = 0
-        else:
-            allowed_control24 = 0
-
-        if Non_HT_value >= 36:
-            if "36" in self.BSS_Basic_Rate:
-                allowed_control36 = 36
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control36 = 24
-                else:
-                    allowed_control36 = 0
-        else:
-            allowed_control36 = 0
-
-        if Non_HT_value >= 48:
-            if "48" in self.BSS_Basic_Rate:
-                allowed_control48 = 48
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control48 = 24
-                else:
-                    allowed_control48 = 0
-        else:
-            allowed_control48 = 0
-
-        if Non_HT_value >= 54:
-            if "54" in self.BSS_Basic_Rate:
-                allowed_control54 = 54
-            else:
-                if (not ("6" in self.BSS_Basic_Rate or "9" in self.BSS_Basic_Rate or "12" in self.BSS_Basic_Rate
-                         or "18" in self.BSS_Basic_Rate or "24" in self.BSS_Basic_Rate or "36" in self.BSS_Basic_Rate or
-                         "48" in self.BSS_Basic_Rate or "54" in self.BSS_Basic_Rate)):
-                    allowed_control54 = 24
-                else:
-                    allowed_control54 = 0
-        else:
-            allowed_control54 = 0
-
-        MeanBackoff = CWmin_leave_alone_for_default * Slot_Time / 2
+        result = self.theoretical_values(phy='11ac', traffic=self.Traffic_Type, mcs=int(self.Data_Voice_MCS),
+                                         nss=int(self.spatial), bandwidth=self.bandwidth_mhz(['20', '40', '80']),
+                                         guard_interval=self.guard_interval_ns(['400', '800']),
+                                         encryption=self.Encryption, qos=self.QoS,
+                                         amsdu=int(self.IP_Packets_MSDU_str),
+                                         ampdu=int(self.MAC_Frames_per_A_MPDU_str), basic_rates=self.BSS_Basic_Rate,
+                                         frame_size=int(self.MAC_MPDU_Size_Data_Traffic), codec='G.711',
+                                         plcp=self.Codec_Type, cwmin=int(self.CWmin), rts_cts=False,
+                                         cts_to_self="No" not in self.RTS_CTS and "Yes" in self.RTS_CTS)
+        self.set_theoretical_values(result)
 
-        IP_Packets_MSDU = int(self.IP_Packets_MSDU_str)
-        if "Mixed" in self.Codec_Type:
-            plcp = 1
-        elif "Greenfield" in self.Codec_Type:
-            plcp = 2
-
-        RTS_CTS_Handshake = 1
-        if "No" in self.RTS_CTS:
-            CTS_to_self = 1
-        elif "Yes" in self.RTS_CTS:
-            CTS_to_self = 2
-
-        # g24 QoS Hdr
-
-        if "Yes" in self.QoS:
-            QoS_1 = 1
-        elif "No" in self.QoS:
-            QoS_1 = 0
-        if (QoS_1 == 1) or (IP_Packets_MSDU > 1):
-            QoS_Hdr = 2
-
-        else:
-            QoS_Hdr = 0
-
-        # g23 Encrypt Hdr
-
-        if "None" in self.Encryption:
-            Encrypt_Hdr = 0
-
-        else:
-            if "WEP" in self.Encryption:
-                Encrypt_Hdr = 8
 
-            elif "TKIP" in self.Encryption:
-                Encrypt_Hdr = 20
+##Class to take all user input (802.11ax Standard)
 
-            else:
-                Encrypt_Hdr = 16
-
-        # c18 MAC MPDU Size
-
-        IP_Packets_MSDU_loc = IP_Packets_MSDU + 1
-
-        if "Data" in self.Traffic_Type:
-            MAC_MPDU_Size = int(self.MAC_MPDU_Size_Data_Traffic)
-
-        else:
-            if IP_Packets_MSDU == 0:
-                MAC_MPDU_Size = (Codec_IP_Packet_Size + 28 + QoS_Hdr + Encrypt_Hdr + 8)
-
-            else:
-                MAC_MPDU_Size_1 = (
-                        Codec_IP_Packet_Size + 28 + QoS_Hdr + Encrypt_Hdr + 8 + (IP_Packets_MSDU_loc - 1) * (
-                        14 + 3))
-                MAC_MPDU_Size = int(MAC_MPDU_Size_1 / (IP_Packets_MSDU_loc - 1))
-
-        # MSDU Size
-
-        if IP_Packets_MSDU == 0:
-            MSDU_final = MAC_MPDU_Size - 28 - QoS_Hdr - Encrypt_Hdr
-
-
-        else:
-            MSDU_1 = (MAC_MPDU_Size - 28 - QoS_Hdr - Encrypt_Hdr - IP_Packets_MSDU * (14 + 3))
-            MSDU_final = (int(MSDU_1 / IP_Packets_MSDU))
-        if MSDU_final < 0:
-            MSDU = MSDU_final - 1
-        else:
-            MSDU = MSDU_final
-
-        if (MSDU - 8) < 20:
-            IP_Packet_value = "N/A"
-            ip_value = 0
-        else:
-            IP_Packet_value = MSDU - 8
-            ip_value = 1
-
-        if ip_value == 0:
-            Ethernet_value = "N/A"
-            eth_value = 0
-        else:
-            ip_1 = int(IP_Packet_value)
-            Ethernet_value = max(ip_1 + 18, 64)
-            eth_value = 1
-
-        i = 1
-        while True:
-            if int(spatial_int) == i:
-                offset_str = HT_LTFs[i - 1]
-                break
-            i = i + 1
-        offset = int(offset_str)
-        Tppdu_fixed = 36 + offset * 4
-
-        # Tppdu_fixed (HT Control Frames)
-
-        offset_str_1 = HT_LTFs[0]
-        offset_1 = int(offset_str_1)
-
-        Tppdu_fixed_control = 36 + offset_1 * 4
-
-        # c23 VHT Data Rate
-        # Ndbps, data bits per symbol (Data)
-        # offset
-        j = 0
-        while True:
-            if Data_Voice_MCS_int == j:
-                if "20" in self.Channel_Bandwidth:
-                    Ndbps_str = Ndbps_20MHz[j]
-                    break
-                elif "40" in self.Channel_Bandwidth:
-                    Ndbps_str = Ndbps_40MHz[j]
-                    break
-                elif "80" in self.Channel_Bandwidth:
-                    Ndbps_str = Ndbps_80MHz[j]
-                    break
-            j = j + 1
-        Ndbps = int(Ndbps_str)
-
-        Ndbps_bits_per_symbol_Data = Ndbps * spatial_int
-
-        # c27 Tsymbol(Data), Data Symbol Period
-        if "400" in self.Guard_Interval_value:
-            Guard_Interval_1 = 1
-        elif "800" in self.Guard_Interval_value:
-            Guard_Interval_1 = 0
-
-        calculation = ((Data_Voice_MCS_int > 7 and plcp == 2) or plcp == 1)
-
-        if (Guard_Interval_1 == 1) and calculation:
-            Tsymbol_Data_Symbol_Period = 3.60
+class ax11_calculator(n11_calculator):
+    calculator_name = "11ax Calculator"
 
+    def __init__(self, Traffic_Type, Data_Voice_MCS, spatial, Channel_Bandwidth, Guard_Interval_value, Encryption,
+                 QoS, IP_Packets_MSDU_str, MAC_Frames_per_A_MPDU_str, BSS_Basic_Rate, MAC_MPDU_Size_Data_Traffic,
+                 Codec_Type, CWmin, RTS_CTS_Handshake, CTS_to_self):
+        super().__init__(Traffic_Type, Data_Voice_MCS, Channel_Bandwidth, Guard_Interval_value, None, Encryption, QoS,
+                         IP_Packets_MSDU_str, MAC_Frames_per_A_MPDU_str, BSS_Basic_Rate, MAC_MPDU_Size_Data_Traffic,
+                         Codec_Type, None, CWmin, RTS_CTS_Handshake, CTS_to_self)
+        self.spatial = spatial
 
-        else:
-            Tsymbol_Data_Symbol_Period = 4
-
-        VHT_Data_Rate = Ndbps_bits_per_symbol_Data / Tsymbol_Data_Symbol_Period
-
-        # Non-HT Reference Rate
-        k = 0
-        while True:
-            if Data_Voice_MCS_int == k:
-                Non_HT = Non_HT_Ref[k]
-                break
-            k = k + 1
-
-        Non_HT_value = int(Non_HT)
-
-        # PHY Bit Rate of Control Frames
-
-        PHY_Bit_Rate_of_Control_Frames = max(allowed_control6, allowed_control9,
-                                             allowed_control12, allowed_control18,
-                                             allowed_control24, allowed_control36,
-                                             allowed_control48, allowed_control54, 6)
-
-        # c27 Ndbps, data bits per symbol (Control)
-
-        if PHY_Bit_Rate_of_Control_Frames < 7:
-            if PHY_Bit_Rate_of_Control_Frames < 3:
-                PHY = PHY_Bit_Rate_of_Control_Frames
-            else:
-                if PHY_Bit_Rate_of_Control_Frames == 3:
-                    PHY = 5.5
-                else:
-                    if PHY_Bit_Rate_of_Control_Frames == 4:
-                        PHY = 11
-                    else:
-                        if PHY_Bit_Rate_of_Control_Frames == 5:
-                            PHY = 6
-                        else:
-                            if PHY_Bit_Rate_of_Control_Frames == 6:
-                                PHY = 9
-        else:
-            if PHY_Bit_Rate_of_Control_Frames == 8:
-                PHY = 18
-            else:
-                if PHY_Bit_Rate_of_Control_Frames == 9:
-                    PHY = 24
-                else:
-                    if PHY_Bit_Rate_of_Control_Frames == 10:
-                        PHY = 36
-                    else:
-                        if PHY_Bit_Rate_of_Control_Frames == 11:
-                            PHY = 48
-                        else:
-                            PHY = 54
-        Ndbps_bits_per_symbol_Control = PHY * 4
-
-        # Nbits, Bits per MAC PPDU
-        # A-MPDU Pad
-
-        if MAC_Frames_per_A_MPDU == 0:
-            MPDU_Pad = int(0)
-
-        else:
-            x = int((MAC_MPDU_Size % 4))
-            y = int((4 - x))
-            MPDU_Pad = int((y % 4))
-
-        MAC_Frames_per_A_MPDU_loc = MAC_Frames_per_A_MPDU + 1
-        if MAC_Frames_per_A_MPDU == 0:
-            Nbits_Bits_per_MAC_PPDU = MAC_MPDU_Size * 8
-
-        else:
-            Nbits_Bits_per_MAC_PPDU = ((MAC_MPDU_Size + 4) * (MAC_Frames_per_A_MPDU_loc - 1) + MPDU_Pad * (
-                    MAC_Frames_per_A_MPDU_loc - 2)) * 8
-
-        # Nes, Number of BCC encoders
-
-        l = 0
-        while True:
-            if Data_Voice_MCS_int == l:
-                if "20" in self.Channel_Bandwidth:
-                    Nes = 0 * 10 + Data_Voice_MCS_int
-                elif "40" in self.Channel_Bandwidth:
-                    Nes = 1 * 10 + Data_Voice_MCS_int
-                elif "80" in self.Channel_Bandwidth:
-                    Nes = 2 * 10 + Data_Voice_MCS_int
-
-                if spatial_int == 1:
-                    Nes_str = Nes1[Nes]
-                    break
-                elif spatial_int == 2:
-                    Nes_str = Nes2[Nes]
-                    break
-                elif spatial_int == 3:
-                    Nes_str = Nes3[Nes]
-                    break
-                elif spatial_int == 4:
-                    Nes_str = Nes4[Nes]
-                    break
-            l = l + 1
-
-        Nes_int = int(Nes_str)
-
-        # Ttxframe (DATA)
-
-        Ttxframe = Tppdu_fixed + int((16 + 6 * Nes_int + Nbits_Bits_per_MAC_PPDU + Ndbps_bits_per_symbol_Data - 1)
-                                     / Ndbps_bits_per_symbol_Data) * Tsymbol_Data_Symbol_Period
-
-        Ttxframe_Ack = int(
-            (22 + 14 * 8 + PHY_Bit_Rate_of_Control_Frames * 4 - 1) / (PHY_Bit_Rate_of_Control_Frames * 4)) * 4 + 20
-
-        # c34 Ttxframe (Compressed BlockAck)
-
-        Ttxframe_Compressed_BlockAck = int((22 + 32 * 8 + PHY_Bit_Rate_of_Control_Frames * 4 - 1)
-                                           / (PHY_Bit_Rate_of_Control_Frames * 4)) * 4 + 20
-
-        # c35 RTS/CTS Handshake Overhead
-
-        if RTS_CTS_Handshake == 2:
-            if "20" in self.Channel_Bandwidth:
-                RTS_CTS_Handshake_Overhead = 2 * 20 + 4 * int(
-                    (22 + (20 + 14) * 8 + 24 * 4 - 1) / (24 * 4)) + 2 * SIFS
-            else:
-                RTS_CTS_Handshake_Overhead = 2 * 20 + int(
-                    (22 + (20 + 14) * 8 + 24 - 1) / 24) * Tsymbol_control_Symbol_Period + 2 * SIFS
-        else:
-            RTS_CTS_Handshake_Overhead = 0
-
-        # c36 CTS-to-self Handshake Overhead
-
-        if RTS_CTS_Handshake == 2:
-            CTS_to_self_Handshake_Overhead = 0
-        else:
-            if CTS_to_self == 2:
-                if "20" in self.Channel_Bandwidth:
-                    CTS_to_self_Handshake_Overhead = 20 + 4 * int((22 + 14 * 8 + 24 * 4 - 1) / (24 * 4)) + SIFS
-                else:
-                    CTS_to_self_Handshake_Overhead = 20 + int(
-                        (22 + 14 * 8 + 24 - 1) / 24) * Tsymbol_control_Symbol_Period + SIFS
-            else:
-                CTS_to_self_Handshake_Overhead = 0
-
-        # c37 Ack Response Overhead
-        # g20 Use BlockAck
-
-        if MAC_Frames_per_A_MPDU == 0:
-            Use_BlockAck = False
-        else:
-            Use_BlockAck = True
-
-        if Use_BlockAck:
-            Ack_Response_Overhead = 0
-        else:
-            Ack_Response_Overhead = SIFS + Ttxframe_Ack
-
-        # c38BlockAck Response Overhead
-
-        if Use_BlockAck:
-            BlockAck_Response_Overhead = SIFS + Ttxframe_Compressed_BlockAck
-        else:
-            BlockAck_Response_Overhead = 0
-
-        # c42 MAC PPDU Interval
-
-        MAC_PPDU_Interval_1 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 1)
-        self.Client_1_new = format(MAC_PPDU_Interval_1, '.2f')
-        MAC_PPDU_Interval_2 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 2)
-        Client_2_new = format(MAC_PPDU_Interval_2, '.2f')
-
-        MAC_PPDU_Interval_3 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 5)
-        Client_3_new = format(MAC_PPDU_Interval_3, '.2f')
-
-        MAC_PPDU_Interval_4 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 10)
-        Client_4_new = format(MAC_PPDU_Interval_4, '.2f')
-        MAC_PPDU_Interval_5 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 20)
-        Client_5_new = format(MAC_PPDU_Interval_5, '.2f')
-        MAC_PPDU_Interval_6 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 50)
-        Client_6_new = format(MAC_PPDU_Interval_6, '.2f')
-        MAC_PPDU_Interval_7 = RTS_CTS_Handshake_Overhead + CTS_to_self_Handshake_Overhead + Ttxframe + Ack_Response_Overhead + BlockAck_Response_Overhead + DIFS + (
-                MeanBackoff / 100)
-        Client_7_new = format(MAC_PPDU_Interval_7, '.3f')
-
-        # Max PPDU Rate
-
-        Max_PPDU_Rate_1 = 1000000 / MAC_PPDU_Interval_1
-        self.Client_8_new = format(Max_PPDU_Rate_1, '.2f')
-        Max_PPDU_Rate_2 = 1000000 / MAC_PPDU_Interval_2
-        Client_9_new = format(Max_PPDU_Rate_2, '.2f')
-        Max_PPDU_Rate_3 = 1000000 / MAC_PPDU_Interval_3
-        Client_10_new = format(Max_PPDU_Rate_3, '.2f')
-        Max_PPDU_Rate_4 = 1000000 / MAC_PPDU_Interval_4
-        Client_11_new = format(Max_PPDU_Rate_4, '.2f')
-        Max_PPDU_Rate_5 = 1000000 / MAC_PPDU_Interval_5
-        Client_12_new = format(Max_PPDU_Rate_5, '.2f')
-        Max_PPDU_Rate_6 = 1000000 / MAC_PPDU_Interval_6
-        Client_13_new = format(Max_PPDU_Rate_6, '.2f')
-        Max_PPDU_Rate_7 = 1000000 / MAC_PPDU_Interval_7
-        Client_14_new = format(Max_PPDU_Rate_7, '.2f')
-
-        # c44 Max_MAC_MPDU_Rate_1
-
-        if MAC_Frames_per_A_MPDU > 0:
-            Max_MAC_MPDU_Rate_1 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_1
-            Max_MAC_MPDU_Rate_2 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_2
-            Max_MAC_MPDU_Rate_3 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_3
-            Max_MAC_MPDU_Rate_4 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_4
-            Max_MAC_MPDU_Rate_5 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_5
-            Max_MAC_MPDU_Rate_6 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_6
-            Max_MAC_MPDU_Rate_7 = MAC_Frames_per_A_MPDU * Max_PPDU_Rate_7
-        else:
-            Max_MAC_MPDU_Rate_1 = Max_PPDU_Rate_1
-            Max_MAC_MPDU_Rate_2 = Max_PPDU_Rate_2
-            Max_MAC_MPDU_Rate_3 = Max_PPDU_Rate_3
-            Max_MAC_MPDU_Rate_4 = Max_PPDU_Rate_4
-            Max_MAC_MPDU_Rate_5 = Max_PPDU_Rate_5
-            Max_MAC_MPDU_Rate_6 = Max_PPDU_Rate_6
-            Max_MAC_MPDU_Rate_7 = Max_PPDU_Rate_7
-
-        self.Client_15_new = round(Max_MAC_MPDU_Rate_1)
-        Client_16_new = round(Max_MAC_MPDU_Rate_2)
-        Client_17_new = round(Max_MAC_MPDU_Rate_3)
-        Client_18_new = round(Max_MAC_MPDU_Rate_4)
-        Client_19_new = round(Max_MAC_MPDU_Rate_5)
-        Client_20_new = round(Max_MAC_MPDU_Rate_6)
-        Client_21_new = round(Max_MAC_MPDU_Rate_7)
-
-        # Max MAC MSDU Rate
-
-        if IP_Packets_MSDU > 0:
-            Max_MAC_MSDU_Rate_1 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_1
-            Max_MAC_MSDU_Rate_2 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_2
-            Max_MAC_MSDU_Rate_3 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_3
-            Max_MAC_MSDU_Rate_4 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_4
-            Max_MAC_MSDU_Rate_5 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_5
-            Max_MAC_MSDU_Rate_6 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_6
-            Max_MAC_MSDU_Rate_7 = IP_Packets_MSDU * Max_MAC_MPDU_Rate_7
-
-        else:
-            Max_MAC_MSDU_Rate_1 = Max_MAC_MPDU_Rate_1
-            Max_MAC_MSDU_Rate_2 = Max_MAC_MPDU_Rate_2
-            Max_MAC_MSDU_Rate_3 = Max_MAC_MPDU_Rate_3
-            Max_MAC_MSDU_Rate_4 = Max_MAC_MPDU_Rate_4
-            Max_MAC_MSDU_Rate_5 = Max_MAC_MPDU_Rate_5
-            Max_MAC_MSDU_Rate_6 = Max_MAC_MPDU_Rate_6
-            Max_MAC_MSDU_Rate_7 = Max_MAC_MPDU_Rate_7
-
-        self.Client_22_new = round(Max_MAC_MSDU_Rate_1)
-        Client_23_new = round(Max_MAC_MSDU_Rate_2)
-        Client_24_new = round(Max_MAC_MSDU_Rate_3)
-        Client_25_new = round(Max_MAC_MSDU_Rate_4)
-        Client_26_new = round(Max_MAC_MSDU_Rate_5)
-        Client_27_new = round(Max_MAC_MSDU_Rate_6)
-        Client_28_new = round(Max_MAC_MSDU_Rate_7)
-
-        # Max. 802.11 MAC Frame Data Rate
-
-        Max_802_11_MAC_Frame_Data_Rate_1 = Max_MAC_MPDU_Rate_1 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_2 = Max_MAC_MPDU_Rate_2 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_3 = Max_MAC_MPDU_Rate_3 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_4 = Max_MAC_MPDU_Rate_4 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_5 = Max_MAC_MPDU_Rate_5 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_6 = Max_MAC_MPDU_Rate_6 * MAC_MPDU_Size * 8 / 1000000
-        Max_802_11_MAC_Frame_Data_Rate_7 = Max_MAC_MPDU_Rate_7 * MAC_MPDU_Size * 8 / 1000000
-
-        self.Client_29_new = format(Max_802_11_MAC_Frame_Data_Rate_1, '.3f')
-        Client_30_new = format(Max_802_11_MAC_Frame_Data_Rate_2, '.3f')
-        Client_31_new = format(Max_802_11_MAC_Frame_Data_Rate_3, '.3f')
-        Client_32_new = format(Max_802_11_MAC_Frame_Data_Rate_4, '.3f')
-        Client_33_new = format(Max_802_11_MAC_Frame_Data_Rate_5, '.3f')
-        Client_34_new = format(Max_802_11_MAC_Frame_Data_Rate_6, '.3f')
-        Client_35_new = format(Max_802_11_MAC_Frame_Data_Rate_7, '.3f')
-
-        # Max. 802.11 MAC Payload Goodput
-
-        Max_802_11_MAC_Payload_Goodput_1 = MSDU * 8 * Max_MAC_MSDU_Rate_1 / 1000000
-        Max_802_11_MAC_Payload_Goodput_2 = MSDU * 8 * Max_MAC_MSDU_Rate_2 / 1000000
-        Max_802_11_MAC_Payload_Goodput_3 = MSDU * 8 * Max_MAC_MSDU_Rate_3 / 1000000
-        Max_802_11_MAC_Payload_Goodput_4 = MSDU * 8 * Max_MAC_MSDU_Rate_4 / 1000000
-        Max_802_11_MAC_Payload_Goodput_5 = MSDU * 8 * Max_MAC_MSDU_Rate_5 / 1000000
-        Max_802_11_MAC_Payload_Goodput_6 = MSDU * 8 * Max_MAC_MSDU_Rate_6 / 1000000
-        Max_802_11_MAC_Payload_Goodput_7 = MSDU * 8 * Max_MAC_MSDU_Rate_7 / 1000000
-
-        self.Client_36_new = format(Max_802_11_MAC_Payload_Goodput_1, '.3f')
-        Client_37_new = format(Max_802_11_MAC_Payload_Goodput_2, '.3f')
-        Client_38_new = format(Max_802_11_MAC_Payload_Goodput_3, '.3f')
-        Client_39_new = format(Max_802_11_MAC_Payload_Goodput_4, '.3f')
-        Client_40_new = format(Max_802_11_MAC_Payload_Goodput_5, '.3f')
-        Client_41_new = format(Max_802_11_MAC_Payload_Goodput_6, '.3f')
-        Client_42_new = format(Max_802_11_MAC_Payload_Goodput_7, '.3f')
-
-        # MAC Goodput Per 802.11 Client
-
-        MAC_Goodput_Per_802_11_Client_1 = Max_802_11_MAC_Payload_Goodput_1 / 1
-        MAC_Goodput_Per_802_11_Client_2 = Max_802_11_MAC_Payload_Goodput_2 / 2
-        MAC_Goodput_Per_802_11_Client_3 = Max_802_11_MAC_Payload_Goodput_3 / 5
-        MAC_Goodput_Per_802_11_Client_4 = Max_802_11_MAC_Payload_Goodput_4 / 10
-        MAC_Goodput_Per_802_11_Client_5 = Max_802_11_MAC_Payload_Goodput_5 / 20
-        MAC_Goodput_Per_802_11_Client_6 = Max_802_11_MAC_Payload_Goodput_6 / 50
-        MAC_Goodput_Per_802_11_Client_7 = Max_802_11_MAC_Payload_Goodput_7 / 100
-
-        self.Client_43_new = format(MAC_Goodput_Per_802_11_Client_1, '.3f')
-        Client_44_new = format(MAC_Goodput_Per_802_11_Client_2, '.3f')
-        Client_45_new = format(MAC_Goodput_Per_802_11_Client_3, '.3f')
-        Client_46_new = format(MAC_Goodput_Per_802_11_Client_4, '.3f')
-        Client_47_new = format(MAC_Goodput_Per_802_11_Client_5, '.3f')
-        Client_48_new = format(MAC_Goodput_Per_802_11_Client_6, '.3f')
-        Client_49_new = format(MAC_Goodput_Per_802_11_Client_7, '.3f')
-
-        # Offered Load (802.3 Side)
-
-        if eth_value != 0:
-
-            Offered_Load_8023_Side_1 = Max_MAC_MSDU_Rate_1 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_2 = Max_MAC_MSDU_Rate_2 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_3 = Max_MAC_MSDU_Rate_3 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_4 = Max_MAC_MSDU_Rate_4 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_5 = Max_MAC_MSDU_Rate_5 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_6 = Max_MAC_MSDU_Rate_6 * Ethernet_value * 8 / 1000000
-            Offered_Load_8023_Side_7 = Max_MAC_MSDU_Rate_7 * Ethernet_value * 8 / 1000000
-            self.Client_50_new = format(Offered_Load_8023_Side_1, '.3f')
-            Client_51_new = format(Offered_Load_8023_Side_2, '.3f')
-            Client_52_new = format(Offered_Load_8023_Side_3, '.3f')
-            Client_53_new = format(Offered_Load_8023_Side_4, '.3f')
-            Client_54_new = format(Offered_Load_8023_Side_5, '.3f')
-            Client_55_new = format(Offered_Load_8023_Side_6, '.3f')
-            Client_56_new = format(Offered_Load_8023_Side_7, '.3f')
-
-        else:
-            self.Client_50_new = "N/A"
-            Client_51_new = "N/A"
-            Client_52_new = "N/A"
-            Client_53_new = "N/A"
-            Client_54_new = "N/A"
-            Client_55_new = "N/A"
-            Client_56_new = "N/A"
-
-        IP_Packet_value_str = str(IP_Packet_value)
-        if "N/A" not in IP_Packet_value_str:
-            IP_Goodput_802_11_8023_1 = Max_MAC_MSDU_Rate_1 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_2 = Max_MAC_MSDU_Rate_2 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_3 = Max_MAC_MSDU_Rate_3 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_4 = Max_MAC_MSDU_Rate_4 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_5 = Max_MAC_MSDU_Rate_5 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_6 = Max_MAC_MSDU_Rate_6 * ip_1 * 8 / 1000000
-            IP_Goodput_802_11_8023_7 = Max_MAC_MSDU_Rate_7 * ip_1 * 8 / 1000000
-            self.Client_57_new = format(IP_Goodput_802_11_8023_1, '.3f')
-            Client_58_new = format(IP_Goodput_802_11_8023_2, '.3f')
-            Client_59_new = format(IP_Goodput_802_11_8023_3, '.3f')
-            Client_60_new = format(IP_Goodput_802_11_8023_4, '.3f')
-            Client_61_new = format(IP_Goodput_802_11_8023_5, '.3f')
-            Client_62_new = format(IP_Goodput_802_11_8023_6, '.3f')
-            Client_63_new = format(IP_Goodput_802_11_8023_7, '.3f')
-
-        else:
-            self.Client_57_new = "N/A"
-            Client_58_new = "N/A"
-            Client_59_new = "N/A"
-            Client_60_new = "N/A"
-            Client_61_new = "N/A"
-            Client_62_new = "N/A"
-            Client_63_new = "N/A"
-
-            # Theoretical Voice Call Capacity
-
-        if "Data" in self.Traffic_Type:
-            self.Maximum_Theoretical_R_value = "N/A"
-            self.Estimated_MOS_Score = "N/A"
-        else:
-
-            self.Maximum_Theoretical_R_value = 85.9
-            if self.Maximum_Theoretical_R_value < 0:
-                self.Estimated_MOS_Score = 1
-            else:
-                if self.Maximum_Theoretical_R_value > 100:
-                    self.Estimated_MOS_Score = 4.5
-                else:
-                    Estimated_MOS_Score_1 = (
-                                1 + 0.035 * self.Maximum_Theoretical_R_value + self.Maximum_Theoretical_R_value * (
-                                self.Maximum_Theoretical_R_value - 60) * (
-                                            100 - self.Maximum_Theoretical_R_value) * 7 * 0.000001)
-                    self.Estimated_MOS_Score = format(Estimated_MOS_Score_1, '.2f')
-
-        # Voice_Call_Range
-
-        try:
-            Voice_Call_Range = round(Max_PPDU_Rate_1 / Codec_Frame_Rate)
-
-            # c55 Maximum Bidirectional Voice Calls
-
-            if Voice_Call_Range <= 1:
-                Maximum_Bidirectional = Max_MAC_MSDU_Rate_1 / Codec_Frame_Rate
-
-            else:
-                if Voice_Call_Range <= 2:
-                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_2 / Codec_Frame_Rate
-
-                else:
-                    if Voice_Call_Range <= 5:
-                        Maximum_Bidirectional = Max_MAC_MSDU_Rate_3 / Codec_Frame_Rate
-
-                    else:
-                        if Voice_Call_Range <= 10:
-                            Maximum_Bidirectional = Max_MAC_MSDU_Rate_4 / Codec_Frame_Rate
-
-                        else:
-                            if Voice_Call_Range <= 20:
-                                Maximum_Bidirectional = Max_MAC_MSDU_Rate_5 / Codec_Frame_Rate
-
-                            else:
-                                if Voice_Call_Range <= 50:
-                                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_6 / Codec_Frame_Rate
-
-                                else:
-
-                                    Maximum_Bidirectional = Max_MAC_MSDU_Rate_7 / Codec_Frame_Rate
-        except ZeroDivisionError:
-            pass
-
-        if "Data" in self.Traffic_Type:
-            self.Maximum_Bidirectional_Voice_Calls = "N/A"
-        else:
-            self.Maximum_Bidirectional_Voice_Calls = round(Maximum_Bidirectional, 2)
-
-    def get_result(self):
+    # The 11ax engine has no value for an MCS, stream count, bandwidth or guard interval outside 802.11ax,
+    # reject those with the allowed values instead of printing NaN
+
+    def check_values(self):
+        if int(self.Data_Voice_MCS) not in range(len(HE_NON_HT_REF)):
+            raise ValueError("invalid Data/Voice MCS Index for 11ax: %s (choose from 0-%d)"
+                             % (self.Data_Voice_MCS, len(HE_NON_HT_REF) - 1))
+        if int(self.spatial) not in range(1, len(HE_LTFS) + 1):
+            raise ValueError("invalid Spatial Streams for 11ax: %s (choose from 1-%d)" % (self.spatial, len(HE_LTFS)))
+        if np.isnan(self.bandwidth_mhz(['160', '20', '40', '80'])):
+            raise ValueError("invalid Channel Bandwidth for 11ax: %s (choose from '20', '40', '80', '160')"
+                             % self.Channel_Bandwidth)
+        if np.isnan(self.guard_interval_ns(['3200', '1600', '800'])):
+            raise ValueError("invalid Guard Interval for 11ax: %s (choose from '800', '1600', '3200')"
+                             % self.Guard_Interval_value)
 
-        print("\n" + "******************Station : 11ac Calculator*****************************" + "\n")
-        print("Theoretical Maximum Offered Load" + "\n")
-        print("1 Client:")
-        All_theoretical_output = {'MAC PPDU Interval(usec)': self.Client_1_new, 'Max PPDU Rate(fps)': self.Client_8_new,
-                                  'Max MAC MPDU Rate': self.Client_15_new,
-                                  'Max MAC MSDU Rate': self.Client_22_new,
-                                  'Max. 802.11 MAC Frame Data Rate(Mb/s)': self.Client_29_new,
-                                  'Max. 802.11 MAC Payload Goodput(Mb/s)': self.Client_36_new,
-                                  'MAC Goodput Per 802.11 Client(Mb/s)': self.Client_43_new,
-                                  'Offered Load (802.3 Side)(Mb/s)': self.Client_50_new,
-                                  'IP Goodput (802.11 -> 802.3)(Mb/s)': self.Client_57_new}
-        print(json.dumps(All_theoretical_output, indent=4))
+    # This function is for calculate intermediate values and Theoretical values
 
-        print("\n" + "Theroretical Voice Call Capacity" + "\n")
+    def calculate(self):
 
-        All_theoretical_voice = {'Maximum Theoretical R-value': self.Maximum_Theoretical_R_value,
-                                 'Estimated MOS Score': self.Estimated_MOS_Score,
-                                 'Maximum Bidirectional Voice Calls(calls)': self.Maximum_Bidirectional_Voice_Calls}
-        print(json.dumps(All_theoretical_voice, indent=4))
+        self.check_values()
+        result = self.theoretical_values(phy='11ax', traffic=self.Traffic_Type, mcs=int(self.Data_Voice_MCS),
+                                         nss=int(self.spatial),
+                                         bandwidth=self.bandwidth_mhz(['160', '20', '40', '80']),
+                                         guard_interval=self.guard_interval_ns(['3200', '1600', '800']),
+                                         encryption=self.Encryption, qos=self.QoS,
+                                         amsdu=int(self.IP_Packets_MSDU_str),
+                                         ampdu=int(self.MAC_Frames_per_A_MPDU_str), basic_rates=self.BSS_Basic_Rate,
+                                         frame_size=int(self.MAC_MPDU_Size_Data_Traffic), codec=self.Codec_Type,
+                                         cwmin=int(self.CWmin), rts_cts=self.RTS_CTS_Handshake,
+                                         cts_to_self=self.CTS_to_self)
+        self.set_theoretical_values(result)
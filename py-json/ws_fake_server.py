@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+NAME: ws_fake_server.py
+
+PURPOSE: Minimal websocket server that stands in for the LANforge GUI :8081 event feed, so
+    LFEventSubscriber in ws_generic_monitor.py and scripts using it can be exercised without a GUI.
+    Only unfragmented text frames are supported. Uses the standard library only.
+
+EXAMPLE:
+    python3 ws_fake_server.py --port 18081 --replay messages.jsonl --interval 0.5
+
+    server = FakeLFWebsocketServer()
+    server.start()
+    subscriber = LFEventSubscriber(url=server.url)
+    subscriber.start(wait_connected_sec=5)
+    server.send_event(details="Port sta0000 IP change from 0.0.0.0 to 10.0.0.5", resource=1)
+    server.drop_clients()  # subscriber reconnects
+    server.stop()
+
+LICENSE:
+    Free to distribute and modify. LANforge systems must be licensed.
+    Copyright 2023 Candela Technologies Inc
+"""
+import argparse
+import base64
+import hashlib
+import json
+import logging
+import socket
+import struct
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+class FakeLFWebsocketServer:
+    def __init__(self, host="127.0.0.1", port=0, on_connect_messages=None):
+        """
+        :param port: port to listen on, 0 picks a free port (see self.port after start())
+        :param on_connect_messages: messages (dict or str) sent to each client as it connects
+        """
+        self.host = host
+        self.port = port
+        self.on_connect_messages = on_connect_messages or []
+        self.listen_sock = None
+        self.clients = []
+        self.received = []  # text frames sent by clients
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.accept_thread = None
+
+    @property
+    def url(self):
+        return "ws://%s:%s" % (self.host, self.port)
+
+    def start(self):
+        self.listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.listen_sock.bind((self.host, self.port))
+        self.listen_sock.listen(8)
+        self.port = self.listen_sock.getsockname()[1]
+        self.stopped.clear()
+        self.accept_thread = threading.Thread(target=self._accept_loop, name="FakeLFWebsocketServer", daemon=True)
+        self.accept_thread.start()
+        return self
+
+    def stop(self):
+        self.stopped.set()
+        self.drop_clients()
+        if self.listen_sock is not None:
+            self.listen_sock.close()
+            self.listen_sock = None
+        if self.accept_thread is not None:
+            self.accept_thread.join(2)
+            self.accept_thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def client_count(self):
+        with self.lock:
+            return len(self.clients)
+
+    def wait_for_clients(self, count=1, timeout_sec=5.0):
+        deadline = time.time() + timeout_sec
+        while time.time() < deadline:
+            if self.client_count() >= count:
+                return True
+            time.sleep(0.02)
+        return False
+
+    def _accept_loop(self):
+        while not self.stopped.is_set():
+            try:
+                client_sock, _ = self.listen_sock.accept()
+            except OSError:
+                break
+            threading.Thread(target=self._serve_client, args=(client_sock,), daemon=True).start()
+
+    def _handshake(self, client_sock):
+        request = b""
+        while b"\r\n\r\n" not in request:
+            chunk = client_sock.recv(4096)
+            if not chunk:
+                return False
+            request += chunk
+        key = None
+        for line in request.decode("latin-1").split("\r\n"):
+            if line.lower().startswith("sec-websocket-key:"):
+                key = line.split(":", 1)[1].strip()
+        if not key:
+            return False
+        accept = base64.b64encode(hashlib.sha1((key + WS_GUID).encode("ascii")).digest()).decode("ascii")
+        client_sock.sendall(("HTTP/1.1 101 Switching Protocols\r\n"
+                             "Upgrade: websocket\r\n"
+                             "Connection: Upgrade\r\n"
+                             "Sec-WebSocket-Accept: %s\r\n\r\n" % accept).encode("latin-1"))
+        return True
+
+    def _serve_client(self, client_sock):
+        if not self._handshake(client_sock):
+            client_sock.close()
+            return
+        with self.lock:
+            self.clients.append(client_sock)
+        for message in self.on_connect_messages:
+            self._send_frame(client_sock, message)
+        try:
+            while not self.stopped.is_set():
+                frame = self._read_frame(client_sock)
+                if frame is None:
+                    break
+                opcode, payload = frame
+                if opcode == 0x8:  # close
+                    break
+                if opcode == 0x9:  # ping
+                    self._send_frame(client_sock, payload, opcode=0xA)
+                elif opcode == 0x1:
+                    with self.lock:
+                        self.received.append(payload.decode("utf-8", "replace"))
+        except OSError:
+            pass
+        self._drop(client_sock)
+
+    @staticmethod
+    def _recv_exact(client_sock, count):
+        data = b""
+        while len(data) < count:
+            chunk = client_sock.recv(count - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _read_frame(self, client_sock):
+        header = self._recv_exact(client_sock, 2)
+        if header is None:
+            return None
+        opcode = header[0] & 0x0F
+        length = header[1] & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self._recv_exact(client_sock, 2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self._recv_exact(client_sock, 8))[0]
+        mask = self._recv_exact(client_sock, 4) if header[1] & 0x80 else None
+        payload = self._recv_exact(client_sock, length) if length else b""
+        if payload is None:
+            return None
+        if mask:
+            payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return opcode, payload
+
+    def _send_frame(self, client_sock, message, opcode=0x1):
+        if isinstance(message, dict):
+            message = json.dumps(message)
+        payload = message if isinstance(message, bytes) else message.encode("utf-8")
+        if len(payload) < 126:
+            header = struct.pack("!BB", 0x80 | opcode, len(payload))
+        elif len(payload) < 65536:
+            header = struct.pack("!BBH", 0x80 | opcode, 126, len(payload))
+        else:
+            header = struct.pack("!BBQ", 0x80 | opcode, 127, len(payload))
+        try:
+            client_sock.sendall(header + payload)
+        except OSError:
+            self._drop(client_sock)
+
+    def _drop(self, client_sock):
+        with self.lock:
+            if client_sock in self.clients:
+                self.clients.remove(client_sock)
+        try:
+            client_sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        client_sock.close()
+
+    def send(self, message=None):
+        """
+        Send a message (dict or str) to every connected client.
+        """
+        with self.lock:
+            clients = list(self.clients)
+        for client_sock in clients:
+            self._send_frame(client_sock, message)
+
+    def send_event(self, details=None, resource=1, name=None, event_type="Custom", is_alert=False):
+        message = {"event_type": event_type, "details": details, "resource": resource, "is_alert": is_alert,
+                   "priority": "Info", "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                   "timestamp": int(time.time() * 1000)}
+        if name:
+            message["name"] = name
+        self.send(message)
+
+    def send_wifi_event(self, resource="1.1", port=None, text=None):
+        self.send({"wifi-event": "%s: %s (phy #0): %s" % (resource, port, text)})
+
+    def drop_clients(self):
+        """
+        Close every client connection, as the GUI does when it restarts.
+        """
+        with self.lock:
+            clients = list(self.clients)
+        for client_sock in clients:
+            self._drop(client_sock)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve canned LANforge websocket messages on a local port")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=18081, help="port to listen on")
+    parser.add_argument("--replay", help="file of JSON messages, one per line, sent to clients in a loop")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between replayed messages")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    messages = []
+    if args.replay:
+        with open(args.replay) as replay_file:
+            messages = [line.strip() for line in replay_file if line.strip()]
+    server = FakeLFWebsocketServer(host=args.host, port=args.port).start()
+    logger.info("serving on %s" % server.url)
+    try:
+        while True:
+            if not messages:
+                time.sleep(args.interval)
+                continue
+            for message in messages:
+                server.send(message)
+                time.sleep(args.interval)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
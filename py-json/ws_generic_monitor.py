@@ -11,7 +11,31 @@ WS_Listener has three arguments in general : lfclient_host, _scriptname, _callba
 3.  Enter the Callback function that you wanna see your messages in everytime your event will trigger up.
     refer py-scripts/ws_generic_monitor_test.py to see an example
 
+LFEventSubscriber is a reconnecting client for the same :8081 feed. It decodes each message
+into an LFWsRecord (event, alert or wifi message), hands it to registered callbacks and
+asyncio queues, and wakes threads blocked in wait_for_association(), wait_for_ip() or
+wait_for_roam() instead of having them poll /events or /port:
+
+    subscriber = LFEventSubscriber(lfclient_host="192.168.1.101")
+    subscriber.add_callback(print, kinds=("alert",))
+    subscriber.start()
+    since_ms = subscriber.now_ms()
+    ... admin-up stations ...
+    if not subscriber.wait_for_ip(port_list=["1.1.sta0000", "1.1.sta0001"], since_ms=since_ms, timeout_sec=60):
+        print("not all stations got an IP")
+    subscriber.stop()
+
+py-json/ws_fake_server.py serves canned messages on a local port for trying this without a GUI.
 """
+import asyncio
+import json
+import logging
+import re
+import threading
+import time
+from collections import deque
+
+logger = logging.getLogger(__name__)
 
 
 class WS_Listener:
@@ -21,3 +45,381 @@ class WS_Listener:
         websocket.enableTrace(True)
         self.ws = websocket.WebSocketApp("ws://" + lfclient_host + ":8081", on_message=_callback)
         self.ws.run_forever()
+
+
+class LFWsRecord:
+    """
+    One decoded websocket message.
+    kind is "event", "alert", "wifi" or "other". eid is "shelf.resource.port" when the port could
+    be worked out from the message. state is set for wifi messages ("authenticating", "authenticated",
+    "associating", "associated", "connected", "disconnected") and for IP changes ("ip", "ip-lost").
+    """
+    def __init__(self,
+                 kind=None,
+                 text=None,
+                 resource=None,
+                 port=None,
+                 state=None,
+                 bssid=None,
+                 ip=None,
+                 event_type=None,
+                 received_ms=None,
+                 message=None):
+        self.kind = kind
+        self.text = text
+        self.resource = resource
+        self.port = port
+        self.state = state
+        self.bssid = bssid
+        self.ip = ip
+        self.event_type = event_type
+        self.received_ms = received_ms
+        self.message = message
+
+    @property
+    def eid(self):
+        if not self.port:
+            return None
+        if self.resource:
+            return "%s.%s" % (self.resource, self.port)
+        return self.port
+
+    def __repr__(self):
+        return "LFWsRecord(%s %s %s: %s)" % (self.kind, self.eid, self.state, self.text)
+
+
+# regular expressions used to work out port names and wifi states, from ws-sta-monitor.py
+WS_REGEX = {
+    "phy": re.compile(r'^(\d+\.\d+):\s+(\S+)\s+\(phy', re.I),
+    "ifname": re.compile(r'^(\d+\.\d+):\s+IFNAME=(\S+)\s+', re.I),
+    "port": re.compile(r'Port (\S+)', re.I),
+    "ip_change": re.compile(r' IP change from (\S+) to (\S+)', re.I),
+    "connected": re.compile(r'CTRL-EVENT-CONNECTED - Connection to ([a-f0-9:]+) complete', re.I),
+    "associated": re.compile(r'Associated with ([a-f0-9:]+)', re.I),
+    "authenticated": re.compile(r'Authenticated with ([a-f0-9:]+)', re.I),
+    "associating": re.compile(r'Trying to associate with ([a-f0-9:]+)', re.I),
+    "authenticating": re.compile(r'Trying to authenticate with ([a-f0-9:]+)', re.I),
+    "disconnected": re.compile(r'CTRL-EVENT-DISCONNECTED bssid=([a-f0-9:]+)', re.I),
+}
+WIFI_STATES = ("connected", "associated", "authenticated", "associating", "authenticating", "disconnected")
+
+
+def decode_ws_message(text=None, received_ms=None):
+    """
+    :param text: one message from the :8081 websocket
+    :param received_ms: time the message arrived, defaults to now
+    :return: LFWsRecord, or None for keep-alive and undecodable messages
+    """
+    if received_ms is None:
+        received_ms = int(time.time() * 1000)
+    try:
+        message = json.loads(text)
+    except (TypeError, ValueError):
+        logger.debug("undecodable websocket message: %s" % text)
+        return None
+    if not isinstance(message, dict):
+        return None
+    # keep-alive messages carry only time and timestamp
+    if ("time" in message) and ("timestamp" in message) and (len(message) <= 3):
+        return None
+
+    record = LFWsRecord(received_ms=received_ms, message=message)
+    if "resource" in message:
+        resource = str(message["resource"])
+        record.resource = resource if "." in resource else "1.%s" % resource
+    if "name" in message:
+        record.port = message["name"]
+
+    if "wifi-event" in message:
+        record.kind = "wifi"
+        record.text = message["wifi-event"]
+        match_result = WS_REGEX["phy"].match(record.text) or WS_REGEX["ifname"].match(record.text)
+        if match_result is not None:
+            record.resource = match_result.group(1)
+            record.port = match_result.group(2).rstrip(":")
+        for state in WIFI_STATES:
+            match_result = WS_REGEX[state].search(record.text)
+            if match_result is not None:
+                record.state = state
+                record.bssid = match_result.group(1).lower()
+                break
+        return record
+
+    if "event_type" in message or "details" in message:
+        record.kind = "alert" if message.get("is_alert") else "event"
+        record.text = message.get("details")
+        record.event_type = message.get("event_type")
+        if record.text:
+            match_result = WS_REGEX["port"].match(record.text)
+            if match_result is not None:
+                record.port = match_result.group(1).rstrip(":")
+            match_result = WS_REGEX["ip_change"].search(record.text)
+            if match_result is not None:
+                record.ip = match_result.group(2).rstrip(".")
+                record.state = "ip-lost" if record.ip in ("0.0.0.0", "NA") else "ip"
+        return record
+
+    record.kind = "other"
+    return record
+
+
+def _port_matches(record=None, eid=None):
+    # eid may be "1.1.sta0000", "1.sta0000" or "sta0000"
+    if not record.port:
+        return False
+    hunks = eid.split(".")
+    if hunks[-1] != record.port:
+        return False
+    if len(hunks) < 2 or not record.resource:
+        return True
+    return record.resource.split(".")[-1] == hunks[-2]
+
+
+class _Waiter:
+    def __init__(self, port_list=None, predicate=None):
+        self.pending = set(port_list)
+        self.predicate = predicate
+        self.matched = {}
+        self.done = threading.Event()
+
+    def offer(self, record=None):
+        for eid in list(self.pending):
+            if _port_matches(record=record, eid=eid) and self.predicate(record):
+                self.pending.discard(eid)
+                self.matched[eid] = record
+        if not self.pending:
+            self.done.set()
+
+
+class LFEventSubscriber:
+    """
+    Reconnecting websocket client for the LANforge GUI event feed, see the module notes.
+    Records are dispatched on the websocket thread; callbacks should return quickly.
+    """
+    Default_Port = 8081
+    Default_History = 4096
+
+    def __init__(self,
+                 lfclient_host="localhost",
+                 port=Default_Port,
+                 url=None,
+                 history=Default_History,
+                 reconnect_sec=1.0,
+                 max_reconnect_sec=30.0,
+                 debug=False):
+        """
+        :param url: full websocket url, overrides lfclient_host and port
+        :param history: number of recent records kept for waiters given since_ms
+        :param reconnect_sec: first pause before reconnecting, doubled up to max_reconnect_sec
+        """
+        self.url = url if url else "ws://%s:%s" % (lfclient_host, port)
+        self.reconnect_sec = reconnect_sec
+        self.max_reconnect_sec = max_reconnect_sec
+        self.debug = debug
+        self.lock = threading.Lock()
+        self.history = deque(maxlen=history)
+        self.callbacks = []  # list of (callback, kinds)
+        self.queues = []  # list of (asyncio.Queue, loop, kinds)
+        self.waiters = []
+        self.connected = threading.Event()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.ws_app = None
+        self.connect_count = 0
+        self.message_count = 0
+
+    @staticmethod
+    def now_ms():
+        return int(time.time() * 1000)
+
+    # ----- ----- ----- ----- subscriptions ----- ----- ----- -----
+    def add_callback(self, callback=None, kinds=None):
+        """
+        :param callback: called with each LFWsRecord
+        :param kinds: tuple of record kinds to receive, all kinds when None
+        """
+        with self.lock:
+            self.callbacks.append((callback, kinds))
+
+    def remove_callback(self, callback=None):
+        with self.lock:
+            self.callbacks = [entry for entry in self.callbacks if entry[0] is not callback]
+
+    def get_queue(self, kinds=None, maxsize=0):
+        """
+        Call from a coroutine; returns an asyncio.Queue on the running loop that receives records.
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(maxsize=maxsize)
+        with self.lock:
+            self.queues.append((queue, loop, kinds))
+        return queue
+
+    def remove_queue(self, queue=None):
+        with self.lock:
+            self.queues = [entry for entry in self.queues if entry[0] is not queue]
+
+    # ----- ----- ----- ----- connection ----- ----- ----- -----
+    def start(self, wait_connected_sec=None):
+        """
+        Start the websocket thread.
+        :param wait_connected_sec: block until the first connection is open or this many seconds pass
+        :return: True when connected or not waiting
+        """
+        import websocket
+        self.stopped.clear()
+        if self.thread is None or not self.thread.is_alive():
+            self.thread = threading.Thread(target=self._run, args=(websocket,),
+                                           name="LFEventSubscriber", daemon=True)
+            self.thread.start()
+        if wait_connected_sec:
+            return self.connected.wait(wait_connected_sec)
+        return True
+
+    def stop(self, timeout_sec=5.0):
+        self.stopped.set()
+        if self.ws_app is not None:
+            self.ws_app.close()
+        if self.thread is not None:
+            self.thread.join(timeout_sec)
+        self.thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    def _run(self, websocket=None):
+        pause_sec = self.reconnect_sec
+        while not self.stopped.is_set():
+            self.ws_app = websocket.WebSocketApp(self.url,
+                                                 on_open=self._on_open,
+                                                 on_message=self._on_message,
+                                                 on_error=self._on_error,
+                                                 on_close=self._on_close)
+            try:
+                self.ws_app.run_forever()
+            except Exception as error:
+                logger.warning("LFEventSubscriber: %s: %s" % (self.url, error))
+            was_connected = self.connected.is_set()
+            self.connected.clear()
+            if self.stopped.is_set():
+                break
+            if was_connected:
+                pause_sec = self.reconnect_sec
+            logger.info("LFEventSubscriber: reconnecting to %s in %.1f sec" % (self.url, pause_sec))
+            self.stopped.wait(pause_sec)
+            pause_sec = min(pause_sec * 2, self.max_reconnect_sec)
+
+    def _on_open(self, ws_app):
+        self.connect_count += 1
+        self.connected.set()
+        if self.debug:
+            logger.debug("LFEventSubscriber: connected to %s" % self.url)
+        ws_app.send('{"text":"ping"}')
+
+    def _on_error(self, ws_app, error):
+        if not self.stopped.is_set():
+            logger.warning("LFEventSubscriber: %s: %s" % (self.url, error))
+
+    def _on_close(self, ws_app, *args):
+        if self.debug:
+            logger.debug("LFEventSubscriber: closed %s" % self.url)
+
+    def _on_message(self, ws_app, text):
+        self.message_count += 1
+        record = decode_ws_message(text)
+        if record is None:
+            return
+        self.dispatch(record)
+
+    # ----- ----- ----- ----- dispatch ----- ----- ----- -----
+    def dispatch(self, record=None):
+        """
+        Deliver a record to the history, waiters, callbacks and queues.
+        """
+        with self.lock:
+            self.history.append(record)
+            for waiter in self.waiters:
+                waiter.offer(record)
+            callbacks = list(self.callbacks)
+            queues = list(self.queues)
+        for (callback, kinds) in callbacks:
+            if kinds and record.kind not in kinds:
+                continue
+            try:
+                callback(record)
+            except Exception as error:
+                logger.error("LFEventSubscriber: callback %s failed: %s" % (callback, error))
+        for (queue, loop, kinds) in queues:
+            if kinds and record.kind not in kinds:
+                continue
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, record)
+            except RuntimeError:
+                # loop closed
+                self.remove_queue(queue)
+
+    # ----- ----- ----- ----- waiters ----- ----- ----- -----
+    def wait_for_ports(self, port_list=None, predicate=None, since_ms=None, timeout_sec=60):
+        """
+        Block until predicate(record) has been true for a record on every port in port_list.
+        :param port_list: list of port EIDs or names
+        :param since_ms: also consider records received at or after this time, see now_ms()
+        :return: True if every port matched before timeout_sec
+        """
+        if isinstance(port_list, str):
+            port_list = [port_list]
+        waiter = self._wait(port_list=port_list, predicate=predicate, since_ms=since_ms, timeout_sec=timeout_sec)
+        return not waiter.pending
+
+    def _wait(self, port_list=None, predicate=None, since_ms=None, timeout_sec=60):
+        waiter = _Waiter(port_list=port_list, predicate=predicate)
+        with self.lock:
+            if since_ms is not None:
+                for record in self.history:
+                    if record.received_ms >= since_ms:
+                        waiter.offer(record)
+            if not waiter.pending:
+                return waiter
+            self.waiters.append(waiter)
+        try:
+            waiter.done.wait(timeout_sec)
+        finally:
+            with self.lock:
+                self.waiters.remove(waiter)
+        if waiter.pending:
+            logger.info("LFEventSubscriber: timed out waiting on %s" % sorted(waiter.pending))
+        return waiter
+
+    def wait_for_association(self, port_list=None, since_ms=None, timeout_sec=60):
+        return self.wait_for_ports(port_list=port_list,
+                                   predicate=lambda record: record.state in ("associated", "connected"),
+                                   since_ms=since_ms,
+                                   timeout_sec=timeout_sec)
+
+    def wait_for_ip(self, port_list=None, since_ms=None, timeout_sec=60):
+        return self.wait_for_ports(port_list=port_list,
+                                   predicate=lambda record: record.state == "ip",
+                                   since_ms=since_ms,
+                                   timeout_sec=timeout_sec)
+
+    def wait_for_roam(self, port=None, from_bssid=None, to_bssid=None, since_ms=None, timeout_sec=60):
+        """
+        Wait until port connects to a BSSID other than from_bssid, or to to_bssid when given.
+        :return: the BSSID roamed to, or None on timeout
+        """
+        def roamed(record):
+            if record.state != "connected" or not record.bssid:
+                return False
+            if to_bssid:
+                return record.bssid == to_bssid.lower()
+            return (from_bssid is None) or (record.bssid != from_bssid.lower())
+
+        waiter = self._wait(port_list=[port], predicate=roamed, since_ms=since_ms, timeout_sec=timeout_sec)
+        if waiter.pending:
+            return None
+        return waiter.matched[port].bssid
@@ -63,6 +63,7 @@ import time
 import logging
 import pandas as pd
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 if sys.version_info[0] != 3:
     print("This script requires Python3")
@@ -77,6 +78,64 @@ from lanforge_client.lanforge_api import LFJsonCommand
 from lanforge_client.lanforge_api import LFJsonQuery
 
 
+# '1.1.RZ8N70TVABP' -> '1.1', the resource whose adb server carries the commands for that device
+def eid_resource(device):
+    return '.'.join(str(device).split('.')[:2])
+
+
+async def fan_out_async(func, items, resource_key=eid_resource, name_key=str, max_per_resource=16, timeout_sec=60):
+    """
+    Calls func(item) for every item in worker threads. At most max_per_resource calls run at once for items
+    on the same resource (resource_key(item)), and each call is given timeout_sec once it starts.
+    A call that times out is reported as 'timeout' and keeps its resource slot until its thread returns.
+    Returns {name_key(item): {'status': 'ok'|'error'|'timeout', 'result': ..., 'error': ..., 'elapsed': sec}}
+    in the order of items.
+    """
+    items = list(items)
+    status = {}
+    if not items:
+        return status
+    loop = asyncio.get_running_loop()
+    semaphores = {}
+    for item in items:
+        semaphores.setdefault(resource_key(item), asyncio.Semaphore(max_per_resource))
+    executor = ThreadPoolExecutor(max_workers=min(len(items), max_per_resource * len(semaphores)))
+
+    async def run_one(item):
+        semaphore = semaphores[resource_key(item)]
+        await semaphore.acquire()
+        entry = {'status': 'ok', 'result': None, 'error': None}
+        start = time.time()
+        future = loop.run_in_executor(executor, func, item)
+        try:
+            entry['result'] = await asyncio.wait_for(asyncio.shield(future), timeout_sec)
+            semaphore.release()
+        except asyncio.TimeoutError:
+            entry['status'] = 'timeout'
+            entry['error'] = 'no response after {} sec'.format(timeout_sec)
+            future.add_done_callback(lambda _: semaphore.release())
+        except Exception as e:
+            entry['status'] = 'error'
+            entry['error'] = str(e)
+            semaphore.release()
+        entry['elapsed'] = round(time.time() - start, 2)
+        status[name_key(item)] = entry
+
+    try:
+        await asyncio.gather(*[run_one(item) for item in items])
+    finally:
+        executor.shutdown(wait=False)
+    for name, entry in status.items():
+        if entry['status'] != 'ok':
+            logging.warning("{}: {} {}".format(name, entry['status'], entry['error']))
+    return {name_key(item): status[name_key(item)] for item in items}
+
+
+# blocking fan_out_async() for callers outside an event loop
+def fan_out(func, items, **kwargs):
+    return asyncio.run(fan_out_async(func, items, **kwargs))
+
+
 class BaseInteropWifi(Realm):
     def __init__(self, manager_ip=None,
                  port=8080,
@@ -87,6 +146,8 @@ class BaseInteropWifi(Realm):
                  screen_size_prcnt=0.4,
                  log_dur=0,
                  log_destination=None,
+                 max_adb_per_resource=16,
+                 adb_timeout_sec=60,
                  _debug_on=False,
                  _exit_on_error=False, ):
         super().__init__(lfclient_host=manager_ip,
@@ -106,6 +167,8 @@ class BaseInteropWifi(Realm):
         self.supported_devices_resource_id = None
         self.log_dur = log_dur
         self.log_destination = log_destination
+        self.max_adb_per_resource = max_adb_per_resource
+        self.adb_timeout_sec = adb_timeout_sec
         self.session = LFSession(lfclient_url=self.manager_ip,
                                  debug=_debug_on,
                                  connection_timeout_sec=2.0,
@@ -145,7 +208,7 @@ class BaseInteropWifi(Realm):
 
     def get_device_details(self, query="name", device="1.1.RZ8N70TVABP"):
         # query device related details like name, phantom, model name etc
-        value = None
+        # a list of devices is answered from one /adb query and returns {device: value}
         cmd = '''curl -H 'Accept: application/json' http://''' + str(self.manager_ip) + ''':8080/adb/'''
         args = shlex.split(cmd)
         process = subprocess.Popen(args, shell=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
@@ -153,6 +216,14 @@ class BaseInteropWifi(Realm):
         output = (stdout.decode("utf-8"))
         out = json.loads(output)
         final = out["devices"]
+        if isinstance(device, list):
+            return {i: self.get_device_value(final, query, i) for i in device}
+        return self.get_device_value(final, query, device)
+
+    # query value of device in the "devices" member of an /adb response
+    @staticmethod
+    def get_device_value(final, query, device):
+        value = None
         if type(final) == list:
             keys_lst = []
             for i in range(len(final)):
@@ -279,20 +350,31 @@ class BaseInteropWifi(Realm):
         # logging.info("Response " + str(response_list))
         return response_list
 
+    # run func(device) on all devices at once, rate limited per resource, returns the fan_out() status map
+    def fan_out_devices(self, func, devices):
+        return fan_out(func, devices, max_per_resource=self.max_adb_per_resource, timeout_sec=self.adb_timeout_sec)
+
+    # post an adb command to every device concurrently, cmd is one command for all or a {device: cmd} dict
+    def post_adb_devices(self, devices=None, cmd=None):
+        if isinstance(cmd, dict):
+            return self.fan_out_devices(lambda device: self.post_adb_(device=device, cmd=cmd[device]), devices)
+        return self.fan_out_devices(lambda device: self.post_adb_(device=device, cmd=cmd), devices)
+
     # enable Wi-Fi or disable Wi-Fi
     def enable_or_disable_wifi(self, wifi=None, device=None):
         if device is None:
             devices = self.check_sdk_release()
             logging.info(devices)
+        elif type(device) is list:
+            devices = device
         else:
             devices = [device]
         if not (wifi == "enable" or wifi == "disable"):
             logging.warning("wifi arg value must either be enable or disable")
             raise ValueError("wifi arg value must either be enable or disable")
         cmd = "shell svc wifi " + wifi
-        for i in devices:
-            logging.info(wifi + " wifi for " + i)
-            self.post_adb_(device=i, cmd=cmd)
+        logging.info(wifi + " wifi for " + str(devices))
+        return self.post_adb_devices(devices=devices, cmd=cmd)
 
     # set username
     def set_user_name(self, device=None, user_name=None):
@@ -321,16 +403,21 @@ class BaseInteropWifi(Realm):
         logging.info(f"Modified USER-NAME List: {user_name_}")
         logging.info(user_name_)
 
+        user_names = {}
         for i, x in zip(devices, range(len(devices))):
-            eid = self.name_to_eid(i)
+            user_names[i] = user_name_[x]
+
+        def add_adb(device):
+            eid = self.name_to_eid(device)
             self.command.post_add_adb(adb_device=None,
                                       adb_id=eid[2],
                                       adb_model=None,
                                       adb_product=None,
-                                      lf_username=user_name_[x],
+                                      lf_username=user_names[device],
                                       resource=eid[1],
                                       shelf=eid[0],
                                       debug=True)
+        return self.fan_out_devices(add_adb, devices)
 
     # apk apply
     def batch_modify_apply(self, device=None, manager_ip=None):
@@ -349,16 +436,15 @@ class BaseInteropWifi(Realm):
                 devices = [device]
                 self.set_user_name(device=device)
 
-        user_list = []
-        for i in devices:
-            name = self.get_device_details(query='user-name', device=i)
-            user_list.append(name)
+        user_names = self.get_device_details(query='user-name', device=devices)
+        user_list = [user_names[i] for i in devices]
 
+        cmds = {}
         for i, x in zip(user_list, devices):
             user_name = i
             if not user_name:
-                logging.warning("please specify a user-name when configuring this Interop device")
-                raise ValueError("please specify a user-name when configuring this Interop device")
+                logging.warning("please specify a user-name when configuring this Interop device: " + str(x))
+                raise ValueError("please specify a user-name when configuring this Interop device: " + str(x))
             cmd = "shell am start -n com.candela.wecan/com.candela.wecan.StartupActivity "
             cmd += "--es auto_start 1 --es username " + user_name
             if self.manager_ip:
@@ -370,46 +456,49 @@ class BaseInteropWifi(Realm):
             if self.encryp:
                 cmd += " --es encryption " + self.encryp
             # print("ADB BATCH MODIFY CMD :", cmd)
-            self.post_adb_(device=x, cmd=cmd)
+            cmds[x] = cmd
+        return self.post_adb_devices(devices=devices, cmd=cmds)
 
     # start
     def start(self, device=None):
         if device is None:
             devices = self.check_sdk_release()
             logging.info(devices)
+        elif type(device) is list:
+            devices = device
         else:
             devices = [device]
-        for i in devices:
-            cmd = "shell am start --es auto_start 1 -n com.candela.wecan/com.candela.wecan.StartupActivity"
-            self.post_adb_(device=i, cmd=cmd)
+        cmd = "shell am start --es auto_start 1 -n com.candela.wecan/com.candela.wecan.StartupActivity"
+        return self.post_adb_devices(devices=devices, cmd=cmd)
 
     # stop
     def stop(self, device=None):
         if device is None:
             devices = self.check_sdk_release()
             logging.info(devices)
+        elif type(device) is list:
+            devices = device
         else:
             devices = [device]
-        for i in devices:
-            cmd = "shell am force-stop com.candela.wecan"
-            self.post_adb_(device=i, cmd=cmd)
+        cmd = "shell am force-stop com.candela.wecan"
+        return self.post_adb_devices(devices=devices, cmd=cmd)
 
     # scan results
     def scan_results(self, device=None):
         if device is None:
             devices = self.check_sdk_release()
             logging.info(devices)
+        elif type(device) is list:
+            devices = device
         else:
             devices = [device]
+        # start scan on all devices, wait for the scans together and then read the results
+        self.post_adb_devices(devices=devices, cmd="shell cmd -w wifi start-scan")
+        time.sleep(10)
+        scan_status = self.post_adb_devices(devices=devices, cmd="shell cmd -w wifi list-scan-results")
         scan_dict = dict.fromkeys(devices)
         for i in devices:
-            # start scan
-            cmd = "shell cmd -w wifi start-scan"
-            self.post_adb_(device=i, cmd=cmd)
-            time.sleep(10)
-            cmd = "shell cmd -w wifi list-scan-results"
-            result = self.post_adb_(device=i, cmd=cmd)
-            scan_dict[i] = result
+            scan_dict[i] = scan_status[i]['result']
         return scan_dict
 
     def clean_phantom_resources(self):
@@ -507,7 +596,10 @@ class UtilityInteropWifi(BaseInteropWifi):
         super().__init__(manager_ip=host_ip)
         self.host = host_ip
 
+    # a list of devices is queried concurrently and returns {device: state}
     def get_device_state(self, device=None):
+        if isinstance(device, list):
+            return self.get_devices_value(self.get_device_state, device)
         cmd = 'shell dumpsys wifi | grep "mWifiInfo SSID"'
         # print("Get device Status CMD :", cmd)
         x = self.post_adb_(device=device, cmd=cmd)
@@ -529,7 +621,10 @@ class UtilityInteropWifi(BaseInteropWifi):
             state = "NA"
         return state
 
+    # a list of devices is queried concurrently and returns {device: ssid}
     def get_device_ssid(self, device=None):
+        if isinstance(device, list):
+            return self.get_devices_value(self.get_device_ssid, device)
         cmd = 'shell dumpsys wifi | grep "mWifiInfo SSID"'
         x = self.post_adb_(device=device, cmd=cmd)
         y = x[0]['LAST']['callback_message']
@@ -551,7 +646,16 @@ class UtilityInteropWifi(BaseInteropWifi):
             ssid = "NA"
         return ssid
 
+    # {device: getter(device)} over devices queried concurrently, default for devices that failed or timed out
+    def get_devices_value(self, getter, devices, default="NA"):
+        status = self.fan_out_devices(getter, devices)
+        return {device: status[device]['result'] if status[device]['status'] == 'ok' else default for device in devices}
+
+    # a list of devices is queried concurrently and returns {device: health}, None for devices that failed
     def get_wifi_health_monitor(self, device=None, ssid=None):
+        if isinstance(device, list):
+            return self.get_devices_value(lambda i: self.get_wifi_health_monitor(device=i, ssid=ssid), device,
+                                          default=None)
         cmd = "shell dumpsys wifi | sed -n '/^WifiHealthMonitor - Log Begin ----$/,/^WifiHealthMonitor - Log End ----$/{/^WifiHealthMonitor - Log End ----$/!p;}'"
         # print("Wifi Health monitor CMD:", cmd)
         x = self.post_adb_(device=device, cmd=cmd)
@@ -593,8 +697,10 @@ class UtilityInteropWifi(BaseInteropWifi):
             logging.info("ssid is not present")
         return return_dict
 
-    # forget network based on the network id
+    # forget network based on the network id, a list of devices is handled concurrently
     def forget_netwrk(self, device=None, network_id=None):
+        if isinstance(device, list):
+            return self.fan_out_devices(lambda i: self.forget_netwrk(device=i, network_id=network_id), device)
         separating_device_name = device.split(".")
         if network_id is None:
             network_id = ['0']
@@ -712,10 +818,15 @@ class RealDevice(Realm):
                  _debug_on=False,
                  _exit_on_error=False,
                  all_android=None,
-                 all_laptops=None):
+                 all_laptops=None,
+                 max_queries_per_resource=16,
+                 query_timeout_sec=60):
         super().__init__(lfclient_host=manager_ip,
                          debug_=_debug_on)
         self.manager_ip = manager_ip
+        self.max_queries_per_resource = max_queries_per_resource
+        self.query_timeout_sec = query_timeout_sec
+        self.configure_status = {}
         self.manager_port = port
         self.server_ip = server_ip
         self.enable_wifi = enable_wifi
@@ -1038,6 +1149,55 @@ class RealDevice(Realm):
     # Step 4: the devices get configured and then the script waits for 2 minutes for the configuration to apply
     # Step 5: then it checks both android and laptops for the expected configuration. If the configuration is not as expected, then the respective device is eliminated from the test
     # Step 6: The script then proceeds for the test
+    # '1.2.wlan0' style port name of a laptop
+    def laptop_port_name(self, laptop):
+        return '{}.{}.{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name'])
+
+    # resource id, port data merged with resource data, and user name of an android
+    def get_android_data(self, android):
+        # get resource id for the android device from interop tab
+        resource_id = self.json_get('/adb/1/1/{}'.format(android[2]))['devices']['resource-id']
+        if(resource_id == ''):
+            return resource_id, None, None
+        shelf, resource = resource_id.split('.')[0], resource_id.split('.')[1]
+
+        # fetching resource data for android device
+        current_android_resource_data = self.json_get('/resource/{}/{}/'.format(shelf, resource))['resource']
+        if(current_android_resource_data['phantom']):
+            return resource_id, current_android_resource_data, None
+
+        # fetching port data for the android device
+        current_android_port_data = self.json_get('/port/{}/{}/wlan0'.format(shelf, resource))['interface']
+        current_android_port_data.update(current_android_resource_data)
+        username = self.json_get('resource/{}/{}?fields=user'.format(shelf, resource))['resource']['user']
+        return resource_id, current_android_port_data, username
+
+    # port data and resource data of a laptop, None when the port is not found
+    def get_laptop_data(self, laptop):
+        current_laptop_port_data = self.json_get(
+            '/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name']))
+        if(current_laptop_port_data is None):
+            return None
+        current_laptop_resource_data = self.json_get('resource/{}/{}'.format(laptop['shelf'], laptop['resource']))[
+            'resource']
+        return current_laptop_port_data['interface'], current_laptop_resource_data
+
+    # laptops whose station port is still down, queried concurrently
+    async def get_down_laptops(self, laptops):
+        port_status = await fan_out_async(
+            lambda laptop: self.json_get('/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name'])),
+            laptops,
+            resource_key=lambda laptop: '{}.{}'.format(laptop['shelf'], laptop['resource']),
+            name_key=self.laptop_port_name,
+            max_per_resource=self.max_queries_per_resource,
+            timeout_sec=self.query_timeout_sec)
+        down_laptops = []
+        for laptop in laptops:
+            current_laptop_port_data = port_status[self.laptop_port_name(laptop)]['result']
+            if current_laptop_port_data is None or current_laptop_port_data['interface']['down'] == True:
+                down_laptops.append(laptop)
+        return down_laptops
+
     async def configure_wifi(self, select_serials=None):
         self.station_list = []
         selected_androids = []
@@ -1139,76 +1299,71 @@ class RealDevice(Realm):
                         selected_laptops.append(laptop)
                         break
 
-        if(selected_androids != []):
+        # androids and laptops are configured at the same time
+        async def configure_androids():
             await self.androids_obj.stop_app(port_list=selected_androids)
             await self.androids_obj.forget_all_networks(port_list=selected_androids)
             await self.androids_obj.configure_wifi(port_list=selected_androids)
-            
-            if(selected_laptops == []):  
-                print("WAITING FOR 120 seconds")
-                time.sleep(120)
-        if(selected_laptops != []):
+            print("WAITING FOR 120 seconds")
+            await asyncio.sleep(120)
+
+        async def configure_laptops():
             # if laptop['eap_method']!="" or laptop['eap_method']!= None or laptop['eap_method']!="NA":
             await self.laptops_obj.rm_station(port_list=selected_laptops)
-            time.sleep(10)
+            await asyncio.sleep(10)
             #trial for making port up before configuration
             await self.laptops_obj.set_port_1(port_list=selected_laptops)
-            time.sleep(10)
+            await asyncio.sleep(10)
             await self.laptops_obj.add_station(port_list=selected_laptops)
-            time.sleep(30)
+            await asyncio.sleep(30)
             #check for enterprise for enterprise configuration
             if i==True:
                 await self.laptops_obj.set_wifi_extra(port_list=selected_laptops)
-                time.sleep(10)
+                await asyncio.sleep(10)
             await self.laptops_obj.set_port(port_list=selected_laptops)
             # await self.laptops_obj.set_port(port_list=selected_laptops)
             # time.sleep(60)
             # logging.info('Applying the new Wi-Fi configuration. Waiting for 2 minutes for the new configuration to apply.')
             print("WAITING TOTAL 120 SECONDS FOR CONFIGURATION TO APPLY")
-            time.sleep(70)
-            exclude_laptops_con=[]
-            for laptop in selected_laptops:
-                current_laptop_port_data = self.json_get('/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name']))
-                current_laptop_port_data = current_laptop_port_data['interface']
-                if (current_laptop_port_data['down'] == True):
-                    exclude_laptops_con.append(laptop)
-                    continue
+            await asyncio.sleep(70)
+            exclude_laptops_con = await self.get_down_laptops(selected_laptops)
             if exclude_laptops_con!=[]:
                 print(exclude_laptops_con)
                 print("WAITING FOR EXTRA 30 SECONDS")
-                time.sleep(30)
-
-            exclude_laptops_1=[]
-            for laptop in selected_laptops:
-                current_laptop_port_data = self.json_get('/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name']))
-                current_laptop_port_data = current_laptop_port_data['interface']
-                if (current_laptop_port_data['down'] == True):
-                    exclude_laptops_1.append(laptop)
-                    continue
+                await asyncio.sleep(30)
+
+            exclude_laptops_1 = await self.get_down_laptops(selected_laptops)
             if (exclude_laptops_1!=[]):
                 print("RETRY FOR: ",exclude_laptops_1)
                 await self.laptops_obj.set_port_1(port_list=exclude_laptops_1)
-                time.sleep(10)
+                await asyncio.sleep(10)
                 await self.laptops_obj.add_station(port_list=exclude_laptops_1)
-                time.sleep(30)
+                await asyncio.sleep(30)
                 await self.laptops_obj.set_port(port_list=exclude_laptops_1)
-                time.sleep(60)
-            exclude_laptops_2=[]
-            
-            for laptop in selected_laptops:
-                current_laptop_port_data = self.json_get('/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name']))
-                current_laptop_port_data = current_laptop_port_data['interface']
-                if (current_laptop_port_data['down'] == True):
-                    exclude_laptops_2.append(laptop)
-                    continue
+                await asyncio.sleep(60)
+
+            exclude_laptops_2 = await self.get_down_laptops(selected_laptops)
             if (exclude_laptops_2!=[]):
                 print("RETRY-2 FOR: ",exclude_laptops_2)
                 await self.laptops_obj.add_station(port_list=exclude_laptops_2)
                 await self.laptops_obj.set_port(port_list=exclude_laptops_2)
                 # await self.laptops_obj.set_port_1(port_list=exclude_laptops_2)
-                time.sleep(60)
-        
-        # for androids
+                await asyncio.sleep(60)
+
+        configure_tasks = []
+        if(selected_androids != []):
+            configure_tasks.append(configure_androids())
+        if(selected_laptops != []):
+            configure_tasks.append(configure_laptops())
+        await asyncio.gather(*configure_tasks)
+
+        # for androids, the port and resource data of all androids is fetched concurrently
+        android_status = await fan_out_async(self.get_android_data, selected_androids,
+                                             resource_key=lambda android: '{}.{}'.format(android[0], android[1]),
+                                             name_key=lambda android: android[2],
+                                             max_per_resource=self.max_queries_per_resource,
+                                             timeout_sec=self.query_timeout_sec)
+        self.configure_status = {}
         exclude_androids = []
         for android in selected_androids:
             if (android[3] == '2g'):
@@ -1218,49 +1373,47 @@ class RealDevice(Realm):
             elif (android[3] == '6g'):
                 curr_ssid = self.ssid_6g
 
-            # get resource id for the android device from interop tab
-            resource_id = self.json_get('/adb/1/1/{}'.format(android[2]))['devices']['resource-id']
+            if (android_status[android[2]]['status'] != 'ok'):
+                logging.warning(
+                    'Could not query the android with serial {}: {}. Excluding it from testing'.format(
+                        android[2], android_status[android[2]]['error']))
+                self.configure_status[android[2]] = android_status[android[2]]['status']
+                exclude_androids.append(android)
+                continue
+            resource_id, current_android_port_data, username = android_status[android[2]]['result']
 
             # if there is no resource id in interop tab
             if(resource_id == ''):
                 logging.warning(
                     'The android with serial {} is missing resource id. Excluding it from testing'.format(android[2]))
+                self.configure_status[android[2]] = 'no resource id'
                 exclude_androids.append(android)
                 continue
 
-            # fetching resource data for android device
-            current_android_resource_data = \
-            self.json_get('/resource/{}/{}/'.format(resource_id.split('.')[0], resource_id.split('.')[1]))['resource']
-
-            if(current_android_resource_data['phantom']):
+            if(current_android_port_data['phantom']):
                 logging.warning(
                     'The android with serial {} is in phantom state in resource manager. Excluding it from testing'.format(android[2]))
+                self.configure_status[android[2]] = 'phantom'
                 exclude_androids.append(android)
                 continue
 
-            # fetching port data for the android device
-            current_android_port_data = \
-            self.json_get('/port/{}/{}/wlan0'.format(resource_id.split('.')[0], resource_id.split('.')[1]))['interface']
-
-            current_android_port_data.update(current_android_resource_data)
             # checking if the android is connected to the desired ssid
             if (current_android_port_data['ssid'] != curr_ssid):
                 logging.warning(
                     'The android with serial {} is not conneted to the given SSID {}. Excluding it from testing'.format(
                         android[2], curr_ssid))
+                self.configure_status[android[2]] = 'wrong ssid'
                 exclude_androids.append(android)
                 continue
 
             # checking if the android is active or down
             if(current_android_port_data['ip'] == '0.0.0.0'):
                 logging.warning('The android with serial {} is down. Excluding it from testing'.format(android[2]))
+                self.configure_status[android[2]] = 'no ip'
                 exclude_androids.append(android)
                 continue
 
-            username = \
-            self.json_get('resource/{}/{}?fields=user'.format(resource_id.split('.')[0], resource_id.split('.')[1]))[
-                'resource']['user']
-
+            self.configure_status[android[2]] = 'connected'
             self.selected_devices.append(resource_id)
             self.selected_macs.append(current_android_port_data['mac'])
             self.report_labels.append('{} android {}'.format(resource_id, username)[:25])
@@ -1284,7 +1437,12 @@ class RealDevice(Realm):
         for android in exclude_androids:
             selected_androids.remove(android)
 
-        # for laptops
+        # for laptops, the port and resource data of all laptops is fetched concurrently
+        laptop_status = await fan_out_async(self.get_laptop_data, selected_laptops,
+                                            resource_key=lambda laptop: '{}.{}'.format(laptop['shelf'], laptop['resource']),
+                                            name_key=self.laptop_port_name,
+                                            max_per_resource=self.max_queries_per_resource,
+                                            timeout_sec=self.query_timeout_sec)
         exclude_laptops = []
         for laptop in selected_laptops:
             if (laptop['band'] == '2g'):
@@ -1294,24 +1452,32 @@ class RealDevice(Realm):
             elif (laptop['band'] == '6g'):
                 curr_ssid = self.ssid_6g
 
+            current_resource_id = self.laptop_port_name(laptop)
+            if (laptop_status[current_resource_id]['status'] != 'ok'):
+                logging.warning(
+                    'Could not query the laptop with port {}: {}. Excluding it from testing'.format(
+                        current_resource_id, laptop_status[current_resource_id]['error']))
+                self.configure_status[current_resource_id] = laptop_status[current_resource_id]['status']
+                exclude_laptops.append(laptop)
+                continue
+
             # check SSID and IP values from port manager
-            current_laptop_port_data = self.json_get(
-                '/port/{}/{}/{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name']))
-            if(current_laptop_port_data is None):
+            if(laptop_status[current_resource_id]['result'] is None):
                 logging.warning(
                     'The laptop with port {}.{}.{} not found. Excluding it from testing'.format(laptop['shelf'],
                                                                                                 laptop['resource'],
                                                                                                 laptop['sta_name']))
+                self.configure_status[current_resource_id] = 'not found'
                 exclude_laptops.append(laptop)
                 continue
-
-            current_laptop_port_data = current_laptop_port_data['interface']
+            current_laptop_port_data, current_laptop_resource_data = laptop_status[current_resource_id]['result']
 
             # checking if the laptop is connected to the desired ssid
             if (current_laptop_port_data['ssid'] != curr_ssid):
                 logging.warning(
                     'The laptop with port {}.{}.{} is not conneted to the given SSID {}. Excluding it from testing'.format(
                         laptop['shelf'], laptop['resource'], laptop['sta_name'], curr_ssid))
+                self.configure_status[current_resource_id] = 'wrong ssid'
                 exclude_laptops.append(laptop)
                 
                 continue
@@ -1319,6 +1485,7 @@ class RealDevice(Realm):
                 logging.warning(
                     'The laptop with port {}.{}.{} is in down state {}.Please check the wifi. Excluding it from testing'.format(
                         laptop['shelf'], laptop['resource'], laptop['sta_name'], curr_ssid))
+                self.configure_status[current_resource_id] = 'down'
                 exclude_laptops.append(laptop)
                 continue
 
@@ -1328,6 +1495,7 @@ class RealDevice(Realm):
                     'The laptop with port {}.{}.{} is 0.0.0.0. IP. Excluding it from testing'.format(laptop['shelf'],
                                                                                               laptop['resource'],
                                                                                               laptop['sta_name']))
+                self.configure_status[current_resource_id] = 'no ip'
                 exclude_laptops.append(laptop)
                 continue
             #checking for windows gateway ip in-order to get ip confirmation
@@ -1336,18 +1504,16 @@ class RealDevice(Realm):
                     'The laptop with port {}.{}.{} is 0.0.0.0. gateway IP. Excluding it from testing'.format(laptop['shelf'],
                                                                                               laptop['resource'],
                                                                                               laptop['sta_name']))
-                
+                self.configure_status[current_resource_id] = 'no gateway ip'
                 exclude_laptops.append(laptop)
                 continue
 
-            current_laptop_resource_data = self.json_get('resource/{}/{}'.format(laptop['shelf'], laptop['resource']))[
-                'resource']
             hostname = current_laptop_resource_data['hostname']
 
             current_laptop_port_data.update(current_laptop_resource_data)
 
             # adding port id to selected_device_eids
-            current_resource_id = '{}.{}.{}'.format(laptop['shelf'], laptop['resource'], laptop['sta_name'])
+            self.configure_status[current_resource_id] = 'connected'
             self.selected_devices.append(current_resource_id)
             self.selected_macs.append(current_laptop_port_data['mac'])
             self.report_labels.append('{} {} {}'.format(current_resource_id, laptop['os'], hostname)[:25])
@@ -1381,6 +1547,8 @@ class RealDevice(Realm):
         for laptop in exclude_laptops:
             selected_laptops.remove(laptop)
 
+        logging.info("Wi-Fi configuration status: {}".format(self.configure_status))
+
         df = pd.DataFrame(data=selected_t_devices).transpose()
         print(df)
         return [self.selected_devices, self.report_labels, self.selected_macs]
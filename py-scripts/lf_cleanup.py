@@ -108,6 +108,10 @@ class lf_clean(Realm):
         self.port_mgr_done = False
         self.br_done = False
         self.misc_done = False
+        self.teardown = self.new_teardown_profile()
+
+    def resource_selected(self, resource):
+        return str(resource) in self.resource or 'all' in self.resource
 
     # removes the endps from the LF gui Layer 4-7 tab (--layer4):
     def layer4_endp_clean(self):
@@ -185,175 +189,55 @@ class lf_clean(Realm):
     # you have to remove CX before removing endpoints belonging to that CX
     # Note the code changed to only remove CX and not endpoints
     def cxs_clean(self):
-        still_looking_cxs = True
-        iterations_cxs = 1
-
-        while still_looking_cxs and iterations_cxs <= 10:
-            iterations_cxs += 1
-            logger.info("cxs_clean: iterations_cxs: {iterations_cxs}".format(iterations_cxs=iterations_cxs))
-            cx_json = super().json_get("cx")
-            # endp_json = super().json_get("endp")
-            if cx_json is not None and 'empty' not in cx_json:
-                logger.info(cx_json.keys())
-                logger.info("Removing old cross connects")
-                # delete L3-CX based upon the L3-Endp name & the resource value from
-                # the e.i.d of the associated L3-Endps
-                cx_json.pop("handler")
-                cx_json.pop("uri")
-                if 'warnings' in cx_json:
-                    cx_json.pop("warnings")
-                # if type(endp_json['endpoint']) is dict:
-
-                for cx_name in list(cx_json):
-                    cxs_eid = cx_json[cx_name]['entity id']
-                    cxs_eid_split = cxs_eid.split('.')
-                    # cxs_eid_split[1] == realm resource value:
-                    resource_eid = str(cxs_eid_split[1])
-                    # logger.info(resource_eid)
-                    if resource_eid in self.resource or 'all' in self.resource:
-                        # remove Layer-3 cx:
-                        req_url = "cli-json/rm_cx"
-                        data = {
-                            "test_mgr": "default_tm",
-                            "cx_name": cx_name
-                        }
-                        # logger.info(data)
-                        logger.info("Removing {cx_name}...".format(cx_name=cx_name))
-                        super().json_post(req_url, data)
-
-                time.sleep(5)
-            else:
-                logger.info("No cross connects found to cleanup")
-                still_looking_cxs = False
-                logger.info("clean_cxs still_looking_cxs {cxs_looking}".format(cxs_looking=still_looking_cxs))
-            if not still_looking_cxs:
-                self.cxs_done = True
-            return still_looking_cxs
+        cx_list = [cx_name for (cx_name, cx) in self.teardown.list_cxs().items()
+                   if self.resource_selected(cx['resource'])]
+        if not cx_list:
+            logger.info("No cross connects found to cleanup")
+            self.cxs_done = True
+            return False
+        logger.info("Removing {count} old cross connects".format(count=len(cx_list)))
+        not_removed = self.teardown.teardown(cx_names=cx_list)['cx']
+        still_looking_cxs = len(not_removed) > 0
+        logger.info("clean_cxs still_looking_cxs {cxs_looking} not removed: {not_removed}".format(
+            cxs_looking=still_looking_cxs, not_removed=not_removed))
+        self.cxs_done = not still_looking_cxs
+        return still_looking_cxs
 
     # removes endpoints that do not have a related Layer-3 cxs from the L3 Endps gui tab.
     def get_json1(self):
         response= self.json_get("port/all")
         return(response)
 
+    # cross connects still using an endpoint are removed first
     def layer3_endp_clean(self):
-        still_looking_endp = True
-        iterations_endp = 0
-
-        while still_looking_endp and iterations_endp <= 10:
-            iterations_endp += 1
-            logger.info("layer3_endp_clean: iterations_endp: {iterations_endp}".format(iterations_endp=iterations_endp))
-            endp_json = super().json_get("endp")
-            # logger.info(endp_json)
-            if endp_json is not None:
-                logger.info("Removing old Layer 3 endpoints")
-                # if there is only a single endpoint:
-                if type(endp_json['endpoint']) is dict:
-                    endp_name = endp_json['endpoint']['name']
-                    req_url = "cli-json/rm_endp"
-                    data = {
-                        "endp_name": endp_name
-                    }
-                    # logger.info(data)
-                    logger.info("Removing {endp_name}...".format(endp_name=endp_name))
-                    super().json_post(req_url, data)
-
-                # if there are > 1 endpoints:
-                else:
-                    for name in list(endp_json['endpoint']):
-                        endp_name = list(name)[0]
-                        if name[list(name)[0]]["name"] == '':
-                            continue
-                        req_url = "cli-json/rm_endp"
-                        data = {
-                            "endp_name": endp_name
-                        }
-                        # logger.info(data)
-                        logger.info("Removing {endp_name}...".format(endp_name=endp_name))
-                        super().json_post(req_url, data)
-                time.sleep(1)
-            else:
-                logger.info("No endpoints found to cleanup")
-                still_looking_endp = False
-                logger.info("layer3_clean_endp still_looking_endp {ednp_looking}".format(ednp_looking=still_looking_endp))
-            if not still_looking_endp:
-                self.endp_done = True
-            return still_looking_endp
+        endp_list = list(self.teardown.list_endps())
+        if not endp_list:
+            logger.info("No endpoints found to cleanup")
+            self.endp_done = True
+            return False
+        logger.info("Removing {count} old Layer 3 endpoints".format(count=len(endp_list)))
+        not_removed = self.teardown.teardown(endp_names=endp_list)
+        still_looking_endp = len(not_removed['cx'] + not_removed['endp']) > 0
+        logger.info("layer3_clean_endp still_looking_endp {ednp_looking} not removed: {not_removed}".format(
+            ednp_looking=still_looking_endp, not_removed=not_removed))
+        self.endp_done = not still_looking_endp
+        return still_looking_endp
 
     def sta_clean(self):
-        still_looking_sta = True
-        iterations_sta = 0
-
-        while still_looking_sta and iterations_sta <= 10:
-            iterations_sta += 1
-            logger.info("sta_clean: iterations_sta: {iterations_sta}".format(iterations_sta=iterations_sta))
-            try:
-                sta_json = super().json_get("/port/?fields=alias".format(resource=self.resource))['interfaces']
-                # logger.info(sta_json)
-            except TypeError:
-                sta_json = None
-                logger.info("sta_json set to None")
-
-            # get and remove current stations
-            if sta_json is not None:
-                logger.info("Removing old stations ")
-                for name in list(sta_json):
-                    for alias in list(name):
-                        info = self.name_to_eid(alias)
-                        sta_resource = str(info[1])
-                        if sta_resource in self.resource or 'all' in self.resource:
-                            # logger.info("alias {alias}".format(alias=alias))
-                            if 'sta' in alias:
-                                info = self.name_to_eid(alias)
-                                req_url = "cli-json/rm_vlan"
-                                data = {
-                                    "shelf": info[0],
-                                    "resource": info[1],
-                                    "port": info[2]
-                                }
-                                # logger.info(data)
-                                logger.info("Removing {alias}...".format(alias=alias))
-                                super().json_post(req_url, data)
-                            if 'wlan' in alias:
-                                info = self.name_to_eid(alias)
-                                req_url = "cli-json/rm_vlan"
-                                data = {
-                                    "shelf": info[0],
-                                    "resource": info[1],
-                                    "port": info[2]
-                                }
-                                # logger.info(data)
-                                logger.info("Removing {alias}...".format(alias=alias))
-                                super().json_post(req_url, data)
-                            if 'moni' in alias:
-                                info = self.name_to_eid(alias)
-                                req_url = "cli-json/rm_vlan"
-                                data = {
-                                    "shelf": info[0],
-                                    "resource": info[1],
-                                    "port": info[2]
-                                }
-                                # logger.info(data)
-                                logger.info("Removing {alias}...".format(alias=alias))
-                                super().json_post(req_url, data)
-                            if 'Unknown' in alias:
-                                info = self.name_to_eid(alias)
-                                req_url = "cli-json/rm_vlan"
-                                data = {
-                                    "shelf": info[0],
-                                    "resource": info[1],
-                                    "port": info[2]
-                                }
-                                # logger.info(data)
-                                logger.info("Removing {alias}...".format(alias=alias))
-                                super().json_post(req_url, data)
-                time.sleep(1)
-            else:
-                logger.info("No stations found to cleanup")
-                still_looking_sta = False
-                logger.info("clean_sta still_looking_sta {sta_looking}".format(sta_looking=still_looking_sta))
-            if not still_looking_sta:
-                self.sta_done = True
-            return still_looking_sta
+        sta_list = [port_eid for (port_eid, port) in self.teardown.list_ports().items()
+                    if self.resource_selected(port['resource'])
+                    and any(name in port_eid for name in ('sta', 'wlan', 'moni', 'Unknown'))]
+        if not sta_list:
+            logger.info("No stations found to cleanup")
+            self.sta_done = True
+            return False
+        logger.info("Removing {count} old stations".format(count=len(sta_list)))
+        not_removed = self.teardown.teardown(port_eids=sta_list)['port']
+        still_looking_sta = len(not_removed) > 0
+        logger.info("clean_sta still_looking_sta {sta_looking} not removed: {not_removed}".format(
+            sta_looking=still_looking_sta, not_removed=not_removed))
+        self.sta_done = not still_looking_sta
+        return still_looking_sta
 
     # cleans all gui or script created objects from Port Mgr tab
     def port_mgr_clean(self):
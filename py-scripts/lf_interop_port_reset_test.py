@@ -472,12 +472,10 @@ class InteropPortReset(Realm):
                 logging.info(f"Separated device names from the full name: {self.phn_name}")
 
             # check status of devices
-            phantom = []
-            for i in self.adb_device_list:
-                phantom.append(self.interop.get_device_details(device=i, query="phantom"))
+            phantom = self.interop.get_device_details(device=self.adb_device_list, query="phantom")
             if self.adb_device_list or self.windows_list or self.linux_list or self.mac_list:
-                for i in self.adb_device_list:
-                    self.device_name.append(self.interop.get_device_details(device=i, query="user-name"))
+                user_names = self.interop.get_device_details(device=self.adb_device_list, query="user-name")
+                self.device_name.extend(user_names[i] for i in self.adb_device_list)
                 logging.info(f"ADB user-names for selected devices: {self.device_name}")
                 logging.info("Checking heath data...")
                 health = dict.fromkeys(self.adb_device_list)
@@ -485,34 +483,28 @@ class InteropPortReset(Realm):
                 health_for_laptops = dict.fromkeys(self.all_laptops)
                 logging.info(f"Initial Health Data For Laptops Clients: {health_for_laptops}")
 
-                # pre-checking whether the adb device connected to given ssid or not
+                # pre-checking whether the adb devices connected to given ssid or not, all devices at once
+                dev_states = self.utility.get_device_state(device=self.adb_device_list)
+                waiting = [i for i in self.adb_device_list if dev_states[i] != "COMPLETED,"]
+                if waiting:
+                    # logging.info(f"Waiting for {self.wait_time} sec & Checking again the status of the device")
+                    logging.info(f"Waiting for 30 sec & Checking again the status of {waiting}")
+                    time.sleep(30)
+                    dev_states.update(self.utility.get_device_state(device=waiting))
+                    logging.info("Checking Device Status Again..." + str(dev_states))
+                connected = [i for i in self.adb_device_list if dev_states[i] == "COMPLETED,"]
+                ssids = self.utility.get_device_ssid(device=connected)
                 for i in self.adb_device_list:
-                    dev_state = self.utility.get_device_state(device=i)
-                    if dev_state == "COMPLETED,":
-                        logging.info("Phone %s is in connected state." % i)
-                        ssid = self.utility.get_device_ssid(device=i)
-                        if ssid == self.ssid:
-                            logging.info("The Device %s is connected to expected ssid (%s)" % (i, ssid))
-                            health[i] = self.utility.get_wifi_health_monitor(device=i, ssid=self.ssid)
-                        else:
-                            logging.info("**** The Device is not connected to the expected ssid ****")
+                    if i not in connected:
+                        logging.info(f"device state {dev_states[i]}")
+                        health[i] = {'ConnectAttempt': '0', 'ConnectFailure': '0', 'AssocRej': '0',
+                                     'AssocTimeout': '0'}
+                    elif ssids[i] == self.ssid:
+                        logging.info("The Device %s is connected to expected ssid (%s)" % (i, ssids[i]))
                     else:
-                        # logging.info(f"Waiting for {self.wait_time} sec & Checking again the status of the device")
-                        logging.info(f"Waiting for 30 sec & Checking again")
-                        time.sleep(30)
-                        dev_state = self.utility.get_device_state(device=i)
-                        logging.info("Checking Device Status Again..." + str(dev_state))
-                        logging.info(f"Device state {dev_state}")
-                        if dev_state == "COMPLETED,":
-                            logging.info("Phone is in connected state")
-                            ssid = self.utility.get_device_ssid(device=i)
-                            if ssid == self.ssid:
-                                logging.info("The Device %s is connected to expected ssid (%s)" % (i, ssid))
-                                health[i] = self.utility.get_wifi_health_monitor(device=i, ssid=self.ssid)
-                        else:
-                            logging.info(f"device state {dev_state}")
-                            health[i] = {'ConnectAttempt': '0', 'ConnectFailure': '0', 'AssocRej': '0',
-                                         'AssocTimeout': '0'}
+                        logging.info("**** The Device is not connected to the expected ssid ****")
+                health.update(self.utility.get_wifi_health_monitor(
+                    device=[i for i in connected if ssids[i] == self.ssid], ssid=self.ssid))
                 logging.info(f"Health Status for the Android Devices: {health}")
 
                 logging.info(f"Health Status for the Laptop Devices: {health_for_laptops}")
@@ -552,25 +544,23 @@ class InteropPortReset(Realm):
                     # note last log time
                     timee = self.get_last_wifi_msg()
 
-                    for i in self.adb_device_list:
-                        self.interop.stop(device=i)
+                    # each android step is sent to all devices at once
+                    if self.adb_device_list:
+                        self.interop.stop(device=self.adb_device_list)
                     for i in self.all_laptops:  # laptop admin down
                         logging.info("**** Disable wifi for laptop %s" % i)
                         self.admin_down(port_eid=i)
-                    for i in self.adb_device_list:
-                        logging.info("**** Disable wifi for android %s" % i)
-                        logging.info("disable wifi")
-                        self.interop.enable_or_disable_wifi(device=i, wifi="disable")
+                    if self.adb_device_list:
+                        logging.info("**** Disable wifi for android %s" % self.adb_device_list)
+                        self.interop.enable_or_disable_wifi(device=self.adb_device_list, wifi="disable")
                     for i in self.all_laptops:  # laptop admin up
                         logging.info("**** Enable wifi for laptop %s" % i)
                         self.admin_up(port_eid=i)
-                    for i in self.adb_device_list:
-                        logging.info("*** Enable wifi for laptop %s" % i)
-                        logging.info("enable wifi")
-                        self.interop.enable_or_disable_wifi(device=i, wifi="enable")
-                    for i in self.adb_device_list:
-                        logging.info("Starting APP for %s" % i)
-                        self.interop.start(device=i)
+                    if self.adb_device_list:
+                        logging.info("*** Enable wifi for android %s" % self.adb_device_list)
+                        self.interop.enable_or_disable_wifi(device=self.adb_device_list, wifi="enable")
+                        logging.info("Starting APP for %s" % self.adb_device_list)
+                        self.interop.start(device=self.adb_device_list)
                     if self.all_laptops:
                         if self.wait_for_ip(station_list=self.all_laptops, timeout_sec=-1):
                             logging.info("PASSED : ALL STATIONS GOT IP")
@@ -186,51 +186,38 @@ class RealBrowserTest(Realm):
         # Check various configuration things on Interop tab, Uses lf_base_interop_profile.py library
         self.adb_device_list = self.interop.check_sdk_release()
 
-        # Get device details for each adb device in the list
-        for i in self.adb_device_list:
-            self.device_name.append(self.interop.get_device_details(device=i, query="user-name"))
+        # Get device details for all adb devices in the list with one query
+        user_names = self.interop.get_device_details(device=self.adb_device_list, query="user-name")
+        self.device_name.extend(user_names[i] for i in self.adb_device_list)
         logging.info(self.device_name)
 
         # Stop ongoing processes on devices
         self.interop.stop()
-        # Apply batch modifications and set user names
-        for i in self.adb_device_list:
-            self.interop.batch_modify_apply(i)
-            time.sleep(5)
+        # Set user names and apply batch modifications on all devices at once
         self.interop.set_user_name(device=self.adb_device_list)
+        self.interop.batch_modify_apply(self.adb_device_list)
+        time.sleep(5)
 
         # Forget network connections on devices
-        for i in self.adb_device_list:
-            self.utility.forget_netwrk(i)
+        self.utility.forget_netwrk(self.adb_device_list)
 
         # Initialize health dictionary for each device
         health = dict.fromkeys(self.adb_device_list)
 
-        # Getting Health for each device
+        # Get the state of every device, then the SSID of the connected ones and the health of those on the expected SSID
+        dev_states = self.utility.get_device_state(device=self.adb_device_list)
+        connected = [i for i in self.adb_device_list if dev_states[i] == "COMPLETED,"]
+        ssids = self.utility.get_device_ssid(device=connected)
+        expected = [i for i in connected if ssids[i] == self.ssid]
+        health.update(self.utility.get_wifi_health_monitor(device=expected, ssid=self.ssid))
         for i in self.adb_device_list:
-            # Get the state of the device
-            dev_state = self.utility.get_device_state(device=i)
-            logging.info("Device State : {dev_state}".format(dev_state = dev_state))
-
-            logging.info("device state" + dev_state)
-            # Check if the device state indicates it is connected
-            if dev_state == "COMPLETED,":
-                logging.info("phone is in connected state")
-                logging.info("phone is in connected state")
-                # Get the SSID of the connected device
-                ssid = self.utility.get_device_ssid(device=i)
-                # Check if the device is connected to the expected SSID
-                if ssid == self.ssid:
-                    logging.info("device is connected to expected ssid")
-                    logging.info("device is connected to expected ssid")
-                    # Retrieve and log the health status of the device
-                    health[i] = self.utility.get_wifi_health_monitor(device=i, ssid=self.ssid)
-                    logging.info("health health:: ", health)
-                    logging.info("Launching Interop UI")
-                    logging.info("health :: {health}".format(health = health))
-                    # Launch the Interop UI for the device
-                    logging.info("Launching Interop UI")
-                    self.interop.launch_interop_ui(device=i)
+            logging.info("Device State : {dev_state}".format(dev_state = dev_states[i]))
+            if i in expected:
+                logging.info("device {device} is connected to expected ssid".format(device = i))
+                # Launch the Interop UI for the device
+                logging.info("Launching Interop UI")
+                self.interop.launch_interop_ui(device=i)
+        logging.info("health :: {health}".format(health = health))
         # Store the health dictionary in the instance variable
         self.health = health
         logging.info("Health:: ", health)
@@ -105,6 +105,8 @@ import logging
 import json
 import pandas as pd
 import shutil
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +122,8 @@ import argparse
 from LANforge import LFUtils
 realm = importlib.import_module("py-json.realm")
 Realm = realm.Realm
+lfdata = importlib.import_module("py-json.lfdata")
+LFTimeSeriesBuffer = lfdata.LFTimeSeriesBuffer
 from lf_report import lf_report
 from lf_graph import lf_bar_graph_horizontal
 from lf_graph import lf_line_graph
@@ -129,6 +133,10 @@ from datetime import datetime, timedelta
 lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 
 class Throughput(Realm):
+    # fields requested from LANforge on every monitor tick
+    monitor_port_fields = ['signal', 'channel', 'mode', 'rx-rate']
+    monitor_cx_fields = ['bps rx a', 'bps rx b', 'rx drop %25 a', 'rx drop %25 b', 'state']
+
     def __init__(self,
                 tos,
                 ssid=None,
@@ -427,48 +435,117 @@ class Throughput(Realm):
         else:
             return True,self.real_client_list
 
-    def get_signal_and_channel_data(self,station_names):
+    def get_signal_and_channel_data(self,station_names,port_data=None):
         """
         Retrieves signal strength, channel, mode, and link speed data for the specified stations.
+        port_data is a /ports response already fetched for this tick, queried here when not given.
 
         """
-   
         signal_list,channel_list,mode_list,link_speed_list=[],[],[],[]
+        if port_data is None:
+            port_data = self.get_port_data()
         interfaces_dict = dict()
-        try:
-            port_data = self.json_get('/ports/all/')['interfaces']
-        except KeyError:
-            logger.error("Error: 'interfaces' key not found in port data")
-            exit(1)
-            
         for port in port_data:
             interfaces_dict.update(port)
         for sta in station_names:
-            if sta in interfaces_dict:
-                if "dBm" in interfaces_dict[sta]['signal']:
-                    signal_list.append(interfaces_dict[sta]['signal'].split(" ")[0])
-                else:
-                    signal_list.append(interfaces_dict[sta]['signal'])
-            else:
+            if sta not in interfaces_dict:
                 signal_list.append('-')
-        for sta in station_names:
-            if sta in interfaces_dict:
-                channel_list.append(interfaces_dict[sta]['channel'])
-            else:
                 channel_list.append('-')
-        for sta in station_names:
-            if sta in interfaces_dict:
-                mode_list.append(interfaces_dict[sta]['mode'])
-            else:
                 mode_list.append('-')
-        for sta in station_names:
-            if sta in interfaces_dict:
-                link_speed_list.append(interfaces_dict[sta]['rx-rate'])
-            else:
                 link_speed_list.append('-')
+                continue
+            port = interfaces_dict[sta]
+            if "dBm" in port['signal']:
+                signal_list.append(port['signal'].split(" ")[0])
+            else:
+                signal_list.append(port['signal'])
+            channel_list.append(port['channel'])
+            mode_list.append(port['mode'])
+            link_speed_list.append(port['rx-rate'])
         return signal_list,channel_list,mode_list,link_speed_list
 
+    def get_port_data(self):
+        """
+        Retrieves the signal, channel, mode and rx-rate fields of all ports.
 
+        """
+        try:
+            return self.json_get('/ports/all/?fields=%s' % ','.join(self.monitor_port_fields))['interfaces']
+        except KeyError:
+            logger.error("Error: 'interfaces' key not found in port data")
+            exit(1)
+
+    def get_monitor_data(self,executor):
+        """
+        Fetches the port data and the layer-3 cx data of one monitor tick, the two requests are in flight together.
+        Returns the port data and, in created_cx order, a row of [bps rx a, bps rx b, rx drop % a, rx drop % b, state]
+        for each connection.
+
+        """
+        port_future = executor.submit(self.get_port_data)
+        response = self.json_get('/cx/%s?fields=%s' % (
+            ','.join(self.cx_profile.created_cx.keys()), ",".join(self.monitor_cx_fields)))
+        cx_rows = []
+        for cx_name in self.cx_profile.created_cx.keys():
+            if response and isinstance(response.get(cx_name), dict):
+                cx_rows.append(list(response[cx_name].values()))
+            else:
+                cx_rows.append([0, 0, 0, 0, 'Unknown'])
+        return port_future.result(), cx_rows
+
+    def reset_monitor_stats(self):
+        """
+        Starts running download/upload/drop aggregates (sum, count, min, max) for every connection.
+
+        """
+        cx_count = len(self.cx_profile.created_cx)
+        self.monitor_stats = {'sum': np.zeros((cx_count, 4)),
+                              'count': 0,
+                              'min': np.full((cx_count, 4), np.inf),
+                              'max': np.full((cx_count, 4), -np.inf)}
+
+    def update_monitor_stats(self,samples):
+        """
+        Adds one tick of [download bps, upload bps, rx drop % a, rx drop % b] samples, one row per connection.
+
+        """
+        self.monitor_stats['sum'] += samples
+        self.monitor_stats['count'] += 1
+        np.minimum(self.monitor_stats['min'], samples, out=self.monitor_stats['min'])
+        np.maximum(self.monitor_stats['max'], samples, out=self.monitor_stats['max'])
+
+    def get_monitor_stats(self):
+        """
+        Returns the average, minimum and maximum download/upload (Mbps) and rx drop % of each connection
+        over the ticks of the last monitor() call.
+
+        """
+        stats = {}
+        count = max(self.monitor_stats['count'], 1)
+        scale = np.array([1000000, 1000000, 1, 1])
+        for index, cx_name in enumerate(self.cx_profile.created_cx.keys()):
+            stats[cx_name] = {}
+            for column, name in enumerate(['download', 'upload', 'rx_drop_a', 'rx_drop_b']):
+                if not self.monitor_stats['count']:
+                    stats[cx_name][name] = {'avg': 0, 'min': 0, 'max': 0}
+                    continue
+                stats[cx_name][name] = {
+                    'avg': round(self.monitor_stats['sum'][index][column] / count / scale[column], 2),
+                    'min': round(self.monitor_stats['min'][index][column] / scale[column], 2),
+                    'max': round(self.monitor_stats['max'][index][column] / scale[column], 2)}
+        return stats
+
+    def get_cx_samples(self,cx_rows):
+        """
+        Converts the cx rows of one tick into [download bps, upload bps, rx drop % a, rx drop % b] per connection,
+        zero for connections that are not running.
+
+        """
+        samples = np.zeros((len(cx_rows), 4))
+        for i, row in enumerate(cx_rows):
+            if row[4] == 'Run':
+                samples[i] = [row[0], row[1], row[2], row[3]]
+        return samples
 
     def get_ssid_list(self,station_names):
         """
@@ -610,10 +687,11 @@ class Throughput(Realm):
         self.cx_profile.cleanup()
 
     def monitor(self,iteration,individual_df,device_names,incremental_capacity_list,overall_start_time,overall_end_time):
-        
+        """
+        Samples every connection until the test duration ends or the user stops the test from the web GUI.
+        One row per tick is appended to throughput_data.csv and the rows are returned appended to individual_df.
 
-        throughput, upload,download,upload_throughput,download_throughput,connections_upload, connections_download = {}, [], [],[],[],{},{}
-        drop_a, drop_a_per, drop_b, drop_b_per,state,state_of_device= [], [], [], [], [], []
+        """
         test_stopped_by_user=False
         if (self.test_duration is None) or (int(self.test_duration) <= 1):
             raise ValueError("Monitor test duration should be > 1 second")
@@ -628,200 +706,127 @@ class Throughput(Realm):
         self.overall=[]
         
         # Initialize variables for real-time connections data
-        index=-1
-        connections_upload = dict.fromkeys(list(self.cx_profile.created_cx.keys()), float(0))
-        connections_download = dict.fromkeys(list(self.cx_profile.created_cx.keys()), float(0))
-        connections_upload_realtime = dict.fromkeys(list(self.cx_profile.created_cx.keys()), float(0))
-        connections_download_realtime = dict.fromkeys(list(self.cx_profile.created_cx.keys()), float(0))
-        
-        # Initialize lists for throughput and drops for each connection
-        [(upload.append([]), download.append([]), drop_a.append([]), drop_b.append([]),state.append([])) for i in range(len(self.cx_profile.created_cx))]
-        
+        cx_names = list(self.cx_profile.created_cx.keys())
+        connections_upload = dict.fromkeys(cx_names, float(0))
+        connections_download = dict.fromkeys(cx_names, float(0))
+        connections_upload_realtime = dict.fromkeys(cx_names, float(0))
+        connections_download_realtime = dict.fromkeys(cx_names, float(0))
+
+        # Latest sample of each connection and running aggregates over the whole monitor call
+        samples = np.zeros((len(cx_names), 4))
+        self.reset_monitor_stats()
+
         # If using web GUI, set runtime directory
         if self.dowebgui:
             runtime_dir = self.result_dir
-        
-        # Continuously collect data until end time is reached
-        while datetime.now() < end_time:
-            index += 1
-            
-            signal_list,channel_list,mode_list,link_speed_list=self.get_signal_and_channel_data(self.input_devices_list)
+            csv_path = '{}/throughput_data.csv'.format(runtime_dir)
+        else:
+            csv_path = 'throughput_data.csv'
 
-            # Fetch required throughput data from Lanforge
-            response = list(
-                self.json_get('/cx/%s?fields=%s' % (
-                    ','.join(self.cx_profile.created_cx.keys()), ",".join(['bps rx a', 'bps rx b', 'rx drop %25 a', 'rx drop %25 b','state']))).values())[2:]
-            # Extracting and storing throughput data
-            throughput[index] = list(
-                map(lambda i: [x for x in i.values()], response))
-            if self.dowebgui:
-                individual_df_data=[]
-                temp_upload, temp_download, temp_drop_a, temp_drop_b= [], [], [], []
-                
-                # Initialize temporary lists for each connection
-                [(temp_upload.append([]), temp_download.append([]), temp_drop_a.append([]), temp_drop_b.append([])) for
-                    i in range(len(self.cx_profile.created_cx))]
-                
-                # Populate temporary lists with current throughput data
-                for i in range(len(throughput[index])):
-                    if throughput[index][i][4]!='Run':
-                            temp_upload[i].append(0)
-                            temp_download[i].append(0)
-                            temp_drop_a[i].append(0)
-                            temp_drop_b[i].append(0)
-                    else:
-                        temp_upload[i].append(throughput[index][i][1])
-                        temp_download[i].append(throughput[index][i][0])
-                        temp_drop_a[i].append(throughput[index][i][2])
-                        temp_drop_b[i].append(throughput[index][i][3])
-                    
-                
-                # Calculate average throughput and drop percentages
-                upload_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in temp_upload]
-                download_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in temp_download]
-                drop_a_per = [float(round(sum(i) / len(i), 2)) for i in temp_drop_a]
-                drop_b_per = [float(round(sum(i) / len(i), 2)) for i in temp_drop_b]
-                keys = list(connections_upload_realtime.keys())
-                keys = list(connections_download_realtime.keys())
-                for i in range(len(download_throughput)):
-                    connections_download_realtime.update({keys[i]: float(f"{(download_throughput[i]):.2f}")})
-                for i in range(len(upload_throughput)):
-                    connections_upload_realtime.update({keys[i]: float(f"{(upload_throughput[i]):.2f}")})
-                time_difference = abs(end_time - datetime.now())
-                overall_time_difference=abs(overall_end_time-datetime.now())
-                overall_total_hours=overall_time_difference.total_seconds() / 3600
-                overall_remaining_minutes=(overall_total_hours % 1) * 60
-                timestamp=datetime.now().strftime("%d/%m %I:%M:%S %p")
-                remaining_minutes_instrf=[str(int(overall_total_hours)) + " hr and " + str(int(overall_remaining_minutes)) + " min" if int(overall_total_hours) != 0 or int(overall_remaining_minutes) != 0 else '<1 min'][0]
-                
-                # Storing individual device throughput data(download, upload, Rx % drop A, Rx % drop B) to dataframe
-                for i in range(len(download_throughput)):
-                    individual_df_data.extend([download_throughput[i],upload_throughput[i],drop_a_per[i],drop_b_per[i],int(signal_list[i]),link_speed_list[i]])                
-               
-                # Storing Overall throughput data for all devices and also start time, end time, remaining time and status of test running
-                individual_df_data.extend([round(sum(download_throughput),2),round(sum(upload_throughput),2),sum(drop_a_per),sum(drop_a_per),iteration+1,timestamp,overall_start_time.strftime("%d/%m %I:%M:%S %p"),overall_end_time.strftime("%d/%m %I:%M:%S %p"),remaining_minutes_instrf,', '.join(str(n) for n in incremental_capacity_list),'Running'])
-                
-                # Append data to individual_df and save to CSV
-                individual_df.loc[len(individual_df)]=individual_df_data
-                individual_df.to_csv('{}/throughput_data.csv'.format(runtime_dir), index=False)
-
-                # Check if test was stopped by the user
-                with open(runtime_dir + "/../../Running_instances/{}_{}_running.json".format(self.ip, self.test_name),
-                          'r') as file:
-                    data = json.load(file)
-                    if data["status"] != "Running":
-                        logger.warning('Test is stopped by the user')
-                        test_stopped_by_user=True
-                        break
-                
-                # Adjust sleep time based on elapsed time since start
-                d=datetime.now()
-                if d - start_time <= timedelta(hours=1):
-                    time.sleep(5)
-                elif d - start_time > timedelta(hours=1) or d - start_time <= timedelta(
-                        hours=6):
-                    if end_time - d < timedelta(seconds=10):
-                        time.sleep(5)
-                    else:
-                        time.sleep(10)
-                elif d - start_time > timedelta(hours=6) or d - start_time <= timedelta(
-                        hours=12):
-                    if end_time - d < timedelta(seconds=30):
-                        time.sleep(5)
-                    else:
-                        time.sleep(30)
-                elif d - start_time > timedelta(hours=12) or d - start_time <= timedelta(
-                        hours=24):
-                    if end_time - d < timedelta(seconds=60):
-                        time.sleep(5)
-                    else:
-                        time.sleep(60)
-                elif d - start_time > timedelta(hours=24) or d - start_time <= timedelta(
-                        hours=48):
-                    if end_time - d < timedelta(seconds=60):
-                        time.sleep(5)
-                    else:
-                        time.sleep(90)
-                elif d - start_time > timedelta(hours=48):
-                    if end_time - d < timedelta(seconds=120):
+        # Rows of this call go to a preallocated table and are appended to the csv one line per tick
+        min_sleep = 5 if self.dowebgui else max(int(self.report_timer), 1)
+        tick_rows = LFTimeSeriesBuffer(capacity=int(self.test_duration) // min_sleep + 2)
+        individual_df.to_csv(csv_path, index=False)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            # Continuously collect data until end time is reached
+            while datetime.now() < end_time:
+
+                # Fetch required port and throughput data from Lanforge
+                port_data, cx_rows = self.get_monitor_data(executor)
+                signal_list,channel_list,mode_list,link_speed_list=self.get_signal_and_channel_data(self.input_devices_list,port_data=port_data)
+                samples = self.get_cx_samples(cx_rows)
+                self.update_monitor_stats(samples)
+                if self.dowebgui:
+                    upload_throughput,download_throughput,drop_a_per,drop_b_per = self.get_tick_values(samples)
+                    for i in range(len(download_throughput)):
+                        connections_download_realtime.update({cx_names[i]: float(f"{(download_throughput[i]):.2f}")})
+                    for i in range(len(upload_throughput)):
+                        connections_upload_realtime.update({cx_names[i]: float(f"{(upload_throughput[i]):.2f}")})
+                    overall_time_difference=abs(overall_end_time-datetime.now())
+                    overall_total_hours=overall_time_difference.total_seconds() / 3600
+                    overall_remaining_minutes=(overall_total_hours % 1) * 60
+                    timestamp=datetime.now().strftime("%d/%m %I:%M:%S %p")
+                    remaining_minutes_instrf=[str(int(overall_total_hours)) + " hr and " + str(int(overall_remaining_minutes)) + " min" if int(overall_total_hours) != 0 or int(overall_remaining_minutes) != 0 else '<1 min'][0]
+
+                    individual_df_data = self.get_individual_df_data(upload_throughput,download_throughput,drop_a_per,drop_b_per,signal_list,link_speed_list)
+
+                    # Storing Overall throughput data for all devices and also start time, end time, remaining time and status of test running
+                    individual_df_data.extend([round(sum(download_throughput),2),round(sum(upload_throughput),2),sum(drop_a_per),sum(drop_a_per),iteration+1,timestamp,overall_start_time.strftime("%d/%m %I:%M:%S %p"),overall_end_time.strftime("%d/%m %I:%M:%S %p"),remaining_minutes_instrf,', '.join(str(n) for n in incremental_capacity_list),'Running'])
+
+                    # Append data to the table and the csv
+                    self.append_tick_row(tick_rows,individual_df.columns,individual_df_data,csv_path)
+
+                    # Check if test was stopped by the user
+                    with open(runtime_dir + "/../../Running_instances/{}_{}_running.json".format(self.ip, self.test_name),
+                              'r') as file:
+                        data = json.load(file)
+                        if data["status"] != "Running":
+                            logger.warning('Test is stopped by the user')
+                            test_stopped_by_user=True
+                            break
+
+                    # Adjust sleep time based on elapsed time since start
+                    d=datetime.now()
+                    if d - start_time <= timedelta(hours=1):
                         time.sleep(5)
-                    else:
-                        time.sleep(120)
-            else:
+                    elif d - start_time > timedelta(hours=1) or d - start_time <= timedelta(
+                            hours=6):
+                        if end_time - d < timedelta(seconds=10):
+                            time.sleep(5)
+                        else:
+                            time.sleep(10)
+                    elif d - start_time > timedelta(hours=6) or d - start_time <= timedelta(
+                            hours=12):
+                        if end_time - d < timedelta(seconds=30):
+                            time.sleep(5)
+                        else:
+                            time.sleep(30)
+                    elif d - start_time > timedelta(hours=12) or d - start_time <= timedelta(
+                            hours=24):
+                        if end_time - d < timedelta(seconds=60):
+                            time.sleep(5)
+                        else:
+                            time.sleep(60)
+                    elif d - start_time > timedelta(hours=24) or d - start_time <= timedelta(
+                            hours=48):
+                        if end_time - d < timedelta(seconds=60):
+                            time.sleep(5)
+                        else:
+                            time.sleep(90)
+                    elif d - start_time > timedelta(hours=48):
+                        if end_time - d < timedelta(seconds=120):
+                            time.sleep(5)
+                        else:
+                            time.sleep(120)
+                else:
 
-                # If not using web GUI, sleep based on report timer
-                individual_df_data=[]
-                time.sleep(self.report_timer)
+                    # If not using web GUI, sleep based on report timer
+                    time.sleep(self.report_timer)
 
-                # Aggregate data from throughput
-                
-                for index, key in enumerate(throughput):
-                    for i in range(len(throughput[key])):
-                        upload[i],download[i],drop_a[i],drop_b[i]=[],[],[],[]
-                        if throughput[key][i][4]!='Run':
-                            upload[i].append(0)
-                            download[i].append(0)
-                            drop_a[i].append(0)
-                            drop_b[i].append(0)
-                           
-                        else:
-                            upload[i].append(throughput[key][i][1])
-                            download[i].append(throughput[key][i][0])
-                            drop_a[i].append(throughput[key][i][2])
-                            drop_b[i].append(throughput[key][i][3])
-                            
+                    upload_throughput,download_throughput,drop_a_per,drop_b_per = self.get_tick_values(samples)
 
-                # Calculate average throughput and drop percentages
-                upload_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in upload]
-                download_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in download]
-                drop_a_per = [float(round(sum(i) / len(i), 2)) for i in drop_a]
-                drop_b_per = [float(round(sum(i) / len(i), 2)) for i in drop_b]
-               
-              
-
-                # Calculate overall time difference and timestamp
-                timestamp=datetime.now().strftime("%d/%m %I:%M:%S %p")
-                # # time_difference = abs(end_time - datetime.now())
-                overall_time_difference=abs(overall_end_time-datetime.now())
-                # # total_hours = time_difference.total_seconds() / 3600
-                overall_total_hours=overall_time_difference.total_seconds() / 3600
-                overall_remaining_minutes=(overall_total_hours % 1) * 60
-                remaining_minutes_instrf=[str(int(overall_total_hours)) + " hr and " + str(int(overall_remaining_minutes)) + " min" if int(overall_total_hours) != 0 or int(overall_remaining_minutes) != 0 else '<1 min'][0]
-                
-                # Storing individual device throughput data(download, upload, Rx % drop A, Rx % drop B) to dataframe
-                for i in range(len(download_throughput)):
-                    individual_df_data.extend([download_throughput[i],upload_throughput[i],drop_a_per[i],drop_b_per[i],int(signal_list[i]),link_speed_list[i]])
-
-                # Storing Overall throughput data for all devices and also start time, end time, remaining time and status of test running
-                individual_df_data.extend([round(sum(download_throughput),2),round(sum(upload_throughput),2),sum(drop_a_per),sum(drop_a_per),iteration+1,timestamp,overall_start_time.strftime("%d/%m %I:%M:%S %p"),overall_end_time.strftime("%d/%m %I:%M:%S %p"),remaining_minutes_instrf,', '.join(str(n) for n in incremental_capacity_list),'Running'])
-                individual_df.loc[len(individual_df)]=individual_df_data
-                individual_df.to_csv('throughput_data.csv', index=False)
-        
-        for index, key in enumerate(throughput):
-            for i in range(len(throughput[key])):
-                upload[i],download[i],drop_a[i],drop_b[i]=[],[],[],[]
-                if throughput[key][i][4]!='Run':
-                    upload[i].append(0)
-                    download[i].append(0)
-                    drop_a[i].append(0)
-                    drop_b[i].append(0)
-                else:
-                    upload[i].append(throughput[key][i][1])
-                    download[i].append(throughput[key][i][0])
-                    drop_a[i].append(throughput[key][i][2])
-                    drop_b[i].append(throughput[key][i][3])
-              
-                
-        individual_df_data=[]
-        upload_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in upload]
-        download_throughput = [float(f"{(sum(i) / 1000000) / len(i): .2f}") for i in download]
-        drop_a_per = [float(round(sum(i) / len(i), 2)) for i in drop_a]
-        drop_b_per = [float(round(sum(i) / len(i), 2)) for i in drop_b]
-        signal_list,channel_list,mode_list,link_speed_list=self.get_signal_and_channel_data(self.input_devices_list)
+                    # Calculate overall time difference and timestamp
+                    timestamp=datetime.now().strftime("%d/%m %I:%M:%S %p")
+                    overall_time_difference=abs(overall_end_time-datetime.now())
+                    overall_total_hours=overall_time_difference.total_seconds() / 3600
+                    overall_remaining_minutes=(overall_total_hours % 1) * 60
+                    remaining_minutes_instrf=[str(int(overall_total_hours)) + " hr and " + str(int(overall_remaining_minutes)) + " min" if int(overall_total_hours) != 0 or int(overall_remaining_minutes) != 0 else '<1 min'][0]
+
+                    individual_df_data = self.get_individual_df_data(upload_throughput,download_throughput,drop_a_per,drop_b_per,signal_list,link_speed_list)
+
+                    # Storing Overall throughput data for all devices and also start time, end time, remaining time and status of test running
+                    individual_df_data.extend([round(sum(download_throughput),2),round(sum(upload_throughput),2),sum(drop_a_per),sum(drop_a_per),iteration+1,timestamp,overall_start_time.strftime("%d/%m %I:%M:%S %p"),overall_end_time.strftime("%d/%m %I:%M:%S %p"),remaining_minutes_instrf,', '.join(str(n) for n in incremental_capacity_list),'Running'])
+                    self.append_tick_row(tick_rows,individual_df.columns,individual_df_data,csv_path)
+
+            upload_throughput,download_throughput,drop_a_per,drop_b_per = self.get_tick_values(samples)
+            signal_list,channel_list,mode_list,link_speed_list=self.get_signal_and_channel_data(self.input_devices_list)
+        finally:
+            executor.shutdown(wait=False)
 
         # Storing individual device throughput data(download, upload, Rx % drop A, Rx % drop B) to dataframe after test stopped
-        for i in range(len(download_throughput)):
-            individual_df_data.extend([download_throughput[i],upload_throughput[i],drop_a_per[i],drop_b_per[i],int(signal_list[i]),link_speed_list[i]])
+        individual_df_data = self.get_individual_df_data(upload_throughput,download_throughput,drop_a_per,drop_b_per,signal_list,link_speed_list)
         timestamp=datetime.now().strftime("%d/%m %I:%M:%S %p") 
 
 
@@ -837,8 +842,19 @@ class Throughput(Realm):
         
         # Otherwise, append metrics and 'Stopped' status with overall end time
         else:
+            overall_time_difference=abs(overall_end_time-datetime.now())
+            overall_total_hours=overall_time_difference.total_seconds() / 3600
+            overall_remaining_minutes=(overall_total_hours % 1) * 60
+            remaining_minutes_instrf=[str(int(overall_total_hours)) + " hr and " + str(int(overall_remaining_minutes)) + " min" if int(overall_total_hours) != 0 or int(overall_remaining_minutes) != 0 else '<1 min'][0]
             individual_df_data.extend([round(sum(download_throughput),2),round(sum(upload_throughput),2),sum(drop_a_per),sum(drop_a_per),iteration+1,timestamp,overall_start_time.strftime("%d/%m %I:%M:%S %p"),overall_end_time.strftime("%d/%m %I:%M:%S %p"),remaining_minutes_instrf,', '.join(str(n) for n in incremental_capacity_list),'Stopped'])          
-        individual_df.loc[len(individual_df)]=individual_df_data
+        tick_rows.append_row(dict(zip(individual_df.columns,individual_df_data)))
+
+        # Rows of this call appended to the rows of the earlier iterations
+        if individual_df.empty:
+            individual_df = tick_rows.to_pandas()
+        else:
+            individual_df = pd.concat([individual_df, tick_rows.to_pandas()], ignore_index=True)
+        tick_rows.close()
 
         # Save individual_df to CSV based on web GUI status
         if self.dowebgui :
@@ -847,20 +863,47 @@ class Throughput(Realm):
         else:
             individual_df.to_csv('throughput_data.csv', index=False)
 
-        keys = list(connections_upload.keys())
-        keys = list(connections_download.keys())
-
         for i in range(len(download_throughput)):
-            connections_download.update({keys[i]: float(f"{(download_throughput[i] ):.2f}")})
+            connections_download.update({cx_names[i]: float(f"{(download_throughput[i] ):.2f}")})
         for i in range(len(upload_throughput)):
-            connections_upload.update({keys[i]: float(f"{(upload_throughput[i] ):.2f}")})
+            connections_upload.update({cx_names[i]: float(f"{(upload_throughput[i] ):.2f}")})
 
         logger.info("connections download {}".format(connections_download))
         logger.info("connections upload {}".format(connections_upload))
+        logger.info("connections average/min/max over the iteration {}".format(self.get_monitor_stats()))
 
 
         return individual_df,test_stopped_by_user
 
+    def get_tick_values(self,samples):
+        """
+        Returns the upload and download (Mbps) and rx drop % lists reported for one tick of samples.
+
+        """
+        upload_throughput = [float(f"{(bps / 1000000): .2f}") for bps in samples[:, 1]]
+        download_throughput = [float(f"{(bps / 1000000): .2f}") for bps in samples[:, 0]]
+        drop_a_per = [float(round(drop, 2)) for drop in samples[:, 2]]
+        drop_b_per = [float(round(drop, 2)) for drop in samples[:, 3]]
+        return upload_throughput,download_throughput,drop_a_per,drop_b_per
+
+    def get_individual_df_data(self,upload_throughput,download_throughput,drop_a_per,drop_b_per,signal_list,link_speed_list):
+        """
+        Returns the per device part of a throughput_data row: download, upload, Rx % drop A, Rx % drop B, RSSI and link speed.
+
+        """
+        individual_df_data=[]
+        for i in range(len(download_throughput)):
+            individual_df_data.extend([download_throughput[i],upload_throughput[i],drop_a_per[i],drop_b_per[i],int(signal_list[i]),link_speed_list[i]])
+        return individual_df_data
+
+    def append_tick_row(self,tick_rows,columns,individual_df_data,csv_path):
+        """
+        Stores one row in the monitor table and appends it to the csv file.
+
+        """
+        tick_rows.append_row(dict(zip(columns,individual_df_data)))
+        pd.DataFrame([individual_df_data],columns=columns).to_csv(csv_path,mode='a',header=False,index=False)
+
     def perform_intended_load(self,iteration,incremental_capacity_list):
         """
         Configures the intended load for each connection endpoint based on the provided iteration and incremental capacity.
@@ -1998,6 +2041,7 @@ Copyright 2023 Candela Technologies Inc.
 
             # Monitor throughput and capture all dataframes and test stop status
             all_dataframes,test_stopped_by_user = throughput.monitor(i,individual_df,device_names,incremental_capacity_list,overall_start_time,overall_end_time)
+            individual_df = all_dataframes
             
             # Check if the test was stopped by the user
             if test_stopped_by_user==False:
@@ -147,43 +147,32 @@ class VideoStreamingTest(Realm):
     def run(self):
         # Checks various configuration things on Interop tab, Uses lf_base_interop_profile.py library
         self.adb_device_list = self.interop.check_sdk_release()
-        for i in self.adb_device_list:
-            self.device_name.append(self.interop.get_device_details(device=i, query="user-name"))
+        user_names = self.interop.get_device_details(device=self.adb_device_list, query="user-name")
+        self.device_name.extend(user_names[i] for i in self.adb_device_list)
         logging.info(self.device_name)
 
 
         self.interop.stop()
-        for i in self.adb_device_list:
-            self.interop.batch_modify_apply(i)
-            time.sleep(5)
         self.interop.set_user_name(device=self.adb_device_list)
+        self.interop.batch_modify_apply(self.adb_device_list)
+        time.sleep(5)
 
-        for i in self.adb_device_list:
-            self.utility.forget_netwrk(i)
+        self.utility.forget_netwrk(self.adb_device_list)
 
         health = dict.fromkeys(self.adb_device_list)
-        # Getting Health for each device
+        # Getting Health for all devices at once
+        dev_states = self.utility.get_device_state(device=self.adb_device_list)
+        connected = [i for i in self.adb_device_list if dev_states[i] == "COMPLETED,"]
+        ssids = self.utility.get_device_ssid(device=connected)
+        expected = [i for i in connected if ssids[i] == self.ssid]
+        health.update(self.utility.get_wifi_health_monitor(device=expected, ssid=self.ssid))
         for i in self.adb_device_list:
-            # post = self.utility.post_adb_(device=i,cmd="shell ip addr show wlan0  | grep 'inet ' | cut -d ' ' -f 6 | cut -d / -f 1")
-            # print("POST IP ", post)
-            dev_state = self.utility.get_device_state(device=i)
-            logging.info("Device State : {dev_state}".format(dev_state = dev_state))
-
-            logging.info("device state" + dev_state)
-            if dev_state == "COMPLETED,":
-                logging.info("phone is in connected state")
-                logging.info("phone is in connected state")
-                ssid = self.utility.get_device_ssid(device=i)
-                if ssid == self.ssid:
-                    logging.info("device is connected to expected ssid")
-                    logging.info("device is connected to expected ssid")
-                    health[i] = self.utility.get_wifi_health_monitor(device=i, ssid=self.ssid)
-                    logging.info("health health:: ", health)
-                    logging.info("Launching Interop UI")
-                    logging.info("health :: {health}".format(health = health))
-                    logging.info("Launching Interop UI")
-
-                    self.interop.launch_interop_ui(device=i)
+            logging.info("Device State : {dev_state}".format(dev_state = dev_states[i]))
+            if i in expected:
+                logging.info("device {device} is connected to expected ssid".format(device = i))
+                logging.info("Launching Interop UI")
+                self.interop.launch_interop_ui(device=i)
+        logging.info("health :: {health}".format(health = health))
         self.health = health
         logging.info("Health:: ", health)
 
@@ -10,6 +10,9 @@ SETUP: This script requires pyshark and tshark to be installed before
 EXAMPLE:
 see: /py-scritps/lf_pcap_test.py for example
 
+    Several filters or checks on the same pcap can be read in one tshark pass with LfPcapAnalyzer,
+    LfPcap.analyze_pcap() or LfPcap.prefetch_pcap(), results are cached next to the pcap.
+
 COPYRIGHT:
     Copyright 2021 Candela Technologies Inc
     License: Free to distribute and modify. LANforge systems must be licensed.
@@ -17,8 +20,12 @@ COPYRIGHT:
 INCLUDE_IN_README
 """
 import os
+import re
 import sys
+import json
+import hashlib
 import argparse
+import subprocess
 import time
 import pyshark as ps
 import importlib
@@ -36,6 +43,246 @@ cv_test_reports = importlib.import_module("py-json.cv_test_reports")
 lf_report = cv_test_reports.lanforge_reports
 
 
+# tokens of a wireshark display filter: quoted strings, operators, parentheses and words (fields, keywords, values)
+FILTER_TOKEN = re.compile(r'\s*("(?:[^"\\]|\\.)*"|&&|\|\||==|!=|>=|<=|[()!<>]|[^\s()!=<>&|"]+)')
+FILTER_COMPARE = {'==': '==', 'eq': '==', '!=': '!=', 'ne': '!=', '>': '>', 'gt': '>', '<': '<', 'lt': '<',
+                  '>=': '>=', 'ge': '>=', '<=': '<=', 'le': '<=', 'contains': 'contains'}
+# fields every analyzed packet carries
+PCAP_FRAME_FIELDS = ['frame.number', 'frame.time_relative', 'frame.time', 'frame.protocols']
+
+
+def filter_value(value):
+    value = str(value).strip('"').lower()
+    if value in ['true', 'false']:
+        return int(value == 'true')
+    try:
+        return int(value, 0)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+class PcapDisplayFilter:
+    """
+    Evaluates the subset of wireshark display filters used by the pcap checks against the -T fields output of tshark:
+    field presence, == != > < >= <= contains (and the eq ne gt lt ge le forms), && || ! (and, or, not) and parentheses.
+    """
+    def __init__(self, display_filter):
+        self.display_filter = display_filter
+        self.fields = []
+        self.tokens = FILTER_TOKEN.findall(display_filter)
+        self.position = 0
+        self.match = self.parse_or()
+        if self.position != len(self.tokens):
+            raise ValueError("cannot parse display filter: %s" % display_filter)
+
+    def next_token(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self):
+        self.position += 1
+        return self.tokens[self.position - 1]
+
+    def parse_or(self):
+        terms = [self.parse_and()]
+        while self.next_token() in ['||', 'or']:
+            self.take()
+            terms.append(self.parse_and())
+        return terms[0] if len(terms) == 1 else lambda packet: any(term(packet) for term in terms)
+
+    def parse_and(self):
+        terms = [self.parse_not()]
+        while self.next_token() in ['&&', 'and']:
+            self.take()
+            terms.append(self.parse_not())
+        return terms[0] if len(terms) == 1 else lambda packet: all(term(packet) for term in terms)
+
+    def parse_not(self):
+        if self.next_token() in ['!', 'not']:
+            self.take()
+            term = self.parse_not()
+            return lambda packet: not term(packet)
+        return self.parse_primary()
+
+    def parse_primary(self):
+        token = self.next_token()
+        if token is None:
+            raise ValueError("cannot parse display filter: %s" % self.display_filter)
+        if token == '(':
+            self.take()
+            term = self.parse_or()
+            if self.next_token() != ')':
+                raise ValueError("unbalanced parentheses in display filter: %s" % self.display_filter)
+            self.take()
+            return term
+        field = self.take()
+        if field not in self.fields:
+            self.fields.append(field)
+        if self.next_token() not in FILTER_COMPARE:
+            return lambda packet: bool(packet.get(field)) or field in packet['frame.protocols']
+        operator = FILTER_COMPARE[self.take()]
+        if self.next_token() is None:
+            raise ValueError("missing value in display filter: %s" % self.display_filter)
+        value = filter_value(self.take())
+        return lambda packet: self.compare(packet.get(field), operator, value)
+
+    @staticmethod
+    def compare(values, operator, value):
+        if not values:
+            return False
+        values = [filter_value(item) for item in values]
+        if operator == '!=':
+            return all(item != value for item in values)
+        for item in values:
+            try:
+                if ((operator == '==' and item == value) or
+                        (operator == '>' and item > value) or
+                        (operator == '<' and item < value) or
+                        (operator == '>=' and item >= value) or
+                        (operator == '<=' and item <= value) or
+                        (operator == 'contains' and str(value) in str(item))):
+                    return True
+            except TypeError:
+                continue
+        return False
+
+
+class LfPcapAnalyzer:
+    """
+    Reads a pcap once for any number of named display filters. tshark is run a single time with the filters or-ed
+    together and prints only the fields the filters reference plus the fields asked for, every printed packet is
+    then matched against each filter.
+    Results are cached in cache_dir (default .lf_pcap_cache next to the pcap) keyed by the pcap content hash and the
+    filter set, so analyzing the same pcap again does not run tshark.
+
+    analyzer = LfPcapAnalyzer("roam.pcap")
+    analyzer.add_filter("reasso", "wlan.fc.type_subtype == 3", fields=["wlan.fixed.status_code"])
+    analyzer.add_filter("action", "wlan.fixed.category_code == 6", max_packets=1)
+    results = analyzer.run()  # {"reasso": [{"frame.time_relative": ..., "wlan.fixed.status_code": ...}, ...], ...}
+    """
+    def __init__(self, pcap_file, cache_dir=None, tshark="tshark"):
+        self.pcap_file = pcap_file
+        self.cache_dir = cache_dir
+        self.tshark = tshark
+        self.filters = {}
+
+    # max_packets: stop collecting packets for this filter after that many, None keeps all
+    def add_filter(self, name, display_filter, fields=None, max_packets=None):
+        self.filters[name] = {'filter': display_filter,
+                              'fields': list(fields or []),
+                              'max_packets': max_packets}
+        return self
+
+    def pcap_hash(self):
+        sha = hashlib.sha256()
+        with open(self.pcap_file, 'rb') as pcap:
+            for chunk in iter(lambda: pcap.read(1 << 20), b''):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def cache_file(self):
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            cache_dir = os.path.join(os.path.dirname(os.path.abspath(self.pcap_file)), '.lf_pcap_cache')
+        filter_hash = hashlib.sha256(json.dumps(self.filters, sort_keys=True).encode()).hexdigest()
+        return os.path.join(cache_dir, "%s-%s.json" % (self.pcap_hash()[:24], filter_hash[:24]))
+
+    def run(self, use_cache=True):
+        if not self.filters:
+            return {}
+        cache_file = self.cache_file() if use_cache else None
+        if cache_file and os.path.exists(cache_file):
+            with open(cache_file, 'r') as cached:
+                return json.load(cached)
+        results = self.read_pcap()
+        if cache_file:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file + '.tmp', 'w') as cached:
+                json.dump(results, cached)
+            os.replace(cache_file + '.tmp', cache_file)
+        return results
+
+    def read_pcap(self):
+        display_filters = {name: PcapDisplayFilter(spec['filter']) for name, spec in self.filters.items()}
+        fields = list(PCAP_FRAME_FIELDS)
+        for name, spec in self.filters.items():
+            for field in display_filters[name].fields + spec['fields']:
+                if field not in fields:
+                    fields.append(field)
+        command = [self.tshark, '-r', self.pcap_file, '-n',
+                   '-Y', ' || '.join('(%s)' % spec['filter'] for spec in self.filters.values()),
+                   '-T', 'fields', '-E', 'separator=/t', '-E', 'occurrence=a', '-E', 'aggregator=\x1f',
+                   '-E', 'quote=n']
+        for field in fields:
+            command += ['-e', field]
+
+        results = {name: [] for name in self.filters}
+        pending = set(self.filters)
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+        try:
+            for line in process.stdout:
+                values = line.rstrip('\n').split('\t')
+                packet = {field: [item for item in value.split('\x1f') if item] for field, value in zip(fields, values)}
+                packet['frame.protocols'] = ':'.join(packet.get('frame.protocols', [])).split(':')
+                for name in list(pending):
+                    if display_filters[name].match(packet):
+                        spec = self.filters[name]
+                        results[name].append({field: (packet.get(field) or [None])[0]
+                                              for field in PCAP_FRAME_FIELDS[:-1] + spec['fields']})
+                        results[name][-1]['frame.protocols'] = ':'.join(packet['frame.protocols'])
+                        if spec['max_packets'] is not None and len(results[name]) >= spec['max_packets']:
+                            pending.discard(name)
+                if not pending:
+                    process.kill()
+                    break
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            returncode = process.wait()
+        if pending and returncode != 0:
+            raise RuntimeError("tshark failed reading %s: %s" % (self.pcap_file, stderr.strip()))
+        return results
+
+
+# text of a 0/1 capability bit the way the check_he_capability_* methods report it
+def he_capability_text(value):
+    if str(filter_value(value)) == '0':
+        return "HE SU PPDU & HE MU PPDU w 4x HE-LTF & 0.8us GI: Not Supported"
+    if str(filter_value(value)) == '1':
+        return "HE SU PPDU & HE MU PPDU w 4x HE-LTF & 0.8us GI: Supported"
+    return str(value)
+
+
+# checks LfPcap.analyze_pcap() runs in one pass: display filter, field reported and the text the check_* method returns
+PCAP_CHECKS = {
+    'group_id_mgmt': ('wlan.mgt && wlan.vht.group_id_management', 'wlan.vht.group_id_management',
+                      lambda value: "Group ID Management: %s" % value),
+    'beamformee_association_request': ('wlan.vht.capabilities.mubeamformee == 1 &&  wlan.fc.type_subtype == 0',
+                                       'wlan.vht.capabilities.mubeamformee', lambda value: str(filter_value(value))),
+    'beamformer_association_response': ('wlan.vht.capabilities.mubeamformer == 1 &&  wlan.fc.type_subtype == 1',
+                                        'wlan.vht.capabilities.mubeamformer', lambda value: str(filter_value(value))),
+    'beamformer_beacon_frame': ('wlan.vht.capabilities.mubeamformer == 1 && wlan.fc.type_subtype == 8',
+                                'wlan.vht.capabilities.mubeamformer', lambda value: str(filter_value(value))),
+    'beamformer_probe_response': ('wlan.vht.capabilities.mubeamformer == 1 && wlan.fc.type_subtype==5',
+                                  'wlan.vht.capabilities.mubeamformer', lambda value: str(filter_value(value))),
+    'he_capability_beacon_frame': ('wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi == 1 && wlan.fc.type_subtype == 8',
+                                   'wlan.ext_tag.he_phy_cap.he_su_ppdu_with_1x_he_ltf_08us', he_capability_text),
+    'he_capability_probe_request': ('wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi == 1 && wlan.fc.type_subtype == 4',
+                                    'wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi', he_capability_text),
+    'he_capability_probe_response': ('wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi == 1 && wlan.fc.type_subtype == 5',
+                                     'wlan.ext_tag.he_phy_cap.he_su_ppdu_with_1x_he_ltf_08us', he_capability_text),
+    'he_capability_association_request': ('wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi == 1 && wlan.fc.type_subtype == 0',
+                                          'wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi', he_capability_text),
+    'he_capability_association_response': ('wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi == 1 && wlan.fc.type_subtype == 1',
+                                           'wlan.ext_tag.he_phy_cap.he_su_ppdu_etc_gi', he_capability_text),
+    'he_guard_interval': ('radiotap.he.data_5.gi', 'radiotap.he.data_5.gi', lambda value: "GI: %sus" % value),
+}
+
+
 class LfPcap(Realm):
     def __init__(self,
                  host="localhost", port=8080,
@@ -64,6 +311,8 @@ class LfPcap(Realm):
         self.live_cap_timeout = _live_cap_timeout
         self.remote_cap_host = _live_remote_cap_host
         self.remote_cap_interface = _live_remote_cap_interface
+        # packets of the filters read by prefetch_pcap(), keyed by filter_key()
+        self.pcap_results = {}
         # self.wifi_monitor = WiFiMonitor(self.lfclient_url, local_realm=self, debug_=self.debug)
 
     def read_pcap(self, pcap_file, apply_filter=None):
@@ -76,8 +325,68 @@ class LfPcap(Realm):
             raise error
         return self.pcap
 
+    # pcap and filter text identifying prefetched packets, spacing differences in the filter do not matter
+    @staticmethod
+    def filter_key(pcap_file, display_filter):
+        return os.path.abspath(str(pcap_file)), ' '.join(str(display_filter).split())
+
+    def prefetch_pcap(self, pcap_file, filters, cache_dir=None):
+        """
+        Reads the packets of all filters from pcap_file in one tshark pass. read_time, read_arrival_time,
+        get_wlan_mgt_status_code and check_frame_present then answer these filters without reading the pcap again.
+        When tshark cannot analyze the pcap nothing is prefetched and those methods read the pcap per call.
+        """
+        analyzer = LfPcapAnalyzer(pcap_file=str(pcap_file), cache_dir=cache_dir)
+        for display_filter in filters:
+            analyzer.add_filter(self.filter_key(pcap_file, display_filter)[1], display_filter,
+                                fields=['wlan.fixed.status_code'])
+        try:
+            results = analyzer.run()
+        except (OSError, RuntimeError, ValueError) as error:
+            print("pcap prefetch failed, filters will be read one by one: %s" % error)
+            return False
+        for display_filter in filters:
+            key = self.filter_key(pcap_file, display_filter)
+            self.pcap_results[key] = results[key[1]]
+        return True
+
+    # prefetched packets of a filter, None when the filter was not prefetched for this pcap
+    def get_prefetched(self, pcap_file, display_filter):
+        return self.pcap_results.get(self.filter_key(pcap_file, display_filter))
+
+    def analyze_pcap(self, pcap_file, checks=None, cache_dir=None):
+        """
+        Runs the named PCAP_CHECKS (all of them by default) on pcap_file in one pass and returns {check: text},
+        text being what the check_<name> method returns. Falls back to calling the check_<name> methods one by one
+        when tshark cannot analyze the pcap.
+        """
+        if checks is None:
+            checks = list(PCAP_CHECKS)
+        analyzer = LfPcapAnalyzer(pcap_file=str(pcap_file), cache_dir=cache_dir)
+        for check in checks:
+            display_filter, field, text = PCAP_CHECKS[check]
+            analyzer.add_filter(check, display_filter, fields=[field], max_packets=1)
+        try:
+            results = analyzer.run()
+        except (OSError, RuntimeError, ValueError) as error:
+            print("pcap analysis failed, running the checks one by one: %s" % error)
+            return {check: getattr(self, 'check_' + check)(pcap_file) for check in checks}
+        report = {}
+        for check in checks:
+            display_filter, field, text = PCAP_CHECKS[check]
+            values = [packet[field] for packet in results[check] if packet[field] is not None]
+            report[check] = text(values[0]) if values else "Packet Not Found"
+        return report
+
     def read_time(self, pcap_file,
                   filter='(wlan.fc.type_subtype==3 && wlan.tag.number==55) && (wlan.da == 04:f0:21:9f:c1:69)'):
+        packets = self.get_prefetched(pcap_file, filter)
+        if packets is not None:
+            if not packets:
+                return None
+            data = round(float(packets[0]['frame.time_relative']), 4) * 1000
+            print(data)
+            return data
         try:
             if pcap_file is not None:
                 cap = self.read_pcap(pcap_file=pcap_file, apply_filter=filter)
@@ -141,6 +450,14 @@ class LfPcap(Realm):
     def get_wlan_mgt_status_code(self, pcap_file, filter='wlan.fc.type_subtype==3 && wlan.tag.number==55'):
         """ To get status code of each packet in WLAN MGT Layer """
         print("pcap file path:  %s" % pcap_file)
+        packets = self.get_prefetched(pcap_file, filter)
+        if packets is not None:
+            mgt_packets = [packet for packet in packets if 'wlan.mgt' in packet['frame.protocols'].split(':')]
+            print("Total Packets: ", len(mgt_packets))
+            if not mgt_packets:
+                return "empty"
+            value = mgt_packets[-1]['wlan.fixed.status_code']
+            return 'Successful' if value is not None and filter_value(value) == 0 else 'failed'
         try:
             if pcap_file is not None:
                 cap = self.read_pcap(pcap_file=pcap_file, apply_filter=filter)
@@ -474,6 +791,11 @@ class LfPcap(Realm):
     def check_frame_present(self, pcap_file, filter='(wlan.fixed.category_code == 6)'):
         """ To get status code of each packet in WLAN MGT Layer """
         print("pcap file path:  %s" % pcap_file)
+        packets = self.get_prefetched(pcap_file, filter)
+        if packets is not None:
+            packet_count = len([packet for packet in packets if 'wlan.mgt' in packet['frame.protocols'].split(':')])
+            print("Total Packets: ", packet_count)
+            return "empty" if packet_count == 0 else "present"
         try:
             if pcap_file is not None:
                 cap = self.read_pcap(pcap_file=pcap_file, apply_filter=filter)
@@ -493,6 +815,9 @@ class LfPcap(Realm):
 
     def read_arrival_time(self, pcap_file,
                           filter='(wlan.fc.type_subtype==3 && wlan.tag.number==55) && (wlan.da == 04:f0:21:9f:c1:69)'):
+        packets = self.get_prefetched(pcap_file, filter)
+        if packets is not None:
+            return packets[0]['frame.time'] if packets else None
         try:
             if pcap_file is not None:
                 cap = self.read_pcap(pcap_file=pcap_file, apply_filter=filter)
@@ -22,10 +22,17 @@ LICENSE:
     Copyright 2021 Candela Technologies Inc
 
 
+Large reports can be streamed: with _stream_html=True sections are spooled to disk as they are built
+instead of growing one html string, _table_max_rows limits the rows rendered per table (the full table is
+written next to the report as csv and linked), and _pdf_workers > 1 renders the pdf in chunks in parallel
+(merging the chunks needs the optional pypdf package, otherwise the pdf is rendered in one pass).
+test_l3.py and test_l3_longevity.py stream and use lf_report.Default_Table_Max_Rows.
+
 INCLUDE_IN_README
 """
 # CAUTION: adding imports to this file which are not in update_dependencies.py is not advised
 import os
+import re
 import sys
 import shutil
 import datetime
@@ -41,6 +48,12 @@ from matplotlib import pyplot as plt
 import platform
 import subprocess
 from psutil import TimeoutExpired
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from pypdf import PdfWriter
+except ImportError:
+    PdfWriter = None
 
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../")))
@@ -56,6 +69,9 @@ os_name = platform.system()
 # base report class
 
 class lf_report:
+    # rows per table for reports with large tables, such as test_l3 and test_l3_longevity
+    Default_Table_Max_Rows = 1000
+
     def __init__(self,
                  # _path the report directory under which the report directories will be created.
                  _path="/home/lanforge/html-reports",
@@ -73,7 +89,10 @@ class lf_report:
                  _dataframe="",
                  _path_date_time="",
                  _custom_css='custom-example.css',
-                 _allure_report_dir_name="allure-report"):  # this is where the final report is placed.
+                 _allure_report_dir_name="allure-report",  # this is where the final report is placed.
+                 _stream_html=False,  # spool finished sections to disk instead of keeping the whole html in memory
+                 _table_max_rows=0,  # rows rendered per table, 0 renders all rows
+                 _pdf_workers=1):  # wkhtmltopdf processes used to render the pdf
         # other report paths,
 
         # _path is where the directory with the data time will be created
@@ -143,6 +162,15 @@ class lf_report:
         self.date_time_directory = ""
         self.log_directory = ""
 
+        # streaming: sections already written to html_section_dir, in report order
+        self.stream_html = _stream_html
+        self.html_sections = []
+        self.html_section_dir = ""
+        self.table_max_rows = _table_max_rows
+        self.table_csv_count = 0
+        self.table_csv_link_html = ""
+        self.pdf_workers = _pdf_workers
+
         self.banner_directory = "artifacts"
         self.banner_file_name = "banner.png"  # does this need to be configurable
         self.logo_directory = "artifacts"
@@ -371,9 +399,7 @@ class lf_report:
         self.write_output_html = str(self.path_date_time) + '/' + str(self.output_html)
         logger.info("write_output_html: {}".format(self.write_output_html))
         try:
-            test_file = open(self.write_output_html, "w")
-            test_file.write(self.html)
-            test_file.close()
+            self.write_html_file(self.write_output_html)
         except Exception as x:
             traceback.print_exception(Exception, x, x.__traceback__, chain=True)
             logger.info("write_html failed")
@@ -389,9 +415,7 @@ class lf_report:
         self.write_output_index_html = str(self.path_date_time) + '/' + str("readme.html")
         logger.info("write_output_index_html: {}".format(self.write_output_index_html))
         try:
-            test_file = open(self.write_output_index_html, "w")
-            test_file.write(self.html)
-            test_file.close()
+            self.write_html_file(self.write_output_index_html)
         except Exception as x:
             traceback.print_exception(Exception, x, x.__traceback__, chain=True)
             logger.info("write_index_html failed")
@@ -406,14 +430,59 @@ class lf_report:
         self.write_output_html = "{}/{}-{}".format(self.path_date_time, self.date, self.output_html)
         logger.info("write_output_html: {}".format(self.write_output_html))
         try:
-            test_file = open(self.write_output_html, "w")
-            test_file.write(self.html)
-            test_file.close()
+            self.write_html_file(self.write_output_html)
         except Exception as x:
             traceback.print_exception(Exception, x, x.__traceback__, chain=True)
             logger.warning("write_html failed")
         return self.write_output_html
 
+    # write the spooled sections followed by the html not yet flushed
+    # once merged, the sections are read back from output_file and the spool directory is removed
+    def write_html_file(self, output_file):
+        self.flush_html()
+        if not self.html_sections:
+            with open(output_file, "w") as test_file:
+                test_file.write(self.html)
+            return
+        # merge through a temporary file, output_file may hold sections of an earlier write
+        merged_file = output_file + ".tmp"
+        merged_sections = []
+        with open(merged_file, "wb") as test_file:
+            for section in self.html_sections:
+                offset = test_file.tell()
+                self.copy_section(section, test_file)
+                merged_sections.append((output_file, offset, test_file.tell() - offset))
+        os.replace(merged_file, output_file)
+        self.html_sections = merged_sections
+        if self.html_section_dir:
+            shutil.rmtree(self.html_section_dir, ignore_errors=True)
+            self.html_section_dir = ""
+
+    # copy a section, a spooled section file or an (html file, offset, length) range, to the binary out_file
+    @staticmethod
+    def copy_section(section, out_file):
+        if isinstance(section, str):
+            with open(section, "rb") as section_file:
+                shutil.copyfileobj(section_file, out_file)
+            return
+        (html_file, offset, length) = section
+        with open(html_file, "rb") as section_file:
+            section_file.seek(offset)
+            out_file.write(section_file.read(length))
+
+    # streaming: move the html built so far to the next section file, nothing to do otherwise
+    def flush_html(self):
+        if not self.stream_html or not self.html:
+            return
+        if not self.html_section_dir:
+            self.html_section_dir = os.path.join(str(self.path_date_time), "report_sections")
+            os.makedirs(self.html_section_dir, exist_ok=True)
+        section = os.path.join(self.html_section_dir, "section-{:05d}.html".format(len(self.html_sections)))
+        with open(section, "w") as section_file:
+            section_file.write(self.html)
+        self.html_sections.append(section)
+        self.html = ""
+
     # will put the set here
     def set_allure_environment_properties(self,allure_environment_properties=""):
         self.allure_environment_properties = allure_environment_properties
@@ -581,12 +650,11 @@ class lf_report:
                    'orientation': _orientation,
                    'page-size': _page_size}  # prevent error Blocked access to file
         self.write_output_pdf = str(self.path_date_time) + '/' + str(self.output_pdf)
+        config = None
         if (os_name == "Windows"):
             path_to_wkhtmltopdf = r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe'
             config = pdfkit.configuration(wkhtmltopdf=path_to_wkhtmltopdf)
-            pdfkit.from_file(self.write_output_html, self.write_output_pdf, options=options, configuration=config)
-        else:
-            pdfkit.from_file(self.write_output_html, self.write_output_pdf, options=options)
+        self.render_pdf(options=options, configuration=config)
 
     # https://wkhtmltopdf.org/usage/wkhtmltopdf.txt
     # page_size A4, A3, Letter, Legal
@@ -602,7 +670,44 @@ class lf_report:
                    'orientation': _orientation,
                    'page-size': _page_size}  # prevent error Blocked access to file
         self.write_output_pdf = "{}/{}-{}".format(self.path_date_time, self.date, self.output_pdf)
-        pdfkit.from_file(self.write_output_html, self.write_output_pdf, options=options)
+        self.render_pdf(options=options)
+
+    # render write_output_html to write_output_pdf, in parallel chunks when pdf_workers > 1 and pypdf can merge them
+    def render_pdf(self, options, configuration=None):
+        self.flush_html()
+        if self.pdf_workers <= 1 or len(self.html_sections) < 2:
+            pdfkit.from_file(self.write_output_html, self.write_output_pdf, options=options, configuration=configuration)
+            return
+        if PdfWriter is None:
+            logger.info("pypdf not installed, rendering the pdf in one pass 'pip install pypdf'")
+            pdfkit.from_file(self.write_output_html, self.write_output_pdf, options=options, configuration=configuration)
+            return
+
+        # consecutive sections are grouped in one html file per worker, next to the report so relative links resolve
+        chunk_size = -(-len(self.html_sections) // self.pdf_workers)
+        chunks = [self.html_sections[i:i + chunk_size] for i in range(0, len(self.html_sections), chunk_size)]
+        chunk_files = []
+        for index, chunk in enumerate(chunks):
+            chunk_html = "{}/.{}-part-{:03d}.html".format(self.path_date_time, self.output_pdf, index)
+            with open(chunk_html, "wb") as chunk_file:
+                if index:
+                    chunk_file.write("<!DOCTYPE html>\n<html lang='en'>\n{}\n<body>\n".format(
+                        self.get_html_head(title=self.title)).encode())
+                for section in chunk:
+                    self.copy_section(section, chunk_file)
+            chunk_files.append((chunk_html, chunk_html[:-len(".html")] + ".pdf"))
+
+        with ThreadPoolExecutor(max_workers=self.pdf_workers) as executor:
+            list(executor.map(lambda files: pdfkit.from_file(files[0], files[1], options=options,
+                                                             configuration=configuration), chunk_files))
+        writer = PdfWriter()
+        for chunk_html, chunk_pdf in chunk_files:
+            writer.append(chunk_pdf)
+        with open(self.write_output_pdf, "wb") as pdf_file:
+            writer.write(pdf_file)
+        for chunk_html, chunk_pdf in chunk_files:
+            os.remove(chunk_html)
+            os.remove(chunk_pdf)
 
     def get_pdf_path(self):
         pdf_link_path = "{}/{}-{}".format(self.path_date_time, self.date, self.output_pdf)
@@ -786,15 +891,34 @@ class lf_report:
                 return highlight_fail
 
     def build_table(self):
-        self.dataframe_html = self.dataframe.to_html(index=False,
-                                                     justify='center')  # have the index be able to be passed in.
+        self.dataframe_html = self.get_table_page().to_html(index=False,
+                                                            justify='center')  # have the index be able to be passed in.
         self.html += self.dataframe_html
+        self.html += self.table_csv_link_html
+        self.flush_html()
 
     def pass_failed_build_table(self):
-        self.dataframe_html = self.dataframe.style.hide_index(subset=None, level=None, names=False).applymap \
+        self.dataframe_html = self.get_table_page().style.hide_index(subset=None, level=None, names=False).applymap \
             (self.pass_fail_background).to_html(index=False,
                                                 justify='center')  # have the index be able to be passed in.
         self.html += self.dataframe_html
+        self.html += self.table_csv_link_html
+        self.flush_html()
+
+    # rows of self.dataframe to render, tables longer than table_max_rows are saved as csv and linked below the table
+    def get_table_page(self):
+        self.table_csv_link_html = ""
+        if not self.table_max_rows or len(self.dataframe) <= self.table_max_rows:
+            return self.dataframe
+        self.table_csv_count += 1
+        csv_name = "table-{:03d}-{}.csv".format(self.table_csv_count,
+                                                re.sub(r'[^A-Za-z0-9]+', '_', str(self.table_title)).strip('_'))
+        self.dataframe.to_csv(os.path.join(str(self.path_date_time), csv_name), index=False)
+        self.table_csv_link_html = """
+            <!-- full table -->
+            <p align='left'>Showing {rows} of {total} rows, full table: <a href="{csv_name}" target="_blank">{csv_name}</a></p>
+        """.format(rows=self.table_max_rows, total=len(self.dataframe), csv_name=csv_name)
+        return self.dataframe.head(self.table_max_rows)
 
     def save_csv(self, file_name, save_to_csv_data):
         save_to_csv_data.to_csv(str(self.path_date_time) + "/" + file_name)
@@ -955,6 +1079,7 @@ function copyTextToClipboard(ele) {
 
     def end_content_div(self):
         self.html += "\n</div><!-- end contentDiv -->\n"
+        self.flush_html()
 
     def build_chart_title(self, chart_title):
         self.chart_title_html = """
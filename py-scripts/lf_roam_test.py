@@ -117,7 +117,6 @@ import time
 import datetime
 from datetime import datetime
 import pandas as pd
-import paramiko
 from itertools import chain
 import argparse
 
@@ -689,14 +688,12 @@ class HardRoam(Realm):
         name = "kernel_log" + file + ".txt"
         jor_lst.append(name)
         try:
-            ssh = paramiko.SSHClient()
             command = "journalctl --since '5 minutes ago' > kernel_log" + file + ".txt"
-            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-            ssh.connect(hostname=self.lanforge_ip, port=self.lanforge_ssh_port, username="lanforge",
-                        password="lanforge", banner_timeout=600)
+            # same connection the pull below uses
+            ssh = lf_report.get_ssh(hostname=self.lanforge_ip, port=self.lanforge_ssh_port, username="lanforge",
+                                    password="lanforge")
             stdin, stdout, stderr = ssh.exec_command(str(command))
             stdout.readlines()
-            ssh.close()
             kernel_log = "/home/lanforge/kernel_log" + file + ".txt"
             lf_report.pull_reports(hostname=self.lanforge_ip, port=self.lanforge_ssh_port, username="lanforge",
                                    password="lanforge", report_location=kernel_log, report_dir=".")
@@ -711,6 +708,17 @@ class HardRoam(Realm):
         print("Query", query_reasso_response)
         return query_reasso_response
 
+    # pcap filters the roam checks use for each station mac
+    def roam_pcap_filters(self, mac_list):
+        filters = []
+        for mac in mac_list:
+            filters += ["wlan.da eq %s and wlan.fc.type_subtype eq 3" % mac,
+                        "(wlan.fc.type_subtype eq 3 && wlan.fixed.status_code == 0x0000 && wlan.tag.number == 55) && (wlan.da == %s)" % mac,
+                        "(wlan.fixed.category_code == 6)  && (wlan.sa == %s)" % mac,
+                        "(wlan.fixed.auth.alg == 0 &&  wlan.sa == %s)" % mac,
+                        "(wlan.fixed.auth.alg == 2 && wlan.fixed.status_code == 0x0000 && wlan.fixed.auth_seq == 0x0001) && (wlan.sa == %s)" % mac]
+        return filters
+
     # Get attenuator serial number
     def attenuator_serial(self):
         obj = attenuator.AttenuatorSerial(lfclient_host=self.lanforge_ip, lfclient_port=self.lanforge_port)
@@ -1311,6 +1319,9 @@ class HardRoam(Realm):
                                         station_before_ = before_bssid
                                         print("The BSSID of the station before roamed :", station_before_)
                                         logging.info("The BSSID of the station before roamed : " + str(station_before_))
+                                        # Read every roam filter of every station from the pcap in one pass
+                                        self.pcap_obj.prefetch_pcap(pcap_file=str(file_name),
+                                                                    filters=self.roam_pcap_filters(mac_list))
                                         # For each mac address query data from pcap
                                         for i, x in zip(mac_list, range(len(station_before_))):
                                             print("MAC address :", i)
@@ -1354,141 +1354,91 @@ class L3VariableTime(Realm):
         return self.csv_results_file.name
 
     # Find avg latency, jitter for connections using specified port.
-    def get_endp_stats_for_port(self, port_eid, endps):
-        lat = 0
-        jit = 0
-        total_dl_rate = 0
-        total_dl_rate_ll = 0
-        total_dl_pkts_ll = 0
-        dl_rx_drop_percent = 0
-        total_ul_rate = 0
-        total_ul_rate_ll = 0
-        total_ul_pkts_ll = 0
-        ul_rx_drop_percent = 0
-        count = 0
-        sta_name = 'no_station'
-
-        eid = port_eid
-        eid = self.name_to_eid(port_eid)
-        if self.dowebgui != True:
-            logger.info("endp-stats-for-port, port-eid: {}".format(port_eid))
-            logger.debug(
-                "eid: {eid}".format(eid=eid))
-
-        # Convert all eid elements to strings
-        eid[0] = str(eid[0])
-        eid[1] = str(eid[1])
-        eid[2] = str(eid[2])
-
+    @staticmethod
+    def _endp_stat_int(endp, key):
+        value = endp.get(key)
+        if value is None or (isinstance(value, str) and not value.isnumeric()):
+            return 0
+        return int(value)
+
+    def build_endp_stats_index(self, endps):
+        """Aggregate latency, jitter, rx rates and drop % for every port in one pass over endps.
+
+        Endpoints are indexed by the port they use (the shelf.resource.port prefix of the
+        endpoint eid) and by cross-connect name (endpoint name without -A/-B). The result maps
+        shelf.resource.port to the tuple returned by get_endp_stats_for_port.
+        """
+        by_port = {}
+        by_cx = {}
         for endp in endps:
-            # pprint(endp)
-            if self.dowebgui != True:
-                logging.info(pformat(endp))
-            eid_endp = endp["eid"].split(".")
-            logger.debug(
-                "Comparing eid:{eid} to endp-id {eid_endp}".format(eid=eid, eid_endp=eid_endp))
-            # Look through all the endpoints (endps), to find the port the port_eid is using.
-            # The port_eid that has the same Shelf, Resource, and Port as the eid_endp (looking at all the endps)
-            # Then read the eid_endp to get the delay, jitter and rx rate
-            # Note: the endp eid is shelf.resource.port.endp-id, the eid can be treated somewhat as
-            # child class of port-eid , and look up the port the eid is using.
-            if eid[0] == eid_endp[0] and eid[1] == eid_endp[1] and eid[2] == eid_endp[2]:
-                if((endp['delay'] is str and not endp['delay'].isnumeric()) or endp['delay'] is None):
-                    logging.debug('Expected integer response for delay, received non-numeric string instead. Replacing with 0')
-                    lat += 0
-                else:
-                    lat += int(endp['delay'])
-                
-                if((endp['jitter'] is str and not endp['jitter'].isnumeric()) or endp['jitter'] is None):
-                    logging.debug('Expected integer response for jitter, received non-numeric string instead. Replacing with 0')
-                    jit += 0
-                else:
-                    jit += int(endp["jitter"])
-                # lat += int(endp["delay"])
-                # jit += int(endp["jitter"])
-                name = endp["name"]
-                logger.debug("endp name {name}".format(name=name))
-                sta_name = name.replace('-A', '')
-                # only the -A endpoint will be found
-
-                count += 1
-                logger.debug(
-                    "Matched: name: {name} eid:{eid} to endp-id {eid_endp}".format(
-                        name=name, eid=eid, eid_endp=eid_endp))
+            port_key = ".".join(endp["eid"].split(".")[:3])
+            name = endp["name"]
+            port_stats = by_port.setdefault(port_key, [0, 0, 0, None])
+            port_stats[0] += self._endp_stat_int(endp, 'delay')
+            port_stats[1] += self._endp_stat_int(endp, 'jitter')
+            port_stats[2] += 1
+            # the last endpoint found on the port selects which rates are reported
+            port_stats[3] = endp
+            cx_name = name[:-2] if (name.endswith('-A') or name.endswith('-B')) else name
+            by_cx.setdefault(cx_name, []).append(endp)
+
+        endp_stats_index = {}
+        for (port_key, (lat, jit, count, last_endp)) in by_port.items():
+            name = last_endp["name"]
+            if name.endswith('-A'):
+                # station side: both endpoints of its cross-connect
+                cx_endps = by_cx.get(name[:-2], [])
+            elif name.endswith('-B'):
+                cx_endps = [last_endp]
             else:
-                name = endp["name"]
-                logger.debug(
-                    "No Match: name: {name} eid:{eid} to endp-id {eid_endp}".format(
-                        name=name, eid=eid, eid_endp=eid_endp))
-
-        if count > 1:
-            lat = int(lat / count)
-            jit = int(jit / count)
-
-        # need to loop though again to find the upload and download per station
-        # if the name matched
-        for endp in endps:
-            if sta_name in endp["name"]:
-                name = endp["name"]
-                if name.endswith("-A"):
-                    logger.info("name has -A")
-
-                    if (type(endp['rx rate']) == str and not endp['rx rate'].isnumeric()) or endp['rx rate'] is None:
-                        logging.debug('Expected integer response for rx rate, received non-numeric string instead. Replacing with 0')
-                        total_dl_rate += 0
-                    else:
-                        total_dl_rate += int(endp["rx rate"])
-
-                    if (type(endp['rx rate ll']) == str and not endp['rx rate ll'].isnumeric()) or endp['rx rate ll'] is None:
-                        logging.debug('Expected integer response for rx rate ll, received non-numeric string instead. Replacing with 0')
-                        total_dl_rate_ll += 0
-                    else:
-                        total_dl_rate_ll += int(endp["rx rate ll"])
-
-                    if (type(endp['rx pkts ll']) == str and not endp['rx pkts ll'].isnumeric()) or endp['rx pkts ll'] is None:
-                        logging.debug('Expected integer response for rx pkts ll, received non-numeric string instead. Replacing with 0')
-                        total_dl_pkts_ll += 0
-                    else:
-                        total_dl_pkts_ll += int(endp["rx pkts ll"])
-
-                    if (type(endp['rx drop %']) == str and not endp['rx drop %'].isnumeric()) or endp['rx drop %'] is None:
-                        logging.debug('Expected integer response for rx drop %, received non-numeric string instead. Replacing with 0')
-                        dl_tx_drop_percent = 0
-                    else:
-                        dl_tx_drop_percent = round(endp["rx drop %"], 2)
-
+                cx_endps = by_cx.get(name, [])
+            if count > 1:
+                lat = int(lat / count)
+                jit = int(jit / count)
+            total_dl_rate = 0
+            total_dl_rate_ll = 0
+            total_dl_pkts_ll = 0
+            dl_rx_drop_percent = 0
+            total_ul_rate = 0
+            total_ul_rate_ll = 0
+            total_ul_pkts_ll = 0
+            ul_rx_drop_percent = 0
+            for endp in cx_endps:
+                if endp["name"].endswith("-A"):
+                    total_dl_rate += self._endp_stat_int(endp, 'rx rate')
+                    total_dl_rate_ll += self._endp_stat_int(endp, 'rx rate ll')
+                    total_dl_pkts_ll += self._endp_stat_int(endp, 'rx pkts ll')
                 # -B upload side
                 else:
-                    if (type(endp['rx rate']) == str and not endp['rx rate'].isnumeric()) or endp['rx rate'] is None:
-                        logging.debug('Expected integer response for rx rate, received non-numeric string instead. Replacing with 0')
-                        total_ul_rate += 0
-                    else:
-                        total_ul_rate += int(endp["rx rate"])
-
-                    if (type(endp['rx rate ll']) == str and not endp['rx rate ll'].isnumeric()) or endp['rx rate ll'] is None:
-                        logging.debug('Expected integer response for rx rate ll, received non-numeric string instead. Replacing with 0')
-                        total_ul_rate_ll += 0
-                    else:
-                        total_ul_rate_ll += int(endp["rx rate ll"])
-
-                    if (type(endp['rx pkts ll']) == str and not endp['rx pkts ll'].isnumeric()) or endp['rx pkts ll'] is None:
-                        logging.debug('Expected integer response for rx pkts ll, received non-numeric string instead. Replacing with 0')
-                        total_ul_pkts_ll += 0
-                    else:
-                        total_ul_pkts_ll += int(endp["rx pkts ll"])
-
-                    if (type(endp['rx drop %']) == str and not endp['rx drop %'].isnumeric()) or endp['rx drop %'] is None:
-                        logging.debug('Expected integer response for rx drop %, received non-numeric string instead. Replacing with 0')
+                    total_ul_rate += self._endp_stat_int(endp, 'rx rate')
+                    total_ul_rate_ll += self._endp_stat_int(endp, 'rx rate ll')
+                    total_ul_pkts_ll += self._endp_stat_int(endp, 'rx pkts ll')
+                    drop = endp.get('rx drop %')
+                    if drop is None or isinstance(drop, str):
                         ul_rx_drop_percent = 0
                     else:
-                        ul_rx_drop_percent = round(endp["rx drop %"], 2)
-
-                    # total_ul_rate += int(endp["rx rate"])
-                    # total_ul_rate_ll += int(endp["rx rate ll"])
-                    # total_ul_pkts_ll += int(endp["rx pkts ll"])
-                    # ul_rx_drop_percent = round(endp["rx drop %"], 2)
-
-        return lat, jit, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, dl_rx_drop_percent, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, ul_rx_drop_percent
+                        ul_rx_drop_percent = round(drop, 2)
+            endp_stats_index[port_key] = (lat, jit, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, dl_rx_drop_percent,
+                                          total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, ul_rx_drop_percent)
+        logger.debug("endp stats index built for {ports} ports from {endps} endpoints".format(
+            ports=len(endp_stats_index), endps=len(endps)))
+        return endp_stats_index
+
+    def get_endp_stats_for_port(self, port_eid, endps, endp_stats_index=None):
+        """Latency, jitter, rx rates and drop % of the connections using port_eid.
+
+        Pass the index from build_endp_stats_index when looking up many ports from the same
+        sample, otherwise one is built from endps for this call.
+        """
+        if endp_stats_index is None:
+            endp_stats_index = self.build_endp_stats_index(endps)
+        eid = self.name_to_eid(port_eid)
+        if self.dowebgui != True:
+            logger.info("endp-stats-for-port, port-eid: {}".format(port_eid))
+            logger.debug(
+                "eid: {eid}".format(eid=eid))
+        port_key = "{}.{}.{}".format(eid[0], eid[1], eid[2])
+        return endp_stats_index.get(port_key, (0, 0, 0, 0, 0, 0, 0, 0, 0, 0))
 
     # Query all endpoints to generate rx and other stats, returned
     # as an array of objects.
@@ -1736,6 +1686,8 @@ class L3VariableTime(Realm):
                         "Creating stations on radio %s" %
                         (self.radio_name_list[index]))
 
+                    # one profile per radio entry, each with its own ssid, security, mode and flags, and a radio
+                    # may be listed more than once, so StationProfile.create_many() does not apply here
                     station_profile.create(
                         radio=self.radio_name_list[index],
                         sta_names_=self.station_lists[index],
@@ -1980,6 +1932,7 @@ class L3VariableTime(Realm):
 
                         self.epoch_time = int(time.time())
                         endp_rx_map, endp_rx_drop_map, endps, total_dl_bps, total_ul_bps, total_dl_ll_bps, total_ul_ll_bps = self.__get_rx_values()
+                        endp_stats_index = self.build_endp_stats_index(endps)
 
                         log_msg = "main loop, total-dl: {total_dl_bps} total-ul: {total_ul_bps} total-dl-ll: {total_dl_ll_bps}".format(
                             total_dl_bps=total_dl_bps, total_ul_bps=total_ul_bps, total_dl_ll_bps=total_dl_ll_bps)
@@ -2064,7 +2017,7 @@ class L3VariableTime(Realm):
                                         mac)
 
                                     self.get_endp_stats_for_port(
-                                        port_data["port"], endps)
+                                        port_data["port"], endps, endp_stats_index)
 
                                 if tx_dl_mac_found:
                                     if self.dowebgui != True:
@@ -2073,7 +2026,7 @@ class L3VariableTime(Realm):
                                     # Find latency, jitter for connections
                                     # using this port.
                                     latency, jitter, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, ul_rx_drop_percent, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, dl_rx_drop_percent = self.get_endp_stats_for_port(
-                                        port_data["port"], endps)
+                                        port_data["port"], endps, endp_stats_index)
 
                                     ap_row_tx_dl.append(ap_row_chanim)
 
@@ -2152,7 +2105,7 @@ class L3VariableTime(Realm):
                                 else:
                                     port_data = response['interface']
                                     latency, jitter, total_ul_rate, total_ul_rate_ll, total_ul_pkts_ll, ul_rx_drop_percent, total_dl_rate, total_dl_rate_ll, total_dl_pkts_ll, dl_rx_drop_percent = self.get_endp_stats_for_port(
-                                        port_data["port"], endps)
+                                        port_data["port"], endps, endp_stats_index)
                                     self.write_dl_port_csv(
                                         len(temp_stations_list),
                                         ul,
@@ -6452,13 +6405,17 @@ INCLUDE_IN_README: False
             _results_dir_name=args.results_dir_name,
             _output_html="{results_dir_name}.html".format(
                 results_dir_name=args.results_dir_name),
-            _output_pdf="{results_dir_name}.pdf".format(results_dir_name=args.results_dir_name))
+            _output_pdf="{results_dir_name}.pdf".format(results_dir_name=args.results_dir_name),
+            _stream_html=True,
+            _table_max_rows=lf_report.lf_report.Default_Table_Max_Rows)
     else:
         report = lf_report.lf_report(
             _results_dir_name=args.results_dir_name,
             _output_html="{results_dir_name}.html".format(
                 results_dir_name=args.results_dir_name),
-            _output_pdf="{results_dir_name}.pdf".format(results_dir_name=args.results_dir_name))
+            _output_pdf="{results_dir_name}.pdf".format(results_dir_name=args.results_dir_name),
+            _stream_html=True,
+            _table_max_rows=lf_report.lf_report.Default_Table_Max_Rows)
 
     kpi_path = report.get_report_path()
     logger.info("Report and kpi_path :{kpi_path}".format(kpi_path=kpi_path))
@@ -3397,12 +3397,16 @@ Note: for enable flags can us && as separator in vscode
             _path=local_lf_report_dir,
             _results_dir_name="test_l3_longevity",
             _output_html="test_l3_longevity.html",
-            _output_pdf="test_l3_longevity.pdf")
+            _output_pdf="test_l3_longevity.pdf",
+            _stream_html=True,
+            _table_max_rows=lf_report.lf_report.Default_Table_Max_Rows)
     else:
         report = lf_report.lf_report(
             _results_dir_name="test_l3_longevity",
             _output_html="test_l3_longevity.html",
-            _output_pdf="test_l3_longevity.pdf")
+            _output_pdf="test_l3_longevity.pdf",
+            _stream_html=True,
+            _table_max_rows=lf_report.lf_report.Default_Table_Max_Rows)
 
     # Get the report path to create the kpi.csv path
     kpi_path = report.get_report_path()
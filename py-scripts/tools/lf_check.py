@@ -13,6 +13,10 @@ EXAMPLE:
 ./lf_check.py  --json_rig ct_us_001_rig.json --json_dut ct_001_AX88U_dut.json
     --json_test ct_us_001_tests.json  --suite "suite_wc_dp"  --path '/home/lanforge/html-reports/ct-us-001'
 
+./lf_check.py --json_rig <rig_json> --json_dut <dut_json> --json_test <tests json> --test_suite <suite_name> --workers 4
+    tests with a "claims" entry run in parallel when the claims do not overlap, reports keep the suite order
+    "claims": {"radio": "1.1.wiphy0 1.1.wiphy1", "resource": "1.2", "dut": "ASUS_AX88U", "rig": "CT_US_001"}
+
 
 rig is the LANforge
 dut is the device under test
@@ -111,6 +115,7 @@ Starting LANforge:
 '''
 
 from psutil import TimeoutExpired
+import psutil
 import requests
 import pandas as pd
 import paramiko
@@ -124,6 +129,7 @@ from time import sleep
 import time
 import logging
 import socket
+import threading
 import importlib
 import platform
 import os
@@ -132,6 +138,7 @@ import sys
 import traceback
 from pprint import pformat
 import copy
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 
 if sys.version_info[0] != 3:
@@ -156,6 +163,75 @@ sys.path.insert(0, parent_dir_path)
 FORMAT = '%(asctime)s %(name)s %(levelname)s: %(message)s'
 
 
+# One ssh session per LANforge kept open for the lf_check run. The system information probes are sent
+# as a single command with delimited output and the results are cached per LANforge.
+class lf_ssh_probe_cache():
+    DELIMITER = "==lf_check_probe:{name}=="
+    PROBES = [
+        ('system_node', 'uname -n'),
+        ('fedora', 'cat /etc/fedora-release'),
+        ('kernel', 'uname -r'),
+        ('server_version', './btserver --version | grep  Version'),
+        ('server_build_info', './btserver --version'),
+        ('gui_version', 'curl -H "Accept: application/json" http://{lanforge_ip}:8080 | json_pp  | grep -A 7 "VersionInfo"'),
+    ]
+    clients = {}
+    results = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def get_client(cls, host, port, user, passwd):
+        key = (host, str(port), user)
+        client = cls.clients.get(key)
+        if client is not None and client.get_transport() is not None and client.get_transport().is_active():
+            return client
+        # creating shh client object we use this object to connect to router
+        client = paramiko.SSHClient()
+        # automatically adds the missing host key
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(hostname=host, port=port, username=user, password=passwd,
+                       allow_agent=False, look_for_keys=False, banner_timeout=600)
+        cls.clients[key] = client
+        return client
+
+    @classmethod
+    def run(cls, host, port, user, passwd, command):
+        with cls.lock:
+            client = cls.get_client(host, port, user, passwd)
+            stdin, stdout, stderr = client.exec_command(command)
+            return [line.replace('\n', '') for line in stdout.readlines()]
+
+    @classmethod
+    def probe(cls, host, port, user, passwd, refresh=False):
+        """
+        :return: dictionary of probe name to the list of output lines
+        """
+        key = (host, str(port), user)
+        if not refresh and key in cls.results:
+            return cls.results[key]
+        command = "; ".join("echo '{delimiter}'; {probe}".format(delimiter=cls.DELIMITER.format(name=name),
+                                                                 probe=probe.format(lanforge_ip=host))
+                            for name, probe in cls.PROBES)
+        lines = cls.run(host, port, user, passwd, command)
+        delimiters = {cls.DELIMITER.format(name=name): name for name, _ in cls.PROBES}
+        results = {name: [] for name, _ in cls.PROBES}
+        name = None
+        for line in lines:
+            if line in delimiters:
+                name = delimiters[line]
+            elif name is not None:
+                results[name].append(line)
+        cls.results[key] = results
+        return results
+
+    @classmethod
+    def close_all(cls):
+        with cls.lock:
+            for client in cls.clients.values():
+                client.close()
+            cls.clients = {}
+
+
 # lf_check class contains verificaiton configuration and ocastrates the
 # testing.
 class lf_check():
@@ -178,7 +254,8 @@ class lf_check():
                  _outfile_name,
                  _report_path,
                  _log_path,
-                 _json_test_name):
+                 _json_test_name,
+                 _workers=1):
 
 
         # get the server information
@@ -373,6 +450,10 @@ class lf_check():
         self.interation = 0
         self.lf_check_link = ''
 
+        # parallel test execution, tests with non conflicting claims run on up to workers threads
+        self.workers = _workers
+        self.scheduled_runs = []
+
     def set_junit_results(self, junit_results):
         self.junit_results = junit_results
 
@@ -436,63 +517,26 @@ class lf_check():
     def get_lanforge_system_ip(self):
         return self.lf_mgr_ip
 
+    # system information from the LANforge, the probes share one cached ssh session and are
+    # run once per lf_check run, see lf_ssh_probe_cache
+    def get_lanforge_system_probe(self, refresh=False):
+        return lf_ssh_probe_cache.probe(host=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, user=self.lf_mgr_user,
+                                        passwd=self.lf_mgr_pass, refresh=refresh)
+
     def get_lanforge_system_node_version(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command('uname -n')
-        self.lanforge_system_node_version = stdout.readlines()
-        self.lanforge_system_node_version = [line.replace(
-            '\n', '') for line in self.lanforge_system_node_version]
-        ssh.close()
-        time.sleep(1)
+        self.lanforge_system_node_version = self.get_lanforge_system_probe()['system_node']
         return self.lanforge_system_node_version
 
     def get_lanforge_fedora_version(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command('cat /etc/fedora-release')
-        self.lanforge_fedora_version = stdout.readlines()
-        self.lanforge_fedora_version = [line.replace(
-            '\n', '') for line in self.lanforge_fedora_version]
-        ssh.close()
-        time.sleep(1)
+        self.lanforge_fedora_version = self.get_lanforge_system_probe()['fedora']
         return self.lanforge_fedora_version
 
     def get_lanforge_kernel_version(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command('uname -r')
-        self.lanforge_kernel_version = stdout.readlines()
-        self.lanforge_kernel_version = [line.replace(
-            '\n', '') for line in self.lanforge_kernel_version]
-        ssh.close()
-        time.sleep(1)
+        self.lanforge_kernel_version = self.get_lanforge_system_probe()['kernel']
         return self.lanforge_kernel_version
 
     def get_lanforge_server_version(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command(
-            './btserver --version | grep  Version')
-        self.lanforge_server_version_full = stdout.readlines()
-        self.lanforge_server_version_full = [line.replace(
-            '\n', '') for line in self.lanforge_server_version_full]
+        self.lanforge_server_version_full = self.get_lanforge_system_probe()['server_version']
         self.logger.info("lanforge_server_version_full: {lanforge_server_version_full}".format(
             lanforge_server_version_full=self.lanforge_server_version_full))
         self.lanforge_server_version = self.lanforge_server_version_full[0].split(
@@ -500,46 +544,19 @@ class lf_check():
         self.lanforge_server_version = self.lanforge_server_version.strip()
         self.logger.info("lanforge_server_version: {lanforge_server_version}".format(
             lanforge_server_version=self.lanforge_server_version))
-        ssh.close()
-        time.sleep(1)
         return self.lanforge_server_version_full
 
     def get_lanforge_server_build_info(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command(
-            './btserver --version')
-        self.lanforge_server_build_info = stdout.readlines()
-        self.lanforge_server_build_info = [line.replace(
-            '\n', '') for line in self.lanforge_server_build_info]
-
-        # self.lanforge_server_build_info = ''.join(self.lanforge_server_build_info)
+        self.lanforge_server_build_info = self.get_lanforge_system_probe()['server_build_info']
         self.logger.info("lanforge_server_build_info: {lanforge_server_build_info}".format(
             lanforge_server_build_info=self.lanforge_server_build_info))
-        # self.lanforge_server_build_info = self.lanforge_server_build_info.strip()
-        self.logger.info("lanforge_server_build_info: {lanforge_server_build_info}".format(
-            lanforge_server_build_info=self.lanforge_server_build_info))
-        ssh.close()
-        time.sleep(1)
         return self.lanforge_server_build_info
 
     def get_lanforge_gui_version(self):
-        # creating shh client object we use this object to connect to router
-        ssh = paramiko.SSHClient()
-        # automatically adds the missing host key
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        ssh.connect(hostname=self.lf_mgr_ip, port=self.lf_mgr_ssh_port, username=self.lf_mgr_user, password=self.lf_mgr_pass,
-                    allow_agent=False, look_for_keys=False, banner_timeout=600)
-        stdin, stdout, stderr = ssh.exec_command(
-            'curl -H "Accept: application/json" http://{lanforge_ip}:8080 | json_pp  | grep -A 7 "VersionInfo"'.format(lanforge_ip=self.lf_mgr_ip))
-        self.lanforge_gui_version_full = stdout.readlines()
-        # self.logger.info("lanforge_gui_version_full pre: {lanforge_gui_version_full}".format(lanforge_gui_version_full=self.lanforge_gui_version_full))
-        self.lanforge_gui_version_full = [line.replace(
-            '\n', '') for line in self.lanforge_gui_version_full]
+        self.lanforge_gui_version_full = self.get_lanforge_system_probe()['gui_version']
+        if len(self.lanforge_gui_version_full) == 0:
+            # the GUI may have been restarted since the cached probe
+            self.lanforge_gui_version_full = self.get_lanforge_system_probe(refresh=True)['gui_version']
         # self.logger.info("lanforge_gui_version_full: {lanforge_gui_version_full}".format(lanforge_gui_version_full=self.lanforge_gui_version_full))
         for element in self.lanforge_gui_version_full:
             if "BuildVersion" in element:
@@ -562,8 +579,6 @@ class lf_check():
                 self.logger.info("GitVersion {}".format(
                     self.lanforge_gui_git_sha))
 
-        ssh.close()
-        time.sleep(1)
         return self.lanforge_gui_version_full, self.lanforge_gui_version, self.lanforge_gui_build_date, self.lanforge_gui_git_sha
 
     def no_send_results_email(self, report_file=None):
@@ -1197,6 +1212,13 @@ junit.xml path: allure serve {junit_path}
         sleep(15)
 
     def run_script(self):
+        run = self.prepare_script()
+        self.execute_script(run)
+        self.finish_script(run)
+
+    # substitute the rig, dut and batch values into the current test and build the command,
+    # returns the run dictionary used by execute_script and finish_script
+    def prepare_script(self):
         # The network arguments need to be changed when in a list
         for index, args_list_element in enumerate(
                 self.test_dict[self.test]['args_list']):
@@ -1398,17 +1420,17 @@ junit.xml path: allure serve {junit_path}
 
         # TODO this code is always run since there is a default
         # TODO change name to file obj to make more understandable
+        stdout_log_txt = None
+        stderr_log_txt = None
         if self.outfile_name is not None:
             stdout_log_txt = os.path.join(
                 self.log_path, "{}-{}-stdout.txt".format(self.outfile_name, self.test))
             self.logger.info(
                 "stdout_log_txt: {}".format(stdout_log_txt))
-            stdout_log = open(stdout_log_txt, 'a')
             stderr_log_txt = os.path.join(
                 self.log_path, "{}-{}-stderr.txt".format(self.outfile_name, self.test))
             self.logger.info(
                 "stderr_log_txt: {}".format(stderr_log_txt))
-            # stderr_log = open(stderr_log_txt, 'a')
         # need to take into account --raw_line parameters thus need to use shlex.split
         # need to preserve command to have correct command syntax
         # in command output
@@ -1421,27 +1443,40 @@ junit.xml path: allure serve {junit_path}
         self.logger.info(
             "running {command_to_run}".format(
                 command_to_run=command_to_run))
-        self.test_start_time = str(datetime.datetime.now().strftime(
+        return {'test': self.test,
+                'iteration': self.iteration,
+                'test_timeout': self.test_timeout,
+                'command': command,
+                'command_to_run': command_to_run,
+                'stdout_log_txt': stdout_log_txt,
+                'stderr_log_txt': stderr_log_txt,
+                'claims': self.get_test_claims()}
+
+    # run the prepared command, output is written to the stdout log as it is read.
+    # Only the run dictionary is updated so this may be called from a worker thread.
+    def execute_script(self, run):
+        command_to_run = run['command_to_run']
+        test_timeout = int(run['test_timeout'])
+        run['test_start_time'] = str(datetime.datetime.now().strftime(
             "%Y-%m-%d-%H-%M-%S")).replace(':', '-')
         self.logger.info(
-            "Test start: {time} Timeout: {timeout}".format(
-                time=self.test_start_time, timeout=self.test_timeout))
+            "Test: {test} start: {time} Timeout: {timeout}".format(
+                test=run['test'], time=run['test_start_time'], timeout=test_timeout))
         start_time = datetime.datetime.now()
         summary_output = ''
-        # have stderr go to stdout
+        summary = None
+        # have stderr go to stdout, the working directory is passed in rather than changed
+        # as tests may run in parallel
         try:
-            summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+            summary = subprocess.Popen(command_to_run, cwd=self.scripts_wd, shell=False, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, universal_newlines=True)
         # TODO the looks one directory higher,  there needs to be a way to execute from higher directory.
         except FileNotFoundError:
             # TODO tx_power is one directory up from py-scripts
             self.logger.info(
-                "FileNotFoundError will try to execute from lanforge Top directory")
-            os.chdir(self.lanforge_wd)
-            self.logger.info(
-                "Changed Current Working Directory to {}".format(os.getcwd()))
-            summary = subprocess.Popen(command_to_run, shell=False, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                                       universal_newlines=True)
+                "FileNotFoundError will try to execute from lanforge Top directory {dir}".format(dir=self.lanforge_wd))
+            summary = subprocess.Popen(command_to_run, cwd=self.lanforge_wd, shell=False, stdout=subprocess.PIPE,
+                                       stderr=subprocess.STDOUT, universal_newlines=True)
 
         except PermissionError:
             self.logger.info("PermissionError on execution of {command}".format(
@@ -1451,25 +1486,26 @@ junit.xml path: allure serve {junit_path}
             self.logger.info("IsADirectoryError on execution of {command}".format(
                 command=command_to_run))
 
-        # This code will read the output as the script is running and log
-        for line in iter(summary.stdout.readline, ''):
-            self.logger.info(line)
-            summary_output += line
-        try:
-            if int(self.test_timeout != 0):
-                summary.wait(timeout=int(self.test_timeout))
-            else:
-                summary.wait()
-        except TimeoutExpired:
-            summary.terminate
-            self.test_result = "TIMEOUT"
-        # TODO will change back to the scripts_wd since a script like tx_power.py will run in the parent directoy to
-        # py-scripts
-        os.chdir(self.scripts_wd)
-        self.logger.info("Current Working Directory {}".format(os.getcwd()))
-
-        # Since using "wait" above the return code will be set.
-        try:
+        run['timed_out'] = False
+        return_code = None
+        stdout_log = open(run['stdout_log_txt'], 'a')
+        if summary is not None:
+            watchdog = None
+            if test_timeout != 0:
+                watchdog = threading.Timer(test_timeout, self.timeout_script, args=(summary, run))
+                watchdog.daemon = True
+                watchdog.start()
+            # This code will read the output as the script is running and log
+            for line in iter(summary.stdout.readline, ''):
+                self.logger.info(line)
+                summary_output += line
+                stdout_log.write(line)
+                stdout_log.flush()
+            summary.wait()
+            if watchdog is not None:
+                watchdog.cancel()
+
+            # Since using "wait" above the return code will be set.
             return_code = summary.returncode
             if return_code == 0:
                 self.logger.info("Script returned pass return code: {return_code} for test: {command}".format(
@@ -1477,27 +1513,72 @@ junit.xml path: allure serve {junit_path}
             else:
                 self.logger.info("Script returned non-zero return code: {return_code} for test: {command}".format(
                     return_code=return_code, command=command_to_run))
-
-        except BaseException as err:
-            self.logger.info(
-                "issue reading return code err:{err}".format(err=err))
+        stdout_log.close()
 
         self.logger.info(summary_output)
-        stdout_log.write(summary_output)
-        stdout_log.close()
         end_time = datetime.datetime.now()
-        self.test_end_time = str(datetime.datetime.now().strftime(
+        run['test_end_time'] = str(datetime.datetime.now().strftime(
             "%Y-%m-%d-%H-%M-%S")).replace(':', '-')
         self.logger.info(
-            "Test end time {time}".format(
-                time=self.test_end_time))
+            "Test: {test} end time {time}".format(
+                test=run['test'], time=run['test_end_time']))
         time_delta = end_time - start_time
-        self.duration_sec_us = "{seconds}.{micro_sec}".format(
+        run['duration_sec_us'] = "{seconds}.{micro_sec}".format(
             seconds=time_delta.seconds, micro_sec=time_delta.microseconds)
         minutes, seconds = divmod(time_delta.seconds, 60)
         hours, minutes = divmod(minutes, 60)
-        self.duration = "{day}d {hours}h {minutes}m {seconds}s {msec} us".format(
+        run['duration'] = "{day}d {hours}h {minutes}m {seconds}s {msec} us".format(
             day=time_delta.days, hours=hours, minutes=minutes, seconds=seconds, msec=time_delta.microseconds)
+        run['summary_output'] = summary_output
+        run['return_code'] = return_code
+        return run
+
+    def timeout_script(self, summary, run):
+        self.logger.info("test: {test} exceeded timeout {timeout} terminating".format(
+            test=run['test'], timeout=run['test_timeout']))
+        run['timed_out'] = True
+        # scripts may start their own processes which keep the output pipe open
+        try:
+            for child in psutil.Process(summary.pid).children(recursive=True):
+                child.terminate()
+        except psutil.Error as err:
+            self.logger.info("unable to terminate child processes of test: {test} err: {err}".format(
+                test=run['test'], err=err))
+        summary.terminate()
+
+    # execute_script raised, fill in the run so finish_script reports it as a failed test
+    def fail_script(self, run, err):
+        self.logger.error("test: {test} iteration: {iteration} failed to run: {err}".format(
+            test=run['test'], iteration=run['iteration'], err=err))
+        now = str(datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")).replace(':', '-')
+        run.setdefault('test_start_time', now)
+        run['test_end_time'] = now
+        run.setdefault('timed_out', False)
+        run.setdefault('duration', "0d 0h 0m 0s 0 us")
+        run.setdefault('duration_sec_us', "0.0")
+        message = "lf_check unable to run test: {err}\n".format(err=err)
+        run['summary_output'] = run.get('summary_output', '') + message
+        run['return_code'] = -1
+        with open(run['stdout_log_txt'], 'a') as stdout_log:
+            stdout_log.write(message)
+
+    # report the results of an executed run: meta.txt, junit, html and csv rows
+    def finish_script(self, run):
+        self.test = run['test']
+        self.iteration = run['iteration']
+        self.test_timeout = run['test_timeout']
+        self.test_start_time = run['test_start_time']
+        self.test_end_time = run['test_end_time']
+        self.duration = run['duration']
+        self.duration_sec_us = run['duration_sec_us']
+        self.test_result = "TIMEOUT" if run['timed_out'] else ""
+        command = run['command']
+        command_to_run = run['command_to_run']
+        stdout_log_txt = run['stdout_log_txt']
+        stderr_log_txt = run['stderr_log_txt']
+        summary_output = run['summary_output']
+        return_code = run['return_code']
+
         # If collect meta data is set
         meta_data_path = ""
         # Will gather data even on a TIMEOUT condition as there is
@@ -1872,6 +1953,93 @@ junit.xml path: allure serve {junit_path}
         # self.logger.info("row: {}".format(row))
         self.logger.info("test: {} executed".format(self.test))
 
+    def test_loads_db(self):
+        if 'load_db' not in self.test_dict[self.test]:
+            return False
+        return str(self.test_dict[self.test]['load_db']).lower() not in ["none", "skip"]
+
+    # resources the current test uses, from the test json:
+    #   "claims": {"radio": "1.1.wiphy0 1.1.wiphy1", "resource": "1.2", "dut": "ASUS_AX88U", "rig": "CT_US_001"}
+    # returns None if the test has no claims or loads a database, the test then runs alone
+    def get_test_claims(self):
+        if 'claims' not in self.test_dict[self.test] or self.test_loads_db():
+            return None
+        claims = set()
+        for kind, values in self.test_dict[self.test]['claims'].items():
+            if kind not in ['radio', 'resource', 'dut', 'rig']:
+                self.logger.warning("test: {test} unknown claim {kind} ignored, use radio, resource, dut or rig".format(
+                    test=self.test, kind=kind))
+                continue
+            for value in str(values).split():
+                claims.add((kind, value))
+        # iterations of the same test share the stdout log
+        claims.add(('test', self.test))
+        return claims
+
+    @staticmethod
+    def claims_conflict(claims_a, claims_b):
+        if claims_a is None or claims_b is None:
+            return True
+        if claims_a & claims_b:
+            return True
+        # a resource claim covers the radios on the resource
+        for kind_a, value_a in claims_a:
+            for kind_b, value_b in claims_b:
+                if kind_a == 'resource' and kind_b == 'radio' and value_b.startswith(value_a + '.'):
+                    return True
+                if kind_a == 'radio' and kind_b == 'resource' and value_a.startswith(value_b + '.'):
+                    return True
+        return False
+
+    # run the current test now, or queue it when running with more than one worker
+    def schedule_script(self):
+        if self.workers <= 1:
+            self.run_script()
+            return
+        if self.test_loads_db():
+            # loading a database changes the whole LANforge, let the queued tests finish first
+            self.run_scheduled_scripts()
+        self.scheduled_runs.append(self.prepare_script())
+
+    # Run the queued tests on self.workers threads. A test starts when it does not conflict with a
+    # running test or with an earlier queued test, so conflicting tests keep the suite order.
+    # Results are reported in the suite order as soon as all earlier tests have finished.
+    def run_scheduled_scripts(self):
+        runs = self.scheduled_runs
+        self.scheduled_runs = []
+        if not runs:
+            return
+        self.logger.info("running {count} tests on {workers} workers".format(count=len(runs), workers=self.workers))
+        pending = list(range(len(runs)))
+        running = {}
+        finished = set()
+        next_report = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while pending or running:
+                blocked = []
+                for index in list(pending):
+                    if len(running) >= self.workers:
+                        break
+                    if any(self.claims_conflict(runs[index]['claims'], runs[other]['claims'])
+                           for other in list(running.values()) + blocked):
+                        blocked.append(index)
+                        continue
+                    pending.remove(index)
+                    self.logger.info("starting test: {test} iteration: {iteration}".format(
+                        test=runs[index]['test'], iteration=runs[index]['iteration']))
+                    running[executor.submit(self.execute_script, runs[index])] = index
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = running.pop(future)
+                    try:
+                        future.result()
+                    except Exception as err:
+                        self.fail_script(runs[index], err)
+                    finished.add(index)
+                while next_report in finished:
+                    self.finish_script(runs[next_report])
+                    next_report += 1
+
     # TODO the command needs to be updated for the batch iterations
     def run_script_test(self):
         self.start_html_results()
@@ -1907,6 +2075,8 @@ junit.xml path: allure serve {junit_path}
                             user_prompt = 'Default prompt User Intervention requested for test: {test}, hit enter to continue: '.format(
                                 test=self.test)
 
+                        # queued tests need to finish before the user configures the testbed
+                        self.run_scheduled_scripts()
                         user_input = input(user_prompt)
                         logger.info(
                             "user input received {input}".format(input=user_input))
@@ -1961,7 +2131,7 @@ junit.xml path: allure serve {junit_path}
                                     for self.iteration in range(self.test_iterations):
                                         self.iteration += 1
                                         # Runs the scripts
-                                        self.run_script()
+                                        self.schedule_script()
 
                     # once done clear out the lists
                     self.channel_list = []
@@ -1981,7 +2151,7 @@ junit.xml path: allure serve {junit_path}
                                     # in batch mode need to set the VARIABLES back into the test
                                     self.iteration += 1
                                     # Runs the scripts
-                                    self.run_script()
+                                    self.schedule_script()
                                     # start counting from zero
                     self.channel_list = []
                     self.nss_list = []
@@ -2000,7 +2170,7 @@ junit.xml path: allure serve {junit_path}
                             for self.iteration in range(self.test_iterations):
                                 self.iteration += 1
                                 # Runs the scripts
-                                self.run_script()
+                                self.schedule_script()
 
                     self.channel_list = []
                     self.nss_list = []
@@ -2015,7 +2185,7 @@ junit.xml path: allure serve {junit_path}
                     for self.iteration in range(self.test_iterations):
                         # Runs the scripts
                         self.iteration += 1
-                        self.run_script()
+                        self.schedule_script()
 
             # Using use_test_list is True and test is not in test_list
             elif self.use_test_list is True and self.test not in self.test_list:
@@ -2032,6 +2202,8 @@ junit.xml path: allure serve {junit_path}
                 self.logger.warning(
                     "enable value {} for test: {} ".format(self.test_dict[self.test]['enabled'], self.test))
 
+        self.run_scheduled_scripts()
+
         # The test suite has run
         self.finish_junit_testsuite()
         self.finish_junit_testsuites()
@@ -2162,6 +2334,10 @@ If parameter not set will read TEST_WINDOW_DAYS from rig.json""")
     parser.add_argument("--no_exit","--no_exit_if_no_gui",dest='no_exit_if_no_gui',
                         help="--no_exit_if_no_gui store true , if gui unavailable do not exit to allow gui restart",
                         action='store_true')
+    parser.add_argument("--workers", type=int, default=1,
+                        help="""--workers <number> run tests with non conflicting "claims" in parallel, default 1 runs tests in order
+tests without "claims" in the test json run alone, example:
+    "claims": {"radio": "1.1.wiphy0 1.1.wiphy1", "resource": "1.2", "dut": "ASUS_AX88U", "rig": "CT_US_001"}""")
 
 
     args = parser.parse_args()
@@ -2413,7 +2589,8 @@ If parameter not set will read TEST_WINDOW_DAYS from rig.json""")
                                  _outfile_name=outfile_name,
                                  _report_path=report_path,
                                  _log_path=log_path,
-                                 _json_test_name=json_test_name)
+                                 _json_test_name=json_test_name,
+                                 _workers=args.workers)
 
                 # set up logging
                 logfile = args.logfile[:-4]
@@ -2972,5 +3149,7 @@ If parameter not set will read TEST_WINDOW_DAYS from rig.json""")
 
     logger.debug("allure report directory copied to {latest}".format(latest=new_allure_epoch_latest_dir))
 
+    lf_ssh_probe_cache.close_all()
+
 if __name__ == '__main__':
     main()
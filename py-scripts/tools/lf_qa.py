@@ -14,11 +14,14 @@ import importlib
 import plotly.express as px
 import pandas as pd
 import sqlite3
+import hashlib
 import argparse
 from pathlib import Path
 import time
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
@@ -32,6 +35,129 @@ lf_logger_config = importlib.import_module("py-scripts.lf_logger_config")
 external_stylesheets = ['https://codepen.io/chriddyp/pen/bWLwgP.css']
 
 
+# columns read from the database to build the kpi graphs
+KPI_GRAPH_COLUMNS = ['Date', 'test-rig', 'test-tag', 'Graph-Group', 'test-id', 'kpi_path', 'Units',
+                     'numeric-score', 'short-description', 'Subtest-Pass', 'Subtest-Fail', 'kernel',
+                     'test_dir', 'radio_fw', 'gui_ver', 'gui_build_date', 'server_ver', 'server_build_date',
+                     'dut-hw-version', 'dut-sw-version', 'dut-model-num', 'dut-serial-num']
+
+
+# build the kpi figure for one test-rig, test-tag and Graph-Group
+def build_kpi_fig(df_tmp, group, test_id, test_tag, test_rig, units):
+    # group of Score will have subtest
+    if group == 'Score':
+        # Print out the Standard Score report
+        kpi_fig = (
+            px.scatter(
+                df_tmp,
+                x="Date",
+                y="numeric-score",
+                custom_data=[
+                    'numeric-score',
+                    'Subtest-Pass',
+                    'Subtest-Fail',
+                    'kernel'
+                    ],
+                color="short-description",
+                hover_name="short-description",
+                size_max=60)).update_traces(
+            mode='lines+markers')
+
+        kpi_fig.update_traces(
+            hovertemplate="<br>".join([
+                "kernel-version: %{customdata[4]}",
+                "numeric-score: %{customdata[0]}",
+                "Subtest-Pass: %{customdata[1]}",
+                "Subtest-Fail: %{customdata[2]}"
+            ])
+        )
+
+        kpi_fig.update_layout(
+            title="{test_id} : {group} : {test_tag} : {test_rig}".format(
+                test_id=test_id, group=group, test_tag=test_tag, test_rig=test_rig),
+            xaxis_title="Time",
+            yaxis_title="{}".format(units),
+            xaxis={'type': 'date'}
+        )
+        kpi_fig.update_layout(autotypenumbers='convert types')
+
+    else:
+        kpi_fig = (
+            px.scatter(
+                df_tmp,
+                x="Date",
+                y="numeric-score",
+                custom_data=[
+                    'Date',
+                    'test_dir',
+                    'numeric-score',
+                    'kernel',
+                    'radio_fw',
+                    'gui_ver',
+                    'gui_build_date',
+                    'server_ver',
+                    'server_build_date',
+                    'dut-hw-version',
+                    'dut-sw-version',
+                    'dut-model-num',
+                    'dut-serial-num'
+                    ],
+                color="short-description",
+                hover_name="short-description",
+                size_max=60)).update_traces(
+            mode='lines+markers')
+
+        kpi_fig.update_layout(
+            title="{test_id} : {group} : {test_tag} : {test_rig}".format(
+                test_id=test_id, group=group, test_tag=test_tag, test_rig=test_rig),
+            xaxis_title="Time",
+            yaxis_title="{units}".format(units=units),
+            xaxis={'type': 'date'}
+        )
+
+        kpi_fig.update_traces(
+            hovertemplate="<br>".join([
+                "Date: %{customdata[0]}",
+                "test_dir: %{customdata[1]}",
+                "numeric-score: %{customdata[2]}",
+                "kernel-version: %{customdata[3]}",
+                "radio-fw: %{customdata[4]}",
+                "gui-version: %{customdata[5]}",
+                "gui-build-date: %{customdata[6]}",
+                "server-version: %{customdata[7]}",
+                "server-build-date: %{customdata[8]}",
+                "dut-hw-version: %{customdata[9]}",
+                "dut-sw-version: %{customdata[10]}",
+                "dut-model-num: %{customdata[11]}",
+                "dut-serial-num: %{customdata[12]}",
+            ])
+        )
+
+        kpi_fig.update_layout(autotypenumbers='convert types')
+    return kpi_fig
+
+
+# render one kpi graph to png and html, called in the worker processes of generate_graph_png
+# the digest is written last so an interrupted render is redone on the next run
+def render_kpi_graph(job):
+    kpi_fig = build_kpi_fig(df_tmp=job['df_tmp'], group=job['group'], test_id=job['test_id'],
+                            test_tag=job['test_tag'], test_rig=job['test_rig'], units=job['units'])
+    # generate png image
+    try:
+        kpi_fig.write_image(job['png_path'], scale=1, width=1200, height=300)
+    except ValueError as err:
+        logger.info("ValueError kpi_fig.write_image {msg}".format(msg=err))
+        return False
+    except BaseException as err:
+        logger.info("BaseException kpi_fig.write_image{msg}".format(msg=err))
+        return False
+    # generate html image (interactive)
+    kpi_fig.write_html(job['html_path'])
+    with open(job['digest_path'], 'w') as digest_file:
+        digest_file.write(job['digest'])
+    return True
+
+
 class csv_sql:
     def __init__(self,
                  _path='.',
@@ -41,7 +167,8 @@ class csv_sql:
                  _database='qa_db',
                  _table='qa_table',
                  _png=False,
-                 _test_window_days='7'):
+                 _test_window_days='7',
+                 _png_workers=None):
         self.path = _path
         self.path_comp = _path_comp
         self.lf_qa_report_path = _lf_qa_report_path
@@ -53,6 +180,8 @@ class csv_sql:
         self.database = _database
         self.table = _table
         self.png = _png
+        # worker processes rendering kpi graphs, 1 renders in this process
+        self.png_workers = int(_png_workers) if _png_workers else (os.cpu_count() or 1)
         self.kpi_list = []
         self.html_list = []
         self.conn = None
@@ -105,142 +234,6 @@ class csv_sql:
         parent_path = os.path.dirname(_path)
         return parent_path
 
-    # TODO put a wrapper around all the LANforge pertinate information 
-    # TODO put in traceback on the exceptions.
-    def get_kernel_version_from_meta(sefl, _kpi_path):
-        kernel_version = "NA"
-        logger.info("read meta path for kernel version:  {_kpi_path}".format(_kpi_path=_kpi_path))
-        try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "lanforge_kernel_version:" in line:
-                    kernel_version = line.replace("$ lanforge_kernel_version:", "")
-                    kernel_version = test_run.strip()
-                    logger.info("meta_data_path: {meta_data_path} Kernel Version: {kernel}".format(
-                        meta_data_path=meta_data_path, kernel=kernel_version))
-                    break
-            meta_data_fd.close()
-        except BaseException:
-            logger.info("exception reading meta get_kernel_version_from_meta {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-        return kernel_version                 
-
-    def get_radio_firmware_from_meta(sefl, _kpi_path):
-        radio_firmware = "NA"
-        logger.info("read meta path for radio firmware version:  {_kpi_path}".format(_kpi_path=_kpi_path))
-        try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "radio_firmware" in line:
-                    radio_firmware = line.replace("$ radio_firmware:", "")
-                    radio_firmware = test_run.strip()
-                    logger.info("meta_data_path: {meta_data_path} Radio Firmware : {radio_fw}".format(
-                        meta_data_path=meta_data_path, kernel=kernel_version))
-                    break
-            meta_data_fd.close()
-        except BaseException:
-            logger.info("exception reading meta get_kernel_version_from_meta {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-        return radio_firmware                 
-
-
-    def get_gui_info_from_meta(sefl, _kpi_path):
-        gui_version = "NA"
-        gui_build_date = "NA"
-        gui_build_date
-        logger.debug("read meta path for gui version:  {_kpi_path}".format(_kpi_path=_kpi_path))
-        try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "lanforge_gui_version_full:" in line:
-                    # gui_version = line.replace("lanforge_gui_version_full:", "")
-                    # gui_version = test_run.strip()
-
-                    pattern = "\"BuildVersion\" : \"(\\S+)\""
-                    match = re.search(pattern, line)
-                    if (match is not None):
-                        gui_version = match.group(1)
-
-                    pattern = "\"BuildDate\" : \"(\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+)\""
-                    match = re.search(pattern, line)
-                    if (match is not None):
-                        gui_build_date = match.group(1)
-
-
-                    logger.info("meta_data_path: {meta_data_path} GUI Version: {gui_version} GUI Build Date {gui_build_date}".format(
-                        meta_data_path=meta_data_path, gui_version=gui_version,gui_build_date=gui_build_date))
-
-                    break
-            meta_data_fd.close()
-        
-        except BaseException:
-            logger.info("exception reading meta get_gui_version_from_meta {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-        return gui_version, gui_build_date                 
-
-    def get_server_info_from_meta(sefl, _kpi_path):
-        server_version = "NA"
-        server_build_date = "NA"
-        logger.debug("read meta path for server version:  {_kpi_path}".format(_kpi_path=_kpi_path))
-        try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "lanforge_server_version_full:" in line:
-
-                    pattern = "Version: (\\S+)"
-                    match = re.search(pattern, line)
-                    if (match is not None):
-                        server_version = match.group(1)
-
-                    pattern = "Compiled on:  (\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+)"
-
-                    match = re.search(pattern, line)
-                    if (match  is not None):
-                        server_build_date = match.group(1)
-
-
-                    logger.info("meta_data_path: {meta_data_path} server Version: {server_version}".format(
-                        meta_data_path=meta_data_path, server_version=server_version))
-                    logger.info("meta_data_path: {meta_data_path} server_build_date: {server_build}".format(
-                        meta_data_path=meta_data_path, server_build=server_build_date))
-                    
-                    break
-
-            meta_data_fd.close()
-        except BaseException:
-            logger.info("exception reading meta get_gui_server_from_meta {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-        return server_version, server_build_date                
-
-    def get_test_dir_info_from_meta(sefl, _kpi_path):
-        test_dir = "NA"
-        logger.debug("read meta path for test dir:  {_kpi_path}".format(_kpi_path=_kpi_path))
-        try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "file_meta:" in line:
-                    split_line = line.split('/')
-                    test_dir = split_line[-2]
-                    logger.info("meta_data_path: {meta_data_path} test_dir: {test_dir}".format(
-                        meta_data_path=meta_data_path, test_dir=test_dir))
-                    break                        
-
-            meta_data_fd.close()
-        except BaseException:
-            logger.info("exception reading meta get_gui_server_from_meta {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-        return test_dir                
-
-
-    #def get_server_from_meta(sefl, _kpi_path):
-    #def get_gui_from_meta(sefl, _kpi_path):
-
-
     def get_test_id_test_tag(self, _kpi_path):
         test_id = "NA"
         test_tag = "NA"
@@ -277,32 +270,70 @@ class csv_sql:
                 kpi_path=_kpi_path))
         return test_id, test_tag
 
-    def get_test_run_from_meta(self, _kpi_path):
-        test_run = "NA"
-        logger.info("read meta path {_kpi_path}".format(_kpi_path=_kpi_path))
+    # read meta.txt once for all the values stored with the kpi rows:
+    # test run, test tag, test dir, kernel, radio firmware, GUI and server versions
+    def get_meta_info_from_meta(self, _kpi_path):
+        meta = {
+            'test_run': "NA",
+            'use_meta_test_tag': False,
+            'test_tag': "NA",
+            'test_dir': "NA",
+            'kernel': "NA",
+            'radio_fw': "NA",
+            'gui_ver': "NA",
+            'gui_build_date': "NA",
+            'server_ver': "NA",
+            'server_build_date': "NA"}
+        meta_data_path = os.path.join(_kpi_path, 'meta.txt')
         try:
-            meta_data_path = _kpi_path + '/' + '/meta.txt'
-            meta_data_fd = open(meta_data_path, 'r')
-            for line in meta_data_fd:
-                if "test_run" in line:
-                    test_run = line.replace("$ test_run: ", "")
-                    test_run = test_run.strip()
-                    logger.info("meta_data_path: {meta_data_path} test_run: {test_run}".format(
-                        meta_data_path=meta_data_path, test_run=test_run))
-                    break
-            meta_data_fd.close()
+            with open(meta_data_path, 'r') as meta_data_fd:
+                lines = meta_data_fd.readlines()
         except BaseException:
-            logger.info("exception reading test_run from {_kpi_path}".format(
-                _kpi_path=_kpi_path))
-
-        if test_run == "NA":
-            try:
-                test_run = _kpi_path.rsplit('/', 2)[0]
-                logger.info("try harder test_run: {test_run}".format(test_run=test_run))
-            except BaseException:
-                logger.info("exception getting test_run from kpi_path")
-            logger.info("Try harder test_run: {test_run} _kpi_path: {_kpi_path}".format(test_run=test_run, _kpi_path=_kpi_path))
-        return test_run
+            logger.info("exception reading meta {meta_data_path}".format(meta_data_path=meta_data_path))
+            lines = []
+
+        meta_test_tag = "NA"
+        for line in lines:
+            if "test_run" in line and meta['test_run'] == "NA":
+                meta['test_run'] = line.replace("$ test_run: ", "").strip()
+            if "gui_version:" in line:
+                if line.replace("$ lanforge_gui_version:", "").strip() == '5.4.3':
+                    meta['use_meta_test_tag'] = True
+            if "test_tag" in line:
+                meta_test_tag = line.replace("test_tag", "").strip()
+            if "file_meta:" in line and meta['test_dir'] == "NA":
+                try:
+                    meta['test_dir'] = line.split('/')[-2]
+                except IndexError:
+                    logger.info("malformed file_meta line in {meta_data_path}: {line}".format(
+                        meta_data_path=meta_data_path, line=line.strip()))
+            if "lanforge_kernel_version:" in line and meta['kernel'] == "NA":
+                meta['kernel'] = line.replace("$ lanforge_kernel_version:", "").strip()
+            if "radio_firmware" in line and meta['radio_fw'] == "NA":
+                meta['radio_fw'] = line.replace("$ radio_firmware:", "").strip()
+            if "lanforge_gui_version_full:" in line and meta['gui_ver'] == "NA":
+                match = re.search("\"BuildVersion\" : \"(\\S+)\"", line)
+                if match is not None:
+                    meta['gui_ver'] = match.group(1)
+                match = re.search("\"BuildDate\" : \"(\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+)\"", line)
+                if match is not None:
+                    meta['gui_build_date'] = match.group(1)
+            if "lanforge_server_version_full:" in line and meta['server_ver'] == "NA":
+                match = re.search("Version: (\\S+)", line)
+                if match is not None:
+                    meta['server_ver'] = match.group(1)
+                match = re.search("Compiled on:  (\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+\\s+\\S+)", line)
+                if match is not None:
+                    meta['server_build_date'] = match.group(1)
+        if meta['use_meta_test_tag']:
+            meta['test_tag'] = meta_test_tag
+
+        if meta['test_run'] == "NA":
+            meta['test_run'] = _kpi_path.rsplit('/', 2)[0]
+            logger.info("Try harder test_run: {test_run} _kpi_path: {_kpi_path}".format(
+                test_run=meta['test_run'], _kpi_path=_kpi_path))
+        logger.debug("meta_data_path: {meta_data_path} meta: {meta}".format(meta_data_path=meta_data_path, meta=meta))
+        return meta
 
     # TODO retrieve the kernel, GUI, and Server information
 
@@ -548,62 +579,28 @@ class csv_sql:
         return kpi_chart_html
 
 
-    # information on sqlite database
-    # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_sql.html
-    # sqlite browser:
-    # Fedora  sudo dnf install sqlitebrowser
-    # Ubuntu sudo apt-get install sqlite3
-    #
-    def store(self):
-        logger.info("reading kpi and storing in db {}".format(self.database))
-        path = Path(self.path)
-        logger.info("store path {path}".format(path=path))
-        logger.info("self.path  {path}".format(path=self.path))
-        self.kpi_list = list(path.glob('**/kpi.csv'))  # Hard code for now
-
-        if not self.kpi_list:
-            logger.info("WARNING: used --store , no new kpi.csv found, check input path or remove --store from command line")
-
-        rows = []
-        for kpi in self.kpi_list:  # TODO note empty kpi.csv failed test
-            df_kpi_tmp = pd.read_csv(kpi, sep='\t')
-            # only store the path to the kpi.csv file
-            _kpi_path = str(kpi).replace('kpi.csv', '')
-            df_kpi_tmp['kpi_path'] = _kpi_path
-            test_run = self.get_test_run_from_meta(_kpi_path)
-            df_kpi_tmp['test_run'] = test_run
-
-            use_meta_test_tag, test_tag = self.get_test_tag_from_meta(_kpi_path)
-            if use_meta_test_tag:
-                df_kpi_tmp['test-tag'] = test_tag
-
-            test_dir = self.get_test_dir_info_from_meta(_kpi_path)
-            # test_dir = test_dir.replace('-',' ')
-            df_kpi_tmp['test_dir'] = test_dir
-
-            logger.info("test_dir: {test_dir}".format(test_dir=test_dir))
+    def get_manifest_table(self):
+        return "{table}_manifest".format(table=self.table)
 
-            df_kpi_tmp['kernel'] = self.get_kernel_version_from_meta(_kpi_path)
-            df_kpi_tmp['radio_fw'] = self.get_radio_firmware_from_meta(_kpi_path)
-            df_kpi_tmp['gui_ver'], df_kpi_tmp['gui_build_date'] = self.get_gui_info_from_meta(_kpi_path)
-            df_kpi_tmp['server_ver'], df_kpi_tmp['server_build_date'] = self.get_server_info_from_meta(_kpi_path)
+    def get_table_columns(self, table):
+        return [row[1] for row in self.conn.execute('PRAGMA table_info("{table}")'.format(table=table))]
 
-            # this next line creats duplicate entries
-            self.df = pd.concat([self.df,df_kpi_tmp], ignore_index=True)
+    @staticmethod
+    def get_file_sha256(path):
+        sha256 = hashlib.sha256()
+        with open(path, 'rb') as file_fd:
+            for chunk in iter(lambda: file_fd.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
 
-
-        self.conn = sqlite3.connect(self.database)
-        try:
-            self.df.to_sql(self.table, self.conn, if_exists='append')
-        except BaseException:
-            logger.info("attempt to append to database with different column layout,\
-                 caused an exception, input new name --database <new name>")
-            print(
-                "Error attempt to append to database with different column layout,\
-                     caused an exception, input new name --database <new name>",
-                file=sys.stderr)
-            exit(1)
-        self.conn.close()
+    # indexes on the columns the reports query on
+    def create_indexes(self):
+        columns = self.get_table_columns(self.table)
+        for column in ['test-rig', 'Graph-Group', 'test-tag', 'Date', 'kpi_path']:
+            if column in columns:
+                index_name = "idx_{table}_{column}".format(table=self.table, column=re.sub('[^0-9a-zA-Z]', '_', column))
+                self.conn.execute('CREATE INDEX IF NOT EXISTS "{index}" ON "{table}" ("{column}")'.format(
+                    index=index_name, table=self.table, column=column))
 
     # information on sqlite database
     # https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.to_sql.html
@@ -611,47 +608,91 @@ class csv_sql:
     # Fedora  sudo dnf install sqlitebrowser
     # Ubuntu sudo apt-get install sqlite3
     #
-    def store_comp(self):
+    # Only kpi.csv files not yet in the database are read. The <table>_manifest table
+    # records the mtime, size and sha256 of each kpi.csv stored, a kpi.csv whose content changed
+    # replaces its earlier rows.
+    def store_kpi_path(self, _path):
         logger.info("reading kpi and storing in db {}".format(self.database))
-        path = Path(self.path_comp)
+        path = Path(_path)
         logger.info("store path {path}".format(path=path))
-        logger.info("self.path_comp  {path}".format(path=self.path_comp))
         self.kpi_list = list(path.glob('**/kpi.csv'))  # Hard code for now
 
         if not self.kpi_list:
             logger.info("WARNING: used --store , no new kpi.csv found, check input path or remove --store from command line")
 
+        self.conn = sqlite3.connect(self.database)
+        manifest_table = self.get_manifest_table()
+        self.conn.execute('CREATE TABLE IF NOT EXISTS "{manifest}" (kpi_path TEXT PRIMARY KEY, mtime REAL, size INTEGER, sha256 TEXT)'.format(
+            manifest=manifest_table))
+        manifest = {row[0]: row[1:] for row in self.conn.execute(
+            'SELECT kpi_path, mtime, size, sha256 FROM "{manifest}"'.format(manifest=manifest_table))}
+        # kpi paths stored before the manifest existed
+        stored_kpi_paths = set()
+        if 'kpi_path' in self.get_table_columns(self.table):
+            stored_kpi_paths = {row[0] for row in self.conn.execute(
+                'SELECT DISTINCT kpi_path FROM "{table}"'.format(table=self.table))}
+
+        df_list = []
+        manifest_rows = []
+        replaced_kpi_paths = []
         for kpi in self.kpi_list:  # TODO note empty kpi.csv failed test
-            df_kpi_tmp = pd.read_csv(kpi, sep='\t')
             # only store the path to the kpi.csv file
             _kpi_path = str(kpi).replace('kpi.csv', '')
-            df_kpi_tmp['kpi_path'] = _kpi_path
-            test_run = self.get_test_run_from_meta(_kpi_path)
-            df_kpi_tmp['test_run'] = test_run
-
-            use_meta_test_tag, test_tag = self.get_test_tag_from_meta(_kpi_path)
-            if use_meta_test_tag:
-                df_kpi_tmp['test-tag'] = test_tag
+            stat = kpi.stat()
+            if _kpi_path in manifest:
+                mtime, size, sha256 = manifest[_kpi_path]
+                if mtime == stat.st_mtime and size == stat.st_size:
+                    continue
+                kpi_sha256 = self.get_file_sha256(kpi)
+                if kpi_sha256 == sha256:
+                    manifest_rows.append((_kpi_path, stat.st_mtime, stat.st_size, kpi_sha256))
+                    continue
+                logger.info("kpi changed, replacing rows: {kpi}".format(kpi=kpi))
+                replaced_kpi_paths.append(_kpi_path)
+            else:
+                kpi_sha256 = self.get_file_sha256(kpi)
+                if _kpi_path in stored_kpi_paths:
+                    manifest_rows.append((_kpi_path, stat.st_mtime, stat.st_size, kpi_sha256))
+                    continue
 
-            test_dir = self.get_test_dir_info_from_meta(_kpi_path)
+            df_kpi_tmp = pd.read_csv(kpi, sep='\t')
+            df_kpi_tmp['kpi_path'] = _kpi_path
+            meta = self.get_meta_info_from_meta(_kpi_path)
+            df_kpi_tmp['test_run'] = meta['test_run']
+            if meta['use_meta_test_tag']:
+                df_kpi_tmp['test-tag'] = meta['test_tag']
             # test_dir = test_dir.replace('-',' ')
-            df_kpi_tmp['test_dir'] = test_dir
-
-            logger.info("test_dir: {test_dir}".format(test_dir=test_dir))
-
-            df_kpi_tmp['kernel'] = self.get_kernel_version_from_meta(_kpi_path)
-            df_kpi_tmp['radio_fw'] = self.get_radio_firmware_from_meta(_kpi_path)
-            df_kpi_tmp['gui_ver'], df_kpi_tmp['gui_build_date'] = self.get_gui_info_from_meta(_kpi_path)
-            df_kpi_tmp['server_ver'], df_kpi_tmp['server_build_date'] = self.get_server_info_from_meta(_kpi_path)
-            
-            # this next line creates duplicate entries
-            # df_kpi_tmp = df_kpi_tmp.append(df_kpi_tmp, ignore_index=True)
-            self.df = self.df.append(df_kpi_tmp, ignore_index=True)
+            df_kpi_tmp['test_dir'] = meta['test_dir']
+            logger.info("test_dir: {test_dir}".format(test_dir=meta['test_dir']))
+            df_kpi_tmp['kernel'] = meta['kernel']
+            df_kpi_tmp['radio_fw'] = meta['radio_fw']
+            df_kpi_tmp['gui_ver'] = meta['gui_ver']
+            df_kpi_tmp['gui_build_date'] = meta['gui_build_date']
+            df_kpi_tmp['server_ver'] = meta['server_ver']
+            df_kpi_tmp['server_build_date'] = meta['server_build_date']
+            df_list.append(df_kpi_tmp)
+            manifest_rows.append((_kpi_path, stat.st_mtime, stat.st_size, kpi_sha256))
+
+        if df_list:
+            self.df = pd.concat(df_list, ignore_index=True)
+        else:
+            self.df = pd.DataFrame()
+        logger.info("new kpi files: {new} rows: {rows} already stored: {stored}".format(
+            new=len(df_list), rows=len(self.df), stored=len(self.kpi_list) - len(df_list)))
 
-        self.conn = sqlite3.connect(self.database)
+        # the manifest is written after the rows so an interrupted store is redone on the next run
         try:
-            self.df.to_sql(self.table, self.conn, if_exists='append')
+            if replaced_kpi_paths:
+                self.conn.executemany('DELETE FROM "{table}" WHERE kpi_path = ?'.format(table=self.table),
+                                      [(kpi_path,) for kpi_path in replaced_kpi_paths])
+            if not self.df.empty:
+                self.df.to_sql(self.table, self.conn, if_exists='append')
+            self.conn.executemany('INSERT OR REPLACE INTO "{manifest}" (kpi_path, mtime, size, sha256) VALUES (?, ?, ?, ?)'.format(
+                manifest=manifest_table), manifest_rows)
+            self.create_indexes()
+            self.conn.commit()
         except BaseException:
+            self.conn.rollback()
             logger.info("attempt to append to database with different column layout,\
                  caused an exception, input new name --database <new name>")
             print(
@@ -661,65 +702,86 @@ class csv_sql:
             exit(1)
         self.conn.close()
 
+    def store(self):
+        logger.info("self.path  {path}".format(path=self.path))
+        self.store_kpi_path(self.path)
 
-
-    def generate_png(self, group, test_id_list, test_tag,
-                     test_rig, kpi_path_list, kpi_fig, df_tmp):
-        # save the figure - figures will be over written png
-        # for testing
-        png_server_img = ''
-        # generate the png files
-        logger.info("generate png and kpi images from kpi kpi_path:{}".format(
-            df_tmp['kpi_path']))
-            # LAN-1535 scripting: test_l3.py output masks other output when browsing (index.html) create relative paths in reports
-        # generate png img path
-        png_path = os.path.join(
-            kpi_path_list[-1], "{}_{}_{}_kpi.png".format(group, test_tag, test_rig))
-        png_path = png_path.replace(' ', '')
-        # generate html graphics path
-        html_path = os.path.join(
-            kpi_path_list[-1], "{}_{}_{}_kpi.html".format(group, test_tag, test_rig))
-        html_path = html_path.replace(' ', '')
-        
-        # generate png image
-        png_present = True
+    def store_comp(self):
+        logger.info("self.path_comp  {path}".format(path=self.path_comp))
+        self.store_kpi_path(self.path_comp)
+
+    # png, html and digest paths of a kpi graph, kept in the directory of the most recent kpi
+    # LAN-1535 scripting: test_l3.py output masks other output when browsing (index.html) create relative paths in reports
+    def get_kpi_graph_paths(self, group, test_tag, test_rig, kpi_path):
+        graph_path = os.path.join(
+            kpi_path, "{}_{}_{}_kpi".format(group, test_tag, test_rig))
+        graph_path = graph_path.replace(' ', '')
+        return graph_path + ".png", graph_path + ".html", graph_path + ".sha256"
+
+    # digest of everything drawn on a kpi graph, an unchanged digest reuses the previous png and html
+    @staticmethod
+    def get_kpi_graph_digest(job):
+        sha256 = hashlib.sha256()
+        sha256.update("{group}\n{test_id}\n{test_tag}\n{test_rig}\n{units}\n".format(
+            group=job['group'], test_id=job['test_id'], test_tag=job['test_tag'],
+            test_rig=job['test_rig'], units=job['units']).encode())
+        sha256.update(job['df_tmp'].to_csv(index=False).encode())
+        return sha256.hexdigest()
+
+    @staticmethod
+    def kpi_graph_current(job):
+        if not (os.path.exists(job['png_path']) and os.path.exists(job['html_path'])):
+            return False
         try:
-            kpi_fig.write_image(png_path, scale=1, width=1200, height=300)
-        except ValueError as err:
-            logger.info("ValueError kpi_fig.write_image {msg}".format(msg=err))
-            png_present = False
-            # exit(1)
-        except BaseException as err:
-            logger.info("BaseException kpi_fig.write_image{msg}".format(msg=err))
-            png_present = False
-            # exit(1)
-        # generate html image (interactive)
-        # TODO Do not crash if a PNG is not present
-        if png_present:
-            kpi_fig.write_html(html_path)
-            # Relative path
-            img_kpi_html_path_relative = os.path.relpath(html_path, self.lf_qa_report_path)
-            png_img_path_relative = os.path.relpath(png_path, self.lf_qa_report_path)
-
-            self.html_results += """
-            <a href={img_kpi_html_path} target="_blank">
-                <img src={png_server_img}>
-            </a>
-            """.format(img_kpi_html_path=img_kpi_html_path_relative, png_server_img=png_img_path_relative)
-
-            # link to interactive results
-            report_index_html_path = kpi_path_list[-1] + "readme.html"
-            relative_report_index_html = os.path.relpath(report_index_html_path, self.lf_qa_report_path)
-
-            self.html_results += """<a href={report_index_html_path} target="_blank">{test_id}_{group}_{test_tag}_{test_rig}_Report </a>
-            """.format(report_index_html_path=relative_report_index_html, test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig)
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-            self.html_results += """<br>"""
-
-    
+            with open(job['digest_path']) as digest_file:
+                return digest_file.read().strip() == job['digest']
+        except OSError:
+            return False
+
+    def generate_png(self, job):
+        # link to the interactive html through the png
+        img_kpi_html_path_relative = os.path.relpath(job['html_path'], self.lf_qa_report_path)
+        png_img_path_relative = os.path.relpath(job['png_path'], self.lf_qa_report_path)
+
+        self.html_results += """
+        <a href={img_kpi_html_path} target="_blank">
+            <img src={png_server_img}>
+        </a>
+        """.format(img_kpi_html_path=img_kpi_html_path_relative, png_server_img=png_img_path_relative)
+
+        # link to interactive results
+        report_index_html_path = job['kpi_path'] + "readme.html"
+        relative_report_index_html = os.path.relpath(report_index_html_path, self.lf_qa_report_path)
+
+        self.html_results += """<a href={report_index_html_path} target="_blank">{test_id}_{group}_{test_tag}_{test_rig}_Report </a>
+        """.format(report_index_html_path=relative_report_index_html, test_id=job['test_id'],
+                   group=job['group'], test_tag=job['test_tag'], test_rig=job['test_rig'])
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+        self.html_results += """<br>"""
+
+    # render the kpi graphs not already current, in parallel worker processes
+    # returns the jobs whose png is present
+    def render_kpi_graphs(self, jobs):
+        stale_jobs = [job for job in jobs if not self.kpi_graph_current(job)]
+        logger.info("kpi graphs: {total} unchanged: {unchanged} rendering: {stale} workers: {workers}".format(
+            total=len(jobs), unchanged=len(jobs) - len(stale_jobs), stale=len(stale_jobs), workers=self.png_workers))
+        rendered = {}
+        if self.png_workers > 1 and len(stale_jobs) > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=min(self.png_workers, len(stale_jobs))) as executor:
+                    for job, png_present in zip(stale_jobs, executor.map(render_kpi_graph, stale_jobs)):
+                        rendered[id(job)] = png_present
+            except BrokenProcessPool as err:
+                logger.warning("kpi graph worker process failed, rendering the remaining graphs serially: {msg}".format(msg=err))
+        for job in stale_jobs:
+            if id(job) not in rendered:
+                rendered[id(job)] = render_kpi_graph(job)
+        return [job for job in jobs if rendered.get(id(job), True)]
+
+
     # TODO determin the subtest pass and fail graph
     # df is sorted by date oldest to newest
     # get the test_run for last run
@@ -804,6 +866,9 @@ class csv_sql:
                 HW=self.dut_hw_version,
                 SN=self.dut_serial_num))
 
+    # The table is split by test-rig, test-tag and Graph-Group in one pass, each graph is
+    # rendered by render_kpi_graph in a worker process unless its digest shows the
+    # png and html from a previous run are still current.
     def generate_graph_png(self):
         logger.info(
             "generate png and html to display, generate time: {}".format(
@@ -811,35 +876,22 @@ class csv_sql:
 
         # https://datacarpentry.org/python-ecology-lesson/09-working-with-sql/index.html-
         self.conn = sqlite3.connect(self.database)
+        # only the columns drawn on the graphs are read
+        table_columns = self.get_table_columns(self.table)
+        columns = [column for column in KPI_GRAPH_COLUMNS if column in table_columns]
         # current connection is sqlite3 /TODO move to SQLAlchemy
-        df3 = pd.read_sql_query(
-            "SELECT * from {}".format(self.table), self.conn)
-        # sort by date from oldest to newest.
         try:
+            df3 = pd.read_sql_query(
+                "SELECT {columns} from \"{table}\"".format(
+                    columns=", ".join('"{}"'.format(column) for column in columns), table=self.table), self.conn)
+            # sort by date from oldest to newest.
             df3 = df3.sort_values(by='Date')
         except BaseException:
             logger.info("Database empty: KeyError(key) when sorting by Date, check Database name, path to kpi, typo in path, exiting")
             exit(1)
         self.conn.close()
 
-        # graph group and test-tag are used for detemining the graphs, can use any columns
-        # the following list manipulation removes the duplicates
-        graph_group_list = list(df3['Graph-Group'])
-        graph_group_list = [x for x in graph_group_list if x is not None]
-        graph_group_list = list(set(graph_group_list))
-        logger.info("graph_group_list: {}".format(graph_group_list))
-
-        # prior to 5.4.3 there was not test-tag, the test tag is in the meta data
-        # logger.info("dataframe df3 {df3}".format(df3=df3))
-
-        test_tag_list = list(df3['test-tag'])
-        test_tag_list = [x for x in test_tag_list if x is not None]
-        test_tag_list = list(sorted(set(test_tag_list)))
-        # logger.info("test_tag_list: {}".format(test_tag_list) )
-
-        test_rig_list = list(df3['test-rig'])
-        test_rig_list = [x for x in test_rig_list if x is not None]
-        test_rig_list = list(sorted(set(test_rig_list)))
+        test_rig_list = list(sorted(df3['test-rig'].dropna().unique()))
         self.test_rig_list = test_rig_list
         logger.info("test_rig_list: {}".format(test_rig_list))
 
@@ -847,147 +899,47 @@ class csv_sql:
         time_now = round(time.time() * 1000)
         test_window_epoch = int(self.test_window_days) * 86400000
 
-        # create the rest of the graphs
-        for test_rig in test_rig_list:
-            for test_tag in test_tag_list:
-                for group in graph_group_list:
-                    df_tmp = df3.loc[(df3['test-rig'] == test_rig) & (
-                        df3['Graph-Group'] == str(group)) & (df3['test-tag'] == str(test_tag))]
-                    if not df_tmp.empty:
-                        # Note if graph group is score there is sub tests for pass and fail
-                        # would like a percentage
-
-                        df_tmp = df_tmp.sort_values(by='Date')
-                        test_id_list = list(df_tmp['test-id'])
-                        kpi_path_list = list(df_tmp['kpi_path'])
-
-                        # get Device Under Test Information ,
-                        # the set command uses a hash , sorted puts it back in order
-                        # the set reduces the redundency the filster removes None
-                        # list puts it back into a list
-                        # This code is since the dut is not passed in to lf_qa.py when
-                        # regernation of graphs from db
-
-                        # find the last Date in the dataframe see if it is a test no longer run
-                        recent_test_run = df_tmp["Date"].iloc[-1]
-                        oldest_test_run = df_tmp["Date"].iloc[0]
-                        # if the recent test is over a week old do not include in run
-                        # 1 day = 86400000 milli seconds
-                        # 1 week = 604800000 milli seconds
-                        time_difference = int(time_now) -int(recent_test_run)
-                        logger.info("time_now: {time_now} recent_test_run: {recent_test_run} difference: {time_difference} test_window_epoch: {test_window_epoch} oldest_test_run: {oldest_test_run}".format(
-                            time_now=time_now,recent_test_run=recent_test_run,test_window_epoch=test_window_epoch, time_difference=time_difference, oldest_test_run=oldest_test_run))
-                        ##if (time_difference) < 604800000:  # TODO have window be configurable
-                        if (time_difference) < test_window_epoch:  # TODO have window be configurable
-                            units_list = list(df_tmp['Units'])
-                            logger.info(
-                                "GRAPHING::: test-rig {} test-tag {}  Graph-Group {}".format(test_rig, test_tag, group))
-                            # group of Score will have subtest
-                            if group == 'Score':
-                                # Print out the Standard Score report
-                                kpi_fig = (
-                                    px.scatter(
-                                        df_tmp,
-                                        x="Date",
-                                        y="numeric-score",
-                                        custom_data=[
-                                            'numeric-score',
-                                            'Subtest-Pass',
-                                            'Subtest-Fail',
-                                            'kernel'
-                                            ],
-                                        color="short-description",
-                                        hover_name="short-description",
-                                        size_max=60)).update_traces(
-                                    mode='lines+markers')
-
-                                kpi_fig.update_traces(
-                                    hovertemplate="<br>".join([
-                                        "kernel-version: %{customdata[4]}",
-                                        "numeric-score: %{customdata[0]}",
-                                        "Subtest-Pass: %{customdata[1]}",
-                                        "Subtest-Fail: %{customdata[2]}"
-                                    ])
-                                )
-
-                                kpi_fig.update_layout(
-                                    title="{test_id} : {group} : {test_tag} : {test_rig}".format(
-                                        test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig),
-                                    xaxis_title="Time",
-                                    yaxis_title="{}".format(units_list[-1]),
-                                    xaxis={'type': 'date'}
-                                )
-                                kpi_fig.update_layout(autotypenumbers='convert types')
-
-                                self.generate_png(df_tmp=df_tmp,
-                                                group=group,
-                                                test_id_list=test_id_list,
-                                                test_tag=test_tag,
-                                                test_rig=test_rig,
-                                                kpi_path_list=kpi_path_list,
-                                                kpi_fig=kpi_fig)
-
-                            else:
-                                kpi_fig = (
-                                    px.scatter(
-                                        df_tmp,
-                                        x="Date",
-                                        y="numeric-score",
-                                        custom_data=[
-                                            'Date',
-                                            'test_dir',
-                                            'numeric-score',
-                                            'kernel',
-                                            'radio_fw',
-                                            'gui_ver',
-                                            'gui_build_date',
-                                            'server_ver',
-                                            'server_build_date',
-                                            'dut-hw-version',
-                                            'dut-sw-version',
-                                            'dut-model-num',
-                                            'dut-serial-num'
-                                            ],
-                                        color="short-description",
-                                        hover_name="short-description",
-                                        size_max=60)).update_traces(
-                                    mode='lines+markers')
-
-                                kpi_fig.update_layout(
-                                    title="{test_id} : {group} : {test_tag} : {test_rig}".format(
-                                        test_id=test_id_list[-1], group=group, test_tag=test_tag, test_rig=test_rig),
-                                    xaxis_title="Time",
-                                    yaxis_title="{units}".format(units=units_list[-1]),
-                                    xaxis={'type': 'date'}
-                                )
-
-                                kpi_fig.update_traces(
-                                    hovertemplate="<br>".join([
-                                        "Date: %{customdata[0]}",
-                                        "test_dir: %{customdata[1]}",
-                                        "numeric-score: %{customdata[2]}",
-                                        "kernel-version: %{customdata[3]}",
-                                        "radio-fw: %{customdata[4]}",
-                                        "gui-version: %{customdata[5]}",
-                                        "gui-build-date: %{customdata[6]}",
-                                        "server-version: %{customdata[7]}",
-                                        "server-build-date: %{customdata[8]}",
-                                        "dut-hw-version: %{customdata[9]}",
-                                        "dut-sw-version: %{customdata[10]}",
-                                        "dut-model-num: %{customdata[11]}",
-                                        "dut-serial-num: %{customdata[12]}",
-                                    ])
-                                )
-
-                                kpi_fig.update_layout(autotypenumbers='convert types')
-
-                                self.generate_png(df_tmp=df_tmp,
-                                                group=group,
-                                                test_id_list=test_id_list,
-                                                test_tag=test_tag,
-                                                test_rig=test_rig,
-                                                kpi_path_list=kpi_path_list,
-                                                kpi_fig=kpi_fig)
+        # graph group and test-tag are used for detemining the graphs, can use any columns
+        # prior to 5.4.3 there was not test-tag, the test tag is in the meta data
+        # groupby drops the rows with a None test-rig, test-tag or Graph-Group, the sort by Date is kept within each group
+        jobs = []
+        for (test_rig, test_tag, group), df_tmp in df3.groupby(['test-rig', 'test-tag', 'Graph-Group'], sort=True):
+            # Note if graph group is score there is sub tests for pass and fail
+            # would like a percentage
+            df_tmp = df_tmp.reset_index(drop=True)
+            kpi_path = df_tmp['kpi_path'].iloc[-1]
+
+            # find the last Date in the dataframe see if it is a test no longer run
+            recent_test_run = df_tmp["Date"].iloc[-1]
+            oldest_test_run = df_tmp["Date"].iloc[0]
+            # if the recent test is over a week old do not include in run
+            # 1 day = 86400000 milli seconds
+            # 1 week = 604800000 milli seconds
+            time_difference = int(time_now) - int(recent_test_run)
+            logger.info("time_now: {time_now} recent_test_run: {recent_test_run} difference: {time_difference} test_window_epoch: {test_window_epoch} oldest_test_run: {oldest_test_run}".format(
+                time_now=time_now, recent_test_run=recent_test_run, test_window_epoch=test_window_epoch, time_difference=time_difference, oldest_test_run=oldest_test_run))
+            if time_difference >= test_window_epoch:  # TODO have window be configurable
+                continue
+            logger.info(
+                "GRAPHING::: test-rig {} test-tag {}  Graph-Group {}".format(test_rig, test_tag, group))
+            png_path, html_path, digest_path = self.get_kpi_graph_paths(group=group, test_tag=test_tag,
+                                                                        test_rig=test_rig, kpi_path=kpi_path)
+            job = {'df_tmp': df_tmp,
+                   'group': group,
+                   'test_id': df_tmp['test-id'].iloc[-1],
+                   'test_tag': test_tag,
+                   'test_rig': test_rig,
+                   'units': df_tmp['Units'].iloc[-1],
+                   'kpi_path': kpi_path,
+                   'png_path': png_path,
+                   'html_path': html_path,
+                   'digest_path': digest_path}
+            job['digest'] = self.get_kpi_graph_digest(job)
+            jobs.append(job)
+
+        # TODO Do not crash if a PNG is not present
+        for job in self.render_kpi_graphs(jobs):
+            self.generate_png(job)
 
 
 # Feature, Sum up the subtests passed/failed from the kpi files for each
@@ -1054,6 +1006,8 @@ Usage: lf_qa.py --store --png --path <path to directories to traverse> --databas
 
     parser.add_argument('--test_window_days', help="--test_window,  days to look back for test results , used to elimnate older tests being reported default 7 days", default="7")
 
+    parser.add_argument('--png_workers', help="--png_workers , worker processes rendering kpi graphs, 1 renders serially default: number of cpus", type=int, default=None)
+
     parser.add_argument('--test_suite', help="--test_suite , the test suite is to help identify which suite was run ", default="lf_qa")
 
     parser.add_argument('--server', help="--server , server switch is deprecated ", default="")
@@ -1133,7 +1087,8 @@ Usage: lf_qa.py --store --png --path <path to directories to traverse> --databas
         _database=__database,
         _table=__table,
         _png=__png,
-        _test_window_days=__test_window_days)
+        _test_window_days=__test_window_days,
+        _png_workers=args.png_workers)
     # csv_dash.sub_test_information()
 
     if args.store:
@@ -22,7 +22,7 @@ def main():
     parse = wlan_theoretical_sta.abg11_calculator.create_argparse(prog='wlan_capacity_calculator.py',
                                                                   formatter_class=argparse.RawTextHelpFormatter,
                                                                   epilog='''\
-             This python script calculates the theoretical value of three different stations( 11abg/11n/11ac)''',
+             This python script calculates the theoretical value of four different stations( 11abg/11n/11ac/11ax)''',
                                                                   description='''\
         wlan_capacity_calculator.py
         ---------------------------------------------------------------------------
@@ -79,7 +79,7 @@ def main():
         else:
             if "11abg" in Calculator_name:
                 qos_name = "No"
-            if "11n" in Calculator_name or "11ac" in Calculator_name:
+            if "11n" in Calculator_name or "11ac" in Calculator_name or "11ax" in Calculator_name:
                 qos_name = "Yes"
 
         # 802.11 MAC Frame
@@ -117,7 +117,7 @@ def main():
         else:
             if "11abg" in Calculator_name:
                 codec_name = "G.723"
-            if "11n" in Calculator_name:
+            if "11n" in Calculator_name or "11ax" in Calculator_name:
                 codec_name = "G.711"
             if "11ac" in Calculator_name:
                 codec_name = "Mixed"
@@ -136,7 +136,7 @@ def main():
         else:
             cts_name = "No"
 
-        # station = 11n and 11ac
+        # station = 11n, 11ac and 11ax
 
         # Data/Voice MCS Index
 
@@ -147,6 +147,8 @@ def main():
                 data_name = "7"
             if "11ac" in Calculator_name:
                 data_name = "9"
+            if "11ax" in Calculator_name:
+                data_name = "11"
 
         # Channel Bandwidth
 
@@ -155,7 +157,7 @@ def main():
         else:
             if "11n" in Calculator_name:
                 channel_name = "40"
-            if "11ac" in Calculator_name:
+            if "11ac" in Calculator_name or "11ax" in Calculator_name:
                 channel_name = "80"
 
         # Guard Interval
@@ -163,7 +165,10 @@ def main():
         if args.guard:
             guard_name = args.guard
         else:
-            guard_name = "400"
+            if "11ax" in Calculator_name:
+                guard_name = "800"
+            else:
+                guard_name = "400"
 
         # Highest Basic MCS
 
@@ -193,7 +198,7 @@ def main():
         else:
             if "11n" in Calculator_name:
                 mc_name = '42'
-            if "11ac" in Calculator_name:
+            if "11ac" in Calculator_name or "11ax" in Calculator_name:
                 mc_name = '64'
 
         # CWmin (leave alone for default)
@@ -221,7 +226,7 @@ def main():
         logging.exception(e)
         exit(2)
 
-    # Select station(802.11a/b/g/n/ac standards)
+    # Select station(802.11a/b/g/n/ac/ax standards)
 
     if "11abg" in Calculator_name:
         Station1 = wlan_theoretical_sta.abg11_calculator(traffic_name, phy_name, encryption_name, qos_name, mac_name, basic_name,
@@ -242,6 +247,15 @@ def main():
                                                         codec_name, cwin_name, rtscts_name)
         Station3.calculate()
         Station3.get_result()
+    if "11ax" in Calculator_name:
+        Station4 = wlan_theoretical_sta.ax11_calculator(traffic_name, data_name, spatial_name, channel_name, guard_name,
+                                                        encryption_name, qos_name, ip_name, mc_name, basic_name, mac_name,
+                                                        codec_name, cwin_name, rts_name, cts_name)
+        try:
+            Station4.calculate()
+        except ValueError as e:
+            parse.error(str(e))
+        Station4.get_result()
 
 
 if __name__ == "__main__":
@@ -10,6 +10,10 @@ PURPOSE: wifi_diag.py provides a comprehensive set of information for the packet
 
 EXAMPLE:  python3 wifi_diag.py --input <pcap(Packet Capture) file path>
 
+          Large captures can be streamed through a field-selected tshark export instead of pyshark,
+          optionally split into shards that are parsed by several worker processes:
+          python3 wifi_diag.py --input <pcap file path> --stream --workers 4
+
 VERIFIED_ON: 18 August 2022
 
 LICENSE:
@@ -28,6 +32,11 @@ import argparse
 import shutil
 import os
 import importlib
+import subprocess
+import tempfile
+import glob
+from collections import Counter
+from multiprocessing import Pool
 
 sys.path.append(os.path.join(os.path.abspath(__file__ + "../../../../")))
 
@@ -36,6 +45,124 @@ lf_report = lf_report.lf_report
 lf_graph = importlib.import_module("py-scripts.lf_graph")
 lf_bar_graph = lf_graph.lf_bar_graph
 
+SUBTYPE_NAMES = {"80": "Beacon frame", "d0": "Action", "b4": "Request-to-send", "d4": "Acknowledgement", \
+                 "88": "QoS Data", "84": "Block Ack Req", "94": "Block Ack Req", \
+                 "40": "Probe Request", "50": "Probe Response", "b0": "Authentication",
+                 "a2": "Disassociate", "a8": "QoS Data + CF-Poll", "c8": "QoS Null function", \
+                 "10": "Association Response", "00": "Association Request", "c4": "Clear-to-send", \
+                 "98": "QoS Data + CF-Acknowledgment", "24": "Trigger", "28": "Data + CF-Poll", \
+                 "d8": "Unknown", "54": "VHT/HE NDP Announcement", "e8": "QoS CF-Poll", \
+                 "b8": "QoS Data + CF-Ack + CF-Poll", "18": "Data + CF-Ack", "48": "Null function", \
+                 "69": "CF-Poll", "08": "Data"
+                 }
+
+# fields exported by tshark in streaming mode, in column order
+STREAM_FIELDS = ["wlan.fc", "wlan.fc.type",
+                 "wlan_radio.signal_dbm", "wlan_radio.phy", "wlan_radio.data_rate",
+                 "wlan_radio.11ac.bandwidth", "wlan_radio.11ac.mcs", "wlan_radio.11ac.nss",
+                 "radiotap.he.data_3.data_mcs", "radiotap.he.data_5.data_bw_ru_allocation",
+                 "radiotap.he.data_6.nsts", "wlan_radio.a_mpdu_aggregate_id"]
+
+# tshark exports raw values, these give the names pyshark shows
+PHY_NAMES = {"1": "802.11 FHSS", "2": "802.11 IR", "3": "802.11 DSSS", "4": "802.11b", "5": "802.11a",
+             "6": "802.11g", "7": "802.11n", "8": "802.11ac", "9": "802.11ad", "10": "802.11ah",
+             "11": "802.11ax", "12": "802.11be"}
+VHT_BANDWIDTH_NAMES = {0: "20 MHz", 1: "40 MHz", 2: "20 MHz", 3: "20 MHz", 4: "80 MHz", 5: "40 MHz",
+                       6: "40 MHz", 7: "20 MHz", 11: "160 MHz"}
+HE_BANDWIDTH_NAMES = {0: "20", 1: "40", 2: "80", 3: "160/80+80"}
+
+STREAM_COUNTERS = ["Managementls", "Controlls", "Data_framels", "PhyType", "DataRate", "SignalStrength",
+                   "MCSIndex", "Bandwidth", "Spatial_Stream", "AMPDU"]
+
+
+def _raw_int(value):
+    try:
+        return int(value, 0)
+    except ValueError:
+        return None
+
+
+def stream_pcap_counters(pcap_file):
+    """
+    Read only STREAM_FIELDS from pcap_file through tshark and count the values,
+    returns a dict of Counters and totals that stream_merge_counters() can add together.
+    """
+    counters = {name: Counter() for name in STREAM_COUNTERS}
+    totals = {"count": 0, "vMCS": 0, "vBW": 0, "vNCS": 0, "vAMPDU": 0}
+    command = ["tshark", "-r", pcap_file, "-n", "-T", "fields",
+               "-E", "separator=/t", "-E", "occurrence=f"]
+    for field in STREAM_FIELDS:
+        command.extend(["-e", field])
+    with subprocess.Popen(command, stdout=subprocess.PIPE, universal_newlines=True) as tshark:
+        for line in tshark.stdout:
+            totals["count"] += 1
+            (fc, fc_type, signal, phy, data_rate,
+             vht_bw, vht_mcs, vht_nss,
+             he_mcs, he_bw, he_nsts, ampdu_id) = (line.rstrip("\n").split("\t") + [""] * len(STREAM_FIELDS))[:len(STREAM_FIELDS)]
+
+            if signal:
+                counters["SignalStrength"][signal] += 1
+            if phy:
+                counters["PhyType"][PHY_NAMES.get(phy, phy)] += 1
+            if data_rate:
+                counters["DataRate"][data_rate] += 1
+            if not fc:
+                continue
+
+            # first byte of the frame control field, as pyshark reports fc_type_subtype.raw_value
+            subtype_name = SUBTYPE_NAMES.get(fc[2:4].lower()) if fc.startswith("0x") else None
+            if fc_type == "0":
+                if subtype_name:
+                    counters["Managementls"][subtype_name] += 1
+            elif fc_type == "1":
+                if subtype_name:
+                    counters["Controlls"][subtype_name] += 1
+            elif fc_type == "2" and subtype_name:
+                counters["Data_framels"][subtype_name] += 1
+                if vht_bw and vht_mcs and vht_nss:
+                    bandwidth = _raw_int(vht_bw)
+                    counters["Bandwidth"][VHT_BANDWIDTH_NAMES.get(bandwidth, vht_bw)] += 1
+                    counters["MCSIndex"][vht_mcs] += 1
+                    counters["Spatial_Stream"][vht_nss] += 1
+                    totals["vBW"] += 1
+                    totals["vMCS"] += 1
+                    totals["vNCS"] += 1
+                if he_mcs and he_bw and he_nsts:
+                    bandwidth = _raw_int(he_bw)
+                    counters["Bandwidth"][HE_BANDWIDTH_NAMES.get(bandwidth, he_bw)] += 1
+                    counters["MCSIndex"][str(_raw_int(he_mcs))] += 1
+                    counters["Spatial_Stream"][str(_raw_int(he_nsts))] += 1
+                    totals["vBW"] += 1
+                    totals["vMCS"] += 1
+                    totals["vNCS"] += 1
+                if ampdu_id:
+                    counters["AMPDU"][ampdu_id] += 1
+                    totals["vAMPDU"] += 1
+    if tshark.returncode:
+        raise RuntimeError("tshark exited with %s reading %s" % (tshark.returncode, pcap_file))
+    counters.update(totals)
+    return counters
+
+
+def stream_merge_counters(results):
+    merged = {name: Counter() for name in STREAM_COUNTERS}
+    for result in results:
+        for name, value in result.items():
+            if isinstance(value, Counter):
+                merged[name].update(value)
+            else:
+                merged[name] = merged.get(name, 0) + value
+    return merged
+
+
+def _unique_counts(values):
+    # sorted unique values and how often each occurs, for a list or a Counter
+    if isinstance(values, Counter):
+        unique = [value for value in np.unique(list(values.keys()))]
+        return unique, [values[value] for value in unique]
+    unique = [value for value in np.unique(values)]
+    return unique, [values.count(value) for value in unique]
+
 
 class wifi_diag:
     def __init__(self):
@@ -45,16 +172,10 @@ class wifi_diag:
     # This is for AMPDU Histogram
     def RateAMPDU(self, AMPDU, count):
 
-        countUniqueAMPDU = []
-
         perUniqueAMPDU = []
         chainCountAMPDU = []
 
-        uniqueAMPDU = np.unique(AMPDU)
-        uniqueAMPDU = [i for i in uniqueAMPDU]
-
-        for countAMPDU in uniqueAMPDU:
-            countUniqueAMPDU.append(AMPDU.count(countAMPDU))
+        uniqueAMPDU, countUniqueAMPDU = _unique_counts(AMPDU)
 
         chainUniqueAMPDU = np.unique(countUniqueAMPDU)
         chainUniqueAMPDU = [i for i in chainUniqueAMPDU]
@@ -130,14 +251,9 @@ class wifi_diag:
 
     # This is for MCS Histogram
     def MCSHistogram(self, MCSIndex, vMCS, count):
-        countUniqueMCSIndex = []
-
         perUniqueMCS = []
 
-        uniqueMCSIndex = np.unique(MCSIndex)
-
-        for countMCS in uniqueMCSIndex:
-            countUniqueMCSIndex.append(MCSIndex.count(countMCS))
+        uniqueMCSIndex, countUniqueMCSIndex = _unique_counts(MCSIndex)
 
         for cnt in countUniqueMCSIndex:
             perUniqueMCS.append(round((cnt * 100) / count, 2))
@@ -198,13 +314,9 @@ class wifi_diag:
 
     # This is for Bandwidth Histogram
     def BandwidthHistogram(self, Bandwidth, vBW, count):
-        countUniqueBandwidth = []
         perUniqueBW = []
 
-        uniqueBandwidth = ((np.unique(Bandwidth)))
-
-        for countBandwidth in uniqueBandwidth:
-            countUniqueBandwidth.append(Bandwidth.count(countBandwidth))
+        uniqueBandwidth, countUniqueBandwidth = _unique_counts(Bandwidth)
 
         for cnt in countUniqueBandwidth:
             perUniqueBW.append(round((cnt * 100) / count, 2))
@@ -266,13 +378,9 @@ class wifi_diag:
 
     # This is for NSS Histogram
     def NSSHistogram(self, Spatial_Stream, vNCS, count):
-        countUniqueSpatial_stream = []
         perUniqueNCS = []
 
-        uniqueSpatial_stream = ((np.unique(Spatial_Stream)))
-
-        for countNCS in uniqueSpatial_stream:
-            countUniqueSpatial_stream.append(Spatial_Stream.count(countNCS))
+        uniqueSpatial_stream, countUniqueSpatial_stream = _unique_counts(Spatial_Stream)
 
         for cnt in countUniqueSpatial_stream:
             perUniqueNCS.append(round((cnt * 100) / count, 2))
@@ -333,15 +441,9 @@ class wifi_diag:
 
     # This is for Rate Histogram
     def RateHistogram(self, DataRate, count):
-        countUniqueData = []
         perUniqueData = []
 
-        uniqueData = np.unique(DataRate)
-
-        for i in uniqueData:
-            countUniqueData.append(DataRate.count(i))
-
-        uniqueData = [i for i in uniqueData]
+        uniqueData, countUniqueData = _unique_counts(DataRate)
 
         dictRate = (dict(zip(uniqueData, countUniqueData, )))
 
@@ -400,14 +502,8 @@ class wifi_diag:
 
     #This is for Phy Histogram
     def PhyHistogram(self, PhyType, count):
-        countUniquePhy = []
         perUniquePhy = []
-        uniquePhy = np.unique(PhyType)
-
-        for j in uniquePhy:
-            countUniquePhy.append(PhyType.count(j))
-
-        uniquePhy = [i for i in uniquePhy]
+        uniquePhy, countUniquePhy = _unique_counts(PhyType)
 
         dictPhy = (dict(zip(uniquePhy, countUniquePhy)))
 
@@ -469,14 +565,8 @@ class wifi_diag:
 
     # This is for Signal Histogram
     def SignalHistogram(self, SignalStrength, count):
-        countUniqueSignal = []
         perUniqueSignal = []
-        uniqueSignal = np.unique(SignalStrength)
-
-        for k in uniqueSignal:
-            countUniqueSignal.append(SignalStrength.count(k))
-
-        uniqueSignal = [i for i in uniqueSignal]
+        uniqueSignal, countUniqueSignal = _unique_counts(SignalStrength)
         dictSig = (dict(zip(uniqueSignal, countUniqueSignal)))
 
         for e in countUniqueSignal:
@@ -551,7 +641,7 @@ class wifi_diag:
                 if (key in liskeys):
                     continue
 
-                val = Subtype[0].count(key)
+                val = Subtype[0][key] if isinstance(Subtype[0], Counter) else Subtype[0].count(key)
                 liskeys.append(key)
                 if (val != 0):
                     Type_list.append(str(Type))
@@ -615,16 +705,7 @@ class wifi_diag:
     # collect data from input pcap
     def main(self):
         type_list = {"0": "Management frame", "1": "Control Frame", "2": "Data frame"}
-        subtype_list = {"80": "Beacon frame", "d0": "Action", "b4": "Request-to-send", "d4": "Acknowledgement", \
-                        "88": "QoS Data", "84": "Block Ack Req", "94": "Block Ack Req", \
-                        "40": "Probe Request", "50": "Probe Response", "b0": "Authentication",
-                        "a2": "Disassociate", "a8": "QoS Data + CF-Poll", "c8": "QoS Null function", \
-                        "10": "Association Response", "00": "Association Request", "c4": "Clear-to-send", \
-                        "98": "QoS Data + CF-Acknowledgment", "24": "Trigger", "28": "Data + CF-Poll", \
-                        "d8": "Unknown", "54": "VHT/HE NDP Announcement", "e8": "QoS CF-Poll", \
-                        "b8": "QoS Data + CF-Ack + CF-Poll", "18": "Data + CF-Ack", "48": "Null function", \
-                        "69": "CF-Poll", "08": "Data"
-                        }
+        subtype_list = SUBTYPE_NAMES
 
 
         Managementls = []
@@ -876,12 +957,55 @@ class wifi_diag:
 
         report.build_footer()
 
+    # collect data from input pcap with a field-selected tshark export, optionally split into
+    # shards of shard_packets packets that are parsed by workers processes
+    def main_stream(self, workers=1, shard_packets=250000):
+        shards = [self.FilePath]
+        shard_dir = None
+        try:
+            if workers > 1 and shard_packets:
+                shard_dir = tempfile.mkdtemp(prefix="wifi_diag_")
+                subprocess.run(["editcap", "-c", str(shard_packets), self.FilePath,
+                                os.path.join(shard_dir, "shard.pcap")], check=True)
+                shards = sorted(glob.glob(os.path.join(shard_dir, "shard*")))
+            if workers > 1 and len(shards) > 1:
+                with Pool(processes=workers) as pool:
+                    results = pool.map(stream_pcap_counters, shards)
+            else:
+                results = [stream_pcap_counters(shard) for shard in shards]
+        finally:
+            if shard_dir is not None:
+                shutil.rmtree(shard_dir, ignore_errors=True)
+        counters = stream_merge_counters(results)
+        count = counters["count"]
+        print("Parsed {count} packets from {shards} shard(s)".format(count=count, shards=len(shards)))
+
+        if counters["vAMPDU"] != 0:
+            wd_obj.RateAMPDU(counters["AMPDU"], count)
+
+        wd_obj.MCSHistogram(counters["MCSIndex"], counters["vMCS"], count)
+        wd_obj.BandwidthHistogram(counters["Bandwidth"], counters["vBW"], count)
+        wd_obj.NSSHistogram(counters["Spatial_Stream"], counters["vNCS"], count)
+        wd_obj.RateHistogram(counters["DataRate"], count)
+        wd_obj.PhyHistogram(counters["PhyType"], count)
+        wd_obj.SignalHistogram(counters["SignalStrength"], count)
+        wd_obj.PacketHistogram(SUBTYPE_NAMES, counters["Managementls"], counters["Controlls"],
+                               counters["Data_framels"], count)
+
+        report.build_footer()
+
 
 if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="To create a report from a pcap files")
     parser.add_argument("-i", "--input", type=str,
                         help="Enter the Name of the pcap files which needs to generatate pdf report.")
+    parser.add_argument("--stream", action="store_true",
+                        help="Read only the needed fields through tshark instead of decoding every packet with pyshark.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="With --stream, number of worker processes parsing shards of the capture.")
+    parser.add_argument("--shard_packets", type=int, default=250000,
+                        help="With --stream and --workers > 1, packets per shard.")
 
     args = None
 
@@ -926,7 +1050,10 @@ if __name__ == "__main__":
     report.build_objective()
 
     wd_obj = wifi_diag()
-    wd_obj.main()
+    if args.stream:
+        wd_obj.main_stream(workers=args.workers, shard_packets=args.shard_packets)
+    else:
+        wd_obj.main()
 
     html_file = report.write_html()
     print("Returned html file in {}".format(html_file))